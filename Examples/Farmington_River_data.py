@@ -1,18 +1,15 @@
 """
-Program to create a pickle file of statistics on water temperatures
+Program to create an array store of statistics on water temperatures
 in the Farmington River basin of Connecticut.
 
 This program was written to write data that is hard-coded into
-the script to a pickle file containing dictionaries that could easily be
-read into Python.
+the script to an array store, a directory of NumPy arrays with a JSON
+manifest, that can be read into Python with read_array_store.
 
 The data are stored in arrays named: sdev, crmsd, ccoef, and gageID. Each of
 these contain 1 reference value (first position) and 22 prediction values,
 for a total of 23 values. These arrays are stored in a container which is
-then written to a pickle file. A different file suffix is used depending upon
-whether the file is created using Python 2 (.pkl) or Python 3 (.pkl3) because
-the pickle package is not cross version compatible for pickle files containing
-containers of dictionaries.
+then written to an array store.
 
 The source data is an observation set at each location as well as a
 simulation set. The reference value is chosen that more or less represents
@@ -21,33 +18,14 @@ the consensus on acceptable values of the root-mean square error.
 Author: Peter A. Rochford
 
 Created on Jan 5, 2019
-Revised on Mar 14, 2023
+Revised on Oct 18, 2026
 
 @author: prochford@thesymplectic.com
 """
 
-import pickle
-from sys import version_info
-
 # from Container import Container
 import numpy as np
-
-
-def save_obj(obj, name):
-    # Save object to file in pickle format
-    if version_info[0] == 2:
-        suffix = "pkl"
-    else:
-        suffix = "pkl3"
-
-    with open(name + "." + suffix, "wb") as f:
-        pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
-
-
-def load_obj(name):
-    # Load object from file in pickle format
-    with open(name + "." + suffix, "rb") as f:
-        return pickle.load(f)
+import skill_metrics as sm
 
 
 class Container(object):
@@ -61,8 +39,6 @@ class Container(object):
 
 
 if __name__ == "__main__":
-    suffix = "pkl3"  # suffix chosen to identify Python 3 version
-
     print("Storing statistics in arrays")
 
     # Store statistics in arrays
@@ -212,11 +188,11 @@ if __name__ == "__main__":
     # Create container for arrays and list
     data = Container(bias, sdev, crmsd, ccoef, rmsd, gageID)
 
-    # Save dictionaries to pickle file
-    save_obj(data, "Farmington_River_data")
+    # Save container to array store
+    sm.write_array_store("Farmington_River_data", data, overwrite=True)
 
     # Print summary
-    data_read = load_obj("Farmington_River_data")
+    data_read = sm.read_array_store("Farmington_River_data")
     ngage = len(data_read.gageID)
     print("\nNumber of gauges = " + str(ngage - 1))
 
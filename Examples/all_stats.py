@@ -12,7 +12,7 @@ and manipulation. The Python code is kept to a minimum.
 All functions in the Skill Metrics library are designed to only work
 with one-dimensional arrays, e.g. time series of observations at a
 selected location. The one-dimensional data are read in as dictionaries
-via a pickle file: ref['data'], pred1['data'], pred2['data'], and
+from an array store: ref['data'], pred1['data'], pred2['data'], and
 pred3['data']. The statistics are displayed to the screen as well as
 written to an Excel file named all_stats.xls.
 
@@ -33,44 +33,24 @@ Author: Peter A. Rochford
         www.thesymplectic.com
 
 Created on Nov 23, 2016
+Revised on Oct 18, 2026
 
 @author: prochford@thesymplectic.com
 """
 
-import pickle
-from sys import version_info
 
 import numpy as np
 import skill_metrics as sm
 
 
-def load_obj(name):
-    # Load object from file in pickle format
-    if version_info[0] == 2:
-        suffix = "pkl"
-    else:
-        suffix = "pkl3"
-
-    with open(name + "." + suffix, "rb") as f:
-        return pickle.load(f)  # Python2 succeeds
-
-
-class Container(object):
-    def __init__(self, pred1, pred2, pred3, ref):
-        self.pred1 = pred1
-        self.pred2 = pred2
-        self.pred3 = pred3
-        self.ref = ref
-
-
 if __name__ == "__main__":
     # Calculate various skill metrics, writing results to screen
     # and Excel file. Use an ordered dictionary so skill metrics are
     # saved in the Excel file in the same order as written to screen.
     stats = OrderedDict()
 
-    # Read data from pickle file
-    data = load_obj("target_data")
+    # Read data from array store
+    data = sm.read_array_store("target_data")
     pred = data.pred1["data"]
     ref = data.ref["data"]
 
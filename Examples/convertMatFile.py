@@ -1,20 +1,21 @@
 """
-Program to convert a Matlab mat file in HDF5 format to a pickle file
+Program to convert a Matlab mat file in HDF5 format to an array store
 
 This program was written to convert a Matlab "mat" file containing data
-structures to a pickle file containing dictionaries that could easily be
-read into Python. The version of scipy.io that was available would not read
-the mat files, so I was forced to use the h5py library to read the mat file
-stored in Hierarchical Data Format version 5 (HDF5), store the data structures
-in corresponding dictionaries and save them in individual pickle files.
+structures to an array store containing dictionaries that can be read into
+Python with read_array_store. The version of scipy.io that was available
+would not read the mat files, so I was forced to use the h5py library to
+read the mat file stored in Hierarchical Data Format version 5 (HDF5), store
+the data structures in corresponding dictionaries and save them in an array
+store: a directory of NumPy arrays with a JSON manifest, whose arrays are
+memory-mapped when read. The generic convert_data_file function of the
+package converts MAT, HDF5 and pickle files to array stores without knowing
+their layout.
 
 The data structures in the mat file have the format: ref.data, pred1.data,
 pred2.data, and pred3.data. Each of these data structures are stored in a
 dictionary and the set of latter stored in a container which is then written
-to a pickle file. A different file suffix is used depending upon whether the
-file is created using Python 2 (.pkl) or Python 3 (.pkl3) because the pickle
-package is not cross version compatible for pickle files containing containers
-of dictionaries.
+to an array store.
 
 The reference data used in this example are cell concentrations of a
 phytoplankton collected from cruise surveys at selected locations and
@@ -33,18 +34,17 @@ Author: Peter A. Rochford
         www.thesymplectic.com
 
 Created on Nov 23, 2016
-Revised on Apr 26, 2017
+Revised on Oct 18, 2026
 
 @author: prochford@thesymplectic.com
 """
 
 # from Container import Container
 import datetime as dt
-import pickle
-from sys import version_info
 
 import h5py
 import numpy as np
+import skill_metrics as sm
 
 
 def char2str(charArr):
@@ -54,23 +54,6 @@ def char2str(charArr):
     return string
 
 
-def save_obj(obj, name):
-    # Save object to file in pickle format
-    if version_info[0] == 2:
-        suffix = "pkl"
-    else:
-        suffix = "pkl3"
-
-    with open(name + "." + suffix, "wb") as f:
-        pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
-
-
-def load_obj(name):
-    # Load object from file in pickle format
-    with open(name + "." + suffix, "rb") as f:
-        return pickle.load(f)
-
-
 def getDateTimeFromHDF5(fileHDF5, name):
     # Get list of dates in Python format
     nDate = len(f[name + "/value/date/value"].values())
@@ -101,7 +84,6 @@ class Container(object):
 
 if __name__ == "__main__":
     matFile = "target_data.mat"
-    suffix = "pkl3"  # suffix chosen to identify Python 3 version
 
     print("Reading in data structures")
     f = h5py.File(matFile, "r")
@@ -177,8 +159,8 @@ if __name__ == "__main__":
     # Create container for dictionaries
     data = Container(pred1, pred2, pred3, ref)
 
-    # Save dictionaries to pickle file
-    save_obj(data, "target_data")
+    # Save dictionaries to array store
+    sm.write_array_store("target_data", data, overwrite=True)
 
     # Print summary
     print("\nSummary for ref:")
@@ -51,7 +51,7 @@ def get_time_series(variables, CSVdata, **kwargs) -> dict:
 
     where
 
-    values : is a list containing the date time series
+    values : is a NumPy array containing the date time series
     units  : is the units for the variable
 
     For example,
@@ -61,7 +61,7 @@ def get_time_series(variables, CSVdata, **kwargs) -> dict:
         rochford.peter1@gmail.com
 
     Created on Sep 11, 2022
-    Revised on Sep 11, 2022
+    Revised on Oct 18, 2026
     """
 
     nargin = len(kwargs)
@@ -102,7 +102,7 @@ def get_time_series(variables, CSVdata, **kwargs) -> dict:
         for name in variables:
             if name in labels:
                 index = labels.index(name)
-                timeSeries = CSVdata.iloc[:, index].tolist()
+                timeSeries = CSVdata.iloc[:, index].to_numpy()
                 if option["subsample"] > 0:
                     step = option["subsample"]
                     timeSeries = timeSeries[0:-1:step]
@@ -128,14 +128,12 @@ def get_time_series(variables, CSVdata, **kwargs) -> dict:
             name = labels[index]
             if name == "hour":
                 # Add hour and t(sec) to just t(sec)
-                hour = CSVdata.iloc[:, index].tolist()
+                hour = CSVdata.iloc[:, index].to_numpy()
                 index += 1
-                time = CSVdata.iloc[:, index].tolist()
-                timeSeries = []
-                for x in range(0, len(hour)):
-                    timeSeries.append(3600 * hour[x] + time[x])
+                time = CSVdata.iloc[:, index].to_numpy()
+                timeSeries = 3600 * hour + time
             else:
-                timeSeries = CSVdata.iloc[:, index].tolist()
+                timeSeries = CSVdata.iloc[:, index].to_numpy()
 
             # Extract units if present and name dictionary to just variable
             start = name.find("(")
@@ -1,6 +1,7 @@
 import os
 
 import pandas as pd
+import skill_metrics as sm
 from read_csv_data import read_csv_data
 
 
@@ -13,9 +14,11 @@ def load_data(filenames: list) -> dict:
         e.g. pred1 for a file named pred1.csv, so for a returned dictionary named "data" this
         would be data['pred1'].
 
-        The contents of the file are stored as lists in the dictionary, so for a column named
-        'data' in the CSV file example above, the data would be accessed using
-        data['pred1']['data'].
+        The contents of the file are stored as NumPy arrays in the dictionary, so for a column
+        named 'data' in the CSV file example above, the data would be accessed using
+        data['pred1']['data']. The arrays are read by the read_csv_arrays function of the
+        SkillMetrics package, which caches them in a NPZ file next to each CSV file (e.g.
+        pred1.csv.npz) so that reruns skip parsing the CSV files.
 
         INPUTS:
         filenames : list of CSV filenames, e.g.
@@ -38,7 +41,7 @@ def load_data(filenames: list) -> dict:
     [56 rows x 7 columns]
 
         Created on Sep 10, 2022
-        Revised on Sep 10, 2022
+        Revised on Oct 18, 2026
 
         Author: Peter A. Rochford
             rochford.peter1@gmail.com
@@ -49,19 +52,13 @@ def load_data(filenames: list) -> dict:
 
     # Process list of filenames
     for name in filenames:
-        # Read data from provided CSV file
-        csv_data = read_csv_data(name)
-
-        # Convert pandas data frame to dictionary
-        dict_data = csv_data.to_dict("list")
-
         # Get prefix of file name
         file_name, file_extension = os.path.splitext(name)
+        if file_extension == "":
+            name = name + ".csv"
 
-        # Store data as key in dictionary
-        data[file_name] = dict_data
-
-        del csv_data, dict_data
+        # Read columns of provided CSV file as arrays
+        data[file_name] = sm.read_csv_arrays(name)
 
     return data
 
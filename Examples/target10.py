@@ -59,7 +59,7 @@ be obtained by simply executing the following two statements
 Author: Peter A. Rochford
 
 Created on Dec 1, 2016
-Revised on Sep 11, 2022
+Revised on Oct 18, 2026
 
 @author: rochford.peter1@gmail.com
 """
@@ -69,8 +69,6 @@ import argparse
 import matplotlib.pyplot as plt
 import numpy as np
 import skill_metrics as sm
-from get_time_series import get_time_series
-from load_data import load_dataframe
 
 if __name__ == "__main__":
     # Define optional arguments for script
@@ -100,14 +98,10 @@ if __name__ == "__main__":
         "pred3_units.csv",
         "ref_units.csv",
     ]
-    data = load_dataframe(data_files)
-
-    # Retrieve quantities from dictionaries
-    variables = ["data (cell/L)"]  # must be specified as a list
-    pred1 = get_time_series(variables, data["pred1_units"])
-    pred2 = get_time_series(variables, data["pred2_units"])
-    pred3 = get_time_series(variables, data["pred3_units"])
-    ref = get_time_series(variables, data["ref_units"])
+    pred1, pred2, pred3, ref = [
+        sm.read_csv_arrays(name, columns=["data (cell/L)"], units="on")
+        for name in data_files
+    ]
 
     # Calculate statistics for target diagram
     target_stats1 = sm.target_statistics(pred1["data"], ref["data"], "values")
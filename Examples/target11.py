@@ -37,8 +37,8 @@ of the model water temperatures.
 The data are stored in arrays named: bias, sdev, crmsd, rmsd, ccoef, and
 gageID. Each of these contain 1 reference value (first position) and 22
 prediction values, for a total of 23 values. These arrays are stored in a
-container which is then written to a pickle file for Python 3
-(.pkl3).
+container which is then written to an array store, a directory of NumPy
+arrays with a JSON manifest.
 
 The source data is an observation set at each location as well as a
 simulation set.
@@ -58,41 +58,18 @@ Yearsley, J. R., Sun, N., Baptiste, M., and Nijssen, B. (2019) Assessing the
 Author: Peter A. Rochford
 
 Created on Mar 14, 2023
-Revised on Mar 14, 2023
+Revised on Oct 18, 2026
 
 @author: rochford.peter1@gmail.com
 """
 
 import argparse
-import pickle
-from sys import version_info
 
 import matplotlib.pyplot as plt
 import numpy as np
 import skill_metrics as sm
 
 
-def load_obj(name):
-    # Load object from file in pickle format
-    if version_info[0] == 2:
-        suffix = "pkl"
-    else:
-        suffix = "pkl3"
-
-    with open(name + "." + suffix, "rb") as f:
-        return pickle.load(f)  # Python2 succeeds
-
-
-class Container(object):
-    def __init__(self, bias, sdev, crmsd, ccoef, rmsd, gageID):
-        self.bias = bias
-        self.sdev = sdev
-        self.crmsd = crmsd
-        self.ccoef = ccoef
-        self.rmsd = rmsd
-        self.gageID = gageID
-
-
 if __name__ == "__main__":
     # Define optional arguments for script
     arg_parser = argparse.ArgumentParser()
@@ -114,8 +91,8 @@ if __name__ == "__main__":
     # Close any previously open graphics windows
     plt.close("all")
 
-    # Read data from pickle file
-    data = load_obj("Farmington_River_data")
+    # Read data from array store
+    data = sm.read_array_store("Farmington_River_data")
 
     """
     Specify individual marker label (key), label color, symbol, size, symbol face color, 
@@ -22,10 +22,9 @@ $ python taylor10.py -nosave
 The data are stored in arrays named: sdev, crmsd, ccoef, and gageID. Each of
 these contain 1 reference value (first position) and 22 prediction values,
 for a total of 23 values. These arrays are stored in a container which is
-then written to a pickle file. A different file suffix is used depending upon
-whether the file is created using Python 2 (.pkl) or Python 3 (.pkl3) because
-the pickle package is not cross version compatible for pickle files containing
-containers of dictionaries.
+then written to an array store: a directory of NumPy arrays with a JSON
+manifest, which is loaded with memory-mapped arrays by read_array_store
+(see convert_data_file for converting pickle and MATLAB files).
 
 The source data is an observation set at each location as well as a
 simulation set. The reference value is chosen that more or less represents
@@ -47,40 +46,19 @@ Authors: Peter A. Rochford
          Andre D. L. Zanchetta
 
 Created on Dec 5, 2019
-Revised on Aug 28, 2022
+Revised on Oct 18, 2026
 
 @author: rochford.peter1@gmail.com
 @author: adlzanchetta@gmail.com
 """
 
 import argparse
-import pickle
-from sys import version_info
 
 import matplotlib.pyplot as plt
 import numpy as np
 import skill_metrics as sm
 
 
-def load_obj(name):
-    # Load object from file in pickle format
-    if version_info[0] == 2:
-        suffix = "pkl"
-    else:
-        suffix = "pkl3"
-
-    with open(name + "." + suffix, "rb") as f:
-        return pickle.load(f)  # Python2 succeeds
-
-
-class Container(object):
-    def __init__(self, pred1, pred2, pred3, ref):
-        self.pred1 = pred1
-        self.pred2 = pred2
-        self.pred3 = pred3
-        self.ref = ref
-
-
 if __name__ == "__main__":
     # Define optional arguments for script
     arg_parser = argparse.ArgumentParser()
@@ -103,8 +81,8 @@ if __name__ == "__main__":
     # ToDo: fails to work within Eclipse
     plt.close("all")
 
-    # Read data from pickle file
-    data = load_obj("Farmington_River_data")
+    # Read data from array store
+    data = sm.read_array_store("Farmington_River_data")
 
     # Change number of data points to illustrate effect
     # of changing number of columns
@@ -27,10 +27,9 @@ $ python taylor13.py -nosave
 The data sets are yearly time series for years 2001-2014, each stored as
 a list in a dictionary having a key of the form 'spi_2001', 'spi_2002', etc.
 There is a separate dictionary for each of the observation data set and the
-two model predictions. Each dictionary is written to its own pickle file.
-A different file suffix is used depending upon whether the file is created
-using Python 2 (.pkl) or Python 3 (.pkl3) because the pickle package is not
-cross version compatible for pickle files containing dictionaries.
+two model predictions. The dictionaries are written to an array store: a
+directory of NumPy arrays with a JSON manifest, which is loaded with
+memory-mapped arrays by read_array_store.
 
 The data in these files are statistics calculated from yearly time series of
 Standard Precipitation Index value over the Mekong basin, a trans-boundary
@@ -65,40 +64,19 @@ Authors: Peter A. Rochford
          Andre D. L. Zanchetta
 
 Created on Feb 26, 2019
-Revised on Aug 28, 2022
+Revised on Oct 18, 2026
 
 @author: rochford.peter1@gmail.com
 @author: adlzanchetta@gmail.com
 """
 
 import argparse
-import pickle
-from sys import version_info
 
 import matplotlib.pyplot as plt
 import skill_metrics as sm
 from matplotlib import rcParams
 
 
-def load_obj(name):
-    # Load object from file in pickle format
-    if version_info[0] == 2:
-        suffix = "pkl"
-    else:
-        suffix = "pkl3"
-
-    with open(name + "." + suffix, "rb") as f:
-        return pickle.load(f)  # Python2 succeeds
-
-
-class Container(object):
-    def __init__(self, target_stats1, target_stats2, taylor_stats1, taylor_stats2):
-        self.target_stats1 = target_stats1
-        self.target_stats2 = target_stats2
-        self.taylor_stats1 = taylor_stats1
-        self.taylor_stats2 = taylor_stats2
-
-
 if __name__ == "__main__":
     # Define optional arguments for script
     arg_parser = argparse.ArgumentParser()
@@ -128,8 +106,8 @@ if __name__ == "__main__":
 
     # Read Taylor statistics for ERA Interim (stats1) and TRMM (stats2)
     # data with respect to APHRODITE observations for each of years 2001 to
-    # 2014 from pickle file
-    stats = load_obj("Mekong_Basin_data_interannual")  # observations
+    # 2014 from array store
+    stats = sm.read_array_store("Mekong_Basin_data_interannual")  # observations
 
     # Specify labels for points in a dictionary because only desire labels
     # for each data set.
@@ -0,0 +1,385 @@
+"""
+This script was created to benchmark the rendering of target and Taylor
+diagrams, so that changes making the plotting path slower or heavier can be
+identified. It complements test_plots.py, which only compares the images of
+the examples.
+
+It supports the following arguments as options.
+
+-markers  : numbers of markers of the cases (Default: 10 100 1000 10000)
+-features : features of the cases among marker, legend, colorbar, panels and
+            overlay (Default: all)
+-kinds    : kinds of diagrams among taylor and target (Default: both)
+-repeat   : number of times each case is drawn, the fastest time being
+            reported (Default: 3)
+-output   : JSON file where the results are saved
+-compare  : JSON file of previous results to compare with
+
+It can be invoked from a command line as:
+
+$ python bench_diagrams.py -markers 10 100 -output before.json
+$ python bench_diagrams.py -markers 10 100 -compare before.json
+
+The script supports the argument "-h" for help (call "$ python bench_diagrams.py -h").
+
+The features of the cases are:
+
+marker   : markers without legend
+legend   : markers with a legend of one label per marker
+colorbar : markers shaded according to the RMSD with a color bar
+panels   : Taylor diagram of two panels, with negative correlations
+overlay  : a second set of markers overlaid on an existing diagram
+
+Target diagrams have a single panel, so the panels cases are only run for
+Taylor diagrams.
+
+Each case is run in a new Python process using the Agg backend and random
+statistics of a fixed seed, which gives a clean measure of the peak
+resident memory (RSS) of the case. The script reports for each case the
+time to call the diagram function ("plot"), the time to draw the figure
+("draw"), the number of artists of the figure and the peak RSS. With
+-compare, cases at least 20% slower or with more artists than before are
+flagged. An example of the script output is shown below.
+
+$ python3 bench_diagrams.py -markers 10 -features marker legend
+Running 4 cases:
+ kind    feature      markers   plot (s)   draw (s)   artists   RSS (MB)
+ taylor  marker            10      0.011      0.029       114       92.5
+ taylor  legend            10      0.014      0.040       171       92.7
+ target  marker            10      0.010      0.014       103       90.7
+ target  legend            10      0.012      0.024       160       91.1
+
+Created on Oct 18, 2026
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# ## CONSTANTS ################################################################## #
+
+KINDS = ("taylor", "target")
+FEATURES = ("marker", "legend", "colorbar", "panels", "overlay")
+MARKERS = (10, 100, 1000, 10000)
+RANDOM_SEED = 20261018
+FIGURE_SIZE = (6, 5)
+REGRESSION_RATIO = 1.2
+REPORT_HEADER = " %-7s %-10s %9s %10s %10s %9s %10s" % (
+    "kind",
+    "feature",
+    "markers",
+    "plot (s)",
+    "draw (s)",
+    "artists",
+    "RSS (MB)",
+)
+REPORT_ROW = " %-7s %-10s %9d %10.3f %10.3f %9d %10.1f"
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_statistics(kind: str, feature: str, markers: int, seed: int) -> tuple:
+    """
+    Random statistics of a reference and of the markers of a diagram
+    :param kind: 'taylor' or 'target'
+    :param feature: Feature of the case
+    :param markers: Number of markers
+    :param seed: Seed of the random number generator
+    :return: Statistics arrays in the order of the diagram function arguments
+    """
+
+    rng = np.random.default_rng(seed)
+    if kind == "taylor":
+        # Reference first, consistent statistics so they pass the checks
+        lowest = -0.99 if feature == "panels" else 0.2
+        sdev = np.append(1.0, rng.uniform(0.5, 1.5, markers))
+        ccoef = np.append(1.0, rng.uniform(lowest, 0.99, markers))
+        crmsd = np.sqrt(np.maximum(1.0 + sdev**2 - 2.0 * sdev * ccoef, 0.0))
+        crmsd[0] = 0.0
+        return sdev, crmsd, ccoef
+
+    bias = rng.normal(0.0, 0.5, markers)
+    crmsd = rng.uniform(0.1, 1.0, markers)
+    return bias, crmsd, np.hypot(bias, crmsd)
+
+
+def get_options(kind: str, feature: str, markers: int) -> dict:
+    """
+    Options of the diagram function for the feature of a case
+    :param kind: 'taylor' or 'target'
+    :param feature: Feature of the case
+    :param markers: Number of markers
+    :return: Keyword arguments of the diagram function
+    """
+
+    options = {}
+    if kind == "taylor":
+        options["checkStats"] = "on"
+    if feature == "legend":
+        labels = ["M%d" % i for i in range(markers)]
+        if kind == "taylor":
+            labels.insert(0, "Obs")
+        options["markerLabel"] = labels
+        options["markerLegend"] = "on"
+    elif feature == "colorbar":
+        options["markerDisplayed"] = "colorbar"
+        options["titleColorbar"] = "RMSD"
+    elif feature == "panels":
+        options["numberPanels"] = 2
+    return options
+
+
+def run_case(kind: str, feature: str, markers: int, repeat: int) -> dict:
+    """
+    Draws the diagram of a case, in the process running the benchmark
+    :param kind: 'taylor' or 'target'
+    :param feature: Feature of the case
+    :param markers: Number of markers
+    :param repeat: Number of times the diagram is drawn
+    :return: Measures of the case, fastest times of all the repeats
+    """
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    import skill_metrics as sm
+
+    diagram = sm.taylor_diagram if kind == "taylor" else sm.target_diagram
+    options = get_options(kind, feature, markers)
+    stats = make_statistics(kind, feature, markers, RANDOM_SEED)
+    if feature == "overlay":
+        overlay = make_statistics(kind, feature, markers, RANDOM_SEED + 1)
+
+    plot_time, draw_time = [], []
+    for _ in range(repeat):
+        fig = plt.figure(figsize=FIGURE_SIZE)
+        ax = fig.add_subplot(1, 1, 1)
+
+        start = time.perf_counter()
+        diagram(ax, *stats, **options)
+        if feature == "overlay":
+            diagram(ax, *overlay, overlay="on", markerColor="b", **options)
+        plot_time.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        fig.canvas.draw()
+        draw_time.append(time.perf_counter() - start)
+
+        artists = len(fig.findobj())
+        plt.close(fig)
+
+    return {
+        "kind": kind,
+        "feature": feature,
+        "markers": markers,
+        "plot": min(plot_time),
+        "draw": min(draw_time),
+        "artists": artists,
+        "rss": get_peak_rss(),
+    }
+
+
+def get_peak_rss() -> float:
+    """
+    Peak resident memory of the process
+    :return: Peak RSS in MB, NaN if not available on the platform
+    """
+
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return float("nan")
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+
+def get_cases(kinds: list, features: list, markers: list) -> list:
+    """
+    List cases to run
+    :param kinds: Kinds of diagrams
+    :param features: Features of the cases
+    :param markers: Numbers of markers
+    :return: List of (kind, feature, markers) tuples
+    """
+
+    return [
+        (kind, feature, number)
+        for kind in kinds
+        for feature in features
+        if kind == "taylor" or feature != "panels"
+        for number in markers
+    ]
+
+
+def evaluate_cases(cases: list, repeat: int, previous: dict) -> list:
+    """
+    Runs each case in a new process, printing its measures in to STDOUT
+    :param cases: List of (kind, feature, markers) tuples
+    :param repeat: Number of times each case is drawn
+    :param previous: Previous results by case to compare with
+    :return: List of measures of the cases
+    """
+
+    print("Running %d cases:" % len(cases))
+    print(REPORT_HEADER)
+
+    results = []
+    for kind, feature, markers in cases:
+        command = [
+            sys.executable,
+            __file__,
+            "-case",
+            kind,
+            feature,
+            str(markers),
+            "-repeat",
+            str(repeat),
+        ]
+        process = subprocess.run(command, capture_output=True, text=True)
+        if process.returncode != 0:
+            print(" %-7s %-10s %9d   failed:" % (kind, feature, markers))
+            print(process.stderr.strip())
+            continue
+
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        results.append(result)
+        row = REPORT_ROW % (
+            kind,
+            feature,
+            markers,
+            result["plot"],
+            result["draw"],
+            result["artists"],
+            result["rss"],
+        )
+
+        key = (kind, feature, markers)
+        if key in previous:
+            row += compare_results(previous[key], result)
+        print(row)
+
+    return results
+
+
+def compare_results(before: dict, after: dict) -> str:
+    """
+    Compares the measures of a case with previous ones
+    :param before: Previous measures of the case
+    :param after: Current measures of the case
+    :return: Changes to append to the report of the case
+    """
+
+    time_before = before["plot"] + before["draw"]
+    time_after = after["plot"] + after["draw"]
+    ratio = time_after / time_before if time_before > 0 else 1.0
+
+    flags = []
+    if ratio >= REGRESSION_RATIO:
+        flags.append("SLOWER")
+    if after["artists"] > before["artists"]:
+        flags.append("MORE ARTISTS (%+d)" % (after["artists"] - before["artists"]))
+    return "   x%.2f %s" % (ratio, ", ".join(flags) if flags else "GOOD")
+
+
+def read_results(file_name: str) -> dict:
+    """
+    Reads results saved by a previous run
+    :param file_name: JSON file of the results
+    :return: Results by (kind, feature, markers)
+    """
+
+    with open(file_name) as file:
+        results = json.load(file)["results"]
+    return {(r["kind"], r["feature"], r["markers"]): r for r in results}
+
+
+def write_results(file_name: str, results: list) -> None:
+    """
+    Saves the results with the versions of the software measured
+    :param file_name: JSON file of the results
+    :param results: List of measures of the cases
+    :return: None
+    """
+
+    import matplotlib
+
+    environment = {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+    with open(file_name, "w") as file:
+        json.dump({"environment": environment, "results": results}, file, indent=1)
+
+    return None
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        "-markers",
+        dest="markers",
+        type=int,
+        nargs="+",
+        default=MARKERS,
+        help="Numbers of markers of the cases.",
+    )
+    arg_parser.add_argument(
+        "-features",
+        dest="features",
+        nargs="+",
+        choices=FEATURES,
+        default=FEATURES,
+        help="Features of the cases.",
+    )
+    arg_parser.add_argument(
+        "-kinds",
+        dest="kinds",
+        nargs="+",
+        choices=KINDS,
+        default=KINDS,
+        help="Kinds of diagrams.",
+    )
+    arg_parser.add_argument(
+        "-repeat",
+        dest="repeat",
+        type=int,
+        default=3,
+        help="Number of times each case is drawn.",
+    )
+    arg_parser.add_argument(
+        "-output", dest="output", help="JSON file where the results are saved."
+    )
+    arg_parser.add_argument(
+        "-compare", dest="compare", help="JSON file of previous results."
+    )
+    arg_parser.add_argument("-case", dest="case", nargs=3, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    del arg_parser
+
+    if args.case:
+        # Single case in the process started by evaluate_cases
+        kind, feature, markers = args.case
+        print(json.dumps(run_case(kind, feature, int(markers), args.repeat)))
+        sys.exit(0)
+
+    previous = read_results(args.compare) if args.compare else {}
+    cases = get_cases(args.kinds, args.features, args.markers)
+    results = evaluate_cases(cases, args.repeat, previous)
+
+    if args.output:
+        write_results(args.output, results)
+        print("Results were saved to '%s'." % args.output)
@@ -0,0 +1,252 @@
+"""
+This script was created to verify that data written to array stores by
+write_array_store and convert_data_file are read back by read_array_store
+in their original structure with memory-mapped arrays, and that the array
+stores of the examples hold the data of their pickle files. MATLAB 7.3
+files are checked to give arrays in the orientation of MATLAB, as MATLAB 5
+files do, when h5py (and scipy) are installed.
+
+It can be invoked from a command line as:
+
+$ python test_array_store.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_array_store.py
+
+Created on Oct 18, 2026
+"""
+
+import datetime
+import importlib.util
+import os
+import sys
+import tempfile
+import warnings
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+EXAMPLES_FOLDER = os.path.join(os.path.dirname(__file__), "..", "Examples")
+EXAMPLE_DATA = (
+    "Farmington_River_data",
+    "Mekong_Basin_data",
+    "Mekong_Basin_data_interannual",
+    "target_data",
+    "taylor_data",
+)
+
+
+MATLAB_HEADER = b"MATLAB 7.3 MAT-file, Platform: GLNXA64, HDF5 schema 1.00 ."
+MATLAB_DATA = {  # in the order of the names, as read from HDF5 files
+    "column": np.arange(5, dtype=np.int32),
+    "flags": np.array([[True, False, True], [False, True, True]]),
+    "large": np.arange(40000.0).reshape(4, 10000),
+    "matrix": np.arange(12.0).reshape(3, 4),
+    "name": "obs",
+    "row": np.arange(5.0),
+    "scalar": 2.5,
+}
+MATLAB_CLASSES = {"f": "double", "i": "int32", "b": "logical"}
+
+
+# ## DEFS ####################################################################### #
+
+
+def skip(reason: str) -> None:
+    """
+    Skips a test under pytest, or reports it when run as a script
+    :param reason: Reason for skipping the test
+    """
+
+    if "pytest" in sys.modules:
+        import pytest
+
+        pytest.skip(reason)
+    print("Skipped:", reason)
+
+
+def write_matlab_73(file_name: str) -> None:
+    """
+    Writes MATLAB_DATA as MATLAB 7.3 does: transposed HDF5 datasets with
+    their MATLAB class, after a header of 512 bytes
+    :param file_name: Name of the MAT file
+    """
+
+    import h5py
+
+    with h5py.File(file_name, "w", userblock_size=512) as file:
+        for name, value in MATLAB_DATA.items():
+            if isinstance(value, str):
+                codes = np.frombuffer(value.encode("utf-16-le"), dtype=np.uint16)
+                dataset = file.create_dataset(name, data=codes.reshape(-1, 1))
+                dataset.attrs["MATLAB_class"] = np.bytes_("char")
+                continue
+
+            # MATLAB vectors are 1xN (or Nx1) and scalars 1x1
+            array = np.asarray(value)
+            if name == "column":
+                array = array.reshape(-1, 1)
+            elif array.ndim < 2:
+                array = array.reshape(1, -1)
+            matlab_class = MATLAB_CLASSES[array.dtype.kind]
+            if array.dtype == bool:
+                array = array.astype(np.uint8)
+            dataset = file.create_dataset(name, data=array.T)
+            dataset.attrs["MATLAB_class"] = np.bytes_(matlab_class)
+    with open(file_name, "r+b") as file:
+        file.write(MATLAB_HEADER.ljust(512))
+
+
+class ArrayLike:
+    """
+    Array read by slices only, as the datasets of HDF5 files
+    """
+
+    def __init__(self, array):
+        self.shape = array.shape
+        self.dtype = array.dtype
+        self._array = array
+
+    def __getitem__(self, index):
+        return self._array[index]
+
+
+def assert_same(value, expected) -> None:
+    """
+    Values of the same structure and contents
+    :param value: Value read from an array store
+    :param expected: Value stored
+    """
+
+    if isinstance(expected, np.ndarray):
+        assert value.dtype == expected.dtype
+        assert np.array_equal(value, expected)
+    elif isinstance(expected, dict) or hasattr(expected, "__dict__"):
+        expected = expected if isinstance(expected, dict) else vars(expected)
+        value = value if isinstance(value, dict) else vars(value)
+        assert list(value) == list(expected)
+        for key in expected:
+            assert_same(value[key], expected[key])
+    else:
+        assert type(value) is type(expected) and value == expected
+
+
+def test_round_trip() -> None:
+    """
+    Structure, values and types read back, arrays memory-mapped
+    """
+
+    rng = np.random.default_rng(23)
+    series = rng.normal(size=(1000, 3))
+    data = {
+        "ref": {
+            "data": series[:, 0],
+            "date": [datetime.date(2008, 5, 3), datetime.date(2008, 5, 4)],
+            "time": [datetime.time(6, 8), datetime.time(12, 30, 15)],
+            "units": "cell/L",
+            "station": [56, 57],
+        },
+        "grid": ArrayLike(series),
+        "labels": ["Obs", "M1"],
+        "mixed": [1, "a", None],
+        "weight": 0.5,
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = os.path.join(directory, "store")
+        sm.write_array_store(store, data)
+        read = sm.read_array_store(store)
+        assert isinstance(read["ref"]["data"], np.memmap)
+        assert np.array_equal(read.pop("grid"), series)
+        expected = dict(data)
+        del expected["grid"]
+        assert_same(read, expected)
+
+        # Stores are only replaced on request
+        try:
+            sm.write_array_store(store, {})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Existing store overwritten")
+        sm.write_array_store(store, {"weight": 1.0}, overwrite=True)
+        assert sm.read_array_store(store, mmap=False) == {"weight": 1.0}
+
+        # Arrays opened from a replaced store remain readable, a failed
+        # write keeps the store, and no temporary directory is left over
+        sm.write_array_store(store, {"data": series}, overwrite=True)
+        opened = sm.read_array_store(store)["data"]
+        sm.write_array_store(store, {"data": series[:10]}, overwrite=True)
+        assert np.array_equal(opened, series)
+        try:
+            sm.write_array_store(store, {"bad": {1: 2}}, overwrite=True)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid data stored")
+        assert np.array_equal(sm.read_array_store(store)["data"], series[:10])
+        assert os.listdir(directory) == ["store"]
+
+
+def test_examples() -> None:
+    """
+    Array stores of the examples equal to their pickle files
+    """
+
+    with tempfile.TemporaryDirectory() as directory, warnings.catch_warnings():
+        # pickles of numpy.core arrays read without deprecation warnings
+        warnings.simplefilter("error", DeprecationWarning)
+        for name in EXAMPLE_DATA:
+            store = os.path.join(directory, name)
+            sm.convert_data_file(os.path.join(EXAMPLES_FOLDER, name + ".pkl3"), store)
+            example = sm.read_array_store(os.path.join(EXAMPLES_FOLDER, name))
+            assert_same(example, sm.read_array_store(store))
+    assert isinstance(example.ref["date"][0], datetime.date)
+
+
+def test_matlab_73() -> None:
+    """
+    Arrays of MATLAB 7.3 files in the orientation of MATLAB 5 files
+    """
+
+    if importlib.util.find_spec("h5py") is None:
+        skip("h5py is not installed")
+        return
+
+    writer = sys.modules["skill_metrics.write_array_store"]
+    chunk_bytes = writer.CHUNK_BYTES
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "data73.mat")
+        write_matlab_73(file_name)
+        try:
+            writer.CHUNK_BYTES = 4096  # copy the large array in slices
+            store = sm.convert_data_file(file_name)
+        finally:
+            writer.CHUNK_BYTES = chunk_bytes
+        data = sm.read_array_store(store)
+        assert_same(data, MATLAB_DATA)
+
+        # Same arrays as read from a MATLAB 5 file by scipy
+        if importlib.util.find_spec("scipy") is not None:
+            from scipy.io import savemat
+
+            # (savemat writes logical arrays as uint8)
+            expected = dict(MATLAB_DATA, column=MATLAB_DATA["column"][:, None])
+            del expected["flags"]
+            file_name = os.path.join(directory, "data5.mat")
+            savemat(file_name, expected)
+            del data["flags"]
+            assert_same(sm.read_array_store(sm.convert_data_file(file_name)), data)
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_examples()
+    test_matlab_73()
+    print("Array stores are consistent.")
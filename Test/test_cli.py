@@ -0,0 +1,179 @@
+"""
+This script was created to verify the skill-metrics command line of
+skill_metrics.cli: that the statistics tables of score are those of the
+metric functions, for files paired by glob patterns or by a manifest and
+aligned by position or by time, that a failing pair is reported without
+stopping the others, and that plot draws the diagrams of each group with
+a pool of workers.
+
+It can be invoked from a command line as:
+
+$ python test_cli.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_cli.py
+
+Created on Oct 18, 2026
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+import skill_metrics as sm
+from skill_metrics.cli import main
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 29
+NUMBER_ROWS = 300
+NUMBER_MODELS = 4
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+# ## DEFS ####################################################################### #
+
+
+def write_series(file_name, time, values) -> None:
+    """
+    Writes a CSV file of a time series
+    :param file_name: Name of the CSV file
+    :param time: Times of the series
+    :param values: Values of the series
+    :return: None
+    """
+
+    with open(file_name, "w") as file:
+        file.write("time,flow\n")
+        for t, value in zip(time, values):
+            file.write("%r,%r\n" % (float(t), float(value)))
+
+    return None
+
+
+def write_files(folder, rng) -> tuple:
+    """
+    Writes a reference series and model series shifted in time
+    :param folder: Folder of the files
+    :param rng: Random number generator
+    :return: (reference values, list of model values)
+    """
+
+    time = np.arange(NUMBER_ROWS, dtype=float)
+    reference = np.sin(time / 20)
+    write_series(os.path.join(folder, "obs.csv"), time, reference)
+    os.mkdir(os.path.join(folder, "models"))
+    models = []
+    for i in range(NUMBER_MODELS):
+        values = reference + rng.normal(0, 0.1 * (i + 1), NUMBER_ROWS)
+        file_name = os.path.join(folder, "models", "m%d.csv" % i)
+        write_series(file_name, time + 0.2, values)
+        models.append(values)
+
+    return reference, models
+
+
+def test_score() -> None:
+    """
+    Statistics of score are those of the metric functions
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    with tempfile.TemporaryDirectory() as folder:
+        reference, models = write_files(folder, rng)
+        output = os.path.join(folder, "stats.csv")
+        arguments = ["--reference", os.path.join(folder, "obs.csv")]
+        arguments += ["--predicted", os.path.join(folder, "models", "*.csv")]
+        arguments += ["--output", output, "--workers", "1", "--quiet"]
+
+        # By position, without cache files next to the input files
+        assert main(["score"] + arguments) == 0
+        assert not os.path.isfile(os.path.join(folder, "obs.csv.npz"))
+        table = sm.read_stats_table(output, tidy=True)
+        assert list(table["label"]) == ["m%d" % i for i in range(NUMBER_MODELS)]
+        for i, values in enumerate(models):
+            assert np.isclose(table["rmsd"][i], sm.rmsd(values, reference))
+            assert np.isclose(table["crmsd"][i], sm.centered_rms_dev(values, reference))
+            assert np.isclose(table["nse"][i], sm.nash_sutcliffe_eff(values, reference))
+            assert np.isclose(table["ccoef"][i], np.corrcoef(values, reference)[0, 1])
+
+        # An existing table is only replaced or appended to on request
+        try:
+            main(["score"] + arguments)
+        except SystemExit as error:
+            assert error.code == 2
+        else:
+            raise AssertionError("Existing table overwritten")
+        assert main(["score", "--append", "--cache"] + arguments) == 0
+        assert os.path.isfile(os.path.join(folder, "obs.csv.npz"))
+        appended = sm.read_stats_table(output, tidy=True)
+        assert np.array_equal(appended["rmsd"], np.tile(table["rmsd"], 2))
+        arguments.append("--overwrite")
+
+        # By time, the same values as the shift is within the tolerance
+        arguments += ["--time", "time", "--method", "nearest", "--tolerance", "0.5"]
+        assert main(["score", "--metrics", "bias,rmsd"] + arguments) == 0
+        timed = sm.read_stats_table(output, tidy=True)
+        assert [name for name in timed if name not in ("set", "title", "label")] == [
+            "bias",
+            "rmsd",
+        ]
+        assert np.allclose(timed["rmsd"], table["rmsd"])
+        assert np.allclose(timed["bias"], table["bias"])
+
+        # A failing pair does not stop the others
+        with open(os.path.join(folder, "models", "m1.csv"), "w") as file:
+            file.write("time,flow\n0.2,none\n")
+        assert main(["score"] + arguments) == 1
+        failed = sm.read_stats_table(output, tidy=True)
+        assert np.isnan(failed["rmsd"][1])
+        assert np.allclose(np.delete(failed["rmsd"], 1), np.delete(table["rmsd"], 1))
+
+    return None
+
+
+def test_plot() -> None:
+    """
+    Diagrams of each group of a manifest are drawn with a pool of workers
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    with tempfile.TemporaryDirectory() as folder:
+        write_files(folder, rng)
+        manifest = os.path.join(folder, "pairs.csv")
+        with open(manifest, "w") as file:
+            file.write("reference,predicted,group\n")
+            for i in range(NUMBER_MODELS):
+                group = "low" if i < 2 else "high"
+                file.write("obs.csv,models/m%d.csv,%s\n" % (i, group))
+
+        output_dir = os.path.join(folder, "figures")
+        arguments = ["plot", "--manifest", manifest, "--output-dir", output_dir]
+        arguments += ["--output", os.path.join(folder, "stats.npz")]
+        assert main(arguments + ["--workers", "2", "--quiet"]) == 0
+
+        assert sorted(os.listdir(output_dir)) == [
+            "target_high.png",
+            "target_low.png",
+            "taylor_high.png",
+            "taylor_low.png",
+        ]
+        for file_name in os.listdir(output_dir):
+            with open(os.path.join(output_dir, file_name), "rb") as file:
+                assert file.read(8) == PNG_SIGNATURE
+
+        table = sm.read_stats_table(os.path.join(folder, "stats.npz"))
+        assert [data["title"] for data in table] == ["low", "high"]
+        assert [len(data["label"]) for data in table] == [2, 2]
+
+    return None
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_score()
+    test_plot()
+    print("Command line is consistent.")
@@ -0,0 +1,196 @@
+"""
+This script was created to verify that options compiled once with
+compile_taylor_diagram_options / compile_target_diagram_options produce the
+same diagrams as passing the keywords to every call.
+
+Each case is rendered with keyword arguments and with the compiled options,
+and the resulting pixels are compared. The compiled options are reused for
+several diagrams with different data, including Taylor diagrams with and
+without negative correlations, so that values depending on the data (axis
+limits, ticks, number of panels) must be determined again for every call.
+Options files given with compiled options are also read and applied.
+
+It can be invoked from a command line as:
+
+$ python test_compiled_options.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_compiled_options.py
+
+Created on Oct 18, 2026
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import os
+import tempfile
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+FIGURE_SIZE = (6, 5)
+FIGURE_DPI = 72
+RANDOM_SEED = 7
+LABELS = ["Ref", "M1", "M2", "M3", "M4", "M5"]
+TAYLOR_KWARGS = {"markerLabel": LABELS, "markerLegend": "on", "styleOBS": "-"}
+TARGET_KWARGS = {"markerLabel": LABELS[1:], "markerLegend": "on", "circles": [1, 2]}
+
+
+# ## DEFS ####################################################################### #
+
+
+def get_taylor_stats(scale: float, negative: bool) -> tuple:
+    """
+    Create a consistent set of Taylor statistics with a fixed seed
+    :param scale: Standard deviation of the reference series
+    :param negative: If True some of the correlations are negative
+    :return: (STDs, RMSs, CORs) with the reference series as first element
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    sdev = scale * np.concatenate(([1.0], rng.uniform(0.5, 1.5, 5)))
+    low = -0.9 if negative else 0.3
+    ccoef = np.concatenate(([1.0], rng.uniform(low, 0.99, 5)))
+    crmsd = np.sqrt(sdev**2 + sdev[0] ** 2 - 2 * sdev * sdev[0] * ccoef)
+    return sdev, crmsd, ccoef
+
+
+def get_target_stats(scale: float) -> tuple:
+    """
+    Create a consistent set of target statistics with a fixed seed
+    :param scale: Scale of the statistics
+    :return: (Bs, RMSDs, RMSDz)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = scale * rng.uniform(-1.0, 1.0, 5)
+    crmsd = scale * rng.uniform(0.1, 1.0, 5)
+    rmsd = np.sqrt(bias**2 + crmsd**2)
+    return bias, crmsd, rmsd
+
+
+def render(diagram, stats: tuple, **kwargs) -> np.ndarray:
+    """
+    Render a single diagram on a new Figure
+    :param diagram: sm.taylor_diagram or sm.target_diagram
+    :param stats: Statistics passed to the diagram function
+    :param kwargs: Options passed to the diagram function
+    :return: RGBA pixels of the rendered figure
+    """
+
+    fig = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    diagram(ax, *stats, **kwargs)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def test_compiled_taylor_options() -> None:
+    """
+    Compiled options must give the same Taylor diagrams as keywords
+    """
+
+    opts = sm.compile_taylor_diagram_options(**TAYLOR_KWARGS)
+    for scale, negative in ((1.0, False), (10.0, True), (0.5, False)):
+        stats = get_taylor_stats(scale, negative)
+        expected = render(sm.taylor_diagram, stats, **TAYLOR_KWARGS)
+        image = render(sm.taylor_diagram, stats, options=opts)
+        assert np.array_equal(image, expected), (scale, negative)
+
+    # the compiled options must not be changed by drawing
+    assert opts["axismax"] == 0.0
+    assert len(opts["tickrms"]) == 0
+
+
+def test_compiled_target_options() -> None:
+    """
+    Compiled options must give the same target diagrams as keywords, also
+    when further keywords are applied on top of them
+    """
+
+    opts = sm.compile_target_diagram_options(**TARGET_KWARGS)
+    for scale in (1.0, 3.0):
+        stats = get_target_stats(scale)
+        expected = render(sm.target_diagram, stats, **TARGET_KWARGS)
+        image = render(sm.target_diagram, stats, options=opts)
+        assert np.array_equal(image, expected), scale
+
+    stats = get_target_stats(1.0)
+    expected = render(sm.target_diagram, stats, **TARGET_KWARGS, alpha=0.5)
+    image = render(sm.target_diagram, stats, options=opts, alpha=0.5)
+    assert np.array_equal(image, expected)
+    assert opts["alpha"] == 1.0
+
+
+def test_compiled_options_file() -> None:
+    """
+    Options file applied on top of compiled options, keywords on top of it
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "options.csv")
+        with open(file_name, "w") as file:
+            file.write("KEY,VALUE\nmarkersize,14\nalpha,0.5\n")
+
+        CORs = np.array([1.0, 0.5])
+        opts = sm.compile_taylor_diagram_options(**TAYLOR_KWARGS)
+        option = sm.get_taylor_diagram_options(
+            CORs, options=opts, taylor_options_file=file_name, alpha=0.7
+        )
+        assert (option["markersize"], option["alpha"]) == (14, 0.7)
+        assert opts["markersize"] == 10
+
+        opts = sm.compile_target_diagram_options(**TARGET_KWARGS)
+        option = sm.get_target_diagram_options(
+            options=opts, target_options_file=file_name
+        )
+        assert (option["markersize"], option["alpha"]) == (14, 0.5)
+        assert option["circles"] == [1, 2]
+
+        # A missing file is not ignored
+        missing = os.path.join(directory, "missing.csv")
+        calls = (
+            (sm.get_taylor_diagram_options, (CORs,), "taylor", "taylor_options_file"),
+            (sm.get_target_diagram_options, (), "target", "target_options_file"),
+        )
+        for getter, args, kind, name in calls:
+            opts = getattr(sm, "compile_%s_diagram_options" % kind)()
+            try:
+                getter(*args, options=opts, **{name: missing})
+            except Exception as error:
+                assert "does not exist" in str(error)
+            else:
+                raise AssertionError("Missing %s ignored" % name)
+
+
+def test_compiled_options_kind() -> None:
+    """
+    Options compiled for one kind of diagram are rejected by the other
+    """
+
+    opts = sm.compile_target_diagram_options()
+    try:
+        sm.get_taylor_diagram_options(np.array([1.0]), options=opts)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("target options accepted by taylor_diagram")
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_compiled_taylor_options()
+    test_compiled_target_options()
+    test_compiled_options_file()
+    test_compiled_options_kind()
+    print("Compiled options match keyword options.")
@@ -0,0 +1,192 @@
+"""
+This script was created to verify the 'density' display of markers of
+Taylor and target diagrams: the points are binned in polar coordinates on
+a Taylor diagram and in Cartesian coordinates on a target diagram, and
+drawn as a single rasterized mesh whose counts sum to the points within
+the domain of the diagram, without an artist per point. It also checks
+the color scaling and colorbar options, and the validation of the number
+of bins and of the kind of diagram.
+
+It can be invoked from a command line as:
+
+$ python test_density_display.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_density_display.py
+
+Created on Oct 18, 2026
+"""
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PathCollection, QuadMesh
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_POINTS = 50000
+NUMBER_BINS = 40
+AXIS_MAX = 1.5
+RANDOM_SEED = 5
+
+
+# ## DEFS ####################################################################### #
+
+
+def new_axes():
+    """
+    Axes of a new figure outside of pyplot
+    :return: matplotlib.axes.Axes
+    """
+
+    fig = Figure(figsize=(6, 5))
+    FigureCanvasAgg(fig)
+    return fig.add_subplot(1, 1, 1)
+
+
+def density_mesh(ax) -> QuadMesh:
+    """
+    The single mesh of the density display, without per-point artists
+    :param ax: Axes of the diagram
+    :return: Mesh of the counts
+    """
+
+    meshes = [c for c in ax.collections if isinstance(c, QuadMesh)]
+    assert len(meshes) == 1
+    assert meshes[0].get_rasterized()
+    assert not any(isinstance(c, PathCollection) for c in ax.collections)
+    assert all(len(line.get_xdata()) < NUMBER_POINTS for line in ax.lines)
+    return meshes[0]
+
+
+def taylor_stats(rng) -> tuple:
+    """
+    Statistics of a Taylor diagram, some points beyond the axis limit
+    :param rng: Random number generator
+    :return: Standard deviations, centered RMS differences, correlations
+    """
+
+    sdev = rng.uniform(0.0, 2.0, NUMBER_POINTS)
+    ccoef = rng.uniform(0.0, 1.0, NUMBER_POINTS)
+    sdev[0], ccoef[0] = 1.0, 1.0
+    crmsd = np.sqrt(1.0 + sdev**2 - 2.0 * sdev * ccoef)
+    return sdev, crmsd, ccoef
+
+
+def test_taylor_density() -> None:
+    """
+    Points of a Taylor diagram binned in standard deviation and angle
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    sdev, crmsd, ccoef = taylor_stats(rng)
+
+    ax = new_axes()
+    sm.taylor_diagram(
+        ax,
+        sdev,
+        crmsd,
+        ccoef,
+        markerDisplayed="density",
+        densityBins=NUMBER_BINS,
+        axismax=AXIS_MAX,
+        checkStats="off",
+    )
+
+    mesh = density_mesh(ax)
+    counts = mesh.get_array()
+    assert counts.size == NUMBER_BINS**2
+    assert counts.sum() == np.count_nonzero(sdev[1:] <= AXIS_MAX)
+    assert isinstance(mesh.norm, LogNorm)
+
+    # Corners of the bins on the circles of the diagram
+    corners = mesh.get_coordinates()
+    assert np.allclose(np.hypot(corners[-1, :, 0], corners[-1, :, 1]), AXIS_MAX)
+    assert len(ax.figure.axes) == 2
+
+    ax.figure.canvas.draw()
+
+
+def test_target_density() -> None:
+    """
+    Points of a target diagram binned in uRMSD and bias
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.normal(0.0, 1.0, NUMBER_POINTS)
+    crmsd = rng.normal(0.0, 1.0, NUMBER_POINTS)
+
+    ax = new_axes()
+    sm.target_diagram(
+        ax,
+        bias,
+        crmsd,
+        np.hypot(bias, crmsd),
+        markerDisplayed="density",
+        densityBins=NUMBER_BINS,
+        densityScale="Linear",
+        densityColorBar="off",
+        axismax=AXIS_MAX,
+    )
+
+    mesh = density_mesh(ax)
+    counts = mesh.get_array()
+    inside = (np.abs(bias) <= AXIS_MAX) & (np.abs(crmsd) <= AXIS_MAX)
+    assert counts.size == NUMBER_BINS**2
+    assert counts.sum() == np.count_nonzero(inside)
+    assert not isinstance(mesh.norm, LogNorm)
+
+    # Square bins of the whole domain
+    corners = mesh.get_coordinates()
+    assert np.allclose(corners[0, 0], [-AXIS_MAX, -AXIS_MAX])
+    assert np.allclose(corners[-1, -1], [AXIS_MAX, AXIS_MAX])
+    assert len(ax.figure.axes) == 1
+
+    ax.figure.canvas.draw()
+
+
+def test_density_options() -> None:
+    """
+    Invalid number of bins and color scaling rejected
+    """
+
+    assert sm.check_density_bins(25) == 25
+    assert sm.check_density_bins("25") == 25
+    assert sm.check_density_bins(25.0) == 25
+    assert sm.check_density_scale("LOG") == "log"
+    for value in (0, -3, 2.7, "2.5", True, "many", None):
+        try:
+            sm.get_target_diagram_options(densitybins=value)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid number of bins accepted: %r" % value)
+    for value in ("sqrt", 1):
+        try:
+            sm.get_taylor_diagram_options(np.array([1.0, 0.5]), densityscale=value)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid color scaling accepted: %r" % value)
+
+    # The kind of diagram is given, not guessed from the options
+    option = sm.get_target_diagram_options(axismax=AXIS_MAX)
+    try:
+        sm.plot_pattern_diagram_density(new_axes(), [0.5], [0.5], option, "polar")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid kind of diagram accepted")
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_taylor_density()
+    test_target_density()
+    test_density_options()
+    print("Density displays are consistent.")
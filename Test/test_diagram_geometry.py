@@ -0,0 +1,105 @@
+"""
+This script was created to verify the grid geometry of Taylor and target
+diagrams computed by get_taylor_diagram_geometry and
+get_target_diagram_geometry without rendering any figure.
+
+It checks that the geometry is memoized and read-only, and that the grid
+lies within the bounds of the diagram.
+
+It can be invoked from a command line as:
+
+$ python test_diagram_geometry.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_diagram_geometry.py
+
+Created on Oct 18, 2026
+"""
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+TOLERANCE = 1.0e-12
+
+
+# ## DEFS ####################################################################### #
+
+
+def get_taylor_inputs(numberpanels: int) -> tuple:
+    """
+    Axes and options as returned by get_taylor_diagram_axes
+    :param numberpanels: Number of panels of the diagram
+    :return: (axes, option)
+    """
+
+    cors = np.array([1.0, -0.5]) if numberpanels == 2 else np.array([1.0, 0.5])
+    option = sm.get_taylor_diagram_options(cors, tickrms=[0.5, 1.0, 1.5, 3.5])
+    option["axismax"] = 2.0
+    option["tickstd"] = np.arange(0.5, 2.5, 0.5)
+    option["rincstd"] = 0.5
+    axes = {"dx": 1.0, "rinc": 0.5, "rmax": 2.0, "rmin": 0}
+    return axes, option
+
+
+def test_taylor_geometry() -> None:
+    """
+    Taylor grid lies within the outer boundary and is memoized
+    """
+
+    for numberpanels in (1, 2):
+        axes, option = get_taylor_inputs(numberpanels)
+        geometry = sm.get_taylor_diagram_geometry(axes, option)
+
+        # Same arrays for the same axes
+        assert sm.get_taylor_diagram_geometry(axes, option) is geometry
+        assert not geometry["cor_lines"].flags.writeable
+
+        # STD ticks mirrored for two panels
+        std_ticks = geometry["std_ticks"]
+        assert len(std_ticks) == numberpanels * len(option["tickstd"])
+
+        # RMS arcs end inside the boundary, the 3.5 circle is not drawn
+        assert list(geometry["rms_ticks"]) == [0.5, 1.0, 1.5]
+        for x, y in geometry["rms_arcs"]:
+            assert np.all(np.hypot(x, y) <= axes["rmax"] + TOLERANCE)
+        assert geometry["rms_arc_angles"].shape == (3, 2)
+        assert geometry["rms_label_text"] == ("0.5", "1.0", "1.5")
+
+        # Correlation lines from the origin to the boundary
+        lengths = np.hypot(*geometry["cor_lines"][:, 1, :].T)
+        assert np.allclose(lengths, axes["rmax"])
+        corr = option["tickcor"][numberpanels - 1]
+        assert len(geometry["cor_label_text"]) == len(corr)
+
+
+def test_target_geometry() -> None:
+    """
+    Target circles beyond the axis limit are not drawn
+    """
+
+    option = sm.get_target_diagram_options(circles=[0.5, 1.0, 3.0])
+    option["axismax"] = 2.0
+    geometry = sm.get_target_diagram_geometry(option)
+
+    assert sm.get_target_diagram_geometry(option) is geometry
+    assert list(geometry["circles"]) == [0.5, 1.0]
+    for radius, (x, y) in zip(geometry["circles"], geometry["circle_xy"]):
+        assert np.allclose(np.hypot(x, y), radius)
+    assert geometry["reference"] is None
+    assert geometry["obsuncertainty"] is None
+
+    # Vertices of all the circles for a single LineCollection
+    assert len(geometry["segments"]) == 2
+    assert np.allclose(np.hypot(*geometry["segments"][1].T), 1.0)
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_taylor_geometry()
+    test_target_geometry()
+    print("Diagram geometry is consistent.")
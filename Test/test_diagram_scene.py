@@ -0,0 +1,174 @@
+"""
+This script was created to verify the scenes of Taylor and target diagrams
+built by taylor_diagram_scene and target_diagram_scene, and their output as
+SVG and JSON documents by write_diagram_svg and write_diagram_json.
+
+It checks that the scenes contain the grid, markers, labels and color bar
+of the diagrams, that they can be serialized to JSON and back, and that the
+SVG documents are well formed.
+
+It can be invoked from a command line as:
+
+$ python test_diagram_scene.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_diagram_scene.py
+
+Created on Oct 18, 2026
+"""
+
+import json
+import xml.etree.ElementTree as ElementTree
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_SERIES = 10
+RANDOM_SEED = 5
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+
+# ## DEFS ####################################################################### #
+
+
+def get_taylor_stats() -> tuple:
+    """
+    Consistent Taylor statistics of a reference and NUMBER_SERIES series
+    :return: (sdev, crmsd, ccoef)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    sdev = np.append(1.0, rng.uniform(0.5, 1.5, NUMBER_SERIES))
+    ccoef = np.append(1.0, rng.uniform(0.3, 0.99, NUMBER_SERIES))
+    crmsd = np.sqrt(sdev**2 + 1.0 - 2.0 * sdev * ccoef)
+    return sdev, crmsd, ccoef
+
+
+def items_of_type(scene: dict, kind: str) -> list:
+    """
+    Items of a scene of the given type
+    :param scene: Scene returned by taylor_diagram_scene or target_diagram_scene
+    :param kind: Type of the items, e.g. 'markers'
+    :return: List of items
+    """
+
+    return [item for item in scene["items"] if item["type"] == kind]
+
+
+def check_svg(scene: dict) -> ElementTree.Element:
+    """
+    SVG document of a scene is well formed and references defined symbols
+    :param scene: Scene to write
+    :return: Root element of the SVG document
+    """
+
+    svg = sm.write_diagram_svg(scene)
+    root = ElementTree.fromstring(svg)
+    assert root.tag == SVG_NAMESPACE + "svg"
+    assert root.get("width") == "%.1fpt" % scene["size"][0]
+
+    # Every marker refers to a symbol defined once
+    defined = {path.get("id") for path in root.iter(SVG_NAMESPACE + "path")}
+    for use in root.iter(SVG_NAMESPACE + "use"):
+        assert use.get("href")[1:] in defined
+
+    # Same document for the same scene
+    assert sm.write_diagram_svg(scene) == svg
+    return root
+
+
+def test_taylor_scene() -> None:
+    """
+    Taylor scene with the grid, markers and legend of the diagram
+    """
+
+    sdev, crmsd, ccoef = get_taylor_stats()
+    labels = ["Obs"] + ["M%d" % i for i in range(NUMBER_SERIES)]
+    option = sm.compile_taylor_diagram_options(
+        markerLabel=labels, markerLegend="on", tickRMS=[0.5, 1.0]
+    )
+    scene = sm.taylor_diagram_scene(sdev, crmsd, ccoef, options=option)
+
+    # One arc per RMS tick about the observation point
+    arcs = [item for item in items_of_type(scene, "circle") if "angles" in item]
+    assert [arc["radius"] for arc in arcs] == [0.5, 1.0]
+    assert all(arc["center"] == [1.0, 0.0] for arc in arcs)
+
+    # Markers of the series and of the legend, all inside the diagram
+    markers = items_of_type(scene, "markers")
+    assert len(markers) == 2
+    positions = np.array(markers[0]["positions"])
+    assert len(positions) == NUMBER_SERIES
+    assert np.all(np.hypot(*positions.T) <= scene["frame"][1])
+    texts = [item["text"] for item in items_of_type(scene, "text")]
+    assert all(label in texts for label in labels[1:])
+
+    # Legend beside the diagram
+    assert scene["limits"][1] > scene["frame"][1]
+    assert min(np.array(markers[1]["positions"])[:, 0]) > scene["frame"][1]
+
+    # Same scene through JSON
+    assert json.loads(sm.write_diagram_json(scene)) == scene
+    check_svg(scene)
+
+
+def test_target_scene() -> None:
+    """
+    Target scene with markers shaded by a color bar
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.uniform(-1.0, 1.0, NUMBER_SERIES)
+    crmsd = rng.uniform(0.1, 1.0, NUMBER_SERIES)
+    rmsd = np.hypot(bias, crmsd)
+    scene = sm.target_diagram_scene(
+        bias,
+        crmsd,
+        rmsd,
+        markerDisplayed="colorBar",
+        locationColorBar="EastOutside",
+        titleColorBar="RMSD",
+        circles=[0.5, 1.0],
+    )
+
+    circles = items_of_type(scene, "circle")
+    assert [circle["radius"] for circle in circles] == [0.5, 1.0]
+
+    # Colors of the markers follow the colormap over the RMSD range
+    markers = items_of_type(scene, "markers")[0]
+    assert len(markers["facecolor"]) == NUMBER_SERIES
+    gradient = items_of_type(scene, "gradient")[0]
+    assert markers["facecolor"][np.argmin(rmsd)] == gradient["colors"][0]
+    assert markers["facecolor"][np.argmax(rmsd)] == gradient["colors"][-1]
+    assert gradient["rect"][0] > scene["frame"][1]
+    assert "RMSD" in [item["text"] for item in items_of_type(scene, "text")]
+
+    root = check_svg(scene)
+    assert len(list(root.iter(SVG_NAMESPACE + "linearGradient"))) == 1
+
+
+def test_taylor_axes_without_ax() -> None:
+    """
+    Radial ticks determined without matplotlib axes
+    """
+
+    sdev, crmsd, ccoef = get_taylor_stats()
+    option = sm.get_taylor_diagram_options(ccoef)
+    axes = sm.get_taylor_diagram_axes(None, sdev, option)
+
+    assert axes["rmax"] >= np.max(sdev)
+    assert axes["rmax"] == option["axismax"]
+    assert np.isclose(option["tickstd"][-1], axes["rmax"])
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_taylor_scene()
+    test_target_scene()
+    test_taylor_axes_without_ax()
+    print("Diagram scenes are consistent.")
@@ -0,0 +1,136 @@
+"""
+This script was created to verify the grids of Taylor and target diagrams
+drawn by facet_diagrams: one diagram per group of a table of statistics on
+a common scale, markers of a series styled alike in every diagram, and a
+single legend or color bar for the whole figure.
+
+It can be invoked from a command line as:
+
+$ python test_facet_diagrams.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_facet_diagrams.py
+
+Created on Oct 18, 2026
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PathCollection
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_GROUPS = 5
+NUMBER_SERIES = 4
+RANDOM_SEED = 17
+
+
+# ## DEFS ####################################################################### #
+
+
+def get_table() -> dict:
+    """
+    Taylor statistics of a reference and NUMBER_SERIES series per group
+    :return: Dictionary of the columns of the table
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    table = {"region": [], "model": [], "sdev": [], "crmsd": [], "ccoef": []}
+    for group in range(NUMBER_GROUPS):
+        sdev = np.append(1.0, rng.uniform(0.5, 1.5, NUMBER_SERIES))
+        ccoef = np.append(1.0, rng.uniform(0.3, 0.99, NUMBER_SERIES))
+        table["region"] += ["R%d" % group] * (NUMBER_SERIES + 1)
+        table["model"] += ["Obs"] + ["M%d" % i for i in range(NUMBER_SERIES)]
+        table["sdev"] += list(sdev)
+        table["ccoef"] += list(ccoef)
+        table["crmsd"] += list(np.sqrt(sdev**2 + 1.0 - 2.0 * sdev * ccoef))
+    table["bias"] = np.array(table["sdev"]) - 1.0
+    table["rmsd"] = np.hypot(table["bias"], table["crmsd"])
+    return table
+
+
+def markers_of(ax) -> PathCollection:
+    """
+    Collection of the markers of a diagram
+    :param ax: Axes of the diagram
+    :return: PathCollection of the markers
+    """
+
+    collections = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(collections) == 1
+    return collections[0]
+
+
+def test_taylor_facets() -> None:
+    """
+    Taylor diagrams on a common scale with a single legend
+    """
+
+    table = get_table()
+    fig, axes = sm.facet_diagrams(table, "region", "taylor", label="model")
+    try:
+        assert list(axes.keys()) == ["R%d" % i for i in range(NUMBER_GROUPS)]
+
+        # Same axis limit and same marker symbols in every diagram
+        limits = {ax.get_xlim() for ax in axes.values()}
+        assert len(limits) == 1
+        first = markers_of(axes["R0"]).get_paths()
+        for ax in axes.values():
+            markers = markers_of(ax)
+            assert len(markers.get_offsets()) == NUMBER_SERIES
+            assert markers.get_paths() == first
+
+        # Axis titles in the first diagram only
+        assert "C" in [text.get_text() for text in axes["R0"].texts]
+        assert "C" not in [text.get_text() for text in axes["R1"].texts]
+
+        assert len(fig.legends) == 1
+        labels = [text.get_text() for text in fig.legends[0].get_texts()]
+        assert labels == ["M%d" % i for i in range(NUMBER_SERIES)]
+        fig.canvas.draw()
+    finally:
+        plt.close(fig)
+
+
+def test_target_facets() -> None:
+    """
+    Target diagrams with markers shaded on a single color bar
+    """
+
+    table = get_table()
+    fig, axes = sm.facet_diagrams(
+        table,
+        "region",
+        "target",
+        ncols=2,
+        markerDisplayed="colorBar",
+        titleColorBar="RMSD",
+    )
+    try:
+        assert len(axes) == NUMBER_GROUPS
+        assert axes["R4"].get_subplotspec().get_geometry()[:2] == (3, 2)
+
+        # One color bar on the range of all the groups
+        colorbars = [ax for ax in fig.axes if ax not in axes.values()]
+        assert len(colorbars) == 1
+        vmin, vmax = colorbars[0].get_xlim()
+        assert np.isclose(vmin, np.min(table["rmsd"]))
+        assert np.isclose(vmax, np.max(table["rmsd"]))
+        fig.canvas.draw()
+    finally:
+        plt.close(fig)
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_taylor_facets()
+    test_target_facets()
+    print("Grids of diagrams are consistent.")
@@ -0,0 +1,117 @@
+"""
+This script was created to verify the automatic placement of marker labels
+(labelplacement='auto') on a dense target diagram.
+
+The labels that are placed must not overlap each other, every label must
+belong to a different marker, and the labels that do not fit must be
+reported in a warning.
+
+It can be invoked from a command line as:
+
+$ python test_label_placement.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_label_placement.py
+
+Created on Oct 18, 2026
+"""
+
+import warnings
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PathCollection
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_SERIES = 1000
+FIGURE_SIZE = (8, 8)
+RANDOM_SEED = 11
+
+
+# ## DEFS ####################################################################### #
+
+
+def label_boxes(ax, collection: PathCollection) -> np.ndarray:
+    """
+    Pixel extents of the labels of a collection
+    :param ax: Axes containing the collection
+    :param collection: Collection returned by place_marker_labels
+    :return: Array of (xmin, ymin, xmax, ymax), one row per label
+    """
+
+    transform = collection.get_transform()
+    offsets = ax.transData.transform(collection.get_offsets())
+    boxes = []
+    for path, offset in zip(collection.get_paths(), offsets):
+        vertices = transform.transform(path.vertices) + offset
+        boxes.append(np.concatenate((vertices.min(axis=0), vertices.max(axis=0))))
+    return np.array(boxes)
+
+
+def test_label_placement() -> None:
+    """
+    Automatically placed labels do not overlap and dropped labels are reported
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.uniform(-1.0, 1.0, NUMBER_SERIES)
+    crmsd = rng.uniform(0.1, 1.0, NUMBER_SERIES)
+    labels = ["S%d" % i for i in range(NUMBER_SERIES)]
+
+    fig = Figure(figsize=FIGURE_SIZE)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        sm.target_diagram(
+            ax,
+            bias,
+            crmsd,
+            np.hypot(bias, crmsd),
+            markerLabel=labels,
+            labelPlacement="auto",
+            markerSize=4,
+        )
+
+    # No text artist per label, one collection of label outlines instead,
+    # drawn after the collection of markers
+    assert len(ax.texts) == 0
+    collections = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(collections) == 2
+    assert len(collections[0].get_offsets()) == NUMBER_SERIES
+    collections = collections[1:]
+    placed = len(collections[0].get_paths())
+    assert 0 < placed < NUMBER_SERIES
+    dropped = "%d of %d" % (NUMBER_SERIES - placed, NUMBER_SERIES)
+    assert any(dropped in str(warning.message) for warning in caught)
+
+    # Labels are offset from distinct markers
+    offsets = collections[0].get_offsets()
+    assert len(np.unique(offsets, axis=0)) == placed
+
+    # Bounding boxes of the labels must not overlap (1 pixel tolerance)
+    boxes = label_boxes(ax, collections[0])
+    lo, hi = boxes[:, :2] + 1.0, boxes[:, 2:] - 1.0
+    overlap = np.all(
+        (lo[:, None, :] < hi[None, :, :]) & (lo[None, :, :] < hi[:, None, :]), axis=2
+    )
+    np.fill_diagonal(overlap, False)
+    assert not overlap.any()
+
+    fig.canvas.draw()
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_label_placement()
+    print("Marker labels placed without overlap.")
@@ -0,0 +1,184 @@
+"""
+This script was created to verify the 'table' and 'figure' legend modes of
+the Taylor and target diagrams, which display the labels of hundreds of
+markers without the matplotlib legend.
+
+Every label must be shown exactly once, either in the table beside the
+diagram or on one of the legend figures returned by the diagram function,
+and the diagram figure must not be resized by a layout pass. On a figure
+of the default size the table must lie within the figure, or be left out
+with all the labels on legend figures when not even one column fits.
+
+It can be invoked from a command line as:
+
+$ python test_legend_table.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_legend_table.py
+
+Created on Oct 18, 2026
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_SERIES = 300
+FIGURE_SIZE = (12, 7)
+RANDOM_SEED = 3
+
+
+# ## DEFS ####################################################################### #
+
+
+def get_labels(number_series: int) -> list:
+    """
+    Names of the series
+    :param number_series: Number of predicted series
+    :return: List of labels
+    """
+
+    return ["model_%03d" % i for i in range(number_series)]
+
+
+def draw_taylor(mode: str, figsize=FIGURE_SIZE, low=0.3) -> tuple:
+    """
+    Draw a Taylor diagram with NUMBER_SERIES labeled markers
+    :param mode: Value of the legendmode option
+    :param figsize: Size of the figure in inches, None for the default size
+    :param low: Lowest correlation, negative for a diagram of two panels
+    :return: (figure, legend pages)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    sdev = np.concatenate(([1.0], rng.uniform(0.5, 1.5, NUMBER_SERIES)))
+    ccoef = np.concatenate(([1.0], rng.uniform(low, 0.99, NUMBER_SERIES)))
+    crmsd = np.sqrt(sdev**2 + sdev[0] ** 2 - 2 * sdev * sdev[0] * ccoef)
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    pages = sm.taylor_diagram(
+        ax,
+        sdev,
+        crmsd,
+        ccoef,
+        markerLabel=["Ref"] + get_labels(NUMBER_SERIES),
+        markerLegend="on",
+        legendMode=mode,
+    )
+    return fig, pages
+
+
+def draw_target(figsize=None) -> tuple:
+    """
+    Draw a target diagram with NUMBER_SERIES labeled markers in a table
+    :param figsize: Size of the figure in inches, None for the default size
+    :return: (figure, legend pages)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.uniform(-1.0, 1.0, NUMBER_SERIES)
+    crmsd = rng.uniform(0.1, 1.0, NUMBER_SERIES)
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    pages = sm.target_diagram(
+        ax,
+        bias,
+        crmsd,
+        np.hypot(bias, crmsd),
+        markerLabel=get_labels(NUMBER_SERIES),
+        markerLegend="on",
+        legendMode="table",
+    )
+    return fig, pages
+
+
+def shown_labels(fig: Figure, pages: list) -> list:
+    """
+    Labels displayed in the legend table of FIG and on the legend PAGES
+    :param fig: Figure of the diagram
+    :param pages: Legend figures returned by the diagram function
+    :return: List of label texts
+    """
+
+    texts = []
+    for ax in fig.axes[0].child_axes:
+        texts += [text.get_text() for text in ax.texts]
+    for page in pages:
+        for ax in page.axes:
+            texts += [text.get_text() for text in ax.texts]
+    return texts
+
+
+def test_legend_table() -> None:
+    """
+    Labels that do not fit in the side table continue on legend figures
+    """
+
+    fig, pages = draw_taylor("table")
+    assert len(fig.axes[0].child_axes) == 1
+    assert len(pages) > 0
+    assert shown_labels(fig, pages) == get_labels(NUMBER_SERIES)
+    assert tuple(fig.get_size_inches()) == FIGURE_SIZE
+    fig.canvas.draw()
+
+
+def test_legend_table_inside_figure() -> None:
+    """
+    Side tables of diagrams on default-size figures lie within the figure
+    """
+
+    figures = [
+        draw_taylor("table", None),
+        draw_taylor("table", (8, 6)),
+        draw_taylor("table", (8, 6), low=-0.9),
+        draw_target(),
+        draw_target((10, 6)),
+    ]
+    ntables = 0
+    for fig, pages in figures:
+        assert shown_labels(fig, pages) == get_labels(NUMBER_SERIES)
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        for table in fig.axes[0].child_axes:
+            ntables += 1
+            extents = [table.get_window_extent(renderer)]
+            extents += [text.get_window_extent(renderer) for text in table.texts]
+            for extent in extents:
+                assert fig.bbox.x0 <= extent.x0 and extent.x1 <= fig.bbox.x1
+                assert fig.bbox.y0 <= extent.y0 and extent.y1 <= fig.bbox.y1
+    assert ntables > 0
+
+
+def test_legend_figure() -> None:
+    """
+    All labels are put on legend figures of markerlayout rows
+    """
+
+    fig, pages = draw_taylor("figure")
+    assert len(fig.axes[0].child_axes) == 0
+    assert len(pages) == int(np.ceil(NUMBER_SERIES / (15 * 4)))
+    assert shown_labels(fig, pages) == get_labels(NUMBER_SERIES)
+    for page in pages:
+        FigureCanvasAgg(page).draw()
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_legend_table()
+    test_legend_table_inside_figure()
+    test_legend_figure()
+    print("All labels displayed by the legend table and figures.")
@@ -0,0 +1,209 @@
+"""
+This script was created to verify that MetricCache serves repeated metric
+calculations on identical data from memory or from disk, distinguishes the
+parameters of the metrics, and keeps its counters. It also checks that
+caches open at the same time share a directory, and that only the files of
+the cache are managed in its directory, and that functions without a
+unique name (lambdas, closures, bound methods) are rejected while partial
+functions are keyed by their arguments.
+
+It can be invoked from a command line as:
+
+$ python test_metric_cache.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_metric_cache.py
+
+Created on Oct 18, 2026
+"""
+
+import functools
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 13
+NUMBER_VALUES = 1000
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_series() -> tuple:
+    """
+    Random predicted and reference series
+    :return: (predicted, reference)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    reference = rng.normal(10.0, 2.0, NUMBER_VALUES)
+    return reference + rng.normal(0.5, 1.0, NUMBER_VALUES), reference
+
+
+def test_memory_cache() -> None:
+    """
+    Results of identical data served from memory, parameters distinguished
+    """
+
+    predicted, reference = make_series()
+    cache = sm.MetricCache(maxsize=2)
+
+    stats = cache(sm.taylor_statistics, predicted, reference)
+    again = cache(sm.taylor_statistics, predicted.copy(), pd.Series(reference))
+    assert cache.statistics()["hits"] == 1
+    for name in ("sdev", "crmsd", "ccoef"):
+        assert np.array_equal(stats[name], again[name])
+
+    # Copies of the results are returned
+    stats["sdev"][0] = -1.0
+    assert cache(sm.taylor_statistics, predicted, reference)["sdev"][0] > 0
+
+    target = cache.wrap(sm.target_statistics)
+    assert target(predicted, reference)["type"] == "unnormalized"
+    assert target(predicted, reference, norm=True)["type"] == "normalized"
+
+    kge = cache.wrap(sm.kling_gupta_eff09)
+    assert kge(predicted, reference) != kge(predicted, reference, sr=0.5)
+    assert kge(predicted, reference) == sm.kling_gupta_eff09(predicted, reference)
+
+    # Different data and the least recently used results are recalculated
+    cache(sm.taylor_statistics, predicted[::-1], reference)
+    cache(sm.taylor_statistics, predicted, reference)
+    counters = cache.statistics()
+    assert counters["hits"] == 3
+    assert counters["misses"] == 7
+    assert counters["entries"] == 2
+
+
+def test_disk_cache() -> None:
+    """
+    Results shared by caches using the same directory
+    """
+
+    predicted, reference = make_series()
+    with tempfile.TemporaryDirectory() as directory:
+        cache = sm.MetricCache(directory=directory)
+        expected = cache(sm.nash_sutcliffe_eff, predicted, reference)
+
+        other = sm.MetricCache(directory=directory)
+        assert other(sm.nash_sutcliffe_eff, predicted, reference) == expected
+        assert other(sm.nash_sutcliffe_eff, predicted, reference) == expected
+        counters = other.statistics()
+        assert counters["disk_hits"] == 1
+        assert counters["hits"] == 1
+        assert counters["misses"] == 0
+        assert counters["disk_entries"] == 1
+
+        # Caches open at the same time share their entries and their size
+        first = sm.MetricCache(directory=directory, max_bytes=400)
+        second = sm.MetricCache(directory=directory, max_bytes=400)
+        expected = first(sm.rmsd, predicted, reference)
+        assert second(sm.rmsd, predicted, reference) == expected
+        assert second.statistics()["disk_hits"] == 1
+        for i in range(20):
+            (first if i % 2 else second)(sm.bias, predicted, reference + i)
+        names = os.listdir(second.disk.directory)
+        sizes = [os.path.getsize(os.path.join(second.disk.directory, n)) for n in names]
+        assert 0 < sum(sizes) <= 400
+
+    try:
+        cache(sm.nash_sutcliffe_eff, predicted, object())
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Argument of unknown type hashed")
+
+
+def test_disk_cache_files() -> None:
+    """
+    Only the files of the cache are managed in its directory
+    """
+
+    predicted, reference = make_series()
+    with tempfile.TemporaryDirectory() as directory:
+        # Files of the user in the directory and in the cache subdirectory
+        data_file = os.path.join(directory, "obs.csv")
+        with open(data_file, "wb") as file:
+            file.write(b"0" * 5000)
+        cache_directory = os.path.join(directory, "skill_metrics-cache")
+        os.makedirs(os.path.join(cache_directory, "0123456789abcdef0123"))
+        other_file = os.path.join(cache_directory, "notes.txt")
+        with open(other_file, "wb") as file:
+            file.write(b"0" * 5000)
+
+        # Temporary files of writes in progress and of an interrupted write
+        writing = os.path.join(cache_directory, ".skill_metrics-new.tmp")
+        interrupted = os.path.join(cache_directory, ".skill_metrics-old.tmp")
+        for name in (writing, interrupted):
+            with open(name, "wb") as file:
+                file.write(b"0" * 5000)
+        os.utime(interrupted, (0, 0))
+
+        cache = sm.MetricCache(directory=directory, max_bytes=4096)
+        for i in range(50):
+            cache(sm.bias, predicted, reference + i)
+        assert len(cache.disk) > 0 and cache.disk.size <= 4096
+        assert os.path.isfile(data_file)
+        assert os.path.isfile(other_file)
+        assert os.path.isfile(writing)
+        assert not os.path.exists(interrupted)
+
+        try:
+            cache.disk.get("../obs.csv")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("File outside of the cache read")
+
+
+def test_function_keys() -> None:
+    """
+    Functions sharing a name rejected, partial functions by their arguments
+    """
+
+    values = np.arange(5.0)
+    cache = sm.MetricCache()
+
+    def scale(factor):
+        return lambda x: x * factor
+
+    def closure(x):
+        return x.sum()
+
+    for function in (
+        lambda x: x.sum(),
+        scale(2),
+        closure,
+        np.random.default_rng(RANDOM_SEED).permutation,
+    ):
+        try:
+            cache(function, values)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Function without a unique name cached")
+
+    assert cache(functools.partial(sm.bias, values), values + 1.0) == -1.0
+    assert cache(functools.partial(sm.bias, values), values + 2.0) == -2.0
+    assert cache(functools.partial(sm.bias, values + 2.0), values) == 2.0
+    assert cache(sm.bias, values + 2.0, values) == 2.0
+    assert cache.statistics()["hits"] == 1
+    assert cache(functools.partial(np.sum, axis=0), values) == 10.0
+    assert cache(functools.partial(np.max, axis=0), values) == 4.0
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_memory_cache()
+    test_disk_cache()
+    test_disk_cache_files()
+    test_function_keys()
+    print("Metric cache is consistent.")
@@ -0,0 +1,143 @@
+"""
+This script was created to verify that the statistics of Taylor and target
+diagrams regenerated from the moments of MomentStore are those calculated
+from the whole record by taylor_statistics and target_statistics, after
+daily updates, revisions of past values and invalidation, and that the
+moments persist in the database file.
+
+It can be invoked from a command line as:
+
+$ python test_moment_store.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_moment_store.py
+
+Created on Oct 18, 2026
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 7
+NUMBER_YEARS = 4
+DAYS_PER_YEAR = 365
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_record() -> tuple:
+    """
+    Daily reference and predicted series of several years
+    :return: (predicted, reference, year of each day)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    days = NUMBER_YEARS * DAYS_PER_YEAR
+    reference = 100.0 + 10.0 * np.sin(np.arange(days) / 58.0) + rng.normal(0, 2, days)
+    predicted = 0.9 * reference + 12.0 + rng.normal(0, 3, days)
+    year = np.repeat(np.arange(2020, 2020 + NUMBER_YEARS), DAYS_PER_YEAR)
+    return predicted, reference, year
+
+
+def assert_statistics(store, predicted, reference, periods=None) -> None:
+    """
+    Statistics of the store equal to those of the whole series
+    :param store: MomentStore with the moments of station 'S1' and model 'M1'
+    :param predicted: Predicted series
+    :param reference: Reference series
+    :param periods: Periods of the moments to merge
+    """
+
+    expected = sm.taylor_statistics(predicted, reference)
+    stats = store.taylor_statistics("S1", "M1", periods)
+    for name in ("sdev", "crmsd", "ccoef"):
+        assert np.allclose(stats[name], expected[name], rtol=1e-10)
+
+    expected = sm.target_statistics(predicted, reference, norm=True)
+    stats = store.target_statistics("S1", "M1", periods, norm=True)
+    for name in ("bias", "crmsd", "rmsd"):
+        assert np.isclose(stats[name], expected[name], rtol=1e-10)
+    assert stats["type"] == "normalized"
+
+
+def test_daily_updates() -> None:
+    """
+    Moments updated day by day, revised and persisted
+    """
+
+    predicted, reference, year = make_record()
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "moments.db")
+        with sm.MomentStore(file_name) as store:
+            for day in range(len(year)):
+                store.update(
+                    "S1", "M1", year[day], predicted[day : day + 1], reference[day]
+                )
+            assert len(store.keys("S1", "M1")) == NUMBER_YEARS
+            assert_statistics(store, predicted, reference)
+
+            # Statistics of a subset of the periods
+            last = year >= 2022
+            assert_statistics(store, predicted[last], reference[last], [2022, 2023])
+
+            # Revision of values of 2021
+            revised = predicted.copy()
+            revised[400:420] += 5.0
+            store.remove("S1", "M1", 2021, predicted[400:420], reference[400:420])
+            store.update("S1", "M1", 2021, revised[400:420], reference[400:420])
+            assert_statistics(store, revised, reference)
+
+        # Moments read back from the file
+        with sm.MomentStore(file_name) as store:
+            assert_statistics(store, revised, reference)
+
+            # Period rebuilt from its revised series
+            assert store.invalidate("S1", "M1", 2021) == 1
+            assert len(store.keys()) == NUMBER_YEARS - 1
+            in_2021 = year == 2021
+            store.replace("S1", "M1", 2021, revised[in_2021], reference[in_2021])
+            assert_statistics(store, revised, reference)
+
+
+def test_missing_values() -> None:
+    """
+    Pairs with NaN ignored, errors for missing moments
+    """
+
+    predicted, reference, _ = make_record()
+    store = sm.MomentStore()
+    with_nan = predicted.copy()
+    with_nan[::10] = np.nan
+    store.update("S1", "M1", "all", with_nan, reference)
+    valid = ~np.isnan(with_nan)
+    assert store.moments("S1", "M1")["n"] == np.count_nonzero(valid)
+    assert_statistics(store, predicted[valid], reference[valid])
+
+    for station, periods in (("S2", None), ("S1", ["1999"])):
+        try:
+            store.taylor_statistics(station, "M1", periods)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Statistics of missing moments")
+
+    # Removing all the values drops the moments
+    store.remove("S1", "M1", "all", with_nan, reference)
+    assert store.keys() == []
+    store.close()
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_daily_updates()
+    test_missing_values()
+    print("Moments are consistent.")
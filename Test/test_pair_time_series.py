@@ -0,0 +1,184 @@
+"""
+This script was created to verify that pair_time_series pairs irregular
+reference series with predicted series exactly, by nearest time within a
+tolerance and by linear interpolation, as pandas merges and NumPy
+interpolation do, and that the paired series can be passed to the
+statistics functions.
+
+It can be invoked from a command line as:
+
+$ python test_pair_time_series.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_pair_time_series.py
+
+Created on Oct 18, 2026
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 11
+NUMBER_MODEL = 2000
+NUMBER_OBSERVATIONS = 700
+TOLERANCE = pd.Timedelta("20min")
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_series() -> tuple:
+    """
+    Hourly model series and irregular, unsorted observations with gaps
+    :return: (model series, observation series)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    start = pd.Timestamp("2026-01-01")
+    model_time = pd.date_range(start, periods=NUMBER_MODEL, freq="h")
+    model_time = model_time.delete(np.arange(500, 540))
+    model = pd.Series(np.sin(np.arange(model_time.size) / 24.0), index=model_time)
+
+    minutes = rng.integers(-60, NUMBER_MODEL * 60 + 60, NUMBER_OBSERVATIONS)
+    minutes[:100] = 60 * rng.integers(0, NUMBER_MODEL, 100)  # on model times
+    obs_time = start + pd.to_timedelta(minutes, unit="min")
+    obs = pd.Series(rng.normal(0.0, 1.0, NUMBER_OBSERVATIONS), index=obs_time)
+    obs.iloc[::50] = np.nan
+    return model, obs
+
+
+def merge(model, obs, **kwargs) -> pd.DataFrame:
+    """
+    Observations merged with the model series by pandas
+    :param model: Model series
+    :param obs: Observation series
+    :return: Data frame of the observation times and values with model values
+    """
+
+    left = obs.dropna().rename("r").rename_axis("time").reset_index()
+    right = model.rename("p").rename_axis("time").reset_index()
+    left = left.sort_values("time", kind="stable")
+    merged = pd.merge_asof(left, right, on="time", **kwargs)
+    return merged.dropna()
+
+
+def test_exact_and_nearest() -> None:
+    """
+    Pairs equal to those of pandas merges
+    """
+
+    model, obs = make_series()
+
+    p, r, time = sm.pair_time_series(model.index, model, obs.index, obs)
+    expected = merge(model, obs, tolerance=pd.Timedelta(0))
+    assert len(time) == len(expected) >= 100
+    assert np.array_equal(time, expected["time"].to_numpy())
+    assert np.array_equal(p, expected["p"]) and np.array_equal(r, expected["r"])
+
+    p, r, time = sm.pair_time_series(
+        model.index, model, obs.index, obs, method="nearest", tolerance=TOLERANCE
+    )
+    expected = merge(model, obs, direction="nearest", tolerance=TOLERANCE)
+    assert len(time) == len(expected)
+    assert np.array_equal(time, expected["time"].to_numpy())
+    assert np.array_equal(p, expected["p"]) and np.array_equal(r, expected["r"])
+
+    # Paired series are those of the statistics functions
+    stats = sm.taylor_statistics(p, r)
+    assert np.isclose(stats["ccoef"][1], np.corrcoef(p, r)[0, 1])
+    sm.target_statistics(p, r)
+
+
+def test_linear() -> None:
+    """
+    Interpolation equal to that of NumPy, not across gaps larger than the
+    tolerance
+    """
+
+    model, obs = make_series()
+    start = model.index[0].to_datetime64()
+    hours = (model.index - start) / pd.Timedelta("1h")
+    obs_hours = (obs.index - start) / pd.Timedelta("1h")
+
+    p, r, time = sm.pair_time_series(
+        model.index, model, obs.index, obs, method="linear"
+    )
+    inside = (obs_hours >= 0) & (obs_hours <= hours[-1]) & obs.notna()
+    assert len(time) == np.count_nonzero(inside)
+    hour = (time - start) / np.timedelta64(1, "h")
+    assert np.allclose(p, np.interp(hour, hours, model.to_numpy()), atol=1e-12)
+
+    # Same pairs with numeric times, fewer across the gap of the model
+    p_hours, _, time_hours = sm.pair_time_series(
+        hours, model, obs_hours, obs, method="linear"
+    )
+    assert np.allclose(p_hours, p) and np.allclose(time_hours, hour)
+    _, _, time = sm.pair_time_series(
+        model.index,
+        model,
+        obs.index,
+        obs,
+        method="linear",
+        tolerance=pd.Timedelta("1h"),
+    )
+    hour = (time - start) / np.timedelta64(1, "h")
+    assert not ((hour > 499) & (hour < 540)).any()
+    assert len(time) < np.count_nonzero(inside)
+
+    for kwargs in ({"method": "cubic"}, {"method": "nearest", "tolerance": 1}):
+        try:
+            sm.pair_time_series(model.index, model, obs.index, obs, **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid pairing accepted")
+
+
+def test_timezones() -> None:
+    """
+    Timezone-aware dates paired in UTC without warnings, and not with naive
+    dates
+    """
+
+    model, obs = make_series()
+    utc = model.index.tz_localize("UTC")
+    local = utc.tz_convert("Europe/Paris")
+    expected = sm.pair_time_series(
+        model.index, model, obs.index, obs, method="nearest", tolerance=TOLERANCE
+    )
+
+    obs_utc = pd.Series(obs.index.tz_localize("UTC"))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        p, r, time = sm.pair_time_series(
+            local, model, obs_utc, obs, method="nearest", tolerance=TOLERANCE
+        )
+        listed = sm.pair_time_series(
+            list(local), model, obs_utc, obs, method="nearest", tolerance=TOLERANCE
+        )
+    assert np.array_equal(p, expected[0]) and np.array_equal(r, expected[1])
+    assert np.array_equal(time, expected[2]) and time.dtype.kind == "M"
+    assert np.array_equal(listed[2], expected[2])
+
+    try:
+        sm.pair_time_series(local, model, obs.index, obs)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Timezone-aware and naive dates paired")
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_exact_and_nearest()
+    test_linear()
+    test_timezones()
+    print("Pairing of time series is consistent.")
@@ -0,0 +1,176 @@
+"""
+This script was created to verify that the markers of pattern diagrams are
+drawn as a single collection: markers beyond the axis limit are skipped,
+each marker keeps its symbol, size and colors, and the legend has one entry
+per marker drawn. It also checks that the circles of a target diagram are
+drawn as a single line collection, that markers beyond the predefined
+styles take their colors from a colormap object, and that markers shaded
+by a color bar are a single scatter plot with the colors of each point.
+
+It can be invoked from a command line as:
+
+$ python test_pattern_markers.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_pattern_markers.py
+
+Created on Oct 18, 2026
+"""
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_SERIES = 7
+NUMBER_POINTS = 10000
+RANDOM_SEED = 11
+
+
+# ## DEFS ####################################################################### #
+
+
+def new_axes():
+    """
+    Axes of a new figure outside of pyplot
+    :return: matplotlib.axes.Axes
+    """
+
+    fig = Figure(figsize=(6, 5))
+    FigureCanvasAgg(fig)
+    return fig.add_subplot(1, 1, 1)
+
+
+def test_legend_markers() -> None:
+    """
+    One collection of markers with a legend entry per marker drawn
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.uniform(-1.0, 1.0, NUMBER_SERIES)
+    crmsd = rng.uniform(0.1, 1.0, NUMBER_SERIES)
+    bias[0] = 5.0  # beyond the axis limit
+    labels = ["M%d" % i for i in range(NUMBER_SERIES)]
+
+    ax = new_axes()
+    sm.target_diagram(
+        ax,
+        bias,
+        crmsd,
+        np.hypot(bias, crmsd),
+        markerLabel=labels,
+        markerLegend="on",
+        axismax=2.0,
+        circles=[0.5, 1.0],
+    )
+
+    assert len(ax.lines) == 0
+    markers = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(markers) == 1
+    assert np.allclose(markers[0].get_offsets(), np.column_stack((crmsd, bias))[1:])
+    assert len(markers[0].get_paths()) == NUMBER_SERIES - 1
+    assert len(markers[0].get_facecolors()) == NUMBER_SERIES - 1
+
+    texts = [text.get_text() for text in ax.get_legend().get_texts()]
+    assert texts == labels[1:]
+
+    circles = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(circles) == 1
+    assert len(circles[0].get_segments()) == 2
+
+    ax.figure.canvas.draw()
+
+
+def test_many_markers() -> None:
+    """
+    Thousands of markers of a single color drawn at once
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.normal(0.0, 1.0, NUMBER_POINTS)
+    crmsd = rng.uniform(0.1, 2.0, NUMBER_POINTS)
+
+    ax = new_axes()
+    sm.target_diagram(ax, bias, crmsd, np.hypot(bias, crmsd))
+
+    markers = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(markers) == 1
+    assert len(markers[0].get_offsets()) == NUMBER_POINTS
+    assert len(ax.lines) == 0
+
+    ax.figure.canvas.draw()
+
+
+def test_colormap_markers() -> None:
+    """
+    Markers beyond the predefined styles colored by a colormap object
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    nmarkers = 100
+    bias = rng.uniform(-1.0, 1.0, nmarkers)
+    crmsd = rng.uniform(0.1, 1.0, nmarkers)
+    cmap = ListedColormap(["r", "g", "b"])
+
+    ax = new_axes()
+    sm.target_diagram(
+        ax,
+        bias,
+        crmsd,
+        np.hypot(bias, crmsd),
+        markerLabel=["M%d" % i for i in range(nmarkers)],
+        markerLegend="on",
+        cmap=cmap,
+    )
+
+    markers = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(markers) == 1
+    colors = markers[0].get_facecolors()
+    assert len(colors) == nmarkers
+    assert np.allclose(colors[0], cmap(0.0))
+    assert np.allclose(colors[-1], cmap(1.0))
+
+
+def test_colorbar_markers() -> None:
+    """
+    One scatter plot of colored markers and a color bar of a few ticks
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.uniform(-1.0, 1.0, NUMBER_SERIES)
+    crmsd = rng.uniform(0.1, 1.0, NUMBER_SERIES)
+    rmsd = np.linspace(5.0, 27.3, NUMBER_SERIES)  # color shading values
+
+    ax = new_axes()
+    sm.target_diagram(ax, bias, crmsd, rmsd, markerDisplayed="colorbar")
+
+    markers = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(markers) == 1
+    colors = markers[0].get_facecolors()
+    assert len(colors) == NUMBER_SERIES
+    assert np.allclose(colors, markers[0].get_edgecolors())
+    assert np.allclose(colors[0], matplotlib.colormaps["jet"](0.0))
+    assert np.allclose(colors[-1], matplotlib.colormaps["jet"](1.0))
+
+    # Tick labels limited to 10 characters
+    colorbar = ax.figure.axes[-1]
+    assert list(colorbar.get_xticks()) == [10.0, 15.0, 20.0, 25.0]
+
+    ax.figure.canvas.draw()
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_legend_markers()
+    test_many_markers()
+    test_colormap_markers()
+    test_colorbar_markers()
+    print("Pattern diagram markers are consistent.")
@@ -3,46 +3,97 @@ This script was created to facilitate identification of undesired side effects
 of updates related to the generation of target and Taylor diagrams using the
 existing examples.
 
-It supports the following argument as an option.
+It supports the following arguments as options.
 
 -clean_files : Delete new files if this flag is present
+-jobs N      : Number of processes running the scripts (Default: number of CPUs)
+-report FILE : Write the results to a JSON report file
 
 It can be invoked from a command line as:
 
-$ python test_plots.py -clean_files
+$ python test_plots.py -clean_files -jobs 4 -report test_plots.json
 
 The script supports the argument "-h" for help (call "$ python test_plots.py -h").
 
 The python scripts executed are those specified by SCRIPTS_TESTED below that
 reside in the "Examples" folder. These scripts are executed without displaying
-the plots but write new example graphics files. The new files are compared
-pixel-wise with the previously existing example graphic files and a percentage
-change is displayed for each example.
-
-Percentage change: 100% * sum of pixel color differences / mean colors intensity
+the plots but write new example graphics files. The scripts are run by a pool of
+JOBS worker processes that import matplotlib and skill_metrics once, each script
+being executed in a worker with runpy as if it were run from the command line,
+after which the figures are closed and the matplotlib settings restored. The new
+files are compared with the previously existing example graphic files and a
+percentage change is displayed for each example.
+
+Percentage change: 100% * fraction of blocks of BLOCK_SIZE x BLOCK_SIZE pixels
+whose mean color differs by more than BLOCK_TOLERANCE in any channel
+
+Comparing blocks rather than single pixels ignores differences of antialiasing
+and font rendering between systems, while changes of markers, lines or labels
+change whole blocks. The JSON report also gives, for each example, the
+percentage of pixels that differ and the root-mean-square difference of the
+colors, as well as the time taken by the script.
 
 Some image files are generated with different width/height depending on the system.
 When the size of the current image and the size of the new image are different,
 both are resized to have the same size and then compared. This is reported in the
 script output if it occurs.
 
-Changes less than 2% may be considered negligible (GOOD). Between 2% and 10% should be
-double checked (CHECK). More than 10% is a probable case of a difference arsing due to a
-bug (BAD). The test_plot script reports these outcomes according to the percentage.
-An example of the script output is shown below.
-
-$ python3 test_plots.py
-Executing 9 scripts in sequence:
- 01:   0.86% distance between 'target1_example.png' and 'target1.png', GOOD.
- 02:   0.15% distance between 'target2_example.png' and 'target2.png', GOOD.
- 03:   0.15% distance between 'target3_example.png' and 'target3.png', GOOD.
- 04:   0.00% distance between 'target4_example.png' and 'target4.png', GOOD.
- 05:   0.00% distance between 'target5_example.png' and 'target5.png', GOOD.
- 06:   0.11% distance between 'target6_example.png' and 'target6.png', GOOD.
- 07:   0.00% distance between 'target7_example.png' and 'target7.png', GOOD.
- 08:   2.64% distance between 'target8_example.png' and 'target8.png', CHECK (size adjusted).
- 09:   2.48% distance between 'target9_example.png' and 'target9.png', CHECK (size adjusted).
-New files were kept after comparison.
+Changes less than 2% of the blocks may be considered negligible (GOOD). Between 2%
+and 10% should be double checked (CHECK). More than 10% is a probable case of a
+difference arising due to a bug (BAD). The test_plot script reports these outcomes
+according to the percentage.
+
+The thresholds were kept for the block metric because they still separate the
+cases that matter when comparing with the example files, which were made on
+another system. Running a script twice on the same system gives 0.00%. Against
+the example files, unchanged code gives 0.0-2.7% from the substitution of missing
+fonts, which moves labels by a few pixels, and up to 7.6% when the image size also
+differs (size adjusted). Changes of whole features, such as the axes, circles or
+colors that differ between consecutive examples, give 6.5-18.6% (e.g. 14.65%
+between 'target5_example.png' and 'target6_example.png'). A single marker added
+or lost changes only about 0.3% of the blocks ('taylor7_example.png' and
+'taylor8_example.png'), below the GOOD threshold, so such a change is only
+detected by comparing with files made on the same system. The percentage of
+pixels that differ, in the JSON report, is more sensitive to it.
+
+An example of the script output is shown below, on a system without the 'Times
+New Roman' font of some examples (messages of matplotlib omitted).
+
+$ python3 test_plots.py -clean_files -jobs 4
+Executing 26 scripts with 4 processes:
+ 01:   0.91% distance between 'target1_example.png' and 'target1.png', GOOD.
+ 02:   0.19% distance between 'target10_example.png' and 'target10.png', GOOD.
+ 03:   1.65% distance between 'target11_example.png' and 'target11.png', GOOD.
+ 04:   0.46% distance between 'target2_example.png' and 'target2.png', GOOD.
+ 05:   0.46% distance between 'target3_example.png' and 'target3.png', GOOD.
+ 06:   0.42% distance between 'target4_example.png' and 'target4.png', GOOD.
+ 07:   0.25% distance between 'target5_example.png' and 'target5.png', GOOD.
+ 08:   0.42% distance between 'target6_example.png' and 'target6.png', GOOD.
+ 09:   0.77% distance between 'target7_example.png' and 'target7.png', GOOD.
+ 10:   0.04% distance between 'target8_example.png' and 'target8.png', GOOD.
+ 11:   3.68% distance between 'target9_example.png' and 'target9.png', CHECK (size adjusted).
+ 12:   2.50% distance between 'taylor1_example.png' and 'taylor1.png', CHECK.
+ 13:   2.71% distance between 'taylor10_example.png' and 'taylor10.png', CHECK.
+ 14:   0.61% distance between 'taylor11_example.png' and 'taylor11.png', GOOD.
+ 15:   2.87% distance between 'taylor12_example.png' and 'taylor12.png', CHECK (size adjusted).
+ 16:   0.62% distance between 'taylor13_example.png' and 'taylor13.png', GOOD.
+ 17:   7.64% distance between 'taylor14_example.png' and 'taylor14.png', CHECK (size adjusted).
+ 18:   1.81% distance between 'taylor15_example.png' and 'taylor15.png', GOOD.
+ 19:   2.71% distance between 'taylor2_example.png' and 'taylor2.png', CHECK.
+ 20:   2.65% distance between 'taylor3_example.png' and 'taylor3.png', CHECK.
+ 21:   2.33% distance between 'taylor4_example.png' and 'taylor4.png', CHECK.
+ 22:   0.42% distance between 'taylor5_example.png' and 'taylor5.png', GOOD.
+ 23:   0.52% distance between 'taylor6_example.png' and 'taylor6.png', GOOD.
+ 24:   0.27% distance between 'taylor7_example.png' and 'taylor7.png', GOOD.
+ 25:   0.83% distance between 'taylor8_example.png' and 'taylor8.png', GOOD.
+ 26:   1.02% distance between 'taylor9_example.png' and 'taylor9.png', GOOD.
+New files were deleted after comparison.
+
+The scripts import skill_metrics in the worker processes. If it is neither
+installed nor on PYTHONPATH, each script is reported as an error saying so, e.g.
+
+ 01: Error running 'target1.py': cannot import skill_metrics in the worker process
+ (No module named 'skill_metrics'), install it or add it to PYTHONPATH.
 
 
 The list of scripts to be processed must be assigned to SCRIPTS_TESTED as a list of
@@ -64,14 +115,20 @@ Author: Andre D. L. Zanchetta
         ("adlzanchetta" in multiple social media)
 
 Created on Aug 28, 2022
+Revised on Oct 18, 2026
 
 @author: adlzanchetta@gmail.com
 """
 
 import argparse
+import concurrent.futures
+import contextlib
 import glob
+import json
 import os
-import subprocess
+import runpy
+import sys
+import time
 
 import numpy as np
 from PIL import Image
@@ -86,9 +143,14 @@ EXAMPLES_FOLDER_NAME = "Examples"
 SCRIPTS_TESTED = ("target*[0-9].py", "taylor*[0-9].py")
 # SCRIPTS_TESTED = ("target*[0-9].py", ) # target diagrams only, must be a tuple
 # SCRIPTS_TESTED = ("taylor*[0-9].py", ) # Taylor diagrams only, must be a tuple
-PYTHON_COMMAND = "python3 <SCRIPT> -noshow"
+SCRIPT_ARGUMENTS = ["-noshow"]
 DEBUG_FILE_NAME = "<BASE>%s" % IMAGES_FORMAT
 EXAMP_FILE_NAME = "<BASE>_example%s" % IMAGES_FORMAT
+BLOCK_SIZE = 8  # pixels
+BLOCK_TOLERANCE = 32  # color levels out of 255
+
+# Error preparing the worker process, reported for every script it runs
+worker_error = None
 
 
 # ## DEFS ####################################################################### #
@@ -169,64 +231,175 @@ def get_comparable_pixels_rgba(file_path_1: str, file_path_2: str) -> tuple:
     return pixels_prev, pixels_curr, True
 
 
-def compare_rasters_pixelwise(prev: str, curr: str) -> tuple:
+def compare_rasters_blockwise(prev: str, curr: str) -> dict:
     """
-    Calculates the distance between rasters in their color space (RGB, RGBA, BW...)
+    Calculates the distance between rasters by blocks of pixels
     :param prev: Previous version image file path
     :param curr: Current version image file path
-    :return: Percentual color distance between images, boolean flag if images were
-                resized if comparison was possible, raise errors otherwise
+    :return: Dictionary of the percentage of blocks that differ ('distance'), of
+                pixels that differ ('pixels'), of root-mean-square color difference
+                ('rms') and a boolean flag if images were resized ('resized'),
+                raise errors if comparison was not possible
     """
 
     try:
         pixels_prev, pixels_curr, resized = get_comparable_pixels_rgba(prev, curr)
+    except FileNotFoundError as e:
+        print("  ", e)
+        raise e
+
+    # color differences of pixels, of all channels at once
+    pixels_prev = np.atleast_3d(pixels_prev).astype(float)
+    pixels_curr = np.atleast_3d(pixels_curr).astype(float)
+    pixels_dist = np.abs(pixels_prev - pixels_curr)
 
-        # get images 'intensities' (color magnitude)
-        pixels_maginitude_1, pixels_maginitude_2 = (
-            np.sum(pixels_prev),
-            np.sum(pixels_curr),
+    # mean colors of blocks, by reshaping the images cropped to whole blocks
+    rows = pixels_dist.shape[0] // BLOCK_SIZE * BLOCK_SIZE
+    cols = pixels_dist.shape[1] // BLOCK_SIZE * BLOCK_SIZE
+    shape = (rows // BLOCK_SIZE, BLOCK_SIZE, cols // BLOCK_SIZE, BLOCK_SIZE, -1)
+    blocks_prev = pixels_prev[:rows, :cols].reshape(shape).mean(axis=(1, 3))
+    blocks_curr = pixels_curr[:rows, :cols].reshape(shape).mean(axis=(1, 3))
+    blocks_dist = np.abs(blocks_prev - blocks_curr).max(axis=-1)
+
+    return {
+        "distance": 100 * float(np.mean(blocks_dist > BLOCK_TOLERANCE)),
+        "pixels": 100 * float(np.mean(pixels_dist.max(axis=-1) > 0)),
+        "rms": 100 * float(np.sqrt(np.mean(pixels_dist**2))) / 255,
+        "resized": resized,
+    }
+
+
+def init_worker(examples_folder_path: str) -> None:
+    """
+    Prepares a worker process: imports the plotting libraries once for all the
+    scripts it runs and makes the helper modules of the examples importable
+    :param examples_folder_path: Path of the Examples folder
+    """
+
+    global worker_error
+
+    os.chdir(examples_folder_path)
+    sys.path.insert(0, examples_folder_path)
+
+    # an exception would break the pool, so keep it for run_script to report
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot  # noqa: F401
+        import skill_metrics  # noqa: F401
+    except ImportError as e:
+        worker_error = (
+            "cannot import %s in the worker process (%s), install it or add "
+            "it to PYTHONPATH" % (e.name, e)
         )
-        pixels_maginitude_mean = np.mean([pixels_maginitude_1, pixels_maginitude_2])
-        del pixels_maginitude_1, pixels_maginitude_2
 
-        # get pixels percentual distance
-        pixels_dist = np.sum(pixels_prev - pixels_curr)
-        pixels_dist_pct = 100 * pixels_dist / pixels_maginitude_mean
-        del pixels_dist, pixels_maginitude_mean
+    return None
 
-        return pixels_dist_pct, resized
 
-    except FileNotFoundError as e:
-        print("  ", e)
-        raise e
+def run_script(script_file_name: str) -> tuple:
+    """
+    Runs an example script in the current process as from the command line
+    :param script_file_name: Script to be executed
+    :return: (time taken in seconds, error message or None)
+    """
+
+    if worker_error is not None:
+        return 0.0, worker_error
 
+    import matplotlib
+    import matplotlib.pyplot as plt
 
-def evaluate_output(all_script_file_names: tuple, clean_files: bool) -> None:
+    error = None
+    start = time.perf_counter()
+    sys.argv = [script_file_name] + SCRIPT_ARGUMENTS
+    try:
+        with open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                runpy.run_path(script_file_name, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = "exit status %s" % e.code
+    except Exception as e:
+        error = "%s: %s" % (type(e).__name__, e)
+    finally:
+        # leave nothing behind for the next script of the worker
+        plt.close("all")
+        matplotlib.rc_file_defaults()
+
+    return time.perf_counter() - start, error
+
+
+def evaluate_output(
+    all_script_file_names: tuple, clean_files: bool, jobs: int, report_file_name=None
+) -> None:
     """
-    Runs sequence of examples, comparing outputs and printing findings in to STDOUT
+    Runs examples in parallel, comparing outputs and printing findings in to STDOUT
     :param all_script_file_names: Sequence of scripts to be executed.
     :param clean_files: If true, remove new files after comparison. Keep them otherwise.
+    :param jobs: Number of worker processes running the scripts.
+    :param report_file_name: If given, path of the JSON report file to write.
     :return: None
     """
 
-    print("Executing %d scripts in sequence:" % len(all_script_file_names))
-
-    for script_count, script_file_name in enumerate(all_script_file_names):
-        # get new and old filenames
-        output_file_name = script_file_name[0:-3]
-        output_file_name_new = DEBUG_FILE_NAME.replace("<BASE>", output_file_name)
-        output_file_name_old = EXAMP_FILE_NAME.replace("<BASE>", output_file_name)
-        del output_file_name
+    print(
+        "Executing %d scripts with %d processes:" % (len(all_script_file_names), jobs)
+    )
+    start = time.perf_counter()
+    report = []
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(os.getcwd(),)
+    ) as executor:
+        # run the scripts whose base figure exists, all at once
+        futures = {}
+        for script_file_name in all_script_file_names:
+            output_file_name_old = EXAMP_FILE_NAME.replace(
+                "<BASE>", script_file_name[0:-3]
+            )
+            if os.path.exists(output_file_name_old):
+                futures[script_file_name] = executor.submit(
+                    run_script, script_file_name
+                )
 
-        # define command to execute
-        py_command = PYTHON_COMMAND.replace("<SCRIPT>", script_file_name)
+        # compare the outputs in the order of the scripts, as they finish
+        for script_count, script_file_name in enumerate(all_script_file_names):
+            # get new and old filenames
+            output_file_name = script_file_name[0:-3]
+            output_file_name_new = DEBUG_FILE_NAME.replace("<BASE>", output_file_name)
+            output_file_name_old = EXAMP_FILE_NAME.replace("<BASE>", output_file_name)
+            entry = {"script": script_file_name, "image": output_file_name_new}
+
+            if script_file_name not in futures:
+                # if old image file does not exist, skip
+                print(
+                    " %02d. Skipping '%s': base figure not found."
+                    % (script_count + 1, script_file_name)
+                )
+                entry["status"] = "SKIPPED"
+                report.append(entry)
+                continue
+
+            try:
+                seconds, error = futures[script_file_name].result()
+            except concurrent.futures.process.BrokenProcessPool as e:
+                seconds, error = 0.0, "worker process terminated (%s)" % e
+            entry["seconds"] = round(seconds, 3)
+            if error is not None or not os.path.exists(output_file_name_new):
+                error = error or "no image written"
+                print(
+                    " %02d: Error running '%s': %s."
+                    % (script_count + 1, script_file_name, error)
+                )
+                entry.update({"status": "ERROR", "error": error})
+                report.append(entry)
+                continue
 
-        if os.path.exists(output_file_name_old):
-            # run the command and calculate files distance
-            subprocess.run(py_command, shell=True, stdout=subprocess.DEVNULL)
-            rasters_distance_pct, resized = compare_rasters_pixelwise(
+            # calculate files distance
+            comparison = compare_rasters_blockwise(
                 output_file_name_old, output_file_name_new
             )
+            rasters_distance_pct = comparison["distance"]
 
             # communicate result
             if rasters_distance_pct < 2:
@@ -246,26 +419,31 @@ def evaluate_output(all_script_file_names: tuple, clean_files: bool) -> None:
                     output_file_name_old,
                     output_file_name_new,
                     status,
-                    " (size adjusted)" if resized else "",
+                    " (size adjusted)" if comparison["resized"] else "",
                 )
             )
-
-            del rasters_distance_pct, resized
-
-        else:
-            # if old image file does not exist, skip
-            print(
-                " %02d. Skipping '%s': base figure not found."
-                % (script_count + 1, script_file_name)
+            entry.update(comparison)
+            entry.update({"example": output_file_name_old, "status": status})
+            report.append(entry)
+
+            # delete new file if needed
+            if clean_files and os.path.exists(output_file_name_new):
+                os.remove(output_file_name_new)
+
+    if report_file_name is not None:
+        with open(report_file_name, "w") as report_file:
+            json.dump(
+                {
+                    "jobs": jobs,
+                    "seconds": round(time.perf_counter() - start, 3),
+                    "block_size": BLOCK_SIZE,
+                    "block_tolerance": BLOCK_TOLERANCE,
+                    "scripts": report,
+                },
+                report_file,
+                indent=1,
             )
 
-        # delete new file if needed
-        if clean_files and os.path.exists(output_file_name_new):
-            os.remove(output_file_name_new)
-
-        del output_file_name_new, output_file_name_old
-        del script_count, script_file_name
-
     return None
 
 
@@ -280,17 +458,35 @@ if __name__ == "__main__":
         action="store_true",
         help="Delete new files if this flag is present.",
     )
+    arg_parser.add_argument(
+        "-jobs",
+        dest="jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes running the scripts (default: number of CPUs).",
+    )
+    arg_parser.add_argument(
+        "-report",
+        dest="report",
+        default=None,
+        help="Write the results to this JSON report file.",
+    )
     args = arg_parser.parse_args()
     del arg_parser
 
+    # Report file path relative to the folder of invocation
+    report_file_name = None if args.report is None else os.path.abspath(args.report)
+
     # Move to the Examples folder
     change_cwd()
 
     # list scripts to execute
     test_script_file_names = get_scripts_to_run()
 
-    # execute each one
-    evaluate_output(test_script_file_names, args.clean_files)
+    # execute all of them
+    evaluate_output(
+        test_script_file_names, args.clean_files, args.jobs, report_file_name
+    )
 
     # wrapping up message
     new_files_were = "deleted" if args.clean_files else "kept"
@@ -0,0 +1,109 @@
+"""
+This script was created to verify that read_csv_arrays reads the columns
+of CSV files as NumPy arrays, whole or in chunks, combines time columns and
+separates units, and that the arrays cached in NPZ files are those of the
+CSV files and are renewed when the CSV files change.
+
+It can be invoked from a command line as:
+
+$ python test_read_csv_arrays.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_read_csv_arrays.py
+
+Created on Oct 18, 2026
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 17
+NUMBER_ROWS = 5000
+
+
+# ## DEFS ####################################################################### #
+
+
+def write_csv(file_name, rng) -> dict:
+    """
+    Writes a CSV file of a time series with units in the headers
+    :param file_name: Name of the CSV file
+    :param rng: Random number generator
+    :return: Dictionary of the columns written
+    """
+
+    columns = {
+        "hour": np.repeat(np.arange(NUMBER_ROWS // 1000), 1000),
+        "t(sec)": np.tile(np.arange(1000) * 0.5, NUMBER_ROWS // 1000),
+        "Frequency (Hz)": rng.normal(60.0, 0.1, NUMBER_ROWS),
+        "station": rng.choice(["A1", "B22", "C333"], NUMBER_ROWS),
+    }
+    with open(file_name, "w") as file:
+        file.write(",".join(columns) + "\n")
+        for hour, second, frequency, station in zip(*columns.values()):
+            row = (hour, float(second), float(frequency), station)
+            file.write("%d,%r,%r,%s\n" % row)
+    return columns
+
+
+def test_read_csv_arrays() -> None:
+    """
+    Columns read whole, in chunks and from the cache
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "series.csv")
+        columns = write_csv(file_name, rng)
+
+        data = sm.read_csv_arrays(file_name)
+        assert list(data) == list(columns)
+        for name, values in columns.items():
+            assert np.array_equal(data[name], values)
+        assert data["Frequency (Hz)"].flags["C_CONTIGUOUS"]
+        assert os.path.isfile(file_name + ".npz")
+
+        # Arrays of the cache and of chunks equal to those of the file
+        for kwargs in ({}, {"chunksize": 700, "cache": "off"}):
+            again = sm.read_csv_arrays(file_name, **kwargs)
+            for name, values in data.items():
+                assert np.array_equal(again[name], values)
+                assert again[name].dtype == values.dtype
+
+        # Time axis and units
+        series = sm.read_csv_arrays(
+            file_name, time={"hour": 3600, "t(sec)": 1}, units="on", dtype=np.float32
+        )
+        assert list(series) == ["Frequency", "station", "time"]
+        assert series["Frequency"]["units"] == "Hz"
+        assert series["Frequency"]["values"].dtype == np.float32
+        time = 3600 * columns["hour"] + columns["t(sec)"]
+        assert np.array_equal(series["time"]["values"], time)
+        assert series["station"]["values"].dtype.kind == "U"
+
+        # Cache renewed when the file changes
+        columns = write_csv(file_name, rng)
+        data = sm.read_csv_arrays(file_name, columns=["Frequency (Hz)"])
+        assert list(data) == ["Frequency (Hz)"]
+        assert np.array_equal(data["Frequency (Hz)"], columns["Frequency (Hz)"])
+
+    try:
+        sm.read_csv_arrays(file_name, chunk=10)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unrecognized option accepted")
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_read_csv_arrays()
+    print("CSV arrays are consistent.")
@@ -0,0 +1,122 @@
+"""
+This script was created to verify that the options CSV files of
+taylor_diagram and target_diagram are parsed by read_options_file as
+pandas.read_csv did: missing values such as 'None' are skipped so the
+options keep their defaults. It also checks that a parsed file is cached,
+and read again when its modification time or size changes.
+
+It can be invoked from a command line as:
+
+$ python test_read_options_file.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_read_options_file.py
+
+Created on Oct 18, 2026
+"""
+
+import os
+import tempfile
+
+import skill_metrics as sm
+from skill_metrics.read_options_file import _parse_options_file
+
+# ## CONSTANTS ################################################################## #
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Examples")
+CONTENTS = (
+    "\ufeffKEY,VALUE,Notes\n"
+    "markersize,12,size of markers\n"
+    "\n"
+    'circles,"[0.5, 1.0]","radii, of circles"\n'
+    "markerobs,None,missing\n"
+    "cmap_vmin,NA\n"
+    "titlecolorbar,,empty\n"
+    "markerlabel\n"
+)
+
+
+# ## DEFS ####################################################################### #
+
+
+def write_file(file_name: str, contents: str) -> None:
+    """
+    Writes an options file
+    :param file_name: Name of the file
+    :param contents: Text of the file
+    """
+
+    with open(file_name, "w", encoding="utf-8", newline="") as file:
+        file.write(contents)
+
+
+def test_parse() -> None:
+    """
+    Keys and values in order, missing values as None
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "options.csv")
+        write_file(file_name, CONTENTS)
+        assert sm.read_options_file(file_name) == (
+            ("markersize", "12"),
+            ("circles", "[0.5, 1.0]"),
+            ("markerobs", None),
+            ("cmap_vmin", None),
+            ("titlecolorbar", None),
+            ("markerlabel", None),
+        )
+
+
+def test_missing_values_keep_defaults() -> None:
+    """
+    Options of missing values in the example file keep their defaults
+    """
+
+    file_name = os.path.join(EXAMPLES, "target_option_config.csv")
+    option = sm.get_target_diagram_options(target_options_file=file_name)
+    default = sm.get_target_diagram_options()
+
+    assert option["markerobs"] == default["markerobs"] == "none"
+    assert option["cmap_vmin"] is None
+    assert option["circles"] == [0.5, 1.0, 1.4, 2.0]
+    assert option["markersize"] == 10
+    assert option["circlelinespec"] == "k--"
+
+
+def test_cache() -> None:
+    """
+    File parsed once, and again when its time or size changes
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "options.csv")
+        write_file(file_name, CONTENTS)
+        os.utime(file_name, ns=(1_000_000_000, 1_000_000_000))
+
+        _parse_options_file.cache_clear()
+        options = sm.read_options_file(file_name)
+        assert sm.read_options_file(file_name) is options
+        info = _parse_options_file.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+        # Same size, later modification time
+        write_file(file_name, CONTENTS.replace("12", "14"))
+        os.utime(file_name, ns=(2_000_000_000, 2_000_000_000))
+        assert sm.read_options_file(file_name)[0] == ("markersize", "14")
+
+        # Same modification time, other size
+        write_file(file_name, CONTENTS.replace("12", "8"))
+        os.utime(file_name, ns=(2_000_000_000, 2_000_000_000))
+        assert sm.read_options_file(file_name)[0] == ("markersize", "8")
+        assert _parse_options_file.cache_info().misses == 3
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_parse()
+    test_missing_values_keep_defaults()
+    test_cache()
+    print("Options files are parsed consistently.")
@@ -0,0 +1,190 @@
+"""
+This script was created to verify the diagram rendering server of
+skill_metrics.render_server: the keys and the size-bounded eviction of
+its disk cache, which leaves the other files of its directory in place,
+a Unix socket path which must not replace a regular file, and a rendering round trip over HTTP served from the cache the second
+time.
+
+It can be invoked from a command line as:
+
+$ python test_render_server.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_render_server.py
+
+Created on Oct 18, 2026
+"""
+
+import json
+import os
+import tempfile
+import threading
+import urllib.request
+
+from skill_metrics.render_server import (
+    DiagramCache,
+    RenderService,
+    create_server,
+    request_key,
+)
+
+# ## CONSTANTS ################################################################## #
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+KEYS = {name: name * 64 + ".png" for name in "abcde"}  # keys of diagrams
+TAYLOR_REQUEST = {
+    "kind": "taylor",
+    "stats": {
+        "sdev": [1.0, 0.9, 1.2],
+        "crmsd": [0.0, 0.45, 0.55],
+        "ccoef": [1.0, 0.9, 0.9],
+    },
+    "options": {"markerLabel": ["Obs", "M1", "M2"], "checkStats": "off"},
+}
+
+
+# ## DEFS ####################################################################### #
+
+
+def test_request_key() -> None:
+    """
+    Same key for the same diagram however the request is written
+    """
+
+    key = request_key(TAYLOR_REQUEST)
+    assert key.endswith(".png")
+
+    # Option names are case insensitive and defaults are implicit
+    request = dict(TAYLOR_REQUEST, format="png", dpi=100)
+    request["options"] = {"markerlabel": ["Obs", "M1", "M2"], "CHECKSTATS": "off"}
+    assert request_key(request) == key
+
+    assert request_key(dict(TAYLOR_REQUEST, dpi=200)) != key
+    assert request_key(dict(TAYLOR_REQUEST, format="svg")).endswith(".svg")
+
+    try:
+        request_key(dict(TAYLOR_REQUEST, kind="polar"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid kind of diagram accepted")
+
+
+def test_cache_eviction() -> None:
+    """
+    Least recently used files evicted beyond the size of the cache
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiagramCache(directory, max_bytes=30)
+        cache.put(KEYS["a"], b"a" * 10)
+        cache.put(KEYS["b"], b"b" * 10)
+        cache.put(KEYS["c"], b"c" * 10)
+        assert cache.get(KEYS["a"]) == b"a" * 10
+
+        # 'b' is now the least recently used
+        cache.put(KEYS["d"], b"d" * 10)
+        assert cache.get(KEYS["b"]) is None
+        assert sorted(os.listdir(cache.directory)) == [KEYS[c] for c in "acd"]
+        assert cache.size == 30
+
+        # Too large to be cached
+        cache.put(KEYS["e"], b"e" * 31)
+        assert cache.get(KEYS["e"]) is None
+
+        # Index rebuilt from the directory
+        assert len(DiagramCache(directory, max_bytes=30)) == 3
+        assert len(DiagramCache(directory, max_bytes=20)) == 2
+
+
+def test_cache_directory_files() -> None:
+    """
+    Files other than diagrams left in place in the cache directory
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        user_file = os.path.join(directory, "notes.txt")
+        with open(user_file, "wb") as file:
+            file.write(b"n" * 100)
+        cache = DiagramCache(directory, max_bytes=10)
+        other_file = os.path.join(cache.directory, "a" * 64 + ".txt")
+        with open(other_file, "wb") as file:
+            file.write(b"t" * 100)
+
+        cache = DiagramCache(directory, max_bytes=10)
+        cache.put(KEYS["a"], b"a" * 10)
+        cache.put(KEYS["b"], b"b" * 10)
+        assert len(cache) == 1
+        assert os.path.isfile(user_file)
+        assert os.path.isfile(other_file)
+
+        try:
+            cache.put("notes.txt", b"n")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("File of invalid key written")
+
+
+def test_socket_path_file() -> None:
+    """
+    Regular file at the path of the Unix socket left in place
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "server.sock")
+        with open(socket_path, "wb") as file:
+            file.write(b"keep")
+        service = RenderService(DiagramCache(directory), workers=1)
+        try:
+            create_server(service, socket_path=socket_path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Regular file replaced by a socket")
+        finally:
+            service.close()
+        with open(socket_path, "rb") as file:
+            assert file.read() == b"keep"
+
+
+def test_render_round_trip() -> None:
+    """
+    Diagram rendered by a worker, then served from the cache
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiagramCache(directory)
+        service = RenderService(cache, workers=1)
+        server = create_server(service, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = "http://127.0.0.1:%d/taylor" % server.server_address[1]
+        body = json.dumps(dict(TAYLOR_REQUEST, kind=None)).encode()
+        try:
+            responses = []
+            for _ in range(2):
+                with urllib.request.urlopen(url, body) as response:
+                    assert response.headers["Content-Type"] == "image/png"
+                    responses.append((response.headers["X-Cache"], response.read()))
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+        assert [cache for cache, _ in responses] == ["MISS", "HIT"]
+        assert responses[0][1].startswith(PNG_SIGNATURE)
+        assert responses[0][1] == responses[1][1]
+        assert os.listdir(cache.directory) == [request_key(TAYLOR_REQUEST)]
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_request_key()
+    test_cache_eviction()
+    test_cache_directory_files()
+    test_socket_path_file()
+    test_render_round_trip()
+    print("Rendering server and cache are consistent.")
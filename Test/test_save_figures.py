@@ -0,0 +1,132 @@
+"""
+This script was created to verify that save_figures saves an explicit list
+of figures to files or to in-memory buffers, with the requested resolution
+and compression, and gives the same images when raster figures are saved
+by several worker processes.
+
+It can be invoked from a command line as:
+
+$ python test_save_figures.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_save_figures.py
+
+Created on Oct 18, 2026
+"""
+
+import os
+import tempfile
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_FIGURES = 3
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_figures() -> list:
+    """
+    Target diagrams of random statistics
+    :return: List of figures
+    """
+
+    rng = np.random.default_rng(0)
+    figures = []
+    for _ in range(NUMBER_FIGURES):
+        fig = plt.figure(figsize=(4, 3))
+        bias = rng.uniform(-1.0, 1.0, 4)
+        crmsd = rng.uniform(0.1, 1.0, 4)
+        sm.target_diagram(fig.add_subplot(), bias, crmsd, np.hypot(bias, crmsd))
+        figures.append(fig)
+    return figures
+
+
+def png_size(data: bytes) -> tuple:
+    """
+    Size of a PNG image from its header
+    :param data: PNG image
+    :return: (width, height) in pixels
+    """
+
+    assert data.startswith(PNG_SIGNATURE)
+    return int.from_bytes(data[16:20], "big"), int.from_bytes(data[20:24], "big")
+
+
+def test_buffers() -> None:
+    """
+    Figures saved to buffers with the requested resolution and compression
+    """
+
+    figures = make_figures()
+    try:
+        buffers = sm.save_figures(None, ".png", figures=figures, dpi=50, buffers=True)
+        assert len(buffers) == NUMBER_FIGURES
+        assert png_size(buffers[0].getvalue()) == (200, 150)
+
+        stored = sm.save_figures(
+            None, "png", figures=figures[:1], dpi=50, compression=0, buffers=True
+        )
+        assert png_size(stored[0].getvalue()) == (200, 150)
+        assert len(stored[0].getvalue()) > len(buffers[0].getvalue())
+
+        for compression in (True, 2.0, 10, "9"):
+            try:
+                sm.save_figures(
+                    None, "png", figures=figures[:1], compression=compression
+                )
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Invalid compression accepted: %r" % compression)
+
+        # All figures as the pages of a single PDF
+        pdf = sm.save_figures(None, ".pdf", figures=figures, buffers=True)
+        assert len(pdf) == 1
+        assert pdf[0].getvalue().count(b"/Type /Page ") == NUMBER_FIGURES
+        assert pdf[0].read(5) == b"%PDF-"
+        assert buffers[0].read(8) == b"\x89PNG\r\n\x1a\n"
+    finally:
+        for fig in figures:
+            plt.close(fig)
+
+
+def test_files_and_workers() -> None:
+    """
+    Numbered files saved by worker processes same as in this process
+    """
+
+    figures = make_figures()
+    try:
+        serial = sm.save_figures(None, ".png", figures=figures, buffers=True)
+        with tempfile.TemporaryDirectory() as directory:
+            name = os.path.join(directory, "target")
+            sm.save_figures(name, ".png", figures=figures, workers=2)
+            assert sorted(os.listdir(directory)) == [
+                "target_%d.png" % (i + 1) for i in range(NUMBER_FIGURES)
+            ]
+            for i, buffer in enumerate(serial):
+                with open("%s_%d.png" % (name, i + 1), "rb") as file:
+                    assert file.read() == buffer.getvalue()
+    finally:
+        for fig in figures:
+            plt.close(fig)
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_buffers()
+    test_files_and_workers()
+    print("Figures are saved consistently.")
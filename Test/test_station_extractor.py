@@ -0,0 +1,106 @@
+"""
+This script was created to verify that StationExtractor extracts the
+values of gridded fields at stations by bilinear interpolation and by
+nearest grid cell, for grids with increasing or decreasing coordinates,
+and that the extracted series can be scored station by station.
+
+It can be invoked from a command line as:
+
+$ python test_station_extractor.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_station_extractor.py
+
+Created on Oct 18, 2026
+"""
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 5
+NUMBER_TIMES = 24
+NUMBER_STATIONS = 300
+LATITUDE = np.linspace(60.0, 20.0, 41)  # north to south
+LONGITUDE = np.linspace(-100.0, -40.0, 121)
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_field(time) -> np.ndarray:
+    """
+    Field varying bilinearly in space, hence interpolated exactly
+    :param time: Times of the field
+    :return: Array of shape (time, latitude, longitude)
+    """
+
+    lat = LATITUDE[None, :, None]
+    lon = LONGITUDE[None, None, :]
+    t = np.asarray(time, dtype=float)[:, None, None]
+    return 2.0 + t * lat + 0.1 * lon + 0.01 * t * lat * lon
+
+
+def test_bilinear() -> None:
+    """
+    Bilinear values equal to those of the field at the stations
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    lat = rng.uniform(20.0, 60.0, NUMBER_STATIONS)
+    lon = rng.uniform(-100.0, -40.0, NUMBER_STATIONS)
+    time = np.arange(NUMBER_TIMES)
+    field = make_field(time)
+
+    extract = sm.StationExtractor(LATITUDE, LONGITUDE, lat, lon)
+    values = extract(field)
+    assert values.shape == (NUMBER_STATIONS, NUMBER_TIMES)
+    t = time[None, :]
+    expected = 2.0 + t * lat[:, None] + 0.1 * lon[:, None]
+    expected += 0.01 * t * (lat * lon)[:, None]
+    assert np.allclose(values, expected, rtol=1e-12)
+    assert np.allclose(extract(field[5]), expected[:, 5], rtol=1e-12)
+
+    # Weights shared by extractors of the same stations
+    other = sm.StationExtractor(LATITUDE, LONGITUDE, lat, lon)
+    assert other.weight is extract.weight
+
+    # Series of each station scored against observations
+    observed = expected + rng.normal(0.0, 1.0, expected.shape)
+    stats = [sm.target_statistics(p, r) for p, r in zip(values, observed)]
+    assert len(stats) == NUMBER_STATIONS
+
+
+def test_nearest() -> None:
+    """
+    Values of the nearest grid cells, NaN outside of the grid
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    lat = np.append(rng.uniform(20.0, 60.0, NUMBER_STATIONS), 61.0)
+    lon = np.append(rng.uniform(-100.0, -40.0, NUMBER_STATIONS), -50.0)
+    field = make_field(np.arange(NUMBER_TIMES))
+
+    values = sm.StationExtractor(LATITUDE, LONGITUDE, lat, lon, "nearest")(field)
+    row = np.abs(LATITUDE[None, :] - lat[:-1, None]).argmin(axis=1)
+    column = np.abs(LONGITUDE[None, :] - lon[:-1, None]).argmin(axis=1)
+    assert np.array_equal(values[:-1], field[:, row, column].T)
+    assert np.isnan(values[-1]).all()
+
+    try:
+        sm.StationExtractor(LATITUDE, LONGITUDE, lat, lon)(field[:, :-1])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Field of another grid extracted")
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_bilinear()
+    test_nearest()
+    print("Station extraction is consistent.")
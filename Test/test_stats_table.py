@@ -0,0 +1,168 @@
+"""
+This script was created to verify that statistics written as columnar
+tables by write_stats_table and StatsTableWriter, in CSV and NPZ formats,
+are read back by read_stats_table in the layout of the diagram functions,
+including tables appended to in chunks and data sets of the same title.
+Parquet tables are checked when
+pyarrow is installed.
+
+It can be invoked from a command line as:
+
+$ python test_stats_table.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_stats_table.py
+
+Created on Oct 18, 2026
+"""
+
+import importlib.util
+import os
+import tempfile
+
+import numpy as np
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 3
+FORMATS = (".csv", ".npz") + (
+    (".parquet",) if importlib.util.find_spec("pyarrow") else ()
+)
+LABELS = ["Obs", "M1", "M2", "M3"]
+
+
+# ## DEFS ####################################################################### #
+
+
+def make_taylor_stats(rng) -> dict:
+    """
+    Random statistics of a Taylor diagram
+    :param rng: Random number generator
+    :return: Dictionary of statistics of a reference and 3 series
+    """
+
+    sdev = rng.uniform(0.5, 1.5, len(LABELS))
+    ccoef = rng.uniform(0.2, 1.0, len(LABELS))
+    sdev[0], ccoef[0] = 1.0, 1.0
+    crmsd = np.sqrt(1.0 + sdev**2 - 2.0 * sdev * ccoef)
+    return {"sdev": sdev, "crmsd": crmsd, "ccoef": ccoef}
+
+
+def test_round_trip() -> None:
+    """
+    Data sets read back exactly, with their titles and labels
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    data = [make_taylor_stats(rng) for _ in range(3)]
+    data[1]["crmsd"][2] = np.nan
+    title = ["Expt. 1", "Expt. 2", "Expt. 3"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in FORMATS:
+            file_name = os.path.join(directory, "taylor" + extension)
+            sm.write_stats_table(file_name, data, title=title, label=LABELS[:3])
+            tables = sm.read_stats_table(file_name)
+
+            assert [table["title"] for table in tables] == title
+            for stats, table in zip(data, tables):
+                assert table["label"] == LABELS[:3] + [""]
+                for name in ("sdev", "crmsd", "ccoef"):
+                    assert np.array_equal(table[name], stats[name], equal_nan=True)
+
+            # Arguments of the diagram functions
+            sm.taylor_diagram(
+                Figure().add_subplot(),
+                tables[0]["sdev"],
+                tables[0]["crmsd"],
+                tables[0]["ccoef"],
+                markerLabel=tables[0]["label"],
+            )
+
+            tidy = sm.read_stats_table(file_name, tidy=True)
+            assert list(tidy) == ["set", "title", "label", "sdev", "crmsd", "ccoef"]
+            assert len(tidy["title"]) == 3 * len(LABELS)
+            assert np.array_equal(tidy["set"], np.repeat(np.arange(3), len(LABELS)))
+
+
+def test_repeated_titles() -> None:
+    """
+    Data sets of the same title kept apart, also when appended
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    data = [make_taylor_stats(rng) for _ in range(3)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in FORMATS:
+            file_name = os.path.join(directory, "taylor" + extension)
+            sm.write_stats_table(file_name, data[:2], title="Expt")
+            if extension == ".parquet":
+                sm.write_stats_table(file_name, data[2], title="Expt", overwrite=True)
+                tables = sm.read_stats_table(file_name)
+                assert len(tables) == 1
+                continue
+            sm.write_stats_table(file_name, data[2], title="Expt", append=True)
+            tables = sm.read_stats_table(file_name)
+
+            assert [table["title"] for table in tables] == ["Expt"] * 3
+            for stats, table in zip(data, tables):
+                assert len(table["label"]) == len(LABELS)
+                for name in ("sdev", "crmsd", "ccoef"):
+                    assert np.array_equal(table[name], stats[name])
+
+                # Reference point first in each data set
+                assert table["sdev"][0] == 1.0 and table["ccoef"][0] == 1.0
+
+
+def test_chunks() -> None:
+    """
+    Rows appended in chunks, to an open writer and to an existing file
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in (".csv", ".npz"):
+            file_name = os.path.join(directory, "target" + extension)
+            columns = ["bias", "crmsd", "rmsd"]
+            chunks = [dict(zip(columns, rng.random((3, 50)))) for _ in range(4)]
+            with sm.StatsTableWriter(file_name, columns) as table:
+                for i, chunk in enumerate(chunks[:2]):
+                    table.write(chunk, title="Stations", continued=i > 0)
+            with sm.StatsTableWriter(file_name, columns, append=True) as table:
+                table.write(chunks[2], title="Stations", continued=True)
+            sm.write_stats_table(file_name, chunks[3], title="Stations", append=True)
+
+            stations, appended = sm.read_stats_table(file_name)
+            for name in columns:
+                values = np.concatenate([chunk[name] for chunk in chunks[:3]])
+                assert np.array_equal(stations[name], values)
+                assert np.array_equal(appended[name], chunks[3][name])
+
+            # Tables of other statistics cannot be appended to
+            try:
+                sm.write_stats_table(file_name, {"bias": 0.0}, append="on")
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Table of other statistics appended to")
+
+            try:
+                sm.write_stats_table(file_name, chunks[0])
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Existing file overwritten")
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_repeated_titles()
+    test_chunks()
+    print("Statistics tables are consistent.")
@@ -0,0 +1,181 @@
+"""
+This script was created to verify that target and Taylor diagrams can be
+rendered concurrently from several threads, e.g. by a web service that draws
+each diagram on its own matplotlib Figure.
+
+Every case is first rendered serially to obtain a reference image. The same
+cases are then rendered many times in a pool of threads, each on a separate
+Figure created without pyplot, and the resulting pixels are compared with the
+serial reference. Any difference indicates that the plotting functions touch
+global pyplot state (current figure/axes) instead of the Axes they are given.
+
+It can be invoked from a command line as:
+
+$ python test_thread_safety.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_thread_safety.py
+
+Created on Oct 18, 2026
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+NUMBER_THREADS = 8
+NUMBER_REPEATS = 4
+FIGURE_SIZE = (6, 5)
+FIGURE_DPI = 72
+RANDOM_SEED = 42
+
+
+# ## DEFS ####################################################################### #
+
+
+def get_taylor_stats(number_series: int) -> tuple:
+    """
+    Create a consistent set of Taylor statistics with a fixed seed
+    :param number_series: Number of predicted series (reference excluded)
+    :return: (STDs, RMSs, CORs) with the reference series as first element
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    sdev = np.concatenate(([1.0], rng.uniform(0.5, 1.5, number_series)))
+    ccoef = np.concatenate(([1.0], rng.uniform(0.3, 0.99, number_series)))
+    crmsd = np.sqrt(sdev**2 + sdev[0] ** 2 - 2 * sdev * sdev[0] * ccoef)
+    return sdev, crmsd, ccoef
+
+
+def get_target_stats(number_series: int) -> tuple:
+    """
+    Create a consistent set of target statistics with a fixed seed
+    :param number_series: Number of predicted series
+    :return: (Bs, RMSDs, RMSDz)
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    bias = rng.uniform(-1.0, 1.0, number_series)
+    crmsd = rng.uniform(0.1, 1.0, number_series)
+    rmsd = np.sqrt(bias**2 + crmsd**2)
+    return bias, crmsd, rmsd
+
+
+def draw_case(case: str) -> np.ndarray:
+    """
+    Render a single diagram on a new Figure that is not managed by pyplot
+    :param case: Name of the case to render, one of CASES
+    :return: RGBA pixels of the rendered figure
+    """
+
+    fig = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+
+    labels = ["Ref", "M1", "M2", "M3", "M4", "M5", "M6", "M7"]
+    if case == "taylor_legend":
+        sdev, crmsd, ccoef = get_taylor_stats(7)
+        sm.taylor_diagram(
+            ax, sdev, crmsd, ccoef, markerLabel=labels, markerLegend="on"
+        )
+    elif case == "taylor_colorbar":
+        sdev, crmsd, ccoef = get_taylor_stats(7)
+        sm.taylor_diagram(
+            ax,
+            sdev,
+            crmsd,
+            ccoef,
+            markerDisplayed="colorBar",
+            titleColorbar="RMSD",
+        )
+    elif case == "target_legend":
+        bias, crmsd, rmsd = get_target_stats(7)
+        sm.target_diagram(
+            ax, bias, crmsd, rmsd, markerLabel=labels[1:], markerLegend="on"
+        )
+    elif case == "target_colorbar":
+        bias, crmsd, rmsd = get_target_stats(7)
+        sm.target_diagram(
+            ax,
+            bias,
+            crmsd,
+            rmsd,
+            markerDisplayed="colorBar",
+            titleColorbar="RMSD",
+        )
+    else:
+        raise ValueError("Unknown case: %s" % case)
+
+    # legend and colorbar must be attached to the figure that was supplied
+    if case.endswith("_legend"):
+        assert ax.get_legend() is not None, "legend not drawn in axes: " + case
+    else:
+        assert len(fig.axes) == 2, "colorbar not drawn in figure: " + case
+
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+CASES = ("taylor_legend", "taylor_colorbar", "target_legend", "target_colorbar")
+
+
+def render_concurrently(cases: tuple, number_threads: int) -> list:
+    """
+    Render the cases in a pool of threads
+    :param cases: Sequence of case names, repetitions allowed
+    :param number_threads: Number of threads in the pool
+    :return: List of RGBA pixel arrays in the order of cases
+    """
+
+    with ThreadPoolExecutor(max_workers=number_threads) as executor:
+        return list(executor.map(draw_case, cases))
+
+
+def test_concurrent_rendering_matches_serial() -> None:
+    """
+    Diagrams rendered in parallel threads must be identical to serial ones
+    """
+
+    reference = {case: draw_case(case) for case in CASES}
+
+    cases = CASES * NUMBER_REPEATS
+    images = render_concurrently(cases, NUMBER_THREADS)
+
+    for case, image in zip(cases, images):
+        assert image.shape == reference[case].shape, case
+        assert np.array_equal(image, reference[case]), case
+
+    # no figure may have been created through the global pyplot registry
+    assert plt.get_fignums() == []
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        "-threads",
+        dest="threads",
+        type=int,
+        default=NUMBER_THREADS,
+        help="Number of threads used for rendering.",
+    )
+    args = arg_parser.parse_args()
+    del arg_parser
+
+    NUMBER_THREADS = args.threads
+    test_concurrent_rendering_matches_serial()
+    print("Concurrent rendering matches serial rendering.")
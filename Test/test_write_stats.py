@@ -0,0 +1,172 @@
+"""
+This script was created to verify the layout of the Excel files written by
+write_stats, write_target_stats and write_taylor_stats in constant memory
+mode, including batches of statistics continued on new worksheets.
+
+The cells are read back from the XML of the worksheets, so no Excel reader
+is needed.
+
+It can be invoked from a command line as:
+
+$ python test_write_stats.py
+
+or collected by pytest:
+
+$ python -m pytest Test/test_write_stats.py
+
+Created on Oct 18, 2026
+"""
+
+import os
+import re
+import tempfile
+import zipfile
+
+import numpy as np
+
+import skill_metrics as sm
+
+# ## CONSTANTS ################################################################## #
+
+RANDOM_SEED = 5
+TAYLOR_HEADERS = ["Description", "Standard Deviation", "CRMSD", "Correlation Coeff."]
+TARGET_HEADERS = ["Description", "Bias", "uRMSD", "RMSD"]
+
+
+# ## DEFS ####################################################################### #
+
+
+def read_cells(file_name: str) -> list:
+    """
+    Values of the cells of each worksheet of an Excel file
+    :param file_name: Excel file written by xlsxwriter
+    :return: List of dictionaries of the values by cell, e.g. 'B5'
+    """
+
+    sheets = []
+    with zipfile.ZipFile(file_name) as archive:
+        names = [n for n in archive.namelist() if n.startswith("xl/worksheets/")]
+        for number in range(1, len(names) + 1):
+            xml = archive.read("xl/worksheets/sheet%d.xml" % number).decode()
+            cells = {}
+            for ref, body in re.findall(r'<c r="(\w+)"[^>]*>(.*?)</c>', xml):
+                text = re.search(r"<t[^>]*>(.*?)</t>", body)
+                if text:
+                    cells[ref] = text.group(1)
+                else:
+                    cells[ref] = float(re.search(r"<v>(.*?)</v>", body).group(1))
+            sheets.append(cells)
+    return sheets
+
+
+def get_row(cells: dict, row: int, columns: str = "ABCD") -> list:
+    """
+    Values of a row of a worksheet
+    :param cells: Values by cell
+    :param row: Row number, from 1
+    :param columns: Letters of the columns
+    :return: List of values, None for blank cells
+    """
+
+    return [cells.get("%s%d" % (column, row)) for column in columns]
+
+
+def test_taylor_stats() -> None:
+    """
+    Title, headers, labels and statistics of each data set
+    """
+
+    rng = np.random.default_rng(RANDOM_SEED)
+    data = [
+        {"sdev": rng.random(3), "crmsd": rng.random(3), "ccoef": rng.random(3)}
+        for _ in range(2)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "taylor.xlsx")
+        sm.write_taylor_stats(
+            file_name, data, title=["Expt. 1", "Expt. 2"], label=["Obs", "M1"]
+        )
+        (cells,) = read_cells(file_name)
+
+        try:
+            sm.write_taylor_stats(file_name, data)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Existing file overwritten")
+
+    assert cells["A2"] == "Taylor Statistics"
+    assert cells["A4"] == "Expt. 1"
+    assert get_row(cells, 5) == TAYLOR_HEADERS
+    assert get_row(cells, 6)[0] == "Obs"
+    assert np.allclose(get_row(cells, 6)[1:], [d[0] for d in data[0].values()])
+    assert np.allclose(get_row(cells, 8)[1:], [d[2] for d in data[0].values()])
+    assert get_row(cells, 8)[0] is None  # fewer labels than statistics
+    assert get_row(cells, 9) == [None] * 4
+    assert cells["A10"] == "Expt. 2"
+    assert np.allclose(get_row(cells, 14)[1:], [d[2] for d in data[1].values()])
+
+
+def test_target_worksheets() -> None:
+    """
+    Rows beyond the size of a worksheet continued on new worksheets
+    """
+
+    ndata = 25
+    rng = np.random.default_rng(RANDOM_SEED)
+    data = {"bias": rng.random(ndata), "crmsd": rng.random(ndata)}
+    data["rmsd"] = np.hypot(data["bias"], data["crmsd"])
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "target.xlsx")
+        sm.write_target_stats(file_name, data, title=["Expt. 1"], maxrows=10)
+        sheets = read_cells(file_name)
+
+    # 5 rows of data on the first worksheet, 8 on the next ones
+    assert len(sheets) == 4
+    bias = []
+    for number, cells in enumerate(sheets):
+        assert cells["A%d" % (4 if number == 0 else 1)] == "Expt. 1"
+        assert get_row(cells, 5 if number == 0 else 2) == TARGET_HEADERS
+        bias += [v for k, v in cells.items() if k[0] == "B" and isinstance(v, float)]
+    assert np.allclose(bias, data["bias"])
+
+
+def test_stats_cases() -> None:
+    """
+    One column per case, continued on new worksheets beyond Excel columns
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "stats.xlsx")
+        sm.write_stats(file_name, {"bias": 0.5, "nse": 0.25})
+        (cells,) = read_cells(file_name)
+        assert cells == {
+            "A2": "Skill Metrics",
+            "A4": "Skill Metric",
+            "B4": "Case 1",
+            "A5": "bias",
+            "B5": 0.5,
+            "A6": "nse",
+            "B6": 0.25,
+        }
+
+        ncase = 20000
+        data = {"bias": np.arange(ncase) / 10.0, "nse": np.ones(ncase)}
+        sm.write_stats(file_name, data, title="Stations", overwrite=True)
+        sheets = read_cells(file_name)
+
+    assert len(sheets) == 2
+    assert sheets[1]["A2"] == "Stations"
+    assert sheets[1]["B4"] == "Case 16384"
+    assert sheets[1]["B5"] == 1638.3
+    # Title and 3 row names on each worksheet, 3 values per case
+    assert len(sheets[0]) + len(sheets[1]) == 2 * 4 + 3 * ncase
+
+
+# ## MAIN ####################################################################### #
+
+if __name__ == "__main__":
+    test_taylor_stats()
+    test_target_worksheets()
+    test_stats_cases()
+    print("Statistics are written consistently.")
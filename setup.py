@@ -16,6 +16,7 @@ setup(
     version="1.2.3",
     packages=find_packages(),
     install_requires=["matplotlib", "numpy", "pandas", "xlsxwriter"],
+    entry_points={"console_scripts": ["skill-metrics=skill_metrics.cli:main"]},
     author="Peter Rochford",
     author_email="rochford.peter1@gmail.com",
     description="A Python library for calculating and displaying the skill of model predictions against observations.",
@@ -1,40 +1,71 @@
 from .add_legend import add_legend
+from .add_legend_table import add_legend_table
+from .add_scene_markers import add_scene_markers
 from .bias import bias
 from .bias_percent import bias_percent
 from .brier_score import brier_score
 from .centered_rms_dev import centered_rms_dev
+from .check_density_options import check_density_bins, check_density_scale
 from .check_duplicate_stats import check_duplicate_stats
 from .check_on_off import check_on_off
 from .check_taylor_stats import check_taylor_stats
+from .compile_target_diagram_options import compile_target_diagram_options
+from .compile_taylor_diagram_options import compile_taylor_diagram_options
+from .convert_data_file import convert_data_file
+from .diagram_options import DiagramOptions
+from .diagram_scene import DiagramScene
 from .error_check_stats import error_check_stats
+from .facet_diagrams import facet_diagrams
+from .file_cache import FileCache
 from .get_axis_tick_label import get_axis_tick_label
 from .get_default_markers import get_default_markers
 from .get_from_dict_or_default import get_from_dict_or_default
 from .get_single_markers import get_single_markers
 from .get_target_diagram_axes import get_target_diagram_axes
+from .get_target_diagram_geometry import get_target_diagram_geometry
 from .get_target_diagram_options import get_target_diagram_options
 from .get_taylor_diagram_axes import get_taylor_diagram_axes
+from .get_taylor_diagram_geometry import get_taylor_diagram_geometry
 from .get_taylor_diagram_options import get_taylor_diagram_options
 from .kling_gupta_eff09 import kling_gupta_eff09
 from .kling_gupta_eff12 import kling_gupta_eff12
+from .metric_cache import MetricCache
+from .moment_store import MomentStore
 from .nash_sutcliffe_eff import nash_sutcliffe_eff
 from .overlay_target_diagram_circles import overlay_target_diagram_circles
 from .overlay_taylor_diagram_circles import overlay_taylor_diagram_circles
 from .overlay_taylor_diagram_lines import overlay_taylor_diagram_lines
+from .pair_time_series import pair_time_series
+from .place_marker_labels import place_marker_labels
+from .plot_markers import plot_markers
 from .plot_pattern_diagram_colorbar import plot_pattern_diagram_colorbar
+from .plot_pattern_diagram_density import plot_pattern_diagram_density
 from .plot_pattern_diagram_markers import plot_pattern_diagram_markers
 from .plot_target_axes import plot_target_axes
 from .plot_taylor_axes import plot_taylor_axes
 from .plot_taylor_obs import plot_taylor_obs
+from .read_array_store import read_array_store
+from .read_csv_arrays import read_csv_arrays
+from .read_options_file import read_options_file
+from .read_stats_table import read_stats_table
 from .report_duplicate_stats import report_duplicate_stats
 from .rmsd import rmsd
 from .save_figures import save_figures
 from .skill_score_brier import skill_score_brier
 from .skill_score_murphy import skill_score_murphy
+from .station_extractor import StationExtractor
+from .stats_table_writer import StatsTableWriter
+from .stats_workbook import StatsWorkbook
 from .target_diagram import target_diagram
+from .target_diagram_scene import target_diagram_scene
 from .target_statistics import target_statistics
 from .taylor_diagram import taylor_diagram
+from .taylor_diagram_scene import taylor_diagram_scene
 from .taylor_statistics import taylor_statistics
+from .write_array_store import write_array_store
+from .write_diagram_json import write_diagram_json
+from .write_diagram_svg import write_diagram_svg
 from .write_stats import write_stats
+from .write_stats_table import write_stats_table
 from .write_target_stats import write_target_stats
 from .write_taylor_stats import write_taylor_stats
@@ -1,10 +1,20 @@
 import math
 
-import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
-
-
-def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[]):
+from .add_legend_table import add_legend_table
+
+
+def add_legend(
+    markerLabel,
+    labelcolor,
+    option,
+    rgba,
+    markerSize,
+    fontSize,
+    hp=[],
+    ax=None,
+    kind=None,
+):
     """
     Adds a legend to a pattern diagram.
 
@@ -14,6 +24,10 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
     a one-to-one match. If labels are provided as a dictionary they will
     appear beside a dot with the color value given to the label.
 
+    If option['legendmode'] is 'table' or 'figure' the labels are shown
+    in a table beside the diagram or on separate legend figures instead
+    (see ADD_LEGEND_TABLE), which scales to hundreds of labels.
+
     INPUTS:
     markerLabel : list or dict variable containing markers and labels to
                   appear in legend
@@ -29,6 +43,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
 
     option : dictionary containing option values. (Refer to
         GET_TARGET_DIAGRAM_OPTIONS function for more information.)
+    option['legendmode']   : 'legend' (default), 'table' or 'figure'
     option['numberpanels'] : Number of panels to display
                              = 1 for positive correlations
                              = 2 for positive and negative correlations
@@ -37,12 +52,18 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
     markerSize : point size of markers
     fontSize : font size in points of labels
     hp : list of plot handles that match markerLabel when latter is a list
+    ax : matplotlib.axes.Axes receiving the legend. If None, the current
+         pyplot axes is used. Pass the axes explicitly when rendering
+         diagrams outside of pyplot, e.g. concurrently in several threads.
+    kind : kind of diagram, 'taylor' or 'target', required when
+           option['legendmode'] is 'table'
 
     OUTPUTS:
-    None
+    pages : list of legend figures when option['legendmode'] is 'table'
+            or 'figure', otherwise None
 
     Created on Mar 2, 2019
-    Revised on Mar 2, 2019
+    Revised on Oct 18, 2026
 
     Author: Peter A. Rochford
         Symplectic, LLC
@@ -50,6 +71,24 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
         prochford@thesymplectic.com
     """
 
+    if ax is None:
+        import matplotlib.pyplot as plt
+
+        ax = plt.gca()
+
+    if _checkKey(option, "legendmode") and option["legendmode"] != "legend":
+        return add_legend_table(
+            ax,
+            markerLabel,
+            labelcolor,
+            option,
+            rgba,
+            markerSize,
+            fontSize,
+            hp,
+            kind=kind,
+        )
+
     if type(markerLabel) is list:
         # Check for empty list of plot handles
         if len(hp) == 0:
@@ -66,7 +105,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
         if len(markerLabel) <= 6:
             # Put legend in a default location
             markerlabel = tuple(markerLabel)
-            leg = plt.legend(
+            leg = ax.legend(
                 hp,
                 markerlabel,
                 loc="upper right",
@@ -86,7 +125,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
             markerlabel = tuple(markerLabel)
 
             # Shift figure to include legend
-            plt.gcf().subplots_adjust(right=0.6)
+            ax.figure.subplots_adjust(right=0.6)
 
             # Plot legend of multi-column markers
             # Note: do not use bbox_to_anchor as this cuts off the legend
@@ -94,7 +133,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
                 loc = (1.2, 0.25)
             else:
                 loc = (1.1, 0.25)
-            leg = plt.legend(
+            leg = ax.legend(
                 hp, markerlabel, loc=loc, fontsize=fontSize, numpoints=1, ncol=ncol
             )
 
@@ -117,7 +156,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
             legend_elements.append(legend_object)
 
         # Put legend in a default location
-        leg = plt.legend(
+        leg = ax.legend(
             handles=legend_elements,
             loc="upper right",
             fontsize=fontSize,
@@ -127,7 +166,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp=[
 
         if _checkKey(option, "numberpanels") and option["numberpanels"] == 2:
             # add padding so legend is not cut off
-            plt.tight_layout(pad=1)
+            ax.figure.tight_layout(pad=1)
     else:
         raise Exception(
             "markerLabel type is not a list or dictionary: " + str(type(markerLabel))
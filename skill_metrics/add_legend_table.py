@@ -0,0 +1,258 @@
+import math
+
+import matplotlib.axes
+import matplotlib.colors as clr
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.markers import MarkerStyle
+from matplotlib.textpath import text_to_path
+
+# Columns per legend figure when option['markerlayout'][1] is not given
+_PAGE_COLUMNS = 4
+
+# Room left for the axis labels beside each kind of diagram, in widths of
+# the diagram
+_LABEL_ROOM = {"taylor": 0.1, "target": 0.2}
+
+
+def add_legend_table(
+    ax: matplotlib.axes.Axes,
+    markerLabel,
+    labelcolor,
+    option: dict,
+    rgba,
+    markerSize,
+    fontSize,
+    hp=[],
+    kind=None,
+) -> list:
+    """
+    Adds a table of marker labels to a pattern diagram or legend figures.
+
+    A scalable alternative to ADD_LEGEND for diagrams with hundreds of
+    labeled markers. Instead of a matplotlib legend, whose layout cost
+    grows quickly with the number of entries, the labels are laid out
+    once on a fixed grid of rows and columns, whose column width is that
+    of the widest label from the font metrics. The markers of all entries
+    are drawn in batches (one scatter collection per marker symbol) as
+    proxies of the markers in the diagram, and each label is a plain text
+    at a precomputed position. No tight layout pass of the figure is done.
+
+    The display depends on option['legendmode']:
+    'table'  : The labels are listed in a table to the right of the
+               diagram. The number of rows follows from the height of the
+               diagram and the number of columns from the free width of the
+               figure. Labels that do not fit are put on legend figures,
+               all of them if not even one column fits in the figure.
+    'figure' : All labels are put on legend figures.
+
+    Legend figures are matplotlib.figure.Figure objects that are not
+    managed by pyplot, one per page of option['markerlayout'] rows and
+    columns (4 columns if not given). They can be saved with their
+    savefig method.
+
+    INPUTS:
+    ax          : matplotlib.axes.Axes of the diagram
+    markerLabel : list or dict variable containing markers and labels to
+                  appear in legend (see ADD_LEGEND)
+    labelcolor  : color of marker labels, one per label
+    option      : dictionary containing option values. (Refer to
+                  GET_TAYLOR_DIAGRAM_OPTIONS or GET_TARGET_DIAGRAM_OPTIONS
+                  functions for more information.)
+    option['legendmode']   : 'table' or 'figure'
+    option['markerlayout'] : rows and columns of a legend figure page
+    rgba       : face color of the markers when markerLabel is a dict
+    markerSize : point size of markers
+    fontSize   : font size in points of labels
+    hp         : list of plot handles that match markerLabel when latter
+                 is a list
+    kind       : kind of diagram, 'taylor' or 'target', which sets the
+                 room left for its axis labels. Required for the 'table'
+                 mode.
+
+    OUTPUTS:
+    pages : list of legend figures (empty if all labels fit in the table)
+
+    Created on Oct 18, 2026
+    """
+
+    # Collect legend entries
+    if type(markerLabel) is list:
+        if len(hp) != len(markerLabel):
+            raise ValueError(
+                "Number of labels and plot handle do not match: "
+                + str(len(markerLabel))
+                + " != "
+                + str(len(hp))
+            )
+        labels = [str(label) for label in markerLabel]
+        symbols = [h.get_marker() for h in hp]
+        sizes = np.array([h.get_markersize() for h in hp], dtype=float)
+        widths = np.array([h.get_markeredgewidth() for h in hp], dtype=float)
+        facecolors = clr.to_rgba_array([h.get_markerfacecolor() for h in hp])
+        edgecolors = clr.to_rgba_array([h.get_markeredgecolor() for h in hp])
+    elif type(markerLabel) is dict:
+        labels = [str(label) for label in markerLabel.keys()]
+        symbols = ["."] * len(labels)
+        sizes = np.full(len(labels), float(markerSize))
+        widths = np.ones(len(labels))
+        facecolors = clr.to_rgba_array([rgba] * len(labels))
+        edgecolors = clr.to_rgba_array(list(markerLabel.values()))
+    else:
+        raise Exception(
+            "markerLabel type is not a list or dictionary: " + str(type(markerLabel))
+        )
+    entries = (labels, list(labelcolor), symbols, sizes, widths, facecolors, edgecolors)
+    nentries = len(labels)
+
+    # Size of a table cell in points, from the widest label
+    maxsize = np.max(sizes, initial=markerSize)
+    rowheight = 1.4 * max(fontSize, maxsize)
+    colwidth = maxsize + 0.5 * rowheight + _label_width(labels, fontSize) + fontSize
+    cell = (rowheight, colwidth, maxsize, fontSize)
+
+    first = 0
+    if option["legendmode"] == "table":
+        if kind not in _LABEL_ROOM:
+            raise ValueError("Invalid kind of diagram: " + str(kind))
+        first = _add_side_table(ax, entries, _LABEL_ROOM[kind], cell)
+
+    # Remaining labels on legend figures
+    nrow = option["markerlayout"][0]
+    ncol = option["markerlayout"][1]
+    if ncol is None:
+        ncol = _PAGE_COLUMNS
+    pages = []
+    for start in range(first, nentries, nrow * ncol):
+        stop = min(start + nrow * ncol, nentries)
+        pages.append(_legend_page(entries, start, stop, nrow, cell))
+
+    return pages
+
+
+def _label_width(labels, fontSize) -> float:
+    """
+    Width in points of the widest label, from the font metrics.
+    """
+
+    prop = FontProperties(size=fontSize)
+    width = 0.0
+    for label in dict.fromkeys(labels):
+        extent = text_to_path.get_text_width_height_descent(label, prop, ismath=False)
+        width = max(width, extent[0])
+    return width
+
+
+def _add_side_table(ax, entries, room, cell) -> int:
+    """
+    Draws the first labels in a table to the right of the diagram, ROOM
+    diagram widths away from it.
+
+    Returns the number of labels drawn, 0 if no column fits in the figure.
+    """
+
+    rowheight, colwidth = cell[:2]
+    figwidth, figheight = ax.figure.get_size_inches() * 72.0
+    position = ax.get_position()
+    axwidth = position.width * figwidth
+    axheight = position.height * figheight
+
+    # Leave room for the axis labels beside the diagram
+    x0 = 1.0 + room
+    available = figwidth * (1.0 - position.x0) - x0 * axwidth
+
+    nrow = int(axheight // rowheight)
+    ncol = int(available // colwidth)
+    if nrow < 1 or ncol < 1:
+        return 0
+    stop = min(len(entries[0]), nrow * ncol)
+    ncol = int(math.ceil(stop / nrow))
+    nrow = min(nrow, stop)
+
+    width, height = ncol * colwidth, nrow * rowheight
+    table = ax.inset_axes(
+        [x0, 1.0 - height / axheight, width / axwidth, height / axheight]
+    )
+    _draw_entries(table, entries, 0, stop, nrow, cell)
+
+    return stop
+
+
+def _legend_page(entries, start, stop, nrow, cell) -> Figure:
+    """
+    Creates a legend figure with the labels START to STOP.
+    """
+
+    rowheight, colwidth = cell[:2]
+    nrow = min(nrow, stop - start)
+    ncol = int(math.ceil((stop - start) / nrow))
+    pad = rowheight
+    width, height = ncol * colwidth, nrow * rowheight
+
+    figwidth, figheight = width + 2 * pad, height + 2 * pad
+
+    fig = Figure(figsize=(figwidth / 72.0, figheight / 72.0))
+    table = fig.add_axes(
+        [pad / figwidth, pad / figheight, width / figwidth, height / figheight]
+    )
+    _draw_entries(table, entries, start, stop, nrow, cell)
+
+    return fig
+
+
+def _draw_entries(table, entries, start, stop, nrow, cell):
+    """
+    Draws the legend entries START to STOP column by column in the axes
+    TABLE, whose data coordinates are set to points.
+    """
+
+    rowheight, colwidth, maxsize, fontSize = cell
+    labels, labelcolor, symbols, sizes, widths, facecolors, edgecolors = entries
+    index = np.arange(start, stop)
+    ncol = int(math.ceil(len(index) / nrow))
+
+    table.set_axis_off()
+    table.set_xlim(0.0, ncol * colwidth)
+    table.set_ylim(nrow * rowheight, 0.0)
+
+    # Marker and label position of every entry
+    column, row = np.divmod(index - start, nrow)
+    ymarker = (row + 0.5) * rowheight
+    xmarker = column * colwidth + 0.25 * rowheight + 0.5 * maxsize
+    xlabel = column * colwidth + 0.5 * rowheight + maxsize
+
+    # One collection per marker symbol
+    symbol = np.array(symbols, dtype=object)[index]
+    for kind in dict.fromkeys(symbol):
+        where = symbol == kind
+        select = index[where]
+        if MarkerStyle(kind).is_filled():
+            colors = {
+                "facecolors": facecolors[select],
+                "edgecolors": edgecolors[select],
+            }
+        else:
+            # Unfilled symbols are drawn with the color of their edge
+            colors = {"c": edgecolors[select]}
+        table.scatter(
+            xmarker[where],
+            ymarker[where],
+            s=sizes[select] ** 2,
+            marker=kind,
+            linewidths=widths[select],
+            clip_on=False,
+            **colors,
+        )
+
+    for i, x, y in zip(index, xlabel, ymarker):
+        table.text(
+            x,
+            y,
+            labels[i],
+            color=labelcolor[i],
+            fontsize=fontSize,
+            verticalalignment="center",
+            horizontalalignment="left",
+            clip_on=False,
+        )
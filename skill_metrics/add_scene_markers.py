@@ -0,0 +1,292 @@
+import math
+
+import matplotlib
+import matplotlib.colors as clr
+import numpy as np
+from matplotlib import rcParams, ticker
+
+from .get_axis_tick_label import get_axis_tick_label
+from .get_default_markers import get_default_markers
+from .get_from_dict_or_default import get_from_dict_or_default
+from .get_single_markers import get_single_markers
+
+# Number of color stops used to shade a color bar
+_GRADIENT_STOPS = 32
+
+
+def add_scene_markers(scene, X, Y, Z, option: dict) -> None:
+    """
+    Adds the markers of a pattern diagram to a diagram scene.
+
+    This is the counterpart of PLOT_PATTERN_DIAGRAM_MARKERS and
+    PLOT_PATTERN_DIAGRAM_COLORBAR for a DiagramScene: markers, their labels
+    or legend and the color bar are added as drawing primitives instead of
+    matplotlib artists. The legend and the color bar are placed beside the
+    diagram and extend the limits of the scene.
+
+    Marker labels are always placed above and to the left of the markers
+    (option['labelplacement'] = 'fixed') and the legend is always drawn
+    beside the diagram (option['legendmode'] = 'legend'). The 'density'
+    display of markers is not supported.
+
+    INPUTS:
+    scene  : DiagramScene receiving the markers
+    X      : x-coordinates of markers
+    Y      : y-coordinates of markers
+    Z      : values used for color shading when option['markerdisplayed']
+             is 'colorbar', otherwise ignored
+    option : dictionary containing option values. (Refer to
+             GET_TAYLOR_DIAGRAM_OPTIONS or GET_TARGET_DIAGRAM_OPTIONS
+             functions for more information.)
+    option['axismax']         : maximum for the X & Y values. Markers beyond
+                                it are not displayed
+    option['markerdisplayed'] : 'marker' or 'colorbar'
+
+    OUTPUTS:
+    None.
+
+    Created on Oct 18, 2026
+    """
+
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+
+    lowcase = option["markerdisplayed"].lower()
+    if lowcase == "marker":
+        _add_markers(scene, X, Y, option)
+    elif lowcase == "colorbar":
+        _add_colorbar(scene, X, Y, np.asarray(Z, dtype=float), option)
+    else:
+        raise ValueError(
+            "Unsupported option for a diagram scene: markerdisplayed="
+            + option["markerdisplayed"]
+        )
+
+
+def _add_markers(scene, X, Y, option: dict) -> None:
+    """
+    Adds markers of different symbols and colors with a legend, or of a
+    single symbol and color with labels beside them.
+    """
+
+    fontSize = rcParams.get("font.size") - 2
+    markerSize = option["markersize"]
+    markerlabel = option["markerlabel"]
+    if isinstance(markerlabel, list) and 0 < len(markerlabel) < len(X):
+        raise ValueError(
+            "Insufficient number of marker labels provided: "
+            + str(len(markerlabel))
+            + " < "
+            + str(len(X))
+        )
+
+    limit = option["axismax"]
+    inside = np.flatnonzero((np.abs(X) <= limit) & (np.abs(Y) <= limit))
+
+    if option["markerlegend"] == "on":
+        if markerlabel == "" and option["markers"] is None:
+            raise ValueError("No marker labels provided.")
+
+        if option["markers"] is None:
+            # Default markers with opaque edges
+            marker, markercolor = get_default_markers(X, option)
+            symbol = [marker[i][0] for i in inside]
+            size = markerSize
+            facecolor = markercolor[inside]
+            edgecolor = facecolor
+            labels = [markerlabel[i] for i in inside]
+            labelcolor = option["markerlabelcolor"]
+            alpha = option["alpha"]
+        else:
+            (
+                labels,
+                labelcolor,
+                marker,
+                markersize,
+                markerfacecolor,
+                markeredgecolor,
+            ) = get_single_markers(option["markers"])
+            symbols = [value["symbol"] for value in option["markers"].values()]
+            symbol = [symbols[i] for i in inside]
+            size = [markersize[i] for i in inside]
+            facecolor = [markerfacecolor[i] for i in inside]
+            edgecolor = [markeredgecolor[i] for i in inside]
+            labels = [labels[i] for i in inside]
+            labelcolor = [labelcolor[i] for i in inside]
+            alpha = 1.0
+
+        scene.markers(
+            X[inside],
+            Y[inside],
+            symbol,
+            size,
+            facecolor,
+            edgecolor,
+            edgewidth=2.0,
+            alpha=alpha,
+        )
+        _add_legend(
+            scene, symbol, size, facecolor, edgecolor, labels, labelcolor, fontSize
+        )
+        return
+
+    # Markers of a single color with accompanying labels
+    edge_color = get_from_dict_or_default(option, "markercolor", "markercolors", "edge")
+    if edge_color is None:
+        edge_color = "r"
+    face_color = get_from_dict_or_default(option, "markercolor", "markercolors", "face")
+    if face_color is None:
+        face_color = edge_color
+    scene.markers(
+        X[inside],
+        Y[inside],
+        option["markersymbol"],
+        markerSize,
+        face_color,
+        edge_color,
+        alpha=option["alpha"],
+    )
+
+    if type(markerlabel) is list:
+        scene.texts(
+            X[inside],
+            Y[inside],
+            [markerlabel[i] for i in inside],
+            color=option["markerlabelcolor"],
+            size=fontSize,
+            halign="right",
+            valign="bottom",
+        )
+    elif type(markerlabel) is dict:
+        # Labels with a dot of the color given to the label
+        colors = list(markerlabel.values())
+        _add_legend(
+            scene,
+            "o",
+            markerSize,
+            colors,
+            colors,
+            list(markerlabel.keys()),
+            option["markerlabelcolor"],
+            fontSize,
+        )
+
+
+def _add_legend(
+    scene, symbol, size, facecolor, edgecolor, labels, labelcolor, fontSize
+) -> None:
+    """
+    Adds a legend to the right of the diagram, in as many columns as
+    needed to fit the height of the diagram.
+    """
+
+    nlabels = len(labels)
+    if nlabels == 0:
+        return
+
+    maxsize = max(np.ravel(size))
+    rowheight = scene.points(max(1.6 * fontSize, 1.2 * maxsize))
+    xmin, xmax, ymin, ymax = scene.frame
+    nrow = max(1, int((ymax - ymin) // rowheight))
+    ncol = int(math.ceil(nlabels / nrow))
+    nrow = int(math.ceil(nlabels / ncol))
+
+    # Text widths estimated from the number of characters
+    labels = [str(label) for label in labels]
+    markerwidth = scene.points(maxsize + 0.5 * fontSize)
+    textwidth = scene.points(0.6 * fontSize * max(len(label) for label in labels))
+    colwidth = markerwidth + textwidth + scene.points(fontSize)
+
+    x0 = scene.limits[1] + scene.points(fontSize)
+    y0 = ymax - 0.5 * rowheight
+    index = np.arange(nlabels)
+    x = x0 + (index // nrow) * colwidth + 0.5 * scene.points(maxsize)
+    y = y0 - (index % nrow) * rowheight
+
+    scene.markers(x, y, symbol, size, facecolor, edgecolor, edgewidth=2.0)
+    scene.texts(
+        x + markerwidth - 0.5 * scene.points(maxsize),
+        y,
+        labels,
+        color=labelcolor,
+        size=fontSize,
+        halign="left",
+    )
+
+    scene.extend(xmax=x0 + ncol * colwidth)
+
+
+def _add_colorbar(scene, X, Y, Z, option: dict) -> None:
+    """
+    Adds markers shaded according to Z and the color bar.
+    """
+
+    fontSize = rcParams.get("font.size")
+
+    cmap = option["cmap"]
+    if isinstance(cmap, str):
+        cmap = matplotlib.colormaps[cmap]
+    if option["colormap"] == "on":
+        vmin = np.min(Z) if option["cmap_vmin"] is None else option["cmap_vmin"]
+        vmax = np.max(Z) if option["cmap_vmax"] is None else option["cmap_vmax"]
+    elif option["colormap"] == "off":
+        vmin, vmax = np.min(Z), np.max(Z)
+    else:
+        raise ValueError("Invalid option for option.colormap: " + option["colormap"])
+    norm = clr.Normalize(vmin, vmax)
+
+    # Markers of the scatter plot (size given as area in points^2)
+    colors = cmap(norm(Z))
+    size = math.sqrt(2 * option["markersize"])
+    scene.markers(X, Y, option["cmap_marker"], size, colors, colors, clip=True)
+
+    # Tick values and labels
+    if option["colormap"] == "on":
+        ticks = ticker.MaxNLocator(nbins=5).tick_values(vmin, vmax)
+        tolerance = 1.0e-10 * (vmax - vmin)
+        ticks = ticks[(ticks >= vmin - tolerance) & (ticks <= vmax + tolerance)]
+        labels = [get_axis_tick_label(tick) for tick in ticks]
+    else:
+        ticks = np.array([vmin, vmax])
+        labels = ["Min.", "Max."]
+    if vmax > vmin:
+        fraction = (ticks - vmin) / (vmax - vmin)
+    else:
+        fraction = np.zeros(len(ticks))
+
+    title = option["titlecolorbar"] if option["titlecolorbar"] else "Color Scale"
+    stops = cmap(np.linspace(0.0, 1.0, _GRADIENT_STOPS))
+    xmin, xmax, ymin, ymax = scene.frame
+    thickness = scene.points(10)
+    ticklength = scene.points(3)
+    gap = scene.points(0.5 * fontSize)
+
+    location = option["locationcolorbar"].lower()
+    if location == "northoutside":
+        # Horizontal color bar above the diagram
+        x0 = xmin + 0.25 * (xmax - xmin)
+        x1 = xmax - 0.25 * (xmax - xmin)
+        y0 = scene.limits[3] + scene.points(fontSize)
+        scene.gradient([x0, y0, x1, y0 + thickness], stops, "horizontal")
+        for tick, label in zip(x0 + fraction * (x1 - x0), labels):
+            y1 = y0 + thickness
+            scene.line([tick, tick], [y1, y1 + ticklength], "k", 0.8, clip=False)
+            scene.text(tick, y1 + ticklength, label, size=fontSize, valign="bottom")
+        top = y0 + thickness + ticklength + scene.points(1.4 * fontSize)
+        scene.text(0.5 * (x0 + x1), top, title, size=fontSize, valign="bottom")
+        scene.extend(ymax=top + scene.points(1.6 * fontSize))
+    elif location == "eastoutside":
+        # Vertical color bar to the right of the diagram
+        x0 = scene.limits[1] + scene.points(fontSize)
+        y0 = ymin + 0.1 * (ymax - ymin)
+        y1 = ymax - 0.1 * (ymax - ymin)
+        scene.gradient([x0, y0, x0 + thickness, y1], stops, "vertical")
+        x1 = x0 + thickness
+        for tick, label in zip(y0 + fraction * (y1 - y0), labels):
+            scene.line([x1, x1 + ticklength], [tick, tick], "k", 0.8, clip=False)
+            scene.text(x1 + ticklength + gap, tick, label, size=fontSize, halign="left")
+        scene.text(x0, y1 + gap, title, size=fontSize, halign="left", valign="bottom")
+        width = max(len(label) for label in labels + [title])
+        scene.extend(xmax=x1 + ticklength + gap + scene.points(0.6 * fontSize * width))
+    else:
+        raise ValueError("Invalid color bar location: " + option["locationcolorbar"])
@@ -0,0 +1,47 @@
+def check_density_bins(value) -> int:
+    """
+    Check number of bins for density display is a positive integer.
+
+    Checks the 'densitybins' option of TAYLOR_DIAGRAM and TARGET_DIAGRAM,
+    used when the markers are displayed as a density ('markerdisplayed'
+    = 'density'). Returns an error if the value is not a positive integer,
+    e.g. a boolean or a number with a fractional part. Integral floats and
+    strings of integers are accepted.
+
+    INPUTS:
+    value : number of bins along each coordinate of the diagram
+
+    OUTPUTS:
+    nbins : number of bins as an integer
+
+    Created on Oct 18, 2026
+    """
+    try:
+        nbins = int(value)
+        integral = float(value) == nbins
+    except (TypeError, ValueError):
+        nbins, integral = 0, False
+    if isinstance(value, bool) or not integral or nbins < 1:
+        raise ValueError("densitybins must be a positive integer: " + str(value))
+    return nbins
+
+
+def check_density_scale(value) -> str:
+    """
+    Check color scaling for density display is 'linear' or 'log'.
+
+    Checks the 'densityscale' option of TAYLOR_DIAGRAM and TARGET_DIAGRAM.
+    The value can be provided in any combination of upper and lower case
+    letters.
+
+    INPUTS:
+    value : color scaling of the point counts
+
+    OUTPUTS:
+    scale : 'linear' or 'log'
+
+    Created on Oct 18, 2026
+    """
+    if not isinstance(value, str) or value.lower() not in {"linear", "log"}:
+        raise ValueError("densityscale must be 'linear' or 'log': " + str(value))
+    return value.lower()
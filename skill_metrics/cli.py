@@ -0,0 +1,573 @@
+import argparse
+import csv
+import functools
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .bias import bias
+from .bias_percent import bias_percent
+from .centered_rms_dev import centered_rms_dev
+from .kling_gupta_eff09 import kling_gupta_eff09
+from .kling_gupta_eff12 import kling_gupta_eff12
+from .nash_sutcliffe_eff import nash_sutcliffe_eff
+from .pair_time_series import METHODS, pair_time_series
+from .read_csv_arrays import read_csv_arrays
+from .rmsd import rmsd
+from .skill_score_murphy import skill_score_murphy
+from .stats_table_writer import StatsTableWriter
+
+
+def _sdev(predicted, reference):
+    return np.std(predicted)
+
+
+def _sdev_ref(predicted, reference):
+    return np.std(reference)
+
+
+def _ccoef(predicted, reference):
+    return np.corrcoef(predicted, reference)[0, 1]
+
+
+# Metrics computed for each pair of predicted and reference series, in the
+# order of the columns of the statistics table
+METRICS = {
+    "bias": bias,
+    "bias_percent": bias_percent,
+    "sdev": _sdev,
+    "sdev_ref": _sdev_ref,
+    "ccoef": _ccoef,
+    "crmsd": centered_rms_dev,
+    "rmsd": rmsd,
+    "nse": nash_sutcliffe_eff,
+    "kge09": kling_gupta_eff09,
+    "kge12": kling_gupta_eff12,
+    "ss_murphy": skill_score_murphy,
+}
+
+# Metrics needed to draw the diagrams
+DIAGRAMS = {
+    "taylor": ("sdev", "sdev_ref", "crmsd", "ccoef"),
+    "target": ("bias", "sdev_ref", "crmsd", "rmsd"),
+}
+
+# Name of the command
+PROG = "skill-metrics"
+
+# Diagrams of at most this many points are drawn with labels and a legend
+MAX_LABELS = 30
+
+# Rows of the statistics table written at a time
+TABLE_CHUNK = 1000
+
+# Seconds between progress reports
+PROGRESS_SECONDS = 1.0
+
+
+def main(argv=None) -> int:
+    """
+    Score and plot many pairs of predicted and reference files from the
+    command line, in a single process start:
+
+    $ skill-metrics score --reference obs.csv --predicted 'models/*.csv'
+      --column flow --output stats.csv
+
+    computes the metrics of every predicted file against the reference
+    file (or the reference file of the same name when there are several)
+    with a pool of worker processes, and streams them to a statistics
+    table as they come, reporting progress on the standard error. The
+    table is read back by READ_STATS_TABLE. An existing table is only
+    replaced with --overwrite, or appended to with --append (CSV and NPZ
+    tables of the same metrics).
+
+    $ skill-metrics plot --manifest pairs.csv --output-dir figures
+
+    also draws a Taylor and a target diagram of each group of pairs, with
+    the statistics normalized by the standard deviation of the reference
+    of each pair so that pairs of different references can be compared.
+
+    The pairs are given by glob patterns or by a manifest: a CSV file with
+    the columns 'reference' and 'predicted' (paths relative to the
+    manifest) and optionally 'label' and 'group'. The files are read by
+    READ_CSV_ARRAYS and, when a time column is given, the series are
+    aligned by PAIR_TIME_SERIES. With --cache, the parsed files are cached
+    in '<file>.npz' files next to the input files, for later runs on the
+    same files; no file is written next to the input files otherwise.
+    Also available as
+
+    $ python -m skill_metrics score ...
+
+    OUTPUTS:
+    status : 0 if all pairs were scored, 1 otherwise
+
+    Created on Oct 18, 2026
+    """
+
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.metrics is None:
+        metrics = list(METRICS)
+    else:
+        metrics = [name.strip() for name in args.metrics.split(",")]
+        unknown = [name for name in metrics if name not in METRICS]
+        if len(unknown) > 0:
+            parser.error("unknown metrics: " + ", ".join(unknown))
+    diagrams = []
+    if args.command == "plot":
+        diagrams = ["taylor", "target"] if args.diagram == "both" else [args.diagram]
+        for diagram in diagrams:
+            metrics += [name for name in DIAGRAMS[diagram] if name not in metrics]
+    if args.command == "score" and args.output is None:
+        args.output = "stats.csv"
+
+    try:
+        if args.manifest is not None:
+            pairs = read_manifest(args.manifest)
+        elif args.reference is not None and args.predicted is not None:
+            pairs = match_files(args.reference, args.predicted)
+        else:
+            parser.error("give --manifest or both --reference and --predicted")
+        tolerance = _tolerance(args.tolerance)
+        table = None
+        if args.output is not None:
+            if os.path.exists(args.output) and not (args.overwrite or args.append):
+                raise ValueError(
+                    "%s already exists, give --overwrite or --append" % args.output
+                )
+            table = StatsTableWriter(args.output, metrics, append=args.append)
+    except ValueError as error:
+        parser.error(str(error))
+
+    settings = {
+        "metrics": metrics,
+        "column": args.column,
+        "time": args.time,
+        "method": args.method,
+        "tolerance": tolerance,
+        "cache": "on" if args.cache else "off",
+    }
+    stats, errors = _score_pairs(pairs, settings, table, args)
+
+    for diagram in diagrams:
+        _plot_diagrams(diagram, pairs, stats, args)
+
+    return 0 if errors == 0 else 1
+
+
+def _parser() -> argparse.ArgumentParser:
+    """
+    Parser of the command line arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description="Score and plot predicted files against reference files.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    score = commands.add_parser("score", help="write a statistics table")
+    plot = commands.add_parser(
+        "plot", help="draw Taylor and target diagrams (and a statistics table)"
+    )
+
+    for command in (score, plot):
+        inputs = command.add_argument_group("pairs of files")
+        inputs.add_argument(
+            "--manifest",
+            help="CSV file of columns 'reference', 'predicted' and optionally "
+            "'label' and 'group'",
+        )
+        inputs.add_argument(
+            "--reference", nargs="+", help="reference files or glob patterns"
+        )
+        inputs.add_argument(
+            "--predicted", nargs="+", help="predicted files or glob patterns"
+        )
+
+        series = command.add_argument_group("series")
+        series.add_argument(
+            "--column", help="column of the values (default: last column)"
+        )
+        series.add_argument(
+            "--time", help="time column aligning the series (default: by position)"
+        )
+        series.add_argument(
+            "--method",
+            choices=METHODS,
+            default="exact",
+            help="time matching of pair_time_series (default: exact)",
+        )
+        series.add_argument(
+            "--tolerance",
+            help="time tolerance, in time units or e.g. '30min' for dates",
+        )
+        series.add_argument(
+            "--cache",
+            action="store_true",
+            help="cache the parsed CSV files in '<file>.npz' files written "
+            "next to each input file, reused by later runs (by default no "
+            "file is written next to the input files)",
+        )
+
+        command.add_argument(
+            "--metrics",
+            help="comma separated metrics (default: all of %s)" % ", ".join(METRICS),
+        )
+        command.add_argument(
+            "--output",
+            help="statistics table, .csv, .npz or .parquet (default: stats.csv "
+            "for score, none for plot)",
+        )
+        existing = command.add_mutually_exclusive_group()
+        existing.add_argument(
+            "--overwrite", action="store_true", help="replace an existing table"
+        )
+        existing.add_argument(
+            "--append",
+            action="store_true",
+            help="append to an existing .csv or .npz table of the same metrics",
+        )
+        command.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="number of worker processes (default: number of CPUs)",
+        )
+        command.add_argument(
+            "--quiet", action="store_true", help="no progress and timing output"
+        )
+
+    plot.add_argument("--diagram", choices=("taylor", "target", "both"), default="both")
+    plot.add_argument("--output-dir", default=".", help="directory of the diagrams")
+    plot.add_argument("--format", choices=("png", "svg", "pdf"), default="png")
+    plot.add_argument("--dpi", type=int, default=100)
+    return parser
+
+
+def read_manifest(filename) -> list:
+    """
+    Read the pairs of files of a manifest.
+
+    INPUTS:
+    filename : CSV file with a header and the columns 'reference' and
+               'predicted', and optionally 'label' (Default: name of the
+               predicted file) and 'group' (Default: '')
+
+    OUTPUTS:
+    pairs : list of (group, label, reference, predicted) tuples
+    """
+
+    if not os.path.isfile(filename):
+        raise ValueError("Manifest does not exist: " + filename)
+    folder = os.path.dirname(filename)
+    pairs = []
+    with open(filename, newline="") as file:
+        for row in csv.DictReader(file):
+            row = {str(key).strip(): value for key, value in row.items()}
+            if "reference" not in row or "predicted" not in row:
+                raise ValueError(
+                    "Manifest must have 'reference' and 'predicted' columns: "
+                    + filename
+                )
+            reference = os.path.join(folder, row["reference"].strip())
+            predicted = os.path.join(folder, row["predicted"].strip())
+            label = (row.get("label") or "").strip() or _label(row["predicted"])
+            group = (row.get("group") or "").strip()
+            pairs.append((group, label, reference, predicted))
+    if len(pairs) == 0:
+        raise ValueError("No pairs of files in manifest: " + filename)
+    return pairs
+
+
+def match_files(reference, predicted) -> list:
+    """
+    Match predicted files to reference files.
+
+    Every predicted file is paired with the reference file when there is
+    only one, or with the reference file of the same name otherwise.
+
+    INPUTS:
+    reference : list of reference files or glob patterns
+    predicted : list of predicted files or glob patterns
+
+    OUTPUTS:
+    pairs : list of (group, label, reference, predicted) tuples
+    """
+
+    references = _expand(reference)
+    predictions = _expand(predicted)
+    if len(references) == 0:
+        raise ValueError("No reference files: " + " ".join(reference))
+    if len(predictions) == 0:
+        raise ValueError("No predicted files: " + " ".join(predicted))
+
+    if len(references) == 1:
+        return [("", _label(name), references[0], name) for name in predictions]
+
+    by_name = {}
+    for name in references:
+        by_name.setdefault(os.path.basename(name), name)
+    pairs = []
+    for name in predictions:
+        if os.path.basename(name) not in by_name:
+            raise ValueError("No reference file for " + name)
+        pairs.append(("", _label(name), by_name[os.path.basename(name)], name))
+    return pairs
+
+
+def _expand(patterns) -> list:
+    """
+    Files matching glob patterns, in sorted order without duplicates.
+    """
+    names = []
+    for pattern in patterns:
+        names += sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+    return list(dict.fromkeys(names))
+
+
+def _label(filename) -> str:
+    """
+    Label of a data point: the file name without extension.
+    """
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def _tolerance(text):
+    """
+    Tolerance of PAIR_TIME_SERIES: a number, or a duration for dates.
+    """
+    if text is None:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    import pandas as pd
+
+    try:
+        return pd.Timedelta(text)
+    except ValueError:
+        raise ValueError("Invalid time tolerance: " + text)
+
+
+def _score_pairs(pairs, settings, table, args) -> tuple:
+    """
+    Scores the pairs with a pool of workers, writing the statistics table
+    TABLE, if any, and reporting progress.
+    """
+
+    metrics = settings["metrics"]
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(pairs)))
+    score = functools.partial(score_pair, settings=settings)
+    start = time.perf_counter()
+    reported = start
+    stats = np.full((len(pairs), len(metrics)), np.nan)
+    errors = 0
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, min(64, len(pairs) // (4 * workers)))
+        results = executor.map(score, pairs, chunksize=chunksize)
+    else:
+        results = map(score, pairs)
+
+    try:
+        # Rows of consecutive pairs of the same group are written together
+        first = 0
+        for index, (values, error) in enumerate(results):
+            if error is None:
+                stats[index] = values
+            else:
+                errors += 1
+                print("%s: %s: %s" % (PROG, pairs[index][1], error), file=sys.stderr)
+
+            last = index + 1 == len(pairs)
+            if table is not None and (
+                last
+                or index + 1 - first == TABLE_CHUNK
+                or pairs[index + 1][0] != pairs[first][0]
+            ):
+                chunk = slice(first, index + 1)
+                table.write(
+                    dict(zip(metrics, stats[chunk].T)),
+                    title=pairs[first][0],
+                    label=[pair[1] for pair in pairs[chunk]],
+                    continued=first > 0 and pairs[first - 1][0] == pairs[first][0],
+                )
+                first = index + 1
+
+            now = time.perf_counter()
+            if not args.quiet and (last or now - reported >= PROGRESS_SECONDS):
+                reported = now
+                print(
+                    "Scored %d/%d pairs in %.1f s (%.0f pairs/s)"
+                    % (index + 1, len(pairs), now - start, (index + 1) / (now - start)),
+                    file=sys.stderr,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if table is not None:
+            table.close()
+
+    if not args.quiet:
+        print(
+            "%d pairs scored with %d workers, %d errors%s"
+            % (
+                len(pairs),
+                workers,
+                errors,
+                "" if table is None else ", statistics written to " + args.output,
+            ),
+            file=sys.stderr,
+        )
+    return dict(zip(metrics, stats.T)), errors
+
+
+def score_pair(pair, settings) -> tuple:
+    """
+    Compute the metrics of a pair of files.
+
+    INPUTS:
+    pair     : (group, label, reference, predicted) tuple of the files
+    settings : dictionary of the metrics, and of the column, time, method,
+               tolerance and cache options of MAIN
+
+    OUTPUTS:
+    values : list of the values of the metrics, None if an error occurred
+    error  : message of the error, None if none occurred
+    """
+
+    try:
+        reference = _read_series(
+            pair[2], settings["column"], settings["time"], settings["cache"]
+        )
+        predicted = _read_series(
+            pair[3], settings["column"], settings["time"], settings["cache"]
+        )
+        if settings["time"] is None:
+            if len(predicted[1]) != len(reference[1]):
+                raise ValueError(
+                    "Series of %d and %d values"
+                    % (len(predicted[1]), len(reference[1]))
+                )
+            p, r = predicted[1], reference[1]
+        else:
+            p, r, _ = pair_time_series(
+                *predicted, *reference, settings["method"], settings["tolerance"]
+            )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = [float(METRICS[name](p, r)) for name in settings["metrics"]]
+    except Exception as error:
+        return None, str(error) if isinstance(error, ValueError) else repr(error)
+    return values, None
+
+
+def _read_series(filename, column, time_column, cache) -> tuple:
+    """
+    Time and values of a series from a CSV file. The series are cached in
+    each worker, as the same reference file is read for many pairs, for
+    as long as the file is unchanged.
+    """
+
+    if not os.path.isfile(filename):
+        raise ValueError("File does not exist: " + filename)
+    status = os.stat(filename)
+    return _read_cached_series(
+        filename, status.st_size, status.st_mtime_ns, column, time_column, cache
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _read_cached_series(filename, size, mtime, column, time_column, cache) -> tuple:
+    """
+    Series of _READ_SERIES, for a given size and modification time.
+    """
+
+    data = read_csv_arrays(filename, cache=cache)
+    if column is None:
+        names = [name for name in data if name != time_column]
+        if len(names) == 0:
+            raise ValueError("No column of values in " + filename)
+        column = names[-1]
+    if column not in data:
+        raise ValueError("Column %s not in %s" % (column, filename))
+    values = np.asarray(data[column], dtype=float)
+    values.flags.writeable = False
+    if time_column is None:
+        return None, values
+
+    if time_column not in data:
+        raise ValueError("Column %s not in %s" % (time_column, filename))
+    time_values = data[time_column]
+    if time_values.dtype.kind == "U":
+        time_values = time_values.astype("datetime64[ns]")
+    time_values.flags.writeable = False
+    return time_values, values
+
+
+def _plot_diagrams(diagram, pairs, stats, args) -> None:
+    """
+    Draws a diagram of each group of pairs, normalized by the standard
+    deviations of the references.
+    """
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from .target_diagram import target_diagram
+    from .taylor_diagram import taylor_diagram
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    groups = np.array([pair[0] for pair in pairs])
+    labels = np.array([pair[1] for pair in pairs])
+    for group in dict.fromkeys(groups):
+        start = time.perf_counter()
+        select = (groups == group) & np.isfinite(
+            [stats[name] for name in DIAGRAMS[diagram]]
+        ).all(axis=0)
+        if not select.any():
+            continue
+        norm = stats["sdev_ref"][select]
+
+        fig = Figure(figsize=(8, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        options = {}
+        if select.sum() <= MAX_LABELS:
+            options = {"markerlabel": list(labels[select]), "markerlegend": "on"}
+        if diagram == "taylor":
+            if "markerlabel" in options:
+                options["markerlabel"].insert(0, "Ref")
+            taylor_diagram(
+                ax,
+                np.r_[1.0, stats["sdev"][select] / norm],
+                np.r_[0.0, stats["crmsd"][select] / norm],
+                np.r_[1.0, stats["ccoef"][select]],
+                checkstats="off",
+                **options,
+            )
+        else:
+            target_diagram(
+                ax,
+                stats["bias"][select] / norm,
+                stats["crmsd"][select] / norm,
+                stats["rmsd"][select] / norm,
+                **options,
+            )
+
+        name = diagram if group == "" else diagram + "_" + group.replace(os.sep, "_")
+        filename = os.path.join(args.output_dir, name + "." + args.format)
+        fig.savefig(filename, dpi=args.dpi, bbox_inches="tight")
+        if not args.quiet:
+            print(
+                "Drew %s of %d pairs in %.1f s"
+                % (filename, select.sum(), time.perf_counter() - start),
+                file=sys.stderr,
+            )
@@ -0,0 +1,30 @@
+from .diagram_options import DiagramOptions
+from .get_target_diagram_options import get_target_diagram_options
+
+
+def compile_target_diagram_options(**kwargs) -> DiagramOptions:
+    """
+    Validate options for the target_diagram function once for reuse.
+
+    Sets the defaults, reads the options CSV file (if specified) and
+    checks the keyword arguments exactly as TARGET_DIAGRAM does, and
+    returns the result as an immutable DiagramOptions object. Passing it
+    to TARGET_DIAGRAM with the OPTIONS keyword avoids repeating this work
+    for every diagram drawn with the same styling, e.g.
+
+    >>> opts = sm.compile_target_diagram_options(markerlabel=label, circles=[1, 2])
+    >>> for ax, (bias, crmsd, rmsd) in zip(axs, stats):
+    ...     sm.target_diagram(ax, bias, crmsd, rmsd, options=opts)
+
+    INPUTS:
+    *kwargs : keyword arguments accepted by the TARGET_DIAGRAM function
+
+    OUTPUTS:
+    options : DiagramOptions object containing the validated options
+
+    Created on Oct 18, 2026
+    """
+
+    option = get_target_diagram_options(**kwargs)
+
+    return DiagramOptions("target", option)
@@ -0,0 +1,37 @@
+import numpy as np
+from .diagram_options import DiagramOptions
+from .get_taylor_diagram_options import get_taylor_diagram_options
+
+
+def compile_taylor_diagram_options(**kwargs) -> DiagramOptions:
+    """
+    Validate options for the taylor_diagram function once for reuse.
+
+    Sets the defaults, reads the options CSV file (if specified) and
+    checks the keyword arguments exactly as TAYLOR_DIAGRAM does, and
+    returns the result as an immutable DiagramOptions object. Passing it
+    to TAYLOR_DIAGRAM with the OPTIONS keyword avoids repeating this work
+    for every diagram drawn with the same styling, e.g.
+
+    >>> opts = sm.compile_taylor_diagram_options(markerlabel=label, tickrms=[1, 2])
+    >>> for ax, (sdev, crmsd, ccoef) in zip(axs, stats):
+    ...     sm.taylor_diagram(ax, sdev, crmsd, ccoef, options=opts)
+
+    Because the default number of panels depends on the correlations of
+    the diagram, the options are validated for one and for two panels.
+    The set matching the correlations is chosen when the diagram is drawn,
+    unless 'numberpanels' is given explicitly.
+
+    INPUTS:
+    *kwargs : keyword arguments accepted by the TAYLOR_DIAGRAM function
+
+    OUTPUTS:
+    options : DiagramOptions object containing the validated options
+
+    Created on Oct 18, 2026
+    """
+
+    option = get_taylor_diagram_options(np.array([1.0]), **kwargs)
+    option_negative = get_taylor_diagram_options(np.array([-1.0]), **kwargs)
+
+    return DiagramOptions("taylor", option, option_negative)
@@ -0,0 +1,180 @@
+import importlib.util
+import os
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+
+from .write_array_store import write_array_store
+
+# Signature of HDF5 files, at the start of the file or after the 512 byte
+# header of MATLAB 7.3 files
+_HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+
+
+def convert_data_file(filename, directory=None, overwrite=False):
+    """
+    Convert a MATLAB, HDF5 or pickle data file to an array store.
+
+    This function reads the data sets of FILENAME and writes them with
+    WRITE_ARRAY_STORE to DIRECTORY, from which READ_ARRAY_STORE loads them
+    with memory-mapped arrays instead of unpickling or parsing the file
+    each time. The format of FILENAME is recognized from its contents:
+
+    MATLAB 7.3 and HDF5 files : read with h5py (optional dependency). The
+                                datasets are copied in chunks, so files
+                                larger than the memory can be converted.
+                                Groups become dictionaries and MATLAB
+                                character arrays become strings. MATLAB
+                                arrays, stored transposed, are copied in
+                                the orientation of MATLAB without their
+                                singleton dimensions, as by loadmat.
+    MATLAB 5 to 7 files       : read with scipy.io.loadmat (optional
+                                dependency). Structures become
+                                dictionaries.
+    pickle files (.pkl/.pkl3) : e.g. the Container objects of the
+                                examples. Objects whose classes cannot be
+                                imported are converted by their
+                                attributes.
+
+    Only convert pickle files from trusted sources: unpickling can execute
+    arbitrary code.
+
+    INPUTS:
+    filename  : name of the data file
+    directory : name of the directory of the store (Default: FILENAME
+                without its extension)
+    overwrite : replace an existing store (Default: False)
+
+    OUTPUTS:
+    directory : name of the directory of the store
+
+    EXAMPLE:
+    convert_data_file('target_data.mat')
+    data = read_array_store('target_data')
+
+    Created on Oct 18, 2026
+    """
+
+    if not os.path.isfile(filename):
+        raise ValueError("File does not exist: " + filename)
+    if directory is None:
+        directory = os.path.splitext(filename)[0]
+
+    with open(filename, "rb") as file:
+        header = file.read(520)
+
+    if _HDF5_SIGNATURE in (header[:8], header[512:520]):
+        h5py = _import_optional("h5py", "HDF5 and MATLAB 7.3 files")
+        with h5py.File(filename, "r") as hdf5:
+            write_array_store(directory, _hdf5_group(hdf5, h5py), overwrite)
+    elif header.startswith(b"MATLAB"):
+        io = _import_optional("scipy.io", "MATLAB files")
+        contents = io.loadmat(filename, simplify_cells=True)
+        data = {key: value for key, value in contents.items() if key[:2] != "__"}
+        write_array_store(directory, data, overwrite)
+    else:
+        with open(filename, "rb") as file:
+            data = _Unpickler(file).load()
+        write_array_store(directory, data, overwrite)
+    return directory
+
+
+def _import_optional(name, purpose):
+    """
+    Imports an optional dependency needed for some file formats.
+    """
+    import importlib
+
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        raise ImportError("%s require %s" % (purpose, name.split(".")[0])) from error
+
+
+def _hdf5_group(group, h5py) -> dict:
+    """
+    Dictionary of the members of an HDF5 group, with the datasets left in
+    the file to be copied in chunks.
+    """
+    data = {}
+    for name, member in group.items():
+        if isinstance(member, h5py.Group):
+            data[name] = _hdf5_group(member, h5py)
+        elif member.attrs.get("MATLAB_class", b"") in (b"char", "char"):
+            # MATLAB strings are arrays of UTF-16 code units
+            codes = np.asarray(member[()], dtype=np.uint16).T.reshape(-1)
+            data[name] = codes.tobytes().decode("utf-16-le")
+        elif member.dtype.kind == "O":
+            # MATLAB cell arrays are arrays of references to datasets
+            data[name] = [
+                _hdf5_reference(member.file[reference], h5py)
+                for reference in np.ravel(member[()])
+            ]
+        elif "MATLAB_class" in member.attrs:
+            array = _MatlabArray(member)
+            data[name] = array if len(array.shape) > 0 else np.asarray(array)[()]
+        else:
+            data[name] = member
+    return data
+
+
+class _MatlabArray:
+    """
+    Numeric or logical array of a MATLAB 7.3 file in the orientation of
+    MATLAB and without its singleton dimensions, as read by
+    scipy.io.loadmat(simplify_cells=True). MATLAB stores its arrays in
+    column-major order, so the HDF5 dataset is the transposed array. The
+    array is read in slices of its first dimension when copied in chunks.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        logical = dataset.attrs["MATLAB_class"] in (b"logical", "logical")
+        self.dtype = np.dtype(bool) if logical else dataset.dtype
+        self.shape = tuple(n for n in reversed(dataset.shape) if n != 1)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.dataset[()].T.reshape(self.shape).astype(self.dtype)
+        return array if dtype is None else array.astype(dtype)
+
+    def __getitem__(self, index):
+        # First dimension of the array, the last non-singleton of the dataset
+        axis = max(i for i, n in enumerate(self.dataset.shape) if n != 1)
+        selection = [slice(None)] * self.dataset.ndim
+        selection[axis] = index
+        array = self.dataset[tuple(selection)].T
+        return array.reshape((-1,) + self.shape[1:]).astype(self.dtype)
+
+
+def _hdf5_reference(member, h5py):
+    """
+    Value of a member of an HDF5 file given by a reference.
+    """
+    if isinstance(member, h5py.Group):
+        return _hdf5_group(member, h5py)
+    return _hdf5_group({"value": member}, h5py)["value"]
+
+
+class _Record(SimpleNamespace):
+    """
+    Object of a pickled class that cannot be imported.
+    """
+
+
+class _Unpickler(pickle.Unpickler):
+    """
+    Unpickler converting objects of classes that cannot be imported, e.g.
+    classes defined in the scripts that wrote the file, to records of
+    their attributes. Classes of numpy.core, renamed numpy._core in
+    NumPy 2, are found without the warning of the deprecated name.
+    """
+
+    def find_class(self, module, name):
+        if module == "numpy.core" or module.startswith("numpy.core."):
+            if importlib.util.find_spec("numpy._core") is not None:
+                module = "numpy._core" + module[len("numpy.core") :]
+        try:
+            return super().find_class(module, name)
+        except (AttributeError, ImportError):
+            return _Record
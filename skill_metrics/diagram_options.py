@@ -0,0 +1,102 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class DiagramOptions(Mapping):
+    """
+    Validated, immutable options for the taylor_diagram or target_diagram
+    functions.
+
+    Building the option dictionary of a diagram sets about a hundred
+    defaults, validates every keyword and possibly reads an options CSV
+    file. When many diagrams are drawn with identical styling this work
+    only needs to be done once: create a DiagramOptions object with
+    COMPILE_TAYLOR_DIAGRAM_OPTIONS or COMPILE_TARGET_DIAGRAM_OPTIONS and
+    pass it to the diagram functions with the OPTIONS keyword, e.g.
+
+    >>> opts = sm.compile_taylor_diagram_options(markerlabel=label, tickrms=[1, 2])
+    >>> sm.taylor_diagram(ax, sdev, crmsd, ccoef, options=opts)
+
+    Each call then only takes a shallow copy of the validated options, so
+    the object itself is never modified. Values that depend on the data of
+    a call, e.g. 'axismax' or the tick values, are still determined for
+    every diagram. For Taylor diagrams the default number of panels depends
+    on the correlations (CORs), so the options are validated for both one
+    and two panels and the matching set is chosen for every call.
+
+    The object behaves as a read-only dictionary of the option values
+    (for positive correlations in the case of a Taylor diagram).
+
+    Created on Oct 18, 2026
+    """
+
+    __slots__ = ("_kind", "_option", "_option_negative")
+
+    def __init__(self, kind: str, option: dict, option_negative: dict = None):
+        """
+        INPUTS:
+        kind            : 'taylor' or 'target'
+        option          : validated option dictionary (for positive
+                          correlations in the case of a Taylor diagram)
+        option_negative : validated option dictionary when some
+                          correlations are negative (Taylor diagram only)
+        """
+        if kind not in {"taylor", "target"}:
+            raise ValueError("Invalid kind of diagram options: " + str(kind))
+        object.__setattr__(self, "_kind", kind)
+        object.__setattr__(self, "_option", dict(option))
+        if option_negative is None:
+            object.__setattr__(self, "_option_negative", None)
+        else:
+            object.__setattr__(self, "_option_negative", dict(option_negative))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DiagramOptions objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DiagramOptions objects are immutable")
+
+    def __getitem__(self, key):
+        return self._option[key]
+
+    def __iter__(self):
+        return iter(self._option)
+
+    def __len__(self):
+        return len(self._option)
+
+    def __repr__(self):
+        return "DiagramOptions(kind=%r, %d options)" % (self._kind, len(self))
+
+    @property
+    def kind(self) -> str:
+        """
+        Kind of diagram the options were compiled for: 'taylor' or 'target'.
+        """
+        return self._kind
+
+    def resolve(self, kind: str, CORs=None) -> dict:
+        """
+        Get a new option dictionary for a single diagram.
+
+        INPUTS:
+        kind : kind of diagram requesting the options, 'taylor' or 'target'
+        CORs : values of correlations (Taylor diagram only). If any value
+               is negative the options for two panels are used.
+
+        OUTPUTS:
+        option : shallow copy of the validated option dictionary that may
+                 be modified while drawing the diagram
+        """
+        if kind != self._kind:
+            raise ValueError(
+                "Options compiled for a %s diagram cannot be used for a %s diagram"
+                % (self._kind, kind)
+            )
+
+        if self._option_negative is not None and CORs is not None:
+            if np.any(np.asarray(CORs) < 0.0):
+                return dict(self._option_negative)
+
+        return dict(self._option)
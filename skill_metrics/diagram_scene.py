@@ -0,0 +1,296 @@
+from functools import lru_cache
+from math import floor, log10
+
+import matplotlib.colors as clr
+import numpy as np
+
+# Height of the diagram axes in points. The size of the scene follows
+# from its limits since diagrams are drawn with equal aspect ratio.
+_FRAME_HEIGHT = 270.0
+
+
+class DiagramScene:
+    """
+    Description of a diagram as a list of drawing primitives.
+
+    A scene describes a Taylor or target diagram without matplotlib: the
+    grid, markers, labels and color bar are stored as plain circles,
+    lines, texts, markers and gradients in data coordinates. Scenes are
+    built by TAYLOR_DIAGRAM_SCENE and TARGET_DIAGRAM_SCENE and written by
+    WRITE_DIAGRAM_SVG or WRITE_DIAGRAM_JSON, or drawn by a client (e.g. a
+    web browser) from the dictionary returned by AS_DICT.
+
+    Coordinates are data units with the y-axis pointing up. Sizes (line
+    widths, font and marker sizes) are given in points, and the scene
+    dictionary gives the size of the whole scene in points. Colors are
+    hexadecimal '#rrggbb' strings and line styles are matplotlib styles
+    ('-', '--', ':' or '-.').
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, kind: str, frame, fontsize: float):
+        """
+        INPUTS:
+        kind     : 'taylor' or 'target'
+        frame    : [xmin, xmax, ymin, ymax] of the diagram axes in data
+                   units. Items drawn with clip=True are clipped to it.
+        fontsize : default font size in points
+        """
+        self.kind = kind
+        self.frame = [float(v) for v in frame]
+        self.limits = list(self.frame)
+        self.fontsize = float(fontsize)
+        self.items = []
+
+        # Points per data unit, fixed by the height of the frame
+        span = self.frame[3] - self.frame[2]
+        self.scale = _FRAME_HEIGHT / span
+
+        # Round coordinates to 1/10000 of the frame
+        self._digits = max(0, 4 - floor(log10(span)))
+
+    def points(self, size: float) -> float:
+        """
+        Converts a length in points to data units.
+        """
+        return size / self.scale
+
+    def extend(self, xmin=None, xmax=None, ymin=None, ymax=None) -> None:
+        """
+        Extends the limits of the scene to include the given bounds.
+        """
+        if xmin is not None:
+            self.limits[0] = min(self.limits[0], xmin)
+        if xmax is not None:
+            self.limits[1] = max(self.limits[1], xmax)
+        if ymin is not None:
+            self.limits[2] = min(self.limits[2], ymin)
+        if ymax is not None:
+            self.limits[3] = max(self.limits[3], ymax)
+
+    def round(self, values):
+        """
+        Rounds coordinates to the precision of the scene and converts them
+        to (lists of) Python floats.
+        """
+        if isinstance(values, (float, int, np.number)):
+            return round(float(values), self._digits)
+        values = np.asarray(values, dtype=float)
+        if values.size > 32:
+            return np.round(values, self._digits).tolist()
+        return _round_list(values.tolist(), self._digits)
+
+    def circle(
+        self, center, radius, color, width, style="-", angles=None, clip=True
+    ) -> None:
+        """
+        Adds a circle, or an arc from angles[0] to angles[1] (degrees,
+        counterclockwise).
+        """
+        item = {
+            "type": "circle",
+            "center": self.round(center),
+            "radius": self.round(radius),
+            "color": _hex(color),
+            "width": float(width),
+            "style": style,
+            "clip": clip,
+        }
+        if angles is not None:
+            item["angles"] = [round(float(a), 2) for a in angles]
+        self.items.append(item)
+
+    def line(self, x, y, color, width, style="-", clip=True) -> None:
+        """
+        Adds a polyline through the points (x, y).
+        """
+        self.items.append(
+            {
+                "type": "line",
+                "points": [list(xy) for xy in zip(self.round(x), self.round(y))],
+                "color": _hex(color),
+                "width": float(width),
+                "style": style,
+                "clip": clip,
+            }
+        )
+
+    def text(
+        self,
+        x,
+        y,
+        text,
+        color="k",
+        size=None,
+        rotation=0.0,
+        halign="center",
+        valign="center",
+        weight="normal",
+    ) -> None:
+        """
+        Adds a text anchored at (x, y). HALIGN is 'left', 'center' or
+        'right' and VALIGN 'top', 'center', 'bottom' or 'baseline'.
+        """
+        self.texts([x], [y], [text], color, size, rotation, halign, valign, weight)
+
+    def texts(
+        self,
+        x,
+        y,
+        texts,
+        color="k",
+        size=None,
+        rotation=0.0,
+        halign="center",
+        valign="center",
+        weight="normal",
+    ) -> None:
+        """
+        Adds several texts of the same style at once, see TEXT. COLOR and
+        ROTATION may also be given with one value per text.
+        """
+        if len(texts) == 0:
+            return
+        n = len(texts)
+        x = self.round(x)
+        y = self.round(y)
+        color = _hex(color)
+        if isinstance(color, str):
+            color = [color] * n
+        if np.ndim(rotation) == 0:
+            rotation = [round(float(rotation), 2)] * n
+        else:
+            rotation = np.round(np.asarray(rotation, dtype=float), 2).tolist()
+        size = float(self.fontsize if size is None else size)
+        self.items.extend(
+            {
+                "type": "text",
+                "position": [x[i], y[i]],
+                "text": str(texts[i]),
+                "color": color[i],
+                "size": size,
+                "rotation": rotation[i],
+                "halign": halign,
+                "valign": valign,
+                "weight": weight,
+            }
+            for i in range(n)
+        )
+
+    def markers(
+        self,
+        x,
+        y,
+        symbol,
+        size,
+        facecolor,
+        edgecolor,
+        edgewidth=1.0,
+        alpha=1.0,
+        clip=False,
+    ) -> None:
+        """
+        Adds markers at the points (x, y). SYMBOL, SIZE, FACECOLOR and
+        EDGECOLOR are either a single value for all markers or a list with
+        one value per marker. Symbols are matplotlib marker symbols and
+        sizes are in points.
+        """
+        if len(x) == 0:
+            return
+        self.items.append(
+            {
+                "type": "markers",
+                "positions": self.round(np.column_stack((x, y))),
+                "symbol": symbol if isinstance(symbol, str) else list(symbol),
+                "size": _scalar_or_list(size),
+                "facecolor": _hex(facecolor),
+                "edgecolor": _hex(edgecolor),
+                "edgewidth": float(edgewidth),
+                "alpha": float(alpha),
+                "clip": clip,
+            }
+        )
+
+    def gradient(self, rect, colors, orientation) -> None:
+        """
+        Adds a rectangle [x0, y0, x1, y1] shaded with evenly spaced COLORS
+        from left to right ('horizontal') or bottom to top ('vertical').
+        """
+        self.items.append(
+            {
+                "type": "gradient",
+                "rect": self.round(rect),
+                "colors": _hex(colors),
+                "orientation": orientation,
+            }
+        )
+
+    def as_dict(self) -> dict:
+        """
+        Gets the scene as a dictionary of JSON-serializable values.
+
+        OUTPUTS:
+        scene           : dictionary describing the diagram
+        scene['kind']   : 'taylor' or 'target'
+        scene['size']   : [width, height] of the scene in points
+        scene['limits'] : [xmin, xmax, ymin, ymax] of the scene in data units
+        scene['frame']  : [xmin, xmax, ymin, ymax] of the diagram axes
+        scene['items']  : list of drawing primitives in drawing order, each
+                          a dictionary with a 'type' key of 'circle', 'line',
+                          'text', 'markers' or 'gradient'
+        """
+        xmin, xmax, ymin, ymax = self.limits
+        return {
+            "kind": self.kind,
+            "size": [
+                round(float(xmax - xmin) * self.scale, 1),
+                round(float(ymax - ymin) * self.scale, 1),
+            ],
+            "limits": self.round(self.limits),
+            "frame": self.round(self.frame),
+            "items": self.items,
+        }
+
+
+def _hex(color):
+    """
+    Converts a matplotlib color, or an array of colors, to '#rrggbb'.
+    """
+    if isinstance(color, (str, tuple)):
+        return _hex_color(color)
+    rgba = np.asarray(color)
+    if rgba.ndim == 1 and rgba.dtype.kind in "fiu" and len(rgba) in (3, 4):
+        return _hex_color(tuple(rgba.tolist()))
+    if rgba.dtype.kind not in "fiu":
+        return [_hex(c) for c in color]
+    rgb = np.rint(clr.to_rgba_array(rgba)[:, :3] * 255).astype(int)
+    return ["#%02x%02x%02x" % tuple(c) for c in rgb.tolist()]
+
+
+@lru_cache(maxsize=256)
+def _hex_color(color) -> str:
+    """
+    Converts a single hashable matplotlib color to '#rrggbb'.
+    """
+    if isinstance(color, str) and color.lower() == "none":
+        return "none"
+    return clr.to_hex(color)
+
+
+def _round_list(values, digits):
+    """
+    Rounds the floats of a nested list, faster than NumPy for short lists.
+    """
+    if isinstance(values, float):
+        return round(values, digits)
+    return [_round_list(value, digits) for value in values]
+
+
+def _scalar_or_list(values):
+    """
+    Converts a number or a sequence of numbers to Python floats.
+    """
+    if np.ndim(values) == 0:
+        return float(values)
+    return [float(v) for v in values]
@@ -0,0 +1,368 @@
+import math
+
+import matplotlib
+import matplotlib.colors as clr
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.cm import ScalarMappable
+from matplotlib.lines import Line2D
+
+from .check_taylor_stats import check_taylor_stats
+from .get_default_markers import get_default_markers
+from .get_single_markers import get_single_markers
+from .get_target_diagram_axes import get_target_diagram_axes
+from .get_target_diagram_options import get_target_diagram_options
+from .get_taylor_diagram_axes import get_taylor_diagram_axes
+from .get_taylor_diagram_options import get_taylor_diagram_options
+from .overlay_target_diagram_circles import overlay_target_diagram_circles
+from .overlay_taylor_diagram_circles import overlay_taylor_diagram_circles
+from .overlay_taylor_diagram_lines import overlay_taylor_diagram_lines
+from .plot_markers import plot_markers
+from .plot_target_axes import plot_target_axes
+from .plot_taylor_axes import plot_taylor_axes
+from .plot_taylor_obs import plot_taylor_obs
+
+# Default columns of the statistics of each kind of diagram, in the order
+# of the arguments of TAYLOR_DIAGRAM and TARGET_DIAGRAM
+_COLUMNS = {"taylor": ("sdev", "crmsd", "ccoef"), "target": ("bias", "crmsd", "rmsd")}
+
+
+def facet_diagrams(
+    stats,
+    group,
+    kind: str = "taylor",
+    ncols: int = None,
+    fig=None,
+    columns=None,
+    label=None,
+    titles: str = "first",
+    **kwargs
+):
+    """
+    Plot a grid of Taylor or target diagrams sharing scale and styling.
+
+    facet_diagrams(stats,group,kind,keyword=value)
+
+    Draws one diagram per value of the GROUP column of a table of
+    statistics, e.g. one per region, on an n x m grid of subplots. The
+    diagrams share the options, which are validated once, the axis limit,
+    which is determined once from the statistics of all the groups, and
+    therefore the grid geometry, which is computed once and reused (see
+    GET_TAYLOR_DIAGRAM_GEOMETRY and GET_TARGET_DIAGRAM_GEOMETRY). The
+    markers of a series have the same symbol and color in every diagram
+    and are explained by a single legend for the whole figure, or shaded
+    by a single color bar with a common color scale when 'markerDisplayed'
+    is 'colorBar'. A page of dozens of diagrams is thus drawn at a small
+    multiple of the cost of one:
+
+    facet_diagrams(table,'region','taylor',markerLabel=['Obs','M1','M2'])
+
+    INPUTS:
+    stats   : table of statistics with one row per series and diagram, as
+              a dictionary of equal-length arrays or a pandas.DataFrame.
+              The default columns are 'sdev', 'crmsd' and 'ccoef' for a
+              Taylor diagram and 'bias', 'crmsd' and 'rmsd' for a target
+              diagram. Within a group the rows are in the order of the
+              arguments of TAYLOR_DIAGRAM or TARGET_DIAGRAM, so for a Taylor
+              diagram the first row of each group is the reference.
+    group   : name of the column whose values identify the diagrams. The
+              diagrams are drawn in the order the values first appear.
+    kind    : 'taylor' (default) or 'target'
+    ncols   : number of columns of the grid (Default: about the square root
+              of the number of diagrams)
+    fig     : matplotlib.figure.Figure receiving the diagrams (Default: a
+              new pyplot figure)
+    columns : names of the three columns of statistics, in the order of the
+              arguments of TAYLOR_DIAGRAM or TARGET_DIAGRAM (Default: the
+              columns given above)
+    label   : name of the column with the labels of the series in the
+              legend (Default: the labels given by the 'markerLabel'
+              option)
+    titles  : 'first' to draw the axis titles of a Taylor diagram, e.g.
+              "Correlation Coefficient", in the first diagram only, or
+              'all' to draw them in every diagram (Default: 'first')
+    kwargs  : options of TAYLOR_DIAGRAM or TARGET_DIAGRAM, including
+              compiled OPTIONS. Markers are styled per series as with
+              markerLegend='on'. The 'density' display of markers is not
+              supported.
+
+    OUTPUTS:
+    fig  : the figure of the diagrams
+    axes : dictionary of the matplotlib.axes.Axes of the diagrams keyed by
+           the values of the GROUP column
+
+    Created on Oct 18, 2026
+    """
+
+    if kind not in _COLUMNS:
+        raise ValueError("Invalid kind of diagram: " + str(kind))
+    if titles not in {"first", "all"}:
+        raise ValueError("Invalid option for titles: " + str(titles))
+    if columns is None:
+        columns = _COLUMNS[kind]
+    elif len(columns) != 3:
+        raise ValueError("Three columns of statistics are required: " + str(columns))
+
+    # Rows of each group in order of appearance
+    keys = np.asarray(stats[group])
+    values, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    groups = [values[i] for i in order]
+    rows = [np.flatnonzero(inverse == i) for i in order]
+    data = [np.asarray(stats[column], dtype=float) for column in columns]
+    if label is None:
+        labels = None
+    else:
+        labels = np.asarray(stats[label])
+
+    # Options validated once for all the diagrams
+    if kind == "taylor":
+        option = get_taylor_diagram_options(data[2], **kwargs)
+    else:
+        option = get_target_diagram_options(**kwargs)
+    lowcase = option["markerdisplayed"].lower()
+    if lowcase not in {"marker", "colorbar"}:
+        raise ValueError(
+            "Unsupported option for a grid of diagrams: markerdisplayed="
+            + option["markerdisplayed"]
+        )
+
+    # Axis limit determined once from all the statistics
+    if kind == "taylor":
+        if option["axismax"] == 0.0:
+            get_taylor_diagram_axes(None, data[0], option)
+    else:
+        target_axes = get_target_diagram_axes(data[1], data[0], option)
+
+    # Grid of subplots
+    ngroups = len(groups)
+    if ncols is None:
+        ncols = int(math.ceil(math.sqrt(ngroups)))
+    nrows = int(math.ceil(ngroups / ncols))
+    if fig is None:
+        fig = plt.figure(figsize=(3.6 * ncols + 1.5, 3.4 * nrows))
+        fig.subplots_adjust(hspace=0.4, wspace=0.3)
+
+    # The diagrams after the first share its axis titles
+    if titles == "first" and kind == "taylor":
+        option_next = dict(option, titlecor="off", titlerms="off", titlestd="off")
+    else:
+        option_next = option
+
+    # Styles of the series shared by all the diagrams
+    nseries = max(len(index) for index in rows) - (1 if kind == "taylor" else 0)
+    styles = _series_styles(nseries, option)
+
+    axes = {}
+    zdata = []
+    collections = []
+    for i, (key, index) in enumerate(zip(groups, rows)):
+        ax = fig.add_subplot(nrows, ncols, i + 1)
+        axes[key] = ax
+        stat = [column[index] for column in data]
+        panel_option = option if i == 0 else option_next
+
+        if kind == "taylor":
+            if option["checkstats"] == "on":
+                check_taylor_stats(*stat, 0.01)
+            rho, theta = stat[0], np.arccos(stat[2])
+            diagram_axes = get_taylor_diagram_axes(ax, rho, panel_option)
+            if option["overlay"] == "off":
+                overlay_taylor_diagram_circles(ax, diagram_axes, panel_option)
+                overlay_taylor_diagram_lines(ax, diagram_axes, panel_option)
+                handles = plot_taylor_axes(ax, diagram_axes, panel_option)
+                plot_taylor_obs(ax, handles, stat[0][0], diagram_axes, panel_option)
+            X = rho[1:] * np.cos(theta[1:])
+            Y = rho[1:] * np.sin(theta[1:])
+            Z = stat[1][1:]
+        else:
+            overlay_target_diagram_circles(ax, option)
+            if option["overlay"] == "off":
+                plot_target_axes(ax, target_axes)
+            X, Y, Z = stat[1], stat[0], stat[2]
+
+        # Title of the diagram above its upper right corner
+        ax.text(
+            1.0,
+            1.02,
+            str(key),
+            transform=ax.transAxes,
+            horizontalalignment="right",
+            verticalalignment="bottom",
+            fontweight="bold",
+        )
+
+        # Markers within the axis limits
+        limit = option["axismax"]
+        inside = np.flatnonzero((np.abs(X) <= limit) & (np.abs(Y) <= limit))
+        if lowcase == "marker":
+            plot_markers(
+                ax,
+                X[inside],
+                Y[inside],
+                [styles["symbol"][j] for j in inside],
+                styles["size"][inside],
+                styles["facecolor"][inside],
+                styles["edgecolor"][inside],
+                2.0,
+            )
+        else:
+            collections.append((ax, X[inside], Y[inside]))
+            zdata.append(Z[inside])
+
+    # Single legend or color bar for all the diagrams
+    ax_list = list(axes.values())
+    if lowcase == "marker":
+        if labels is not None:
+            offset = 1 if kind == "taylor" else 0
+            longest = rows[np.argmax([len(index) for index in rows])]
+            names = [str(name) for name in labels[longest][offset:]]
+        elif isinstance(option["markerlabel"], list):
+            names = [str(name) for name in option["markerlabel"]]
+        elif option["markers"] is not None:
+            names = list(option["markers"].keys())
+        else:
+            names = []
+        if len(names) > 0:
+            _add_legend(fig, styles, names[:nseries], option)
+    else:
+        _add_colorbar(fig, ax_list, collections, zdata, option)
+
+    return fig, axes
+
+
+def _series_styles(nseries: int, option: dict) -> dict:
+    """
+    Gets the marker symbol, size and colors of each series, as
+    PLOT_PATTERN_DIAGRAM_MARKERS does with a marker legend.
+    """
+
+    if option["markers"] is None:
+        marker, markercolor = get_default_markers(np.zeros(nseries), option)
+        symbol = [value[0] for value in marker]
+        size = np.full(nseries, option["markersize"], dtype=float)
+        facecolor = np.array(markercolor)
+        edgecolor = facecolor.copy()
+        edgecolor[:, 3] = 1.0
+    else:
+        (
+            labels,
+            labelcolor,
+            marker,
+            markersize,
+            markerfacecolor,
+            markeredgecolor,
+        ) = get_single_markers(option["markers"])
+        if len(labels) < nseries:
+            raise ValueError(
+                "Insufficient number of markers provided: "
+                + str(len(labels))
+                + " < "
+                + str(nseries)
+            )
+        symbol = [value["symbol"] for value in option["markers"].values()]
+        size = np.array(markersize, dtype=float)
+        facecolor = clr.to_rgba_array(markerfacecolor)
+        edgecolor = clr.to_rgba_array(markeredgecolor)
+
+    return {
+        "symbol": symbol,
+        "size": size,
+        "facecolor": facecolor,
+        "edgecolor": edgecolor,
+    }
+
+
+def _add_legend(fig, styles: dict, names: list, option: dict) -> None:
+    """
+    Adds a single legend for the series to the right of the diagrams.
+    """
+
+    fontSize = matplotlib.rcParams.get("font.size") - 2
+    handles = [
+        Line2D(
+            [],
+            [],
+            linestyle="",
+            marker=styles["symbol"][i],
+            markersize=styles["size"][i],
+            markerfacecolor=styles["facecolor"][i],
+            markeredgecolor=styles["edgecolor"][i],
+            markeredgewidth=2,
+        )
+        for i in range(len(names))
+    ]
+
+    # As many columns as needed to fit the height of the figure
+    rowheight = 1.6 * max(fontSize, np.max(styles["size"][: len(names)]))
+    nrow = max(1, int(0.9 * fig.get_figheight() * 72 // rowheight))
+    ncol = int(math.ceil(len(names) / nrow))
+    fig.subplots_adjust(right=1.0 - 0.12 * ncol)
+    legend = fig.legend(
+        handles,
+        names,
+        loc="center left",
+        bbox_to_anchor=(1.0 - 0.12 * ncol + 0.01, 0.5),
+        fontsize=fontSize,
+        numpoints=1,
+        ncol=ncol,
+    )
+    for text in legend.get_texts():
+        text.set_color(option["markerlabelcolor"])
+
+
+def _add_colorbar(fig, axes: list, collections: list, zdata: list, option: dict):
+    """
+    Adds the markers shaded on a common color scale and a single color bar
+    for all the diagrams.
+    """
+
+    cmap = option["cmap"]
+    if isinstance(cmap, str):
+        cmap = matplotlib.colormaps[cmap]
+    values = np.concatenate(zdata) if len(zdata) > 0 else np.zeros(1)
+    if option["colormap"] == "on":
+        vmin = np.min(values) if option["cmap_vmin"] is None else option["cmap_vmin"]
+        vmax = np.max(values) if option["cmap_vmax"] is None else option["cmap_vmax"]
+    elif option["colormap"] == "off":
+        vmin, vmax = np.min(values), np.max(values)
+    else:
+        raise ValueError("Invalid option for option.colormap: " + option["colormap"])
+    mappable = ScalarMappable(clr.Normalize(vmin, vmax), cmap)
+
+    # Markers colored directly, with edges of the face color
+    for (ax, X, Y), Z in zip(collections, zdata):
+        colors = mappable.to_rgba(Z)
+        ax.scatter(
+            X,
+            Y,
+            s=option["markersize"] * 2,
+            c=colors,
+            edgecolors=colors,
+            marker=option["cmap_marker"],
+            zorder=2,
+        )
+
+    location = option["locationcolorbar"].lower()
+    if location == "northoutside":
+        orientation, loc = "horizontal", "top"
+    elif location == "eastoutside":
+        orientation, loc = "vertical", "right"
+    else:
+        raise ValueError("Invalid color bar location: " + option["locationcolorbar"])
+    colorbar = fig.colorbar(
+        mappable,
+        ax=axes,
+        location=loc,
+        orientation=orientation,
+        fraction=0.05,
+        pad=0.08,
+        shrink=0.8,
+        aspect=40,
+    )
+
+    if option["colormap"] == "off":
+        colorbar.set_ticks([vmin, vmax])
+        colorbar.set_ticklabels(["Min.", "Max."])
+    title = option["titlecolorbar"] if option["titlecolorbar"] else "Color Scale"
+    colorbar.set_label(title, fontsize=matplotlib.rcParams.get("font.size"))
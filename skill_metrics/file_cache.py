@@ -0,0 +1,179 @@
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+# Subdirectory of the cache directory holding the cached files, so that
+# the files of the cache are never mixed with other files
+SUBDIRECTORY = "skill_metrics-cache"
+
+# Temporary files of writes in progress, and their age in seconds beyond
+# which they are left over by an interrupted write and removed
+TEMPORARY_PREFIX = ".skill_metrics-"
+TEMPORARY_SUFFIX = ".tmp"
+TEMPORARY_AGE = 3600
+
+
+class FileCache:
+    """
+    Directory of cached data with size-bounded LRU eviction.
+
+    Each item is stored in a file named after its key, a hexadecimal hash
+    of what the data was computed from, optionally followed by a file
+    suffix (see KEY_PATTERN). The files are kept in the subdirectory
+    'skill_metrics-cache' of DIRECTORY, and only regular files named like
+    keys are managed by the cache: other files are never read or removed.
+
+    When the total size exceeds MAX_BYTES, the least recently used files
+    are removed. The order of use is kept in the modification times of
+    the files, so it survives restarts, and files are written atomically,
+    so the directory can be shared by several processes: a key missing
+    from the index of a process is looked up on disk, and the directory
+    is scanned again before evicting files, as well as after every
+    sixteenth of MAX_BYTES written by the process. Between scans, the
+    total size can exceed MAX_BYTES by what the other processes wrote.
+
+    Used by the DIAGRAMCACHE of RENDER_SERVER and by METRICCACHE.
+
+    Created on Oct 18, 2026
+    """
+
+    # Names of the cached files: a hexadecimal hash and an optional suffix
+    KEY_PATTERN = r"[0-9a-f]{16,128}(\.[a-z0-9]{1,8})?"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20):
+        """
+        INPUTS:
+        directory : directory of the cache, created if needed. The files
+                    are stored in its subdirectory 'skill_metrics-cache'.
+        max_bytes : maximum total size of the cached files (Default: 256 MiB)
+        """
+        self.directory = os.path.join(directory, SUBDIRECTORY)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._key = re.compile(self.KEY_PATTERN)
+        self._temporary = re.compile(
+            re.escape(TEMPORARY_PREFIX) + r"\w+" + re.escape(TEMPORARY_SUFFIX)
+        )
+        self._lock = threading.Lock()
+        self._files = OrderedDict()  # least recently used first
+        self._size = 0
+        self._written = 0  # bytes written since the last scan
+
+        with self._lock:
+            self._scan()
+            self._evict()
+
+    def __len__(self):
+        return len(self._files)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size in bytes of the cached files.
+        """
+        return self._size
+
+    def get(self, key: str) -> bytes:
+        """
+        Gets the cached data of KEY, or None if it is not cached.
+        """
+        self._check_key(key)
+        with self._lock:
+            if key in self._files:
+                self._files.move_to_end(key)
+
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)
+        except (FileNotFoundError, IsADirectoryError):
+            # Not cached, or removed by another process sharing the directory
+            with self._lock:
+                self._size -= self._files.pop(key, 0)
+            return None
+
+        with self._lock:
+            # Possibly written by another process sharing the directory
+            self._size += len(data) - self._files.pop(key, 0)
+            self._files[key] = len(data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores DATA under KEY and evicts the least recently used files if
+        the cache is full. Data larger than the cache is not stored.
+        """
+        self._check_key(key)
+        if len(data) > self.max_bytes:
+            return
+
+        handle, temporary = tempfile.mkstemp(
+            dir=self.directory, prefix=TEMPORARY_PREFIX, suffix=TEMPORARY_SUFFIX
+        )
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        os.replace(temporary, os.path.join(self.directory, key))
+
+        with self._lock:
+            self._size += len(data) - self._files.pop(key, 0)
+            self._files[key] = len(data)
+            self._written += len(data)
+            self._evict()
+
+    def _check_key(self, key: str) -> None:
+        """
+        Checks KEY is the name of a file managed by the cache.
+        """
+        if not isinstance(key, str) or self._key.fullmatch(key) is None:
+            raise ValueError("Invalid cache key: " + repr(key))
+
+    def _scan(self) -> None:
+        """
+        Rebuilds the index from the cached files in the directory, least
+        recently used first, and removes the temporary files left over by
+        interrupted writes.
+        """
+        entries = []
+        now = time.time()
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    if self._key.fullmatch(entry.name):
+                        entries.append((stat.st_mtime_ns, entry.name, stat.st_size))
+                    elif (
+                        self._temporary.fullmatch(entry.name)
+                        and now - stat.st_mtime > TEMPORARY_AGE
+                    ):
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    # Removed by another process sharing the directory
+                    pass
+
+        # Files of the same modification time, which has a resolution of a
+        # few milliseconds, keep their order of use in this process
+        order = {name: index for index, name in enumerate(self._files)}
+        entries.sort(key=lambda entry: (entry[0], order.get(entry[1], -1), entry[1]))
+        self._files = OrderedDict((name, size) for _, name, size in entries)
+        self._size = sum(self._files.values())
+        self._written = 0
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used files beyond the size of the cache.
+        """
+        if self._size > self.max_bytes or self._written > self.max_bytes // 16:
+            self._scan()
+        while self._size > self.max_bytes:
+            key, size = self._files.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(os.path.join(self.directory, key))
+            except FileNotFoundError:
+                pass
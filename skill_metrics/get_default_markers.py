@@ -1,4 +1,12 @@
+from functools import lru_cache
+
+import matplotlib
 import matplotlib.colors as clr
+import numpy as np
+
+# Marker symbols and colors of the predefined combinations
+_KIND = ("+", "o", "x", "s", "d", "^", "v", "p", "h", "*")
+_COLORM = ("r", "b", "g", "c", "m", "y", "k", "gray")
 
 
 def get_default_markers(X, option: dict):
@@ -6,62 +14,100 @@ def get_default_markers(X, option: dict):
     """
     Provides a list of default markers and marker colors.
 
-    Returns a list of 70 marker symbol & color combinations.
+    Returns a list of marker symbol & color combinations, one per point.
+    Up to 80 points the combinations are taken from a predefined list of
+    10 symbols and 8 colors. Beyond that, styles are generated for any
+    number of points by cycling through the symbols and sampling the
+    colormap option['cmap'], so every point gets a unique combination.
+
+    The styles are cached per number of points and options, so repeated
+    diagrams with the same number of series do not recompute them. Styles
+    sampling a colormap object rather than a registered colormap name are
+    not cached, as colormap objects cannot be used as cache keys.
 
     INPUTS:
     X      : x-coordinates of markers
     option : dictionary containing option values. (Refer to
         GET_TARGET_DIAGRAM_OPTIONS function for more information.)
+    option['alpha']       : blending of symbol face color
+    option['cmap']        : colormap (name or object) used to generate colors
+                            beyond 80 points
     option['markercolor'] : single color to use for all markers
     option['markerlabel'] : labels for markers
 
     OUTPUTS:
     marker      : list of marker symbols
-    markercolor : list of marker colors
+    markercolor : array of RGBA marker colors with one row per marker. The
+                  array is shared between calls and must not be modified.
 
     Authors:
     Peter A. Rochford
     rochford.peter1@gmail.com
 
     Created on Mar 12, 2023
-    Revised on Mar 12, 2023
+    Revised on Oct 18, 2026
+    """
+    # Use hashable keys for the cache
+    markercolor = option["markercolor"]
+    if markercolor is not None:
+        markercolor = clr.to_rgba(markercolor)
+    cmap = option.get("cmap", "jet") if len(X) > len(_KIND) * len(_COLORM) else None
+
+    if cmap is None or isinstance(cmap, str):
+        marker, rgba = _default_markers(len(X), markercolor, option["alpha"], cmap)
+    else:
+        marker, rgba = _default_markers.__wrapped__(
+            len(X), markercolor, option["alpha"], cmap
+        )
+
+    return list(marker), rgba
+
+
+@lru_cache(maxsize=64)
+def _default_markers(nmarkers: int, markercolor, alpha: float, cmap) -> tuple:
     """
-    # Set face color transparency
-    alpha = option["alpha"]
+    Build the marker symbols and RGBA colors for NMARKERS points.
 
-    # Define list of marker symbols and colros
-    kind = ["+", "o", "x", "s", "d", "^", "v", "p", "h", "*"]
-    colorm = ["r", "b", "g", "c", "m", "y", "k", "gray"]
-    if len(X) > 80:
-        _disp("You must introduce new markers to plot more than 70 cases.")
-        _disp("The " "marker" " character array need to be extended inside the code.")
+    INPUTS:
+    nmarkers    : number of markers
+    markercolor : single RGBA color for all markers, or None
+    alpha       : blending of symbol face color
+    cmap        : colormap (name or object) used to generate colors when
+                  more than 80 markers are requested, otherwise None
 
-    if len(X) <= len(kind):
+    OUTPUTS:
+    marker : tuple of marker symbols (with color letter when predefined)
+    rgba   : read-only array of RGBA colors with shape (nmarkers, 4)
+    """
+    nkind = len(_KIND)
+    ncolor = len(_COLORM)
+    if nmarkers <= ncolor or (nmarkers <= nkind and markercolor is not None):
         # Define markers with specified color
-        marker = []
-        markercolor = []
-        if option["markercolor"] is None:
-            for i, color in enumerate(colorm):
-                rgba = clr.to_rgb(color) + (alpha,)
-                marker.append(kind[i] + color)
-                markercolor.append(rgba)
+        if markercolor is None:
+            marker = tuple(k + c for k, c in zip(_KIND, _COLORM))
+            rgba = clr.to_rgba_array(_COLORM)
         else:
-            rgba = clr.to_rgb(option["markercolor"]) + (alpha,)
-            for symbol in kind:
-                marker.append(symbol + option["markercolor"])
-                markercolor.append(rgba)
-    else:
+            marker = _KIND
+            rgba = np.tile(markercolor, (nkind, 1))
+    elif nmarkers <= nkind * ncolor:
         # Define markers and colors using predefined list
-        marker = []
-        markercolor = []
-        for color in colorm:
-            for symbol in kind:
-                marker.append(symbol + color)
-                rgba = clr.to_rgb(color) + (alpha,)
-                markercolor.append(rgba)
-
-    return marker, markercolor
+        marker = tuple(k + c for c in _COLORM for k in _KIND)
+        rgba = np.repeat(clr.to_rgba_array(_COLORM), nkind, axis=0)
+    else:
+        # Generate markers cycling through the symbols and sampling the
+        # colormap once per cycle
+        ncycle = -(-nmarkers // nkind)
+        marker = (_KIND * ncycle)[:nmarkers]
+        if markercolor is None:
+            if isinstance(cmap, str):
+                cmap = matplotlib.colormaps[cmap]
+            colors = cmap(np.linspace(0.0, 1.0, ncycle))
+            rgba = colors[np.arange(nmarkers) // nkind]
+        else:
+            rgba = np.tile(markercolor, (nmarkers, 1))
 
+    rgba = np.array(rgba, dtype=float)
+    rgba[:, 3] = alpha
+    rgba.setflags(write=False)
 
-def _disp(text):
-    print(text)
+    return marker, rgba
@@ -0,0 +1,114 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+def get_target_diagram_geometry(option: dict) -> dict:
+    """
+    Get the grid geometry of a target diagram.
+
+    Computes the vertices of the circles of a target diagram using NumPy
+    only. The result does not depend on matplotlib, so it can be drawn by
+    any plotting backend (see OVERLAY_TARGET_DIAGRAM_CIRCLES), tested or
+    benchmarked without rendering.
+
+    The geometry is memoized on the axis limit, circle radii and
+    observational uncertainty, so diagrams sharing the same axes reuse the
+    same arrays. The returned arrays are therefore read-only and must not
+    be modified.
+
+    INPUTS:
+    option : dictionary containing option values. (Refer to
+             GET_TARGET_DIAGRAM_OPTIONS function for more information.)
+    option['axismax']        : maximum for the X & Y values. Used to set
+                               default circles when no contours specified
+    option['circles']        : radii of circles to draw to indicate
+                               isopleths of standard deviation
+    option['normalized']     : statistics supplied are normalized with
+                               respect to the standard deviation of
+                               reference values
+    option['obsuncertainty'] : Observational Uncertainty (default of 0)
+
+    OUTPUTS:
+    geometry : dictionary with the grid geometry. Vertices are given as
+               (x, y) tuples of arrays.
+    geometry['reference']      : vertices of the reference circle of a
+                                 normalized diagram, or None
+    geometry['circles']        : radii of the circles that are drawn
+    geometry['circle_xy']      : vertices of the circles, one per radius
+    geometry['obsuncertainty'] : vertices of the observational uncertainty
+                                 circle, or None
+    geometry['segments']       : vertices of the reference circle (if any),
+                                 the circles and the observational
+                                 uncertainty circle (if any) as (n, 2)
+                                 arrays, in drawing order, for a
+                                 LineCollection
+
+    Created on Oct 18, 2026
+    """
+
+    if option["circles"] is None:
+        circles = None
+    else:
+        circles = tuple(float(c) for c in np.ravel(option["circles"]))
+
+    return _target_geometry(
+        float(option["axismax"]),
+        circles,
+        option["normalized"] == "on",
+        float(option["obsuncertainty"]),
+    )
+
+
+@lru_cache(maxsize=32)
+def _target_geometry(axismax, circles, normalized, obsuncertainty) -> dict:
+    """
+    Computes the geometry for GET_TARGET_DIAGRAM_GEOMETRY from hashable
+    arguments.
+    """
+
+    theta = np.arange(0, 2 * np.pi, 0.01)
+    xunit = np.cos(theta)
+    yunit = np.sin(theta)
+
+    geometry = {}
+
+    # 1 - reference circle if normalized
+    geometry["reference"] = (xunit, yunit) if normalized else None
+
+    # 2 - secondary circles
+    if normalized:
+        radii = np.array([0.5, 1])
+    elif circles is None:
+        radii = np.array([axismax * x for x in [0.7, 1]])
+    else:
+        radii = np.asarray(circles)
+        radii = radii[radii <= axismax]
+    geometry["circles"] = radii
+    geometry["circle_xy"] = tuple((xunit * c, yunit * c) for c in radii)
+
+    # 3 - Observational Uncertainty threshold
+    if obsuncertainty > 0:
+        geometry["obsuncertainty"] = (xunit * obsuncertainty, yunit * obsuncertainty)
+    else:
+        geometry["obsuncertainty"] = None
+
+    # All the circles as vertex arrays
+    circles_xy = list(geometry["circle_xy"])
+    if normalized:
+        circles_xy.insert(0, geometry["reference"])
+    if geometry["obsuncertainty"] is not None:
+        circles_xy.append(geometry["obsuncertainty"])
+    geometry["segments"] = tuple(np.column_stack(xy) for xy in circles_xy)
+
+    # The arrays are shared through the cache
+    arrays = [xunit, yunit, radii]
+    for xy in geometry["circle_xy"]:
+        arrays.extend(xy)
+    if geometry["obsuncertainty"] is not None:
+        arrays.extend(geometry["obsuncertainty"])
+    arrays.extend(geometry["segments"])
+    for array in arrays:
+        array.setflags(write=False)
+
+    return geometry
@@ -2,8 +2,10 @@ import os
 import re
 from typing import Union
 
-import pandas as pd
 from . import check_on_off
+from .check_density_options import check_density_bins, check_density_scale
+from .read_options_file import read_options_file
+from .diagram_options import DiagramOptions
 
 
 def _check_dict_with_keys(
@@ -49,6 +51,30 @@ def _circle_color_style(option: dict) -> dict:
     return option
 
 
+def _check_label_placement(value) -> str:
+    """
+    Check placement of marker labels is 'fixed' or 'auto'.
+    """
+    if not isinstance(value, str) or value.lower() not in {"fixed", "auto"}:
+        raise ValueError("labelplacement must be 'fixed' or 'auto': " + str(value))
+    return value.lower()
+
+
+def _check_legend_mode(value) -> str:
+    """
+    Check legend mode is 'legend', 'table' or 'figure'.
+    """
+    if not isinstance(value, str) or value.lower() not in {
+        "legend",
+        "table",
+        "figure",
+    }:
+        raise ValueError(
+            "legendmode must be 'legend', 'table' or 'figure': " + str(value)
+        )
+    return value.lower()
+
+
 def is_int(element):
     """
     Check if variable is an integer.
@@ -120,9 +146,23 @@ def _default_options() -> dict:
                                  max range of CMapZData values ('off').
                                  (Default : 'on')
 
+    option['densitybins']     : number of bins along each axis when markerdisplayed
+                                is 'density' (Default: 100)
+    option['densitycolorbar'] : 'on'/'off' switch to display a colorbar of the point
+                                counts when markerdisplayed is 'density' (Default: 'on')
+    option['densityscale']    : 'linear' or 'log' color shading of the point counts
+                                when markerdisplayed is 'density' (Default: 'log')
+
     option['equalAxes']       : 'on'/'off' switch to set axes to be equal
                                 (Default 'on')
 
+    option['labelplacement']  : placement of marker labels when markerlegend
+                                is 'off' (Default 'fixed')
+                                'fixed' : above and to the left of each marker
+                                'auto'  : around each marker avoiding overlaps,
+                                          labels that do not fit are omitted
+                                          and the labels are drawn as glyph
+                                          outlines, not as text
     option['labelweight']     : weight of the x & y axis labels
     option['locationcolorbar'] : location for the colorbar, 'NorthOutside' or
                                  'EastOutside'
@@ -130,11 +170,19 @@ def _default_options() -> dict:
     option['markercolors']    : dictionary with two colors as keys ('face', 'edge')
                                 or None. If None or 'markerlegend' == 'on' then
                                 considers only the value of 'markercolor'. (Default: None)
-    option['markerdisplayed'] : markers to use for individual experiments
+    option['markerdisplayed'] : markers to use for individual experiments: 'marker',
+                                'colorbar', or 'density' (Default: 'marker')
     option['markerlabel']     : name of the experiment to use for marker
     option['markerlabelcolor']: marker label color (Default: 'k')
     option['markerlayout']    : matrix layout for markers in legend [nrow, ncol]
                                 (Default [15, no. markers/15] )
+    option['legendmode']      : how the marker legend is displayed when
+                                markerlegend is 'on' (Default 'legend')
+                                'legend' : matplotlib legend beside the diagram
+                                'table'  : table of labels beside the diagram,
+                                           labels that do not fit are put on
+                                           separate legend figures
+                                'figure' : labels only on separate legend figures
     option['markerlegend']    : 'on'/'off' switch to display marker legend
                                 (Default 'off')
     option['markers']         : Dictionary providing individual control of the marker
@@ -199,13 +247,20 @@ def _default_options() -> dict:
     option["colframe"] = "#000000"  # black
 
     option["colormap"] = "on"
+
+    option["densitybins"] = 100
+    option["densitycolorbar"] = "on"
+    option["densityscale"] = "log"
+
     option["equalaxes"] = "on"
 
+    option["labelplacement"] = "fixed"
     option["labelweight"] = (
         "bold"  # weight of the x/y labels ('light', 'normal', 'bold', ...)
     )
     option["locationcolorbar"] = "NorthOutside"
 
+    option["legendmode"] = "legend"
     option["markercolor"] = None
     option["markercolors"] = None  # if None, considers 'markercolor' only
     option["markerdisplayed"] = "marker"
@@ -280,6 +335,12 @@ def _get_options(option, **kwargs) -> dict:
                 elif isinstance(option[optname], bool):
                     raise ValueError("cmapzdata cannot be a boolean!")
                 option["cmapzdata"] = optvalue
+            elif optname == "densitybins":
+                option["densitybins"] = check_density_bins(optvalue)
+            elif optname == "densitycolorbar":
+                option["densitycolorbar"] = check_on_off(option["densitycolorbar"])
+            elif optname == "densityscale":
+                option["densityscale"] = check_density_scale(optvalue)
             elif optname == "equalaxes":
                 option["equalaxes"] = check_on_off(option["equalaxes"])
             elif optname == "markerlabel":
@@ -292,6 +353,10 @@ def _get_options(option, **kwargs) -> dict:
                         "markerlabel value is not a list or dictionary: "
                         + str(optvalue)
                     )
+            elif optname == "labelplacement":
+                option["labelplacement"] = _check_label_placement(optvalue)
+            elif optname == "legendmode":
+                option["legendmode"] = _check_legend_mode(optvalue)
             elif optname == "markerlegend":
                 option["markerlegend"] = check_on_off(option["markerlegend"])
 
@@ -314,6 +379,24 @@ def _get_options(option, **kwargs) -> dict:
     return option
 
 
+def _pop_compiled_options(kwargs: dict) -> Union[DiagramOptions, None]:
+    """
+    Remove the OPTIONS keyword from KWARGS and return its value.
+
+    Returns None if the keyword is not supplied. Raises a ValueError if
+    the value is not a DiagramOptions object.
+    """
+    compiled = None
+    for optname in list(kwargs):
+        if optname.lower() == "options":
+            compiled = kwargs.pop(optname)
+            if not isinstance(compiled, DiagramOptions):
+                raise ValueError(
+                    "options must be created with compile_target_diagram_options"
+                )
+    return compiled
+
+
 def _read_options(option, **kwargs) -> dict:
     """
     Reads the optional arguments from a CSV file.
@@ -341,7 +424,7 @@ def _read_options(option, **kwargs) -> dict:
     Peter Rochford, rochford.peter1@gmail.com
 
     Created on Sep 17, 2022
-    Revised on Sep 17, 2022
+    Revised on Oct 18, 2026
     """
     # Check if option filename provided
     name = ""
@@ -367,12 +450,10 @@ def _read_options(option, **kwargs) -> dict:
     if not os.path.isfile(filename):
         raise Exception("File does not exist: " + filename)
 
-    # Load object from CSV file
-    objectData = pd.read_csv(filename)
-
-    # Parse object for keys and values
-    keys = objectData.iloc[:, 0]
-    values = objectData.iloc[:, 1].tolist()
+    # Load keys and values from CSV file (cached while the file is unchanged)
+    items = read_options_file(filename)
+    keys = [key for key, _ in items]
+    values = [value for _, value in items]
 
     # Identify keys requiring special consideration
     listkey = ["cmapzdata", "circles"]
@@ -381,7 +462,7 @@ def _read_options(option, **kwargs) -> dict:
     # Process for options read from CSV file
     for index in range(len(keys)):
         # Skip assignment if no value provided in CSV file
-        if pd.isna(values[index]):
+        if values[index] is None:
             continue
 
         # Convert list provided as string
@@ -390,7 +471,7 @@ def _read_options(option, **kwargs) -> dict:
             values[index] = values[index].replace("[", "").replace("]", "")
 
         if keys[index] in listkey:
-            if pd.isna(values[index]):
+            if values[index] is None:
                 option[keys[index]] = []
             else:
                 # Convert string to list of floats
@@ -403,7 +484,7 @@ def _read_options(option, **kwargs) -> dict:
                 option[keys[index]] = eval(values[index])
             except NameError:
                 raise Exception("Invalid " + keys[index] + ": " + values[index])
-        elif pd.isna(values[index]):
+        elif values[index] is None:
             option[keys[index]] = ""
         elif is_int(values[index]):
             option[keys[index]] = int(values[index])
@@ -431,6 +512,11 @@ def get_target_diagram_options(**kwargs) -> dict:
     assigned to selected optional arguments. The function will terminate
     with an error if an unrecognized optional argument is supplied.
 
+    Options previously compiled with COMPILE_TARGET_DIAGRAM_OPTIONS can be
+    supplied with the OPTIONS keyword. They are then used instead of the
+    defaults without validating them again, and only the options of a
+    target_options_file and the other keywords are applied on top of them.
+
     INPUTS:
     *kwargs : variable-length keyword argument list. The keywords by
               definition are dictionaries with keys that must correspond to
@@ -446,9 +532,19 @@ def get_target_diagram_options(**kwargs) -> dict:
         rochford.peter1@gmail.com
 
     Created on Nov 25, 2016
-    Revised on Sep 17, 2022
+    Revised on Oct 18, 2026
     """
 
+    # Use compiled options, if supplied
+    compiled = _pop_compiled_options(kwargs)
+    if compiled is not None:
+        option = compiled.resolve("target")
+        if len(kwargs) > 0:
+            # Options of a CSV file, then of the keywords, on top of them
+            option = _read_options(option, **kwargs)
+            option = _get_options(option, **kwargs)
+        return option
+
     nargin = len(kwargs)
 
     # Set default parameters for all options
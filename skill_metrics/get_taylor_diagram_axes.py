@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+import matplotlib.ticker as ticker
 import numpy as np
 
 
@@ -10,7 +13,8 @@ def get_taylor_diagram_axes(ax, rho, option) -> dict:
     the GET_TAYLOR_DIAGRAM_OPTIONS function.
 
     INPUTS:
-    ax     : the matplotlib.axes.Axes to receive the plot
+    ax     : the matplotlib.axes.Axes to receive the plot, or None to
+             determine the ticks without axes (e.g. TAYLOR_DIAGRAM_SCENE)
     rho    : radial coordinate
     option : dictionary containing option values. (Refer to
              get_taylor_diagram_subplot_options() function for more information.)
@@ -32,7 +36,7 @@ def get_taylor_diagram_axes(ax, rho, option) -> dict:
         adlzanchetta@gmail.com
 
     Created on Nov 25, 2016
-    Revised on Aug 14, 2022
+    Revised on Oct 18, 2026
     """
 
     axes = {}
@@ -43,14 +47,17 @@ def get_taylor_diagram_axes(ax, rho, option) -> dict:
 
     # make a radial grid
     if option["axismax"] == 0.0:
-        maxrho = max(abs(rho))
+        maxrho = np.amax(np.abs(rho))
     else:
         maxrho = option["axismax"]
 
     # Determine default number of tick marks
-    if option["overlay"] == "off":
-        ax.set_xlim(-maxrho, maxrho)
-    xt = ax.get_xticks()
+    if ax is None:
+        xt = _tick_values(-float(maxrho), float(maxrho))
+    else:
+        if option["overlay"] == "off":
+            ax.set_xlim(-maxrho, maxrho)
+        xt = ax.get_xticks()
     ticks = sum(xt >= 0)
 
     # Check radial limits and ticks
@@ -79,3 +86,14 @@ def get_taylor_diagram_axes(ax, rho, option) -> dict:
         option["rincstd"] = axes["rinc"]
 
     return axes
+
+
+@lru_cache(maxsize=64)
+def _tick_values(vmin: float, vmax: float) -> np.ndarray:
+    """
+    Tick values chosen by the default locator of an axis spanning
+    [VMIN, VMAX]. The array is shared through the cache.
+    """
+    ticks = ticker.AutoLocator().tick_values(vmin, vmax)
+    ticks.setflags(write=False)
+    return ticks
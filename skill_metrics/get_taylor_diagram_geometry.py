@@ -0,0 +1,207 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+def get_taylor_diagram_geometry(axes: dict, option: dict) -> dict:
+    """
+    Get the grid geometry of a Taylor diagram.
+
+    Computes the vertices of all grid lines of a Taylor diagram together
+    with the positions and texts of their labels, using NumPy only. The
+    result does not depend on matplotlib, so it can be drawn by any
+    plotting backend (see OVERLAY_TAYLOR_DIAGRAM_CIRCLES and
+    OVERLAY_TAYLOR_DIAGRAM_LINES), tested or benchmarked without
+    rendering.
+
+    The geometry is memoized on the radial limits, ticks and number of
+    panels, so diagrams sharing the same axes reuse the same arrays. The
+    returned arrays are therefore read-only and must not be modified.
+
+    INPUTS:
+    axes   : dictionary containing axes information for Taylor diagram
+             returned by GET_TAYLOR_DIAGRAM_AXES
+    axes['dx']   : observed standard deviation
+    axes['rinc'] : increment for radial coordinate
+    axes['rmax'] : maximum value for radial coordinate
+    option : dictionary containing option values. (Refer to
+             GET_TAYLOR_DIAGRAM_OPTIONS function for more information.)
+    option['axismax']        : maximum for the radial contours
+    option['numberpanels']   : number of panels
+    option['rincrms']        : increment spacing for RMS grid
+    option['rmslabelformat'] : string format for RMS contour labels
+    option['tickcor']        : CORs values to plot lines from origin
+    option['tickrms']        : RMS values to plot gridding circles from
+                               observation point
+    option['tickrmsangle']   : angle for RMS tick labels
+    option['tickstd']        : STD values to plot gridding circles from origin
+
+    OUTPUTS:
+    geometry : dictionary with the grid geometry. Vertices are given as
+               (x, y) tuples of arrays.
+    geometry['boundary']       : vertices of the outer boundary circle
+    geometry['std_circles']    : vertices of the STD circles, one per
+                                 option['tickstd']
+    geometry['std_ticks']      : values of the STD ticks along the x-axis
+    geometry['rms_ticks']      : values of the RMS circles that are drawn
+    geometry['rms_arcs']       : vertices of the RMS arcs, one per rms_ticks
+    geometry['rms_arc_angles'] : (n,2) array of the start and end angles in
+                                 degrees of the RMS arcs, counterclockwise
+                                 about the observation point
+    geometry['rms_label_xy']   : (n,2) array of RMS label positions
+    geometry['rms_label_text'] : RMS label texts
+    geometry['rms_label_rotation'] : rotation of RMS labels in degrees
+    geometry['cor_lines']      : (n,2,2) array of the end points of the
+                                 correlation lines
+    geometry['cor_label_xy']   : (n,2) array of correlation label positions
+    geometry['cor_label_text'] : correlation label texts
+
+    Created on Oct 18, 2026
+    """
+
+    # Label texts depend on the type of the tick values (e.g. 1 or 1.0),
+    # so they are formatted here and become part of the cache key
+    labelFormat = "{" + option["rmslabelformat"] + "}"
+    tickrms = np.ravel(option["tickrms"])
+    tickcor = option["tickcor"][option["numberpanels"] - 1]
+
+    return _taylor_geometry(
+        float(axes["rmax"]),
+        float(axes["dx"]),
+        float(axes["rinc"]),
+        float(option["axismax"]),
+        _as_key(option["tickstd"]),
+        _as_key(tickrms),
+        tuple(labelFormat.format(value) for value in tickrms),
+        float(option["rincrms"]),
+        float(option["tickrmsangle"]),
+        _as_key(tickcor),
+        tuple(str(round(value, 2)) for value in tickcor),
+        int(option["numberpanels"]),
+    )
+
+
+def _as_key(values) -> tuple:
+    """
+    Converts a sequence of numbers to a hashable tuple of floats.
+    """
+    return tuple(float(value) for value in np.ravel(values))
+
+
+def _readonly(*arrays):
+    """
+    Marks arrays as read-only since they are shared through the cache.
+    """
+    for array in arrays:
+        array.setflags(write=False)
+
+
+@lru_cache(maxsize=32)
+def _taylor_geometry(
+    rmax,
+    dx,
+    rinc,
+    axismax,
+    tickstd,
+    tickrms,
+    rmstext,
+    rincrms,
+    tickrmsangle,
+    tickcor,
+    cortext,
+    numberpanels,
+) -> dict:
+    """
+    Computes the geometry for GET_TAYLOR_DIAGRAM_GEOMETRY from hashable
+    arguments.
+    """
+
+    th = np.arange(0, 2 * np.pi, np.pi / 150)
+    xunit = np.cos(th)
+    yunit = np.sin(th)
+
+    # now really force points on x/y axes to lie on them exactly
+    inds = range(0, len(th), (len(th) - 1) // 4)
+    xunit[inds[1:5:2]] = np.zeros(2)
+    yunit[inds[0:6:2]] = np.zeros(3)
+
+    geometry = {}
+
+    # STD circles about the origin and outer boundary
+    std = np.asarray(tickstd)
+    geometry["std_circles"] = tuple((xunit * i, yunit * i) for i in std)
+    geometry["boundary"] = (xunit * axismax, yunit * axismax)
+    if numberpanels == 2:
+        geometry["std_ticks"] = np.sort(np.concatenate((-std, std)))
+    else:
+        geometry["std_ticks"] = std.copy()
+
+    # RMS circles about the observation point, clipped at the boundary
+    if tickrmsangle > 0:
+        angle = tickrmsangle
+    else:
+        phi = np.arctan2(tickstd[-1], dx)
+        angle = 180 - np.rad2deg(phi)
+    cst = np.cos(angle * np.pi / 180)
+    snt = np.sin(angle * np.pi / 180)
+    radius = np.sqrt(dx**2 + rmax**2 - 2 * dx * rmax * xunit)
+
+    rms = np.asarray(tickrms, dtype=float).reshape(-1)
+    outside = radius[np.newaxis, :] >= rms[:, np.newaxis]
+    drawn = outside.any(axis=1)
+    rms = rms[drawn]
+    phi = th[np.argmax(outside[drawn], axis=1)]
+    inside = (
+        rms[:, np.newaxis] * np.cos(th)[np.newaxis, :] + dx
+        <= rmax * np.cos(phi)[:, np.newaxis]
+    )
+    geometry["rms_ticks"] = rms
+    geometry["rms_arcs"] = tuple(
+        (xunit[ig] * r + dx, yunit[ig] * r) for r, ig in zip(rms, inside)
+    )
+
+    # The arcs are centered on 180 degrees, so the part inside the
+    # boundary is contiguous
+    first = np.argmax(inside, axis=1)
+    last = len(th) - 1 - np.argmax(inside[:, ::-1], axis=1)
+    angles = np.column_stack((th[first], th[last])) * 180 / np.pi
+    angles[inside.all(axis=1)] = [0.0, 360.0]
+    geometry["rms_arc_angles"] = angles
+
+    rt = rms + rincrms / 20
+    if tickrmsangle > 90:
+        rt = rt + abs(cst) * rinc / 5
+    geometry["rms_label_xy"] = np.column_stack((rt * cst + dx, rt * snt))
+    geometry["rms_label_text"] = tuple(np.array(rmstext, dtype=object)[drawn])
+    geometry["rms_label_rotation"] = angle - 90
+
+    # Correlation lines emanating from the origin and their labels
+    corr = np.asarray(tickcor)
+    th = np.arccos(corr)
+    cst, snt = np.cos(th), np.sin(th)
+    ends = np.column_stack((np.append(-1.0 * cst, cst), np.append(-1.0 * snt, snt)))
+    lines = np.zeros((len(ends), 2, 2))
+    lines[:, 1, :] = rmax * ends
+    geometry["cor_lines"] = lines
+
+    if numberpanels == 2:
+        x = (1.05 + abs(cst) / 30) * rmax * cst
+    else:
+        x = 1.05 * rmax * cst
+    geometry["cor_label_xy"] = np.column_stack((x, 1.05 * rmax * snt))
+    geometry["cor_label_text"] = cortext
+
+    _readonly(
+        xunit,
+        yunit,
+        geometry["std_ticks"],
+        rms,
+        angles,
+        geometry["rms_label_xy"],
+        lines,
+        geometry["cor_label_xy"],
+        *[v for xy in geometry["std_circles"] + geometry["rms_arcs"] for v in xy],
+        *geometry["boundary"],
+    )
+
+    return geometry
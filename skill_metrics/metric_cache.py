@@ -0,0 +1,208 @@
+import functools
+import hashlib
+import importlib.metadata
+import pickle
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+from .file_cache import FileCache
+
+# Cached results are only valid for the version that computed them
+try:
+    _VERSION = importlib.metadata.version("SkillMetrics")
+except importlib.metadata.PackageNotFoundError:
+    _VERSION = "unknown"
+
+
+class MetricCache:
+    """
+    Cache of the results of metric calculations keyed by their inputs.
+
+    Calling the cache with a function and its arguments, e.g.
+
+    cache = MetricCache()
+    stats = cache(taylor_statistics, predicted, reference)
+
+    returns the result of a previous call with the same arguments, or
+    calculates it and stores it. The key of a call is a SHA-1 hash of the
+    name of the function, of the bytes, dtype and shape of the arrays and
+    of the other arguments (e.g. the SR, SALPHA and SBETA weights of
+    KLING_GUPTA_EFF09 or NORM of TARGET_STATISTICS), so identical data
+    hits the cache whatever array object holds it. WRAP returns a function
+    cached this way.
+
+    Results are kept in memory for the MAXSIZE most recently used calls
+    and, if DIRECTORY is given, in files of at most MAX_BYTES in total
+    in its subdirectory 'skill_metrics-cache' (see FILECACHE), which are
+    shared by processes and sessions using the same directory. Cached
+    results are copies, so they can be modified freely. Results on disk
+    are pickled: only use a directory written by trusted processes.
+
+    Arguments can be NumPy arrays, pandas Series, lists, dictionaries,
+    strings, numbers, booleans and None. Calls with other arguments raise
+    TypeError.
+
+    Functions are identified by their module and qualified name, so only
+    functions defined at the top level of a module or class can be
+    cached. Lambdas, functions defined inside other functions (closures)
+    and methods bound to an instance raise TypeError, as different
+    functions of the same name would share results. functools.partial
+    objects are keyed by their function, arguments and keywords.
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, maxsize: int = 1024, directory=None, max_bytes=256 * 2**20):
+        """
+        INPUTS:
+        maxsize   : number of results kept in memory (Default: 1024)
+        directory : directory of the results stored on disk, in its
+                    subdirectory 'skill_metrics-cache' (Default: None,
+                    results kept in memory only)
+        max_bytes : maximum total size of the results stored on disk
+                    (Default: 256 MiB)
+        """
+        self.maxsize = maxsize
+        self.disk = None if directory is None else FileCache(directory, max_bytes)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # least recently used first
+
+    def __call__(self, function, *args, **kwargs):
+        key = self.key(function, *args, **kwargs)
+
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(data)
+
+        data = None if self.disk is None else self.disk.get(key)
+        if data is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            result = function(*args, **kwargs)
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.disk is not None:
+                self.disk.put(key, data)
+            with self._lock:
+                self.misses += 1
+
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+        return pickle.loads(data)
+
+    def wrap(self, function):
+        """
+        Returns FUNCTION with its results cached, e.g.
+        taylor_statistics = cache.wrap(sm.taylor_statistics)
+        """
+
+        @functools.wraps(function)
+        def cached(*args, **kwargs):
+            return self(function, *args, **kwargs)
+
+        return cached
+
+    def key(self, function, *args, **kwargs) -> str:
+        """
+        Key of a call of FUNCTION with the given arguments.
+        """
+        # Arguments of partial functions are those of the call
+        while isinstance(function, functools.partial):
+            args = function.args + args
+            kwargs = {**function.keywords, **kwargs}
+            function = function.func
+
+        digest = hashlib.sha1(usedforsecurity=False)
+        digest.update(("%s:%s" % (_VERSION, _function_name(function))).encode())
+        _update(digest, args)
+        _update(digest, kwargs)
+        return digest.hexdigest()
+
+    def clear(self) -> None:
+        """
+        Removes the results kept in memory and resets the counters.
+        """
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def statistics(self) -> dict:
+        """
+        Counters of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._memory),
+                "disk_entries": 0 if self.disk is None else len(self.disk),
+                "disk_bytes": 0 if self.disk is None else self.disk.size,
+            }
+
+
+def _function_name(function) -> str:
+    """
+    Module and qualified name of a function, unique to it.
+    """
+    module = getattr(function, "__module__", None)
+    name = getattr(function, "__qualname__", None)
+    if module is None or name is None or "<" in name:
+        # Lambdas and closures ('<lambda>', 'f.<locals>.g') share names
+        raise TypeError(
+            "Cannot cache function without a unique qualified name: %r" % (function,)
+        )
+    owner = getattr(function, "__self__", None)
+    if owner is not None and not isinstance(owner, (type, types.ModuleType)):
+        raise TypeError("Cannot cache method bound to an instance: %r" % (function,))
+    return "%s.%s" % (module, name)
+
+
+def _update(digest, value) -> None:
+    """
+    Adds a value to a hash, with its type so that e.g. 1 and '1' differ.
+    """
+    if isinstance(value, (list, tuple)) and not _is_numeric(value):
+        digest.update(b"L%d;" % len(value))
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, dict):
+        digest.update(b"D%d;" % len(value))
+        for name in sorted(value, key=str):
+            _update(digest, str(name))
+            _update(digest, value[name])
+    elif isinstance(value, str):
+        digest.update(b"S%d;" % len(value.encode()) + value.encode())
+    elif value is None or isinstance(value, (bool, int, float, complex, np.generic)):
+        digest.update(("%s:%r;" % (type(value).__name__, value)).encode())
+    elif isinstance(value, (np.ndarray, list, tuple)) or hasattr(value, "to_numpy"):
+        # Arrays, lists of numbers and pandas objects by their values
+        array = np.ascontiguousarray(
+            value.to_numpy() if hasattr(value, "to_numpy") else value
+        )
+        if array.dtype.hasobject:
+            raise TypeError("Cannot hash array of objects for the cache")
+        digest.update(("A%s%s;" % (array.dtype.str, array.shape)).encode())
+        digest.update(array.data)
+    else:
+        raise TypeError("Cannot hash argument of type %s" % type(value).__name__)
+
+
+def _is_numeric(value) -> bool:
+    """
+    True for lists and tuples of numbers, hashed as arrays.
+    """
+    numbers = (bool, int, float, np.number)
+    return len(value) > 0 and all(isinstance(item, numbers) for item in value)
@@ -0,0 +1,314 @@
+import sqlite3
+
+import numpy as np
+
+# Moments accumulated for each pair of predicted (p) and reference (r)
+# series: number of values, means, sums of squared deviations from the
+# means and sum of the products of the deviations (co-moment)
+_MOMENTS = ("n", "mean_p", "mean_r", "m2_p", "m2_r", "c_pr")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS moments (
+    station TEXT NOT NULL,
+    model TEXT NOT NULL,
+    period TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    mean_p REAL NOT NULL,
+    mean_r REAL NOT NULL,
+    m2_p REAL NOT NULL,
+    m2_r REAL NOT NULL,
+    c_pr REAL NOT NULL,
+    PRIMARY KEY (station, model, period)
+)
+"""
+
+
+class MomentStore:
+    """
+    Persistent store of the moments of predicted and reference series.
+
+    The statistics of TAYLOR_STATISTICS and TARGET_STATISTICS follow from
+    a few moments of the paired series: the number of values, the means,
+    the sums of squared deviations from the means and the co-moment. The
+    store keeps these moments in an SQLite database for each (station,
+    model, period), so that new values are added with UPDATE without
+    reading the record again, and the statistics of any set of periods
+    are merged from the stored moments instantly.
+
+    Moments are merged and removed with the pairwise formulas of Chan et
+    al. (1979), which are numerically stable. Pairs where either value is
+    NaN are ignored.
+
+    When historical values are revised, the moments of the periods
+    concerned are corrected with REMOVE (old values) and UPDATE (new
+    values), replaced by REPLACE from the whole revised series, or dropped
+    by INVALIDATE to be rebuilt. Periods are free strings, e.g. '1995' or
+    '1995-07', and keeping them short bounds what has to be recomputed
+    after a revision.
+
+    Changes are saved by COMMIT or CLOSE, so that the updates of a day are
+    written as a single transaction.
+
+    EXAMPLE:
+    with MomentStore('moments.db') as store:
+        store.update('Station 1', 'Model A', '2026', predicted, reference)
+        stats = store.taylor_statistics('Station 1', 'Model A')
+
+    Reference:
+    Chan, T. F., G. H. Golub, and R. J. LeVeque (1979), Updating formulae
+      and a pairwise algorithm for computing sample variances, Technical
+      Report STAN-CS-79-773, Stanford University.
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, filename: str = ":memory:"):
+        """
+        INPUTS:
+        filename : name of the SQLite database file, created if it does
+                   not exist (Default: in memory)
+        """
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is not None:
+            self.connection.rollback()
+        self.close()
+
+    def commit(self) -> None:
+        """
+        Saves the changes to the database.
+        """
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Saves the changes and closes the database.
+        """
+        self.connection.commit()
+        self.connection.close()
+
+    def keys(self, station=None, model=None) -> list:
+        """
+        Lists the (station, model, period) of the stored moments, for a
+        station and/or a model if given.
+        """
+        where, values = _where(station, model)
+        cursor = self.connection.execute(
+            "SELECT station, model, period FROM moments" + where + " ORDER BY 1, 2, 3",
+            values,
+        )
+        return cursor.fetchall()
+
+    def update(self, station, model, period, predicted, reference) -> None:
+        """
+        Adds values of the predicted and reference series to the moments
+        of a period.
+        """
+        batch = _batch_moments(predicted, reference)
+        if batch[0] > 0:
+            moments = self._get(station, model, period)
+            self._put(station, model, period, _merge(moments, batch))
+
+    def remove(self, station, model, period, predicted, reference) -> None:
+        """
+        Removes values previously added to the moments of a period, e.g.
+        the old values of a revision.
+        """
+        batch = _batch_moments(predicted, reference)
+        if batch[0] > 0:
+            moments = self._get(station, model, period)
+            self._put(station, model, period, _subtract(moments, batch))
+
+    def replace(self, station, model, period, predicted, reference) -> None:
+        """
+        Replaces the moments of a period by those of the given series.
+        """
+        self.invalidate(station, model, period)
+        self.update(station, model, period, predicted, reference)
+
+    def invalidate(self, station=None, model=None, period=None) -> int:
+        """
+        Drops the moments of a station, model and/or period (all of them
+        when none is given), e.g. to rebuild them after a revision.
+        Returns the number of (station, model, period) dropped.
+        """
+        where, values = _where(station, model, period)
+        cursor = self.connection.execute("DELETE FROM moments" + where, values)
+        return cursor.rowcount
+
+    def moments(self, station, model, periods=None) -> dict:
+        """
+        Moments of a station and model merged over PERIODS (Default: all
+        the periods stored).
+        """
+        where, values = _where(station, model)
+        cursor = self.connection.execute(
+            "SELECT period, %s FROM moments%s" % (", ".join(_MOMENTS), where), values
+        )
+        rows = {row[0]: row[1:] for row in cursor}
+        if periods is None:
+            periods = sorted(rows)
+        moments = (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        for period in periods:
+            if str(period) not in rows:
+                raise ValueError("No moments for %s, %s, %s" % (station, model, period))
+            moments = _merge(moments, rows[str(period)])
+        if moments[0] == 0:
+            raise ValueError("No moments for %s, %s" % (station, model))
+        return dict(zip(_MOMENTS, moments))
+
+    def taylor_statistics(self, station, model, periods=None) -> dict:
+        """
+        Statistics of a Taylor diagram of a station and model over PERIODS
+        (Default: all), as returned by TAYLOR_STATISTICS.
+        """
+        m = self.moments(station, model, periods)
+        sdevp = np.sqrt(m["m2_p"] / m["n"])
+        sdevr = np.sqrt(m["m2_r"] / m["n"])
+        ccoef = m["c_pr"] / np.sqrt(m["m2_p"] * m["m2_r"])
+        crmsd = np.sqrt(max(m["m2_p"] + m["m2_r"] - 2.0 * m["c_pr"], 0.0) / m["n"])
+        return {
+            "ccoef": np.array([1.0, ccoef]),
+            "crmsd": [0.0, crmsd],
+            "sdev": [sdevr, sdevp],
+        }
+
+    def target_statistics(self, station, model, periods=None, norm=False) -> dict:
+        """
+        Statistics of a target diagram of a station and model over PERIODS
+        (Default: all), as returned by TARGET_STATISTICS.
+        """
+        m = self.moments(station, model, periods)
+        bias = m["mean_p"] - m["mean_r"]
+        crmsd = np.sqrt(max(m["m2_p"] + m["m2_r"] - 2.0 * m["c_pr"], 0.0) / m["n"])
+        rmsd = np.sqrt(crmsd**2 + bias**2)
+
+        # Normalize if requested
+        if norm:
+            sigma_ref = np.sqrt(m["m2_r"] / m["n"])
+            bias = bias / sigma_ref
+            crmsd = crmsd / sigma_ref
+            rmsd = rmsd / sigma_ref
+
+        stats = {"bias": bias, "crmsd": crmsd, "rmsd": rmsd}
+        stats["type"] = "normalized" if norm else "unnormalized"
+        return stats
+
+    def _get(self, station, model, period) -> tuple:
+        """
+        Moments of a period, zero if none are stored.
+        """
+        cursor = self.connection.execute(
+            "SELECT %s FROM moments WHERE station = ? AND model = ? AND period = ?"
+            % ", ".join(_MOMENTS),
+            (str(station), str(model), str(period)),
+        )
+        row = cursor.fetchone()
+        return (0, 0.0, 0.0, 0.0, 0.0, 0.0) if row is None else row
+
+    def _put(self, station, model, period, moments: tuple) -> None:
+        """
+        Stores the moments of a period, dropping them when empty.
+        """
+        if moments[0] == 0:
+            self.invalidate(station, model, period)
+            return
+        self.connection.execute(
+            "INSERT OR REPLACE INTO moments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (str(station), str(model), str(period)) + tuple(moments),
+        )
+
+
+def _where(station=None, model=None, period=None) -> tuple:
+    """
+    WHERE clause selecting the given keys, and its parameters.
+    """
+    names, values = [], []
+    for name, value in zip(("station", "model", "period"), (station, model, period)):
+        if value is not None:
+            names.append(name + " = ?")
+            values.append(str(value))
+    if len(names) == 0:
+        return "", values
+    return " WHERE " + " AND ".join(names), values
+
+
+def _batch_moments(predicted, reference) -> tuple:
+    """
+    Moments of paired series, ignoring pairs with a NaN.
+    """
+    p = np.asarray(predicted, dtype=float).ravel()
+    r = np.asarray(reference, dtype=float).ravel()
+    if p.shape != r.shape:
+        raise ValueError(
+            "Predicted and reference series differ in size: %d, %d"
+            % (p.size, r.size)
+        )
+    valid = ~(np.isnan(p) | np.isnan(r))
+    p, r = p[valid], r[valid]
+    if p.size == 0:
+        return (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    mean_p, mean_r = p.mean(), r.mean()
+    dp, dr = p - mean_p, r - mean_r
+    return (
+        int(p.size),
+        float(mean_p),
+        float(mean_r),
+        float(np.dot(dp, dp)),
+        float(np.dot(dr, dr)),
+        float(np.dot(dp, dr)),
+    )
+
+
+def _merge(a: tuple, b: tuple) -> tuple:
+    """
+    Moments of the union of two sets of pairs.
+    """
+    na, nb = a[0], b[0]
+    if na == 0:
+        return tuple(b)
+    if nb == 0:
+        return tuple(a)
+    n = na + nb
+    delta_p = b[1] - a[1]
+    delta_r = b[2] - a[2]
+    weight = na * nb / n
+    return (
+        n,
+        a[1] + delta_p * nb / n,
+        a[2] + delta_r * nb / n,
+        a[3] + b[3] + delta_p * delta_p * weight,
+        a[4] + b[4] + delta_r * delta_r * weight,
+        a[5] + b[5] + delta_p * delta_r * weight,
+    )
+
+
+def _subtract(total: tuple, b: tuple) -> tuple:
+    """
+    Moments of a set of pairs without a subset B of them.
+    """
+    n, nb = total[0], b[0]
+    na = n - nb
+    if na < 0:
+        raise ValueError("Cannot remove %d values from %d values" % (nb, n))
+    if na == 0:
+        return (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    mean_p = (n * total[1] - nb * b[1]) / na
+    mean_r = (n * total[2] - nb * b[2]) / na
+    delta_p = b[1] - mean_p
+    delta_r = b[2] - mean_r
+    weight = na * nb / n
+    return (
+        na,
+        mean_p,
+        mean_r,
+        max(total[3] - b[3] - delta_p * delta_p * weight, 0.0),
+        max(total[4] - b[4] - delta_r * delta_r * weight, 0.0),
+        total[5] - b[5] - delta_p * delta_r * weight,
+    )
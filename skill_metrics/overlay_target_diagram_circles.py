@@ -1,24 +1,8 @@
-import matplotlib
-import numpy as np
+import matplotlib.axes
+from matplotlib import rcParams
+from matplotlib.collections import LineCollection
 
-
-def pol2cart(phi, rho):
-    """
-    Transforms corresponding elements of polar coordinate arrays to
-    Cartesian coordinates.
-
-    INPUTS:
-    phi : polar angle counter-clockwise from x-axis in radians
-    rho : radius
-
-    OUTPUTS:
-    x   : Cartesian x-coordinate
-    y   : Cartesian y-coordinate
-    """
-
-    x = np.multiply(rho, np.cos(phi))
-    y = np.multiply(rho, np.sin(phi))
-    return x, y
+from .get_target_diagram_geometry import get_target_diagram_geometry
 
 
 def overlay_target_diagram_circles(ax: matplotlib.axes.Axes, option: dict) -> None:
@@ -37,6 +21,7 @@ def overlay_target_diagram_circles(ax: matplotlib.axes.Axes, option: dict) -> No
             of standard deviation
     option['circleLineSpec'] : circle line specification (default dashed
             black, '--k')
+    option['circleLineWidth'] : circle line width
     option['normalized']     : statistics supplied are normalized with
             respect to the standard deviation of reference values
     option['obsUncertainty'] : Observational Uncertainty (default of 0)
@@ -44,46 +29,37 @@ def overlay_target_diagram_circles(ax: matplotlib.axes.Axes, option: dict) -> No
     OUTPUTS:
     None.
 
+    The vertices of the circles are computed by GET_TARGET_DIAGRAM_GEOMETRY
+    and reused by diagrams with the same circles. All the circles are drawn
+    as a single LineCollection.
+
     Author: Peter A. Rochford
         Symplectic, LLC
         www.thesymplectic.com
         prochford@thesymplectic.com
     """
 
-    theta = np.arange(0, 2 * np.pi, 0.01)
-    unit = np.ones(len(theta))
-    # 1 - reference circle if normalized
-    if option["normalized"] == "on":
-        rho = unit
-        X, Y = pol2cart(theta, rho)
-        ax.plot(X, Y, "k", "LineWidth", option["circleLineWidth"])
-
-    # Set range for target circles
-    if option["normalized"] == "on":
-        circles = [0.5, 1]
-    else:
-        if option["circles"] is None:
-            circles = [option["axismax"] * x for x in [0.7, 1]]
-        else:
-            circles = np.asarray(option["circles"])
-            index = np.where(circles <= option["axismax"])
-            circles = [option["circles"][i] for i in index[0]]
+    # Vertices of the circles
+    geometry = get_target_diagram_geometry(option)
+    nreference = 0 if geometry["reference"] is None else 1
+    ncircles = len(geometry["circle_xy"])
+    nobs = 0 if geometry["obsuncertainty"] is None else 1
 
+    # 1 - reference circle if normalized
     # 2 - secondary circles
-    for c in circles:
-        rho = c * unit
-        X, Y = pol2cart(theta, rho)
-        ax.plot(
-            X,
-            Y,
-            linestyle=option["circlestyle"],
-            color=option["circlecolor"],
-            linewidth=option["circlelinewidth"],
-        )
-    del c
-
     # 3 - Observational Uncertainty threshold
-    if option["obsuncertainty"] > 0:
-        rho = option["obsuncertainty"] * unit
-        X, Y = pol2cart(theta, rho)
-        ax.plot(X, Y, "--b")
+    colors = ["k"] * nreference + [option["circlecolor"]] * ncircles + ["b"] * nobs
+    styles = ["-"] * nreference + [option["circlestyle"]] * ncircles + ["--"] * nobs
+    widths = [option["circlelinewidth"]] * (nreference + ncircles) + [
+        rcParams["lines.linewidth"]
+    ] * nobs
+
+    circles = LineCollection(
+        geometry["segments"],
+        colors=colors,
+        linestyles=styles,
+        linewidths=widths,
+        zorder=2,
+    )
+    ax.add_collection(circles, autolim=True)
+    ax.autoscale_view()
@@ -1,6 +1,9 @@
-import matplotlib
+import matplotlib.axes
 import numpy as np
-from . import get_from_dict_or_default
+from matplotlib.collections import LineCollection
+
+from .get_from_dict_or_default import get_from_dict_or_default
+from .get_taylor_diagram_geometry import get_taylor_diagram_geometry
 
 
 def overlay_taylor_diagram_circles(
@@ -41,107 +44,69 @@ def overlay_taylor_diagram_circles(
     OUTPUTS:
     None
 
+    The vertices and label positions are computed by
+    GET_TAYLOR_DIAGRAM_GEOMETRY. The RMS circles and the STD circles are
+    each drawn as a single LineCollection.
+
     See also GET_TAYLOR_DIAGRAM_OPTIONS
 
     Author: Andre D. L. Zanchetta (adapting Peter A. Rochford's code)
         adlzanchetta@gmail.com
     """
 
-    th = np.arange(0, 2 * np.pi, np.pi / 150)
-    xunit = np.cos(th)
-    yunit = np.sin(th)
-
-    # now really force points on x/y axes to lie on them exactly
-    inds = range(0, len(th), (len(th) - 1) // 4)
-    xunit[inds[1:5:2]] = np.zeros(2)
-    yunit[inds[0:6:2]] = np.zeros(3)
+    # Vertices and label positions of the grid
+    geometry = get_taylor_diagram_geometry(axes, option)
 
     # DRAW RMS CIRCLES:
-    # ANGLE OF THE TICK LABELS
-    if option["tickrmsangle"] > 0:
-        tickRMSAngle = option["tickrmsangle"]
-    else:
-        phi = np.arctan2(option["tickstd"][-1], axes["dx"])
-        tickRMSAngle = 180 - np.rad2deg(phi)
-
-    cst = np.cos(tickRMSAngle * np.pi / 180)
-    snt = np.sin(tickRMSAngle * np.pi / 180)
-    radius = np.sqrt(
-        axes["dx"] ** 2 + axes["rmax"] ** 2 - 2 * axes["dx"] * axes["rmax"] * xunit
-    )
-
-    # Define label format
-    labelFormat = "{" + option["rmslabelformat"] + "}"
     fontSize = matplotlib.rcParams.get("font.size") + 2
-
-    for iradius in option["tickrms"]:
-        phi = th[np.where(radius >= iradius)]
-        if len(phi) != 0:
-            phi = phi[0]
-            ig = np.where(
-                iradius * np.cos(th) + axes["dx"] <= axes["rmax"] * np.cos(phi)
-            )
-            hhh = ax.plot(
-                xunit[ig] * iradius + axes["dx"],
-                yunit[ig] * iradius,
-                linestyle=option["stylerms"],
+    arcs = [np.column_stack(xy) for xy in geometry["rms_arcs"]]
+    ax.add_collection(
+        LineCollection(
+            arcs,
+            linestyles=option["stylerms"],
+            colors=option["colrms"],
+            linewidths=option["widthrms"],
+            zorder=2,
+        )
+    )
+    if option["showlabelsrms"] == "on":
+        for (xtextpos, ytextpos), text in zip(
+            geometry["rms_label_xy"], geometry["rms_label_text"]
+        ):
+            ax.text(
+                xtextpos,
+                ytextpos,
+                text,
+                horizontalalignment="center",
+                verticalalignment="center",
                 color=option["colrms"],
-                linewidth=option["widthrms"],
+                rotation=geometry["rms_label_rotation"],
+                fontsize=fontSize,
             )
-            if option["showlabelsrms"] == "on":
-                rt = iradius + option["rincrms"] / 20
-                if option["tickrmsangle"] > 90:
-                    xtextpos = (rt + abs(cst) * axes["rinc"] / 5) * cst + axes["dx"]
-                    ytextpos = (rt + abs(cst) * axes["rinc"] / 5) * snt
-                else:
-                    xtextpos = rt * cst + axes["dx"]
-                    ytextpos = rt * snt
-
-                ax.text(
-                    xtextpos,
-                    ytextpos,
-                    labelFormat.format(iradius),
-                    horizontalalignment="center",
-                    verticalalignment="center",
-                    color=option["colrms"],
-                    rotation=tickRMSAngle - 90,
-                    fontsize=fontSize,
-                )
 
     # DRAW STD CIRCLES:
-    # draw radial circles
+    # draw radial circles, the outermost one solid, and the outer boundary
     grid_color = get_from_dict_or_default(option, "colstd", "colsstd", "grid")
-    for i in option["tickstd"]:
-        hhh = ax.plot(
-            xunit * i,
-            yunit * i,
-            linestyle=option["stylestd"],
-            color=grid_color,
-            linewidth=option["widthstd"],
+    circles = [np.column_stack(xy) for xy in geometry["std_circles"]]
+    styles = [option["stylestd"]] * len(circles)
+    styles[-1] = "-"
+    circles.append(np.column_stack(geometry["boundary"]))
+    styles.append(option["stylestd"])
+    ax.add_collection(
+        LineCollection(
+            circles,
+            linestyles=styles,
+            colors=grid_color,
+            linewidths=option["widthstd"],
+            zorder=2,
         )
-        del i
+    )
 
     # Set tick values for axes
     tickValues = []
     if option["showlabelsstd"] == "on":
-        if option["numberpanels"] == 2:
-            tickValues = -option["tickstd"] + option["tickstd"]
-            tickValues.sort()
-        else:
-            tickValues = option["tickstd"]
+        tickValues = geometry["std_ticks"]
 
     ax.set_xticks(tickValues)
 
-    hhh[0].set_linestyle("-")  # Make outermost STD circle solid
-
-    # Draw circle for outer boundary
-    i = option["axismax"]
-    hhh = ax.plot(
-        xunit * i,
-        yunit * i,
-        linestyle=option["stylestd"],
-        color=grid_color,
-        linewidth=option["widthstd"],
-    )
-
     return None
@@ -1,6 +1,8 @@
-import matplotlib
-import numpy as np
+import matplotlib.axes
+from matplotlib.collections import LineCollection
+
 from .get_from_dict_or_default import get_from_dict_or_default
+from .get_taylor_diagram_geometry import get_taylor_diagram_geometry
 
 
 def overlay_taylor_diagram_lines(
@@ -34,32 +36,30 @@ def overlay_taylor_diagram_lines(
     OUTPUTS:
     None.
 
+    The vertices and label positions are computed by
+    GET_TAYLOR_DIAGRAM_GEOMETRY.
+
     Author: Andre D. L. Zanchetta (adapting Peter A. Rochford's code)
         adlzanchetta@gmail.com
 
     Created on Aug 14, 2022
     """
 
-    # Get common information
-    corr = option["tickcor"][option["numberpanels"] - 1]
-    th = np.arccos(corr)
-    cst, snt = np.cos(th), np.sin(th)
-    del th
+    # Vertices and label positions of the grid
+    geometry = get_taylor_diagram_geometry(axes, option)
 
     # DRAW CORRELATION LINES EMANATING FROM THE ORIGIN:
-    cs = np.append(-1.0 * cst, cst)
-    sn = np.append(-1.0 * snt, snt)
     lines_col = get_from_dict_or_default(option, "colcor", "colscor", "grid")
-    for i, val in enumerate(cs):
-        ax.plot(
-            [0, axes["rmax"] * cs[i]],
-            [0, axes["rmax"] * sn[i]],
-            linestyle=option["stylecor"],
-            color=lines_col,
-            linewidth=option["widthcor"],
+    ax.add_collection(
+        LineCollection(
+            geometry["cor_lines"],
+            linestyles=option["stylecor"],
+            colors=lines_col,
+            linewidths=option["widthcor"],
+            zorder=2,
         )
-        del i, val
-    del lines_col, sn, cs
+    )
+    del lines_col
 
     # annotate them in correlation coefficient
     if option["showlabelscor"] == "on":
@@ -67,22 +67,17 @@ def overlay_taylor_diagram_lines(
             option, "colcor", "colscor", "tick_labels"
         )
         fontSize = matplotlib.rcParams.get("font.size")
-        rt = 1.05 * axes["rmax"]
-        for i, cc in enumerate(corr):
-            if option["numberpanels"] == 2:
-                x = (1.05 + abs(cst[i]) / 30) * axes["rmax"] * cst[i]
-            else:
-                x = rt * cst[i]
-            y = rt * snt[i]
+        for (x, y), text in zip(
+            geometry["cor_label_xy"], geometry["cor_label_text"]
+        ):
             ax.text(
                 x,
                 y,
-                str(round(cc, 2)),
+                text,
                 horizontalalignment="center",
                 color=ticklabels_col,
                 fontsize=fontSize,
             )
-            del i, cc
-        del fontSize, rt, ticklabels_col
+        del fontSize, ticklabels_col
 
     return None
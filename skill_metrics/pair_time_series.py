@@ -0,0 +1,201 @@
+import datetime
+import numbers
+
+import numpy as np
+
+METHODS = ("exact", "nearest", "linear")
+
+
+def pair_time_series(
+    predicted_time, predicted, reference_time, reference, method="exact", tolerance=None
+):
+    """
+    Pairs predicted and reference series sampled at different times.
+
+    Each reference value (e.g. an observation) is paired with the
+    predicted value (e.g. model output) at its time, so that the paired
+    arrays can be passed to TAYLOR_STATISTICS, TARGET_STATISTICS and the
+    other statistics functions, which require series of equal size. The
+    predicted value at a reference time is
+
+    'exact'   : the predicted value at the same time,
+    'nearest' : the predicted value nearest in time, if it is within
+                TOLERANCE of the reference time,
+    'linear'  : the linear interpolation of the predicted values before
+                and after the reference time, if they are at most
+                TOLERANCE apart.
+
+    Reference values without a predicted value are dropped, as are the
+    values that are missing (NaN) or have a missing time (NaT). The times
+    are matched by binary search on sorted arrays (NUMPY.SEARCHSORTED),
+    so pairing takes O(N log N) time and a few copies of the arrays for
+    tens of millions of values, and the series are only sorted when they
+    are not already in order of time.
+
+    Times can be numbers, or NumPy datetime64 arrays or pandas objects of
+    dates, in which case TOLERANCE is a timedelta, e.g.
+    pd.Timedelta('30min') or np.timedelta64(30, 'm'). Timezone-aware
+    dates are compared in UTC, and their paired times are returned as
+    datetime64 values in UTC. As in pandas, timezone-aware dates cannot
+    be paired with naive dates.
+
+    INPUTS:
+    predicted_time : times of the predicted values
+    predicted      : predicted values
+    reference_time : times of the reference values
+    reference      : reference values
+    method         : 'exact', 'nearest' or 'linear' (Default: 'exact')
+    tolerance      : maximum time between a reference value and the
+                     nearest predicted value ('nearest'), or between the
+                     interpolated predicted values ('linear') (Default:
+                     None, no limit)
+
+    OUTPUTS:
+    predicted : predicted values at the paired reference times
+    reference : paired reference values, in order of time
+    time      : paired reference times, in order of time
+
+    EXAMPLE:
+    p, r, time = pair_time_series(model.index, model, obs.index, obs,
+                                  method='nearest',
+                                  tolerance=pd.Timedelta('15min'))
+    stats = taylor_statistics(p, r)
+
+    Created on Oct 18, 2026
+    """
+    if method not in METHODS:
+        raise ValueError(
+            "Unknown pairing method: %s, expected one of %s"
+            % (method, ", ".join(METHODS))
+        )
+
+    ptime, pvalue, paware = _prepare(predicted_time, predicted, "PREDICTED")
+    time, rvalue, raware = _prepare(reference_time, reference, "REFERENCE")
+    rtime = time
+    if (ptime.dtype.kind == "M") != (rtime.dtype.kind == "M"):
+        raise ValueError("PREDICTED and REFERENCE times must both be dates or numbers")
+    if paware != raware:
+        raise ValueError(
+            "PREDICTED and REFERENCE dates must both be timezone-aware or both naive"
+        )
+
+    # Dates as integer nanoseconds, so that differences are exact
+    limit = None
+    if ptime.dtype.kind == "M":
+        ptime = ptime.astype("datetime64[ns]").view(np.int64)
+        rtime = rtime.astype("datetime64[ns]").view(np.int64)
+        if tolerance is not None:
+            limit = _nanoseconds(tolerance)
+    elif tolerance is not None:
+        limit = tolerance
+        if not isinstance(limit, numbers.Real):
+            raise ValueError("TOLERANCE of numeric times must be a number")
+
+    number = ptime.size
+    if number == 0 or rtime.size == 0:
+        empty = np.empty(0)
+        return empty, empty, time[:0]
+
+    if method == "exact":
+        index = np.minimum(np.searchsorted(ptime, rtime), number - 1)
+        paired = ptime[index] == rtime
+        value = pvalue[index]
+    elif method == "nearest":
+        index = np.searchsorted(ptime, rtime)
+        before = np.maximum(index - 1, 0)
+        after = np.minimum(index, number - 1)
+        # Ties go to the earlier predicted value
+        nearest = rtime - ptime[before] <= ptime[after] - rtime
+        index = np.where(nearest, before, after)
+        value = pvalue[index]
+        if limit is None:
+            paired = np.ones(rtime.size, dtype=bool)
+        else:
+            paired = np.abs(rtime - ptime[index]) <= limit
+    else:
+        if number == 1:
+            index = np.zeros(rtime.size, dtype=np.intp)
+            paired = ptime[index] == rtime
+            value = pvalue[index]
+        else:
+            before = np.clip(np.searchsorted(ptime, rtime, "right") - 1, 0, number - 2)
+            after = before + 1
+            step = ptime[after] - ptime[before]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                weight = np.where(
+                    step > 0, (rtime - ptime[before]) / np.where(step > 0, step, 1), 0.0
+                )
+            value = pvalue[before] + weight * (pvalue[after] - pvalue[before])
+            value = np.where(ptime[after] == rtime, pvalue[after], value)
+            paired = (rtime >= ptime[0]) & (rtime <= ptime[-1])
+            if limit is not None:
+                # Reference times on a predicted time need no interval
+                exact = (ptime[before] == rtime) | (ptime[after] == rtime)
+                paired &= (step <= limit) | exact
+
+    return value[paired], rvalue[paired], time[paired]
+
+
+def _prepare(time, value, name) -> tuple:
+    """
+    Times and values of a series in order of time, without missing values,
+    and whether the times were timezone-aware dates, converted to UTC.
+    """
+    aware = False
+    if getattr(getattr(time, "dt", None), "tz", None) is not None:
+        # pandas Series of timezone-aware dates
+        time = time.dt.tz_convert("UTC").dt.tz_localize(None)
+        aware = True
+    elif getattr(time, "tz", None) is not None and hasattr(time, "tz_convert"):
+        # pandas DatetimeIndex of timezone-aware dates
+        time = time.tz_convert("UTC").tz_localize(None)
+        aware = True
+    if hasattr(time, "to_numpy"):
+        time = time.to_numpy()
+    time = np.asarray(time)
+    if time.dtype.kind == "O":
+        # e.g. lists of datetime objects
+        first = next((t for t in time.flat if t is not None), None)
+        if getattr(first, "tzinfo", None) is not None:
+            import pandas as pd
+
+            time = pd.to_datetime(time, utc=True).tz_localize(None).to_numpy()
+            aware = True
+        else:
+            time = time.astype("datetime64[ns]")
+    if time.dtype.kind not in "iufM":
+        raise ValueError("%s times must be numbers or dates" % name)
+    if time.dtype.kind == "u":
+        time = time.astype(np.int64)
+    value = np.asarray(value.to_numpy() if hasattr(value, "to_numpy") else value)
+    value = value.astype(float, copy=False)
+    if time.ndim != 1 or time.shape != value.shape:
+        raise ValueError(
+            "%s times and values must be one-dimensional arrays of the same size: "
+            "%s, %s" % (name, time.shape, value.shape)
+        )
+
+    valid = ~(np.isnat(time) if time.dtype.kind == "M" else np.isnan(time))
+    valid &= ~np.isnan(value)
+    if not valid.all():
+        time, value = time[valid], value[valid]
+
+    # Stable sort keeps the first of repeated times first
+    if time.size > 1 and (time[1:] < time[:-1]).any():
+        order = np.argsort(time, kind="stable")
+        time, value = time[order], value[order]
+    return time, value, aware
+
+
+def _nanoseconds(tolerance) -> int:
+    """
+    Tolerance of dates in nanoseconds.
+    """
+    if hasattr(tolerance, "to_timedelta64"):
+        # pandas Timedelta
+        tolerance = tolerance.to_timedelta64()
+    elif isinstance(tolerance, datetime.timedelta):
+        tolerance = np.timedelta64(tolerance)
+    if not isinstance(tolerance, np.timedelta64):
+        raise ValueError("TOLERANCE of dates must be a timedelta")
+    return int(tolerance.astype("timedelta64[ns]").view(np.int64))
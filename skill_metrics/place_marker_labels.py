@@ -0,0 +1,208 @@
+import warnings
+
+import matplotlib.axes
+import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath, text_to_path
+from matplotlib.transforms import Affine2D
+
+# Candidate positions of a label relative to its marker, in order of
+# preference: -1/0/1 for left/centered/right and below/centered/above.
+# The first one matches the fixed placement (above and to the left).
+_OFFSETS = ((-1, 1), (1, 1), (-1, -1), (1, -1), (-1, 0), (1, 0), (0, 1), (0, -1))
+
+
+def place_marker_labels(
+    ax: matplotlib.axes.Axes, X, Y, labels, option: dict, fontSize
+) -> PathCollection:
+    """
+    Places marker labels on a pattern diagram without overlaps.
+
+    Each label is tried at several positions around its marker, starting
+    with the default position above and to the left of the marker, and
+    the first position that does not overlap a marker or an already placed
+    label and lies within the axes is kept. Labels that cannot be placed
+    are omitted and their number is reported in a warning.
+
+    The overlap tests use a uniform grid as spatial index, so only labels
+    and markers in neighboring grid cells are compared and the placement
+    scales to thousands of labels. The outlines of all placed labels are
+    drawn in a single pass as one collection of text paths instead of one
+    text artist per label.
+
+    LIMITATIONS:
+    The labels are drawn as outlines of the glyphs (TextPath), not as
+    text. In SVG and PDF files they therefore cannot be selected or
+    searched, and they are rendered with the font of FONTSIZE found by
+    matplotlib without text.usetex or the fallback fonts of text
+    artists. Use the 'fixed' placement for text labels.
+
+    The overlaps are tested with the data-to-pixel transform of AX at the
+    time of the call. Later changes of the axis limits, the aspect or the
+    size of the figure move the markers but not the offsets of the
+    labels from them, so labels can overlap again. Set the limits and size
+    of the diagram before placing the labels.
+
+    INPUTS:
+    ax       : matplotlib.axes.Axes of the diagram. Its limits must be set.
+    X        : x-coordinates of markers
+    Y        : y-coordinates of markers
+    labels   : labels of markers, one per marker
+    option   : dictionary containing option values. (Refer to
+               GET_TAYLOR_DIAGRAM_OPTIONS or GET_TARGET_DIAGRAM_OPTIONS
+               functions for more information.)
+    option['markerlabelcolor'] : color of the labels
+    option['markersize']       : size of the markers in points
+    fontSize : font size in points of labels
+
+    OUTPUTS:
+    collection : collection of the placed labels, or None if no label
+                 could be placed
+
+    Created on Oct 18, 2026
+    """
+
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if len(X) == 0:
+        return None
+
+    # Marker and label sizes in points
+    labels = [str(label) for label in labels]
+    prop = FontProperties(size=fontSize)
+    size, origin = _label_extents(labels, prop)
+    marker = float(option["markersize"])
+    gap = 0.5 * marker + 1.0
+
+    # Work in pixels of the final axes position
+    ax.apply_aspect()
+    scale = ax.figure.dpi / 72.0
+    center = ax.transData.transform(np.column_stack((X, Y)))
+    box = size * scale
+    bounds = ax.bbox.extents
+
+    # Spatial index of occupied rectangles (xmin, ymin, xmax, ymax)
+    index = _GridIndex(max(box.max(initial=0.0), marker * scale))
+    half = 0.5 * marker * scale
+    for cx, cy in center:
+        index.insert((cx - half, cy - half, cx + half, cy + half))
+
+    placed = []
+    shifts = []
+    for i, (cx, cy) in enumerate(center):
+        w, h = box[i]
+        for dx, dy in _OFFSETS:
+            # Lower left corner of the label in points from the marker
+            left = _corner(dx, size[i, 0], gap)
+            bottom = _corner(dy, size[i, 1], gap)
+            rect = (cx + left * scale, cy + bottom * scale)
+            rect += (rect[0] + w, rect[1] + h)
+            if (
+                rect[0] < bounds[0]
+                or rect[1] < bounds[1]
+                or rect[2] > bounds[2]
+                or rect[3] > bounds[3]
+            ):
+                continue
+            if index.overlaps(rect):
+                continue
+            index.insert(rect)
+            placed.append(i)
+            shifts.append((left, bottom) - origin[i])
+            break
+
+    ndropped = len(X) - len(placed)
+    if ndropped > 0:
+        warnings.warn(
+            "%d of %d marker labels could not be placed without overlap "
+            "and were omitted." % (ndropped, len(X))
+        )
+    if len(placed) == 0:
+        return None
+
+    # All labels in one collection, offset from their markers in points
+    outlines = []
+    for i, shift in zip(placed, shifts):
+        path = TextPath((0.0, 0.0), labels[i], prop=prop)
+        outlines.append(Path(path.vertices + shift, path.codes))
+    collection = PathCollection(
+        outlines,
+        offsets=np.column_stack((X[placed], Y[placed])),
+        offset_transform=ax.transData,
+        facecolors=option["markerlabelcolor"],
+        edgecolors="none",
+        linewidths=0,
+    )
+    points_to_pixels = Affine2D().scale(1.0 / 72.0) + ax.figure.dpi_scale_trans
+    collection.set_transform(points_to_pixels)
+    ax.add_collection(collection, autolim=False)
+
+    return collection
+
+
+def _corner(direction: int, length: float, gap: float) -> float:
+    """
+    Position of the lower or left edge of a label of LENGTH points that is
+    placed in DIRECTION (-1, 0 or 1) at a distance GAP from its marker.
+    """
+    if direction > 0:
+        return gap
+    elif direction < 0:
+        return -gap - length
+    else:
+        return -0.5 * length
+
+
+def _label_extents(labels, prop) -> tuple:
+    """
+    Size and lower left corner in points of the labels relative to their
+    text origin, from the font metrics without creating the outlines.
+    """
+
+    size = np.zeros((len(labels), 2))
+    origin = np.zeros((len(labels), 2))
+    for i, label in enumerate(labels):
+        width, height, descent = text_to_path.get_text_width_height_descent(
+            label, prop, ismath=False
+        )
+        size[i] = width, height
+        origin[i, 1] = -descent
+
+    return size, origin
+
+
+class _GridIndex:
+    """
+    Uniform grid of rectangles supporting overlap queries.
+    """
+
+    def __init__(self, cell):
+        self.cell = cell if cell > 0 else 1.0
+        self.grid = {}
+        self.rects = []
+
+    def _cells(self, rect):
+        i0, j0 = int(rect[0] // self.cell), int(rect[1] // self.cell)
+        i1, j1 = int(rect[2] // self.cell), int(rect[3] // self.cell)
+        return ((i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1))
+
+    def insert(self, rect):
+        n = len(self.rects)
+        self.rects.append(rect)
+        for key in self._cells(rect):
+            self.grid.setdefault(key, []).append(n)
+
+    def overlaps(self, rect) -> bool:
+        for key in self._cells(rect):
+            for n in self.grid.get(key, ()):
+                other = self.rects[n]
+                if (
+                    rect[0] < other[2]
+                    and other[0] < rect[2]
+                    and rect[1] < other[3]
+                    and other[1] < rect[3]
+                ):
+                    return True
+        return False
@@ -0,0 +1,63 @@
+from functools import lru_cache
+
+import matplotlib.axes
+import numpy as np
+from matplotlib.markers import MarkerStyle
+
+
+def plot_markers(
+    ax: matplotlib.axes.Axes,
+    X,
+    Y,
+    symbol,
+    markersize,
+    facecolor,
+    edgecolor,
+    edgewidth: float,
+):
+    """
+    Plots markers of any symbols as a single collection.
+
+    Draws the markers like ax.plot does for each point, but as one
+    PathCollection with a path, size and colors per marker, so thousands
+    of markers are drawn at once. Symbols, sizes and colors given as a
+    single-element list apply to all the markers.
+
+    INPUTS:
+    ax         : matplotlib.axes.Axes to receive the markers
+    X          : x-coordinates of markers
+    Y          : y-coordinates of markers
+    symbol     : list of marker symbols, e.g. ['o', '+']
+    markersize : list of marker sizes in points
+    facecolor  : list or array of marker face colors
+    edgecolor  : list or array of marker edge colors
+    edgewidth  : width of marker edges in points
+
+    OUTPUTS:
+    collection : matplotlib.collections.PathCollection of the markers
+
+    Created on Oct 18, 2026
+    """
+
+    markersize = np.asarray(markersize, dtype=float)
+    collection = ax.scatter(
+        X,
+        Y,
+        s=markersize**2,
+        facecolors=facecolor,
+        edgecolors=edgecolor,
+        linewidths=edgewidth,
+        zorder=2,
+    )
+    collection.set_paths([_marker_path(s) for s in symbol])
+    return collection
+
+
+@lru_cache(maxsize=None)
+def _marker_path(symbol):
+    """
+    Path of a marker symbol scaled to a size of one point, as Line2D
+    draws it.
+    """
+    style = MarkerStyle(symbol)
+    return style.get_path().transformed(style.get_transform())
@@ -1,8 +1,11 @@
 import math
 
 import matplotlib
-import matplotlib.pyplot as plt
+import matplotlib.axes
+import matplotlib.colors as clr
+import numpy as np
 from matplotlib import rcParams, ticker
+from matplotlib.cm import ScalarMappable
 
 
 def plot_pattern_diagram_colorbar(
@@ -15,9 +18,9 @@ def plot_pattern_diagram_colorbar(
     Values are indicated via a color bar on the plot.
 
     Plots color markers on a target diagram according their (X,Y) locations.
-    The color shading is accomplished by plotting the markers as a scatter
-    plot in (X,Y) with the colors of each point specified using Z as a
-    vector.
+    The color shading is accomplished by plotting the markers as a single
+    scatter plot in (X,Y) with the colors of each point mapped from Z
+    beforehand, and the color bar is drawn for the same color mapping.
 
     The color range is controlled by option['cmapzdata'].
     option['colormap'] = 'on' :
@@ -46,7 +49,7 @@ def plot_pattern_diagram_colorbar(
     None.
 
     Created on Nov 30, 2016
-    Revised on Jan 1, 2019
+    Revised on Oct 18, 2026
 
     Author: Peter A. Rochford
         Symplectic, LLC
@@ -54,27 +57,38 @@ def plot_pattern_diagram_colorbar(
         prochford@thesymplectic.com
     """
 
-    """
-    Plot color shaded data points using scatter plot
-    Keyword s defines marker size in points^2
-            c defines the sequence of numbers to be mapped to colors 
-              using the cmap and norm
-    """
     fontSize = rcParams.get("font.size")
     cxscale = fontSize / 10  # scale color bar by font size
     markerSize = option["markersize"] * 2
 
-    hp = plt.scatter(
+    # Color range of the markers
+    Z = np.asarray(Z)
+    if option["colormap"] == "on":
+        # map color shading of markers to colormap
+        vmin = np.min(Z) if option["cmap_vmin"] is None else option["cmap_vmin"]
+        vmax = np.max(Z) if option["cmap_vmax"] is None else option["cmap_vmax"]
+    elif option["colormap"] == "off":
+        # map color shading of markers to min to max range of Z values
+        vmin, vmax = np.min(Z), np.max(Z)
+    else:
+        raise ValueError("Invalid option for option.colormap: " + option["colormap"])
+    cmap = option["cmap"]
+    if isinstance(cmap, str):
+        cmap = matplotlib.colormaps[cmap]
+    mappable = ScalarMappable(clr.Normalize(vmin, vmax), cmap)
+
+    # Plot color shaded data points as a single scatter plot, with the
+    # colors of the faces and edges given for each point (s defines the
+    # marker size in points^2)
+    colors = mappable.to_rgba(Z)
+    ax.scatter(
         X,
         Y,
         s=markerSize,
-        c=Z,
+        c=colors,
+        edgecolors=colors,
         marker=option["cmap_marker"],
-        cmap=option["cmap"],
-        vmin=option["cmap_vmin"],
-        vmax=option["cmap_vmax"],
     )
-    hp.set_facecolor(hp.get_edgecolor())
 
     # Set parameters for color bar location
     location = option["locationcolorbar"].lower()
@@ -98,38 +112,34 @@ def plot_pattern_diagram_colorbar(
 
     # Add color bar to plot
     if option["colormap"] == "on":
-        # map color shading of markers to colormap
-        hc = plt.colorbar(
-            hp,
+        # Limit number of ticks on color bar to reasonable number
+        if orientation == "horizontal":
+            ticks = _getColorBarTicks(vmin, vmax, 5)
+        else:
+            ticks = None
+        hc = ax.figure.colorbar(
+            mappable,
             orientation=orientation,
             aspect=aspect,
             fraction=fraction,
             pad=0.06,
+            ticks=ticks,
             ax=ax,
         )
 
-        # Limit number of ticks on color bar to reasonable number
-        if orientation == "horizontal":
-            _setColorBarTicks(hc, 5, 20)
-
-    elif option["colormap"] == "off":
-        # map color shading of markers to min to max range of Z values
-        if len(Z) > 1:
-            ax.clim(min(Z), max(Z))
-            hc = ax.colorbar(
-                hp,
-                orientation=orientation,
-                aspect=aspect,
-                fraction=fraction,
-                pad=0.06,
-                ticks=[min(Z), max(Z)],
-                ax=ax,
-            )
+    elif len(Z) > 1:
+        hc = ax.figure.colorbar(
+            mappable,
+            orientation=orientation,
+            aspect=aspect,
+            fraction=fraction,
+            pad=0.06,
+            ticks=[vmin, vmax],
+            ax=ax,
+        )
 
-            # Label just min/max range
-            hc.set_ticklabels(["Min.", "Max."])
-    else:
-        raise ValueError("Invalid option for option.colormap: " + option["colormap"])
+        # Label just min/max range
+        hc.set_ticklabels(["Min.", "Max."])
 
     if orientation == "horizontal":
         location = _getColorBarLocation(
@@ -159,7 +169,7 @@ def plot_pattern_diagram_colorbar(
                 rotation=0,
             )
     else:
-        hc.set_label(hc, "Color Scale", fontsize=fontSize)
+        hc.set_label("Color Scale", fontsize=fontSize)
 
 
 def _getColorBarLocation(hc, option, **kwargs):
@@ -225,38 +235,35 @@ def _getColorBarLocation(hc, option, **kwargs):
     return location
 
 
-def _setColorBarTicks(hc, numBins, lenTick):
+def _getColorBarTicks(vmin, vmax, numBins, maxChar=10):
     """
-    Determine number of ticks for color bar.
+    Determine ticks for color bar.
 
-    Determines number of ticks for colorbar so tick labels do not
-    overlap.
+    Determines the ticks for a color bar so tick labels do not overlap,
+    without drawing the color bar. The number of bins is reduced until
+    the tick labels are written with at most maxChar characters.
 
     INPUTS:
-    hc      : handle of colorbar
+    vmin    : minimum value of color bar
+    vmax    : maximum value of color bar
     numBins : number of bins to use for determining number of
               tick values using ticker.MaxNLocator
-    lenTick : maximum number of characters for all the tick labels
+    maxChar : maximum number of characters for all the tick labels
 
     OUTPUTS:
-    None
+    ticks : tick values for color bar
 
     """
 
-    maxChar = 10
-    lengthTick = lenTick
-    while lengthTick > maxChar:
+    while True:
         # Limit number of ticks on color bar to numBins-1
-        hc.locator = ticker.MaxNLocator(nbins=numBins, prune="both")
-        hc.update_ticks()
+        locator = ticker.MaxNLocator(nbins=numBins, prune="both")
+        ticks = locator.tick_values(vmin, vmax)
 
         # Check number of characters in tick labels is
         # acceptable, otherwise reduce number of bins
-        locs = str(hc.get_ticks())
-        locs = locs[1:-1].split()
-        lengthTick = 0
-        for tick in locs:
-            tickStr = str(tick).rstrip(".")
-            lengthTick += len(tickStr)
-        if lengthTick > maxChar:
-            numBins -= 1
+        labels = np.array2string(ticks)[1:-1].split()
+        lengthTick = sum(len(label.rstrip(".")) for label in labels)
+        if lengthTick <= maxChar or numBins <= 1:
+            return ticks
+        numBins -= 1
@@ -0,0 +1,127 @@
+import matplotlib.axes
+import matplotlib.colors as clr
+import numpy as np
+from matplotlib import rcParams
+
+
+def plot_pattern_diagram_density(
+    ax: matplotlib.axes.Axes, X, Y, option: dict, kind: str
+):
+    """
+    Plots the density of a large number of points on a pattern diagram.
+
+    Instead of drawing one marker per point, the (X,Y) locations are
+    aggregated in a two-dimensional histogram and the number of points
+    in each bin is displayed as a single rasterized mesh shaded with a
+    colormap. The cost of rendering therefore no longer depends on the
+    number of points, which makes the diagrams usable for 10^5 - 10^6
+    points, e.g. one per grid cell of a model.
+
+    For a Taylor diagram the points are binned in polar coordinates, i.e.
+    in standard deviation (radius) and correlation (angle) space, so the
+    bins follow the grid of the diagram. For a target diagram the points
+    are binned in Cartesian (uRMSD, Bias) space. In both cases only the
+    domain of the diagram (limited by option['axismax']) is binned, so
+    points outside of the axes are ignored.
+
+    INPUTS:
+    ax     : matplotlib.axes.Axes object in which the diagram is plotted
+    X      : x-coordinates of points
+    Y      : y-coordinates of points
+    option : dictionary containing option values. (Refer to
+             GET_TAYLOR_DIAGRAM_OPTIONS or GET_TARGET_DIAGRAM_OPTIONS
+             functions for more information.)
+    option['axismax']          : maximum for the X & Y values
+    option['cmap']             : colormap used to shade the bins
+    option['cmap_vmin']        : minimum count of the color range
+    option['cmap_vmax']        : maximum count of the color range
+    option['densitybins']      : number of bins along each coordinate
+    option['densitycolorbar']  : 'on'/'off' switch to display a colorbar
+    option['densityscale']     : 'linear' or 'log' shading of the counts
+    option['locationcolorbar'] : location for the colorbar, 'NorthOutside'
+                                 or 'EastOutside'
+    option['numberpanels']     : number of panels of a Taylor diagram
+    option['titlecolorbar']    : title for the colorbar
+    kind   : kind of diagram, 'taylor' or 'target'
+
+    OUTPUTS:
+    None
+
+    Created on Oct 18, 2026
+    """
+
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    nbins = option["densitybins"]
+    limit = option["axismax"]
+
+    if kind == "taylor":
+        # Taylor diagram: bin in (standard deviation, angle of correlation)
+        thetamax = np.pi if option["numberpanels"] == 2 else np.pi / 2
+        rho = np.hypot(X, Y)
+        theta = np.arctan2(Y, X)
+        counts, redges, tedges = np.histogram2d(
+            rho, theta, bins=nbins, range=[[0.0, limit], [0.0, thetamax]]
+        )
+
+        # Corners of the bins, bent along the circles of the diagram
+        R, T = np.meshgrid(redges, tedges, indexing="ij")
+        xmesh, ymesh = R * np.cos(T), R * np.sin(T)
+    elif kind == "target":
+        # target diagram: bin in (uRMSD, Bias)
+        counts, xedges, yedges = np.histogram2d(
+            X, Y, bins=nbins, range=[[-limit, limit], [-limit, limit]]
+        )
+        xmesh, ymesh = np.meshgrid(xedges, yedges, indexing="ij")
+    else:
+        raise ValueError("Invalid kind of diagram: " + str(kind))
+
+    # Leave empty bins transparent
+    counts = np.ma.masked_equal(counts, 0)
+
+    if option["densityscale"] == "log":
+        norm = clr.LogNorm(vmin=option["cmap_vmin"], vmax=option["cmap_vmax"])
+    else:
+        norm = clr.Normalize(vmin=option["cmap_vmin"], vmax=option["cmap_vmax"])
+
+    hp = ax.pcolormesh(
+        xmesh,
+        ymesh,
+        counts,
+        cmap=option["cmap"],
+        norm=norm,
+        shading="flat",
+        rasterized=True,
+    )
+
+    if option["densitycolorbar"] == "on" and counts.count() > 0:
+        _add_density_colorbar(ax, hp, option)
+
+
+def _add_density_colorbar(ax, hp, option):
+    """
+    Adds a colorbar for the point counts next to the diagram.
+    """
+
+    fontSize = rcParams.get("font.size")
+    location = option["locationcolorbar"].lower()
+    # leave room for the axis titles drawn outside of the diagram
+    if location == "northoutside":
+        side, aspect, pad = "top", 30, 0.15
+    elif location == "eastoutside":
+        side, aspect, pad = "right", 25, 0.15
+    else:
+        raise ValueError("Invalid color bar location: " + option["locationcolorbar"])
+
+    hc = ax.figure.colorbar(
+        hp,
+        ax=ax,
+        location=side,
+        aspect=aspect,
+        fraction=0.05,
+        pad=pad,
+    )
+    hc.ax.tick_params(labelsize=fontSize)
+
+    title = option["titlecolorbar"] if option["titlecolorbar"] else "Count"
+    hc.set_label(title, fontsize=fontSize)
@@ -1,26 +1,37 @@
 import warnings
 
-import matplotlib
+import matplotlib.axes
 import matplotlib.colors as clr
+import numpy as np
+from matplotlib.lines import Line2D
+
 from . import (
     add_legend,
     get_default_markers,
     get_from_dict_or_default,
     get_single_markers,
 )
+from .place_marker_labels import place_marker_labels
+from .plot_markers import plot_markers
 
 
-def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
+def plot_pattern_diagram_markers(
+    ax: matplotlib.axes.Axes, X, Y, option: dict, kind: str = None
+):
     """
     Plots color markers on a pattern diagram in the provided subplot axis.
 
     Plots color markers on a target diagram according their (X,Y)
-    locations. The symbols and colors are chosen automatically with a
-    limit of 70 symbol & color combinations.
+    locations. The symbols and colors are chosen automatically for any
+    number of markers (see GET_DEFAULT_MARKERS).
 
     The color bar is titled using the content of option['titleColorBar']
     (if non-empty string).
 
+    Without a marker legend, labels given as a list are written beside the
+    markers. If option['labelplacement'] is 'auto' they are placed around
+    the markers avoiding overlaps (see PLACE_MARKER_LABELS).
+
     It is a direct adaptation of the plot_pattern_diagram_markers() function
     for the scenario in which the Taylor diagram is draw in an
     matplotlib.axes.Axes object.
@@ -34,10 +45,18 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
         GET_TARGET_DIAGRAM_OPTIONS function for more information.)
     option['axismax'] : maximum for the X & Y values. Used to limit
         maximum distance from origin to display markers
+    option['labelplacement'] : 'fixed' or 'auto' placement of labels
     option['markerlabel'] : labels for markers
+    kind   : kind of diagram, 'taylor' or 'target', required when
+        option['legendmode'] is 'table' (see ADD_LEGEND_TABLE)
+
+    The markers are drawn as a single collection (see PLOT_MARKERS) and
+    those beyond option['axismax'] are skipped, so diagrams with
+    thousands of markers are drawn quickly.
 
     OUTPUTS:
-    None
+    pages : list of legend figures when option['legendmode'] is 'table'
+            or 'figure' (see ADD_LEGEND_TABLE), otherwise None
 
     Authors:
     Peter A. Rochford
@@ -47,7 +66,7 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
         adlzanchetta@gmail.com
 
     Created on Nov 30, 2016
-    Revised on Aug 14, 2022
+    Revised on Oct 18, 2026
     """
 
     # Set face color transparency
@@ -74,13 +93,12 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
                 + " < No. markers="
                 + str(len(X) + 1)
             )
-        elif isinstance(option["markerlabel"], dict) and numberLabel > 70:
-            raise ValueError(
-                "Insufficient number of marker labels provided.\n"
-                + "target: No. labels="
-                + str(numberLabel)
-                + " > No. markers= 70"
-            )
+
+    # Markers within the axis limits
+    limit = option["axismax"]
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    inside = np.flatnonzero((np.abs(X) <= limit) & (np.abs(Y) <= limit))
 
     if option["markerlegend"] == "on":
         # Check that marker labels have been provided
@@ -88,32 +106,21 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
             raise ValueError("No marker labels provided.")
 
         # Plot markers of different color and symbols with labels displayed in a legend
-        limit = option["axismax"]
-        hp = ()
         rgba = None
 
         if option["markers"] is None:
             # Define default markers (function)
             marker, markercolor = get_default_markers(X, option)
+            symbol = [marker[i][0] for i in inside]
+            markersize = np.full(len(inside), markerSize)
+            facecolor = markercolor[inside]
 
-            # Plot markers at data points
-            labelcolor = []
-            markerlabel = []
-            for i, xval in enumerate(X):
-                if abs(X[i]) <= limit and abs(Y[i]) <= limit:
-                    h = ax.plot(
-                        X[i],
-                        Y[i],
-                        marker[i],
-                        markersize=markerSize,
-                        markerfacecolor=markercolor[i],
-                        markeredgecolor=markercolor[i][0:3] + (1.0,),
-                        markeredgewidth=2,
-                    )
-                    hp += tuple(h)
-                    labelcolor.append(option["markerlabelcolor"])
-                    markerlabel.append(option["markerlabel"][i])
+            # Edge colors are the opaque marker colors
+            edgecolor = facecolor.copy()
+            edgecolor[:, 3] = 1.0
 
+            labelcolor = [option["markerlabelcolor"]] * len(inside)
+            markerlabel = [option["markerlabel"][i] for i in inside]
         else:
             # Obtain markers from option['markers']
             (
@@ -124,34 +131,57 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
                 markerfacecolor,
                 markeredgecolor,
             ) = get_single_markers(option["markers"])
-
-            # Plot markers at data points
-            markerlabel = []
-            for i, xval in enumerate(X):
-                if abs(X[i]) <= limit and abs(Y[i]) <= limit:
-                    h = ax.plot(
-                        X[i],
-                        Y[i],
-                        marker[i],
-                        markersize=markersize[i],
-                        markerfacecolor=markerfacecolor[i],
-                        markeredgecolor=markeredgecolor[i],
-                        markeredgewidth=2,
-                    )
-                    hp += tuple(h)
-                    markerlabel.append(labels[i])
+            symbols = [value["symbol"] for value in option["markers"].values()]
+            symbol = [symbols[i] for i in inside]
+            markersize = np.array([markersize[i] for i in inside], dtype=float)
+            facecolor = clr.to_rgba_array([markerfacecolor[i] for i in inside])
+            edgecolor = clr.to_rgba_array([markeredgecolor[i] for i in inside])
+            markerlabel = [labels[i] for i in inside]
 
         # Add legend
         if len(markerlabel) == 0:
             warnings.warn("No markers within axis limit ranges.")
         else:
-            add_legend(markerlabel, labelcolor, option, rgba, markerSize, fontSize, hp)
+            # Plot all the markers at once
+            plot_markers(
+                ax,
+                X[inside],
+                Y[inside],
+                symbol,
+                markersize,
+                facecolor,
+                edgecolor,
+                2.0,
+            )
+
+            # Legend entries standing for the markers
+            hp = tuple(
+                Line2D(
+                    [],
+                    [],
+                    linestyle="",
+                    marker=symbol[i],
+                    markersize=markersize[i],
+                    markerfacecolor=facecolor[i],
+                    markeredgecolor=edgecolor[i],
+                    markeredgewidth=2,
+                )
+                for i in range(len(inside))
+            )
+            return add_legend(
+                markerlabel,
+                labelcolor,
+                option,
+                rgba,
+                markerSize,
+                fontSize,
+                hp,
+                ax=ax,
+                kind=kind,
+            )
     else:
         # Plot markers as dots of a single color with accompanying labels
 
-        # Plot markers at data points
-        limit = option["axismax"]
-
         # Define edge and face colors of the markers
         edge_color = get_from_dict_or_default(
             option, "markercolor", "markercolors", "edge"
@@ -165,47 +195,51 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
             face_color = edge_color
         face_color = clr.to_rgb(face_color) + (alpha,)
 
-        labelcolor = []
-        for i in range(len(X)):
-            xval, yval = X[i], Y[i]
-            if abs(xval) <= limit and abs(yval) <= limit:
-                # Plot marker
-                ax.plot(
-                    xval,
-                    yval,
-                    option["markersymbol"],
-                    markersize=markerSize,
-                    markerfacecolor=face_color,
-                    markeredgecolor=edge_color,
-                )
-                labelcolor.append(option["markerlabelcolor"])
-
-                # Check if marker labels provided
-                if type(option["markerlabel"]) is list:
-                    # Label marker
+        # Plot all the markers at once
+        plot_markers(
+            ax,
+            X[inside],
+            Y[inside],
+            [option["markersymbol"]],
+            [markerSize],
+            [face_color],
+            [edge_color],
+            matplotlib.rcParams["lines.markeredgewidth"],
+        )
+        labelcolor = [option["markerlabelcolor"]] * len(inside)
+
+        # Check if marker labels provided
+        if type(option["markerlabel"]) is list:
+            labels = [option["markerlabel"][i] for i in inside]
+            if option.get("labelplacement", "fixed") == "auto":
+                # Place all labels at once avoiding overlaps
+                place_marker_labels(ax, X[inside], Y[inside], labels, option, fontSize)
+            else:
+                # Label markers
+                for xval, yval, label in zip(X[inside], Y[inside], labels):
                     ax.text(
                         xval,
                         yval,
-                        option["markerlabel"][i],
+                        label,
                         color=option["markerlabelcolor"],
                         verticalalignment="bottom",
                         horizontalalignment="right",
                         fontsize=fontSize,
                     )
 
-            del i, xval, yval
-
         # Add legend if labels provided as dictionary
         markerlabel = option["markerlabel"]
         marker_label_color = clr.to_rgb(edge_color) + (alpha,)
         if type(markerlabel) is dict:
-            add_legend(
+            return add_legend(
                 markerlabel,
                 labelcolor,
                 option,
                 marker_label_color,
                 markerSize,
                 fontSize,
+                ax=ax,
+                kind=kind,
             )
 
 
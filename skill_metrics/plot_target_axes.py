@@ -1,4 +1,4 @@
-import matplotlib
+import matplotlib.axes
 from matplotlib import rcParams
 from matplotlib.ticker import ScalarFormatter
 
@@ -1,7 +1,7 @@
-import matplotlib
+import matplotlib.axes
 import numpy as np
 from matplotlib import rcParams
-from . import get_from_dict_or_default
+from .get_from_dict_or_default import get_from_dict_or_default
 from .get_axis_tick_label import get_axis_tick_label
 
 
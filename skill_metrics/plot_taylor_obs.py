@@ -1,4 +1,4 @@
-import matplotlib
+import matplotlib.axes
 import numpy as np
 
 
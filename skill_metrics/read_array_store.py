@@ -0,0 +1,83 @@
+import datetime
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+
+from .write_array_store import MANIFEST, STORE_FORMAT, STORE_VERSION
+
+
+def read_array_store(directory, mmap=True):
+    """
+    Read data sets from a directory of NumPy arrays with a JSON manifest.
+
+    This function loads the data written by WRITE_ARRAY_STORE or
+    CONVERT_DATA_FILE to DIRECTORY in its original structure: dictionaries,
+    objects (as SimpleNamespace objects with the same attributes), lists
+    and values. The arrays are memory-mapped read-only by default, so that
+    loading is near-instant whatever their size, and only the values that
+    are used are read from the disk. Lists, which are stored as arrays,
+    are returned as lists, e.g. of strings, dates or times.
+
+    INPUTS:
+    directory : name of the directory of the store
+    mmap      : memory-map the arrays read-only instead of reading them
+                in memory (Default: True)
+
+    OUTPUTS:
+    data : data stored
+
+    EXAMPLE:
+    data = read_array_store('Farmington_River_data')
+    taylor_diagram(data.sdev, data.crmsd, data.ccoef)
+
+    Created on Oct 18, 2026
+    """
+
+    filename = os.path.join(directory, MANIFEST)
+    if not os.path.isfile(filename):
+        raise ValueError("Not an array store: " + directory)
+    with open(filename) as file:
+        manifest = json.load(file)
+    if manifest.get("format") != STORE_FORMAT:
+        raise ValueError("Not an array store: " + directory)
+    if manifest.get("version", 0) > STORE_VERSION:
+        raise ValueError(
+            "Array store of version %s is newer than version %d read here"
+            % (manifest["version"], STORE_VERSION)
+        )
+    return _value(manifest["data"], directory, "r" if mmap else None)
+
+
+def _value(node, directory, mmap_mode):
+    """
+    Value of a manifest entry, loading its arrays.
+    """
+    kind = node["type"]
+    if kind == "value":
+        return node["value"]
+    if kind == "array":
+        filename = os.path.join(directory, node["file"])
+        if "kind" in node:
+            # Lists stored as arrays
+            values = np.load(filename, allow_pickle=False).tolist()
+            if node["kind"] == "time":
+                values = [datetime.time.fromisoformat(value) for value in values]
+            return values
+        try:
+            return np.load(filename, mmap_mode=mmap_mode, allow_pickle=False)
+        except ValueError:
+            # Empty arrays cannot be memory-mapped
+            return np.load(filename, allow_pickle=False)
+    if kind == "list":
+        return [_value(item, directory, mmap_mode) for item in node["items"]]
+
+    items = {
+        key: _value(item, directory, mmap_mode) for key, item in node["items"].items()
+    }
+    if kind == "dict":
+        return items
+    if kind == "object":
+        return SimpleNamespace(**items)
+    raise ValueError("Invalid entry of type %s in array store %s" % (kind, directory))
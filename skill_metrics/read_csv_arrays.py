@@ -0,0 +1,228 @@
+import json
+import os
+
+import numpy as np
+
+
+def read_csv_arrays(filename, **kwargs) -> dict:
+    """
+    Read the columns of a Comma Separated Value (CSV) file as arrays.
+
+    This function reads the columns of FILENAME into contiguous NumPy
+    arrays, numeric columns as numbers of the type given by DTYPE (or
+    inferred by the parser) and other columns as strings, so that they
+    can be passed directly to the statistics functions, e.g.
+
+    pred = read_csv_arrays('pred1.csv')
+    ref = read_csv_arrays('ref.csv')
+    stats = taylor_statistics(pred, ref, 'data')
+
+    Large files can be parsed in chunks of CHUNKSIZE rows to bound the
+    memory used by the parser. The parsed arrays are cached in a NPZ file
+    next to the CSV file (FILENAME + '.npz'), which is read instead of the
+    CSV file as long as the CSV file and the options are unchanged, so
+    that reruns skip parsing.
+
+    Columns can be combined into a time axis in seconds, e.g. the 'hour'
+    and 't(sec)' columns of a time series by time={'hour': 3600,
+    't(sec)': 1}, and the units given in parentheses in the headers, e.g.
+    'data (cell/L)', can be separated from the names of the columns.
+
+    INPUTS:
+    filename : name of CSV file
+
+    OUTPUTS:
+    data : dictionary of an array for each column, e.g. data['data'],
+           or if UNITS is 'on', of a dictionary for each column of the
+           form {'values': array, 'units': 'cell/L'}
+
+    LIST OF OPTIONS:
+    cache = boolean : true/false flag to cache the parsed arrays in a NPZ
+                      file (Default: true)
+    chunksize = rows : number of rows parsed at a time (Default: None, the
+                       whole file at once)
+    columns = names : list of the columns to read (Default: all)
+    dtype = type : type of the numeric columns, or dictionary of the type
+                   of each column, e.g. {'depth': int} (Default: inferred)
+    time = factors : dictionary of the columns summed into a 'time' column
+                     (in seconds), with the factor of each column, e.g.
+                     {'hour': 3600, 't(sec)': 1} (Default: none)
+    units = boolean : true/false flag to separate the units in the headers
+                      from the names of the columns (Default: false)
+
+    Created on Oct 18, 2026
+    """
+
+    option = get_read_csv_arrays_options(**kwargs)
+    if not os.path.isfile(filename):
+        raise ValueError("File does not exist: " + filename)
+
+    # The cache is valid for the same CSV file and options
+    status = os.stat(filename)
+    key = json.dumps(
+        [status.st_size, status.st_mtime_ns, option["columns"], option["dtype"]],
+        default=str,
+    )
+    cachename = filename + ".npz"
+    columns = None
+    if option["cache"] == "on" and os.path.isfile(cachename):
+        columns = _read_cache(cachename, key)
+    if columns is None:
+        columns = _read_csv(filename, option)
+        if option["cache"] == "on":
+            _write_cache(cachename, key, columns)
+
+    # Names without spaces around them, as in the headers of the examples
+    columns = {name.strip(): values for name, values in columns.items()}
+
+    if len(option["time"]) > 0:
+        time = np.zeros(len(next(iter(columns.values()))))
+        for name, factor in option["time"].items():
+            if name not in columns:
+                raise ValueError("Time column not in data: " + name)
+            time += factor * columns.pop(name)
+        columns["time"] = time
+
+    if option["units"] == "off":
+        return columns
+
+    data = {}
+    for name, values in columns.items():
+        start = name.find("(")
+        end = name.find(")")
+        if start != -1 and end > start:
+            units = name[start + 1 : end]
+            data[name[:start].strip()] = {"values": values, "units": units}
+        else:
+            units = "s" if name == "time" and len(option["time"]) > 0 else ""
+            data[name] = {"values": values, "units": units}
+    return data
+
+
+def get_read_csv_arrays_options(**kwargs):
+    """
+    Get optional arguments for read_csv_arrays function.
+
+    Retrieves the keywords supplied to the READ_CSV_ARRAYS function
+    (**KWARGS), and returns the values in a OPTION dictionary. Default
+    values are assigned to selected optional arguments. The function will
+    terminate with an error if an unrecognized optional argument is
+    supplied.
+
+    INPUTS:
+    **kwargs : keyword argument list
+
+    OUTPUTS:
+    option : data structure containing option values.
+    option['cache']     : 'on'/'off' switch to cache the parsed arrays.
+    option['chunksize'] : number of rows parsed at a time.
+    option['columns']   : list of the columns to read.
+    option['dtype']     : type of the numeric columns.
+    option['time']      : factors of the columns summed into a time axis.
+    option['units']     : 'on'/'off' switch to separate units from names.
+
+    Created on Oct 18, 2026
+    """
+    from .check_on_off import check_on_off
+
+    #  Set default parameters
+    option = {}
+    option["cache"] = "on"
+    option["chunksize"] = None
+    option["columns"] = []
+    option["dtype"] = None
+    option["time"] = {}
+    option["units"] = "off"
+
+    # Check for valid keys and values in dictionary
+    for optname, optvalue in kwargs.items():
+        optname = optname.lower()
+        if optname not in option:
+            raise ValueError("Unrecognized option: " + optname)
+        else:
+            # Replace option value with that from arguments
+            option[optname] = optvalue
+
+            # Check values for specific options
+            if optname in ["cache", "units"]:
+                option[optname] = check_on_off(option[optname])
+            elif optname == "chunksize":
+                if optvalue is not None and (int(optvalue) != optvalue or optvalue < 1):
+                    raise ValueError("chunksize must be a positive integer")
+            elif optname == "columns":
+                if isinstance(optvalue, str):
+                    option["columns"] = [optvalue]
+            elif optname == "time":
+                if not isinstance(optvalue, dict):
+                    raise ValueError("time must be a dictionary of column factors")
+
+    return option
+
+
+def _read_csv(filename, option) -> dict:
+    """
+    Parses the columns of a CSV file into contiguous arrays.
+    """
+    import pandas as pd
+
+    dtype = option["dtype"]
+    usecols = option["columns"] if len(option["columns"]) > 0 else None
+    # A single type applies to the numeric columns only, text stays text
+    numeric = None if dtype is None or isinstance(dtype, dict) else dtype
+
+    reader = pd.read_csv(
+        filename,
+        usecols=usecols,
+        dtype=None if numeric is not None else dtype,
+        chunksize=option["chunksize"],
+        float_precision="round_trip",
+    )
+    chunks = [reader] if option["chunksize"] is None else reader
+
+    columns = {}
+    for chunk in chunks:
+        for name in chunk.columns:
+            values = chunk[name]
+            if pd.api.types.is_numeric_dtype(values):
+                values = values.to_numpy(dtype=numeric)
+            else:
+                values = values.to_numpy(dtype=str, na_value="")
+            columns.setdefault(name, []).append(values)
+
+    # Text columns of different widths in different chunks are widened
+    return {
+        name: values[0] if len(values) == 1 else np.concatenate(values)
+        for name, values in columns.items()
+    }
+
+
+def _read_cache(cachename, key):
+    """
+    Arrays of a NPZ cache file, or None if it is not that of KEY.
+    """
+    try:
+        with np.load(cachename, allow_pickle=False) as archive:
+            if str(archive["__key__"]) != key:
+                return None
+            names = archive["__names__"].tolist()
+            return {name: archive["column_%d" % i] for i, name in enumerate(names)}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _write_cache(cachename, key, columns) -> None:
+    """
+    Writes the arrays to a NPZ cache file, replacing it atomically so that
+    concurrent readers never see a partial file.
+    """
+    arrays = {"column_%d" % i: values for i, values in enumerate(columns.values())}
+    temporary = "%s.%d.tmp" % (cachename, os.getpid())
+    try:
+        with open(temporary, "wb") as file:
+            names = np.array(list(columns), dtype=str)
+            np.savez(file, __key__=key, __names__=names, **arrays)
+        os.replace(temporary, cachename)
+    except OSError:
+        # The cache is optional, e.g. in a read-only directory
+        if os.path.exists(temporary):
+            os.remove(temporary)
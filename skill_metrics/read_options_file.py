@@ -0,0 +1,85 @@
+import csv
+import os
+from functools import lru_cache
+
+# Values read as missing, those of pandas.read_csv by default
+NA_VALUES = frozenset(
+    (
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    )
+)
+
+
+def read_options_file(filename: str) -> tuple:
+    """
+    Reads the (key, value) pairs of a diagram options CSV file.
+
+    Reads a Comma Separated Value (CSV) file as supplied with the
+    taylor_options_file or target_options_file options of the
+    TAYLOR_DIAGRAM and TARGET_DIAGRAM functions. The first line is a
+    header, the first column contains the option names and the second
+    column their values. Any further columns (e.g. notes) are ignored.
+    Values that are empty or one of the missing values of
+    pandas.read_csv (NA_VALUES, e.g. 'None', 'NA' or 'nan') are returned
+    as None, so the options keep their defaults.
+
+    The parsed contents are cached per process using the absolute path,
+    modification time and size of the file as key, so a file that is used
+    for many diagrams is only read once, while changes to the file are
+    picked up by the next call. The least recently used files are evicted
+    from the cache.
+
+    INPUTS:
+    filename : name of CSV file
+
+    OUTPUTS:
+    options : tuple of (key, value) pairs in the order of the file. The
+              values are strings, or None when the value is missing.
+
+    Created on Oct 18, 2026
+    """
+
+    stat = os.stat(filename)
+    return _parse_options_file(
+        os.path.abspath(filename), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_options_file(path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Parses the CSV file PATH. MTIME_NS and SIZE are only used as part
+    of the cache key.
+    """
+
+    options = []
+    with open(path, newline="", encoding="utf-8-sig") as csvfile:
+        reader = csv.reader(csvfile)
+        # Skip header
+        next(reader, None)
+        for row in reader:
+            # Skip blank lines
+            if not row:
+                continue
+            value = row[1] if len(row) > 1 and row[1] not in NA_VALUES else None
+            options.append((row[0], value))
+
+    return tuple(options)
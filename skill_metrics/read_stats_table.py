@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+
+from .stats_table_writer import DESCRIPTION_COLUMNS, FORMATS, import_pyarrow
+
+
+def read_stats_table(filename, format=None, tidy=False):
+    """
+    Read statistics from a columnar table file.
+
+    This function reads the statistics written by WRITE_STATS_TABLE or
+    STATSTABLEWRITER to FILENAME, and returns them in the layout of the
+    data given to WRITE_TAYLOR_STATS and WRITE_TARGET_STATS: a dictionary
+    of statistics arrays for each data set, so that a data set can be
+    plotted directly, e.g.
+
+    data = read_stats_table('taylor_stats.csv')
+    taylor_diagram(data[0]['sdev'], data[0]['crmsd'], data[0]['ccoef'],
+                   markerLabel=data[0]['label'])
+
+    The data sets are the runs of consecutive rows of the same SET number,
+    so data sets of the same title are kept apart.
+
+    INPUTS:
+    filename : name of statistics table file
+    format   : 'csv', 'npz' or 'parquet' (Default: from the extension of
+               FILENAME)
+    tidy     : return the columns of the whole table instead of a list of
+               data sets, e.g. for FACET_DIAGRAMS with group='title'
+               (Default: False)
+
+    OUTPUTS:
+    data : list of a dictionary for each data set
+    data[i]['title'] : title of the data set
+    data[i]['label'] : list of the labels of the data points
+    data[i]['stat']  : array of the statistic of each data point, for each
+                       statistic (column) of the table
+    or, if TIDY is True, a dictionary of an array for each column of the
+    table: 'set', 'title', 'label' and the statistics.
+
+    Created on Oct 18, 2026
+    """
+
+    if format is None:
+        extension = os.path.splitext(filename)[1].lower()
+        if extension not in FORMATS:
+            raise ValueError("Unknown format of statistics table: " + filename)
+        format = FORMATS[extension]
+
+    if format == "csv":
+        table = _read_csv(filename)
+    elif format == "npz":
+        table = _read_npz(filename)
+    elif format == "parquet":
+        _, pq = import_pyarrow()
+        columns = pq.read_table(filename).to_pydict()
+        table = {name: np.asarray(values) for name, values in columns.items()}
+    else:
+        raise ValueError("Invalid format of statistics table: " + str(format))
+
+    ndescription = len(DESCRIPTION_COLUMNS)
+    if list(table)[:ndescription] != list(DESCRIPTION_COLUMNS):
+        raise ValueError("Not a statistics table: " + filename)
+    table["set"] = table["set"].astype(np.int64)
+    for name in ("title", "label"):
+        table[name] = table[name].astype(str)
+    if tidy:
+        return table
+
+    # Split the rows in data sets where the set number changes
+    number = table["set"]
+    starts = np.flatnonzero(np.append(True, number[1:] != number[:-1]))
+    ends = np.append(starts[1:], len(number))
+    data = []
+    for start, end in zip(starts, ends):
+        stats = {"title": str(table["title"][start])}
+        stats["label"] = table["label"][start:end].tolist()
+        for name in list(table)[ndescription:]:
+            stats[name] = table[name][start:end]
+        data.append(stats)
+    return data
+
+
+def _read_csv(filename) -> dict:
+    """
+    Reads the columns of a CSV table, keeping blank titles and labels.
+    """
+    import pandas as pd
+
+    with open(filename) as file:
+        header = file.readline().rstrip("\r\n").split(",")
+    table = pd.read_csv(
+        filename,
+        dtype={"set": np.int64, "title": str, "label": str},
+        keep_default_na=False,
+        float_precision="round_trip",
+        na_values={name: ["nan"] for name in header[len(DESCRIPTION_COLUMNS) :]},
+    )
+    return {name: table[name].to_numpy() for name in table.columns}
+
+
+def _read_npz(filename) -> dict:
+    """
+    Reads the columns of a NPZ table, concatenating the chunks in order.
+    """
+    with np.load(filename, allow_pickle=False) as archive:
+        chunks = {}
+        for key in archive.files:
+            chunks.setdefault(key.rsplit(".", 1)[0], []).append(archive[key])
+    return {name: np.concatenate(values) for name, values in chunks.items()}
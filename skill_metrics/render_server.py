@@ -0,0 +1,454 @@
+import argparse
+import hashlib
+import importlib.metadata
+import io
+import json
+import os
+import stat
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .file_cache import FileCache
+from .target_diagram import target_diagram
+from .target_diagram_scene import target_diagram_scene
+from .taylor_diagram import taylor_diagram
+from .taylor_diagram_scene import taylor_diagram_scene
+from .write_diagram_json import write_diagram_json
+
+# Content types of the supported output formats. 'json' is the diagram
+# scene of TAYLOR_DIAGRAM_SCENE or TARGET_DIAGRAM_SCENE.
+_CONTENT_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "pdf": "application/pdf",
+    "json": "application/json",
+}
+
+# Names of the statistics of each kind of diagram, in argument order
+_STATS = {"taylor": ("sdev", "crmsd", "ccoef"), "target": ("bias", "crmsd", "rmsd")}
+
+# Rendered diagrams are only valid for the version that rendered them
+try:
+    _VERSION = importlib.metadata.version("SkillMetrics")
+except importlib.metadata.PackageNotFoundError:
+    _VERSION = "unknown"
+
+
+def render_diagram(request: dict) -> bytes:
+    """
+    Render a Taylor or target diagram described by a JSON request.
+
+    Draws the diagram on a new figure without pyplot and returns the
+    encoded image, or the diagram scene for the 'json' format. This is the
+    function run by the workers of the rendering server, but it can also
+    be called directly.
+
+    INPUTS:
+    request : dictionary of JSON values describing the diagram
+    request['kind']     : 'taylor' or 'target'
+    request['stats']    : dictionary of the statistics passed to the
+                          diagram function: 'sdev', 'crmsd' and 'ccoef' for
+                          a Taylor diagram, 'bias', 'crmsd' and 'rmsd' for
+                          a target diagram
+    request['options']  : keyword options of TAYLOR_DIAGRAM or
+                          TARGET_DIAGRAM (Default: {})
+    request['format']   : 'png' (default), 'svg', 'pdf' or 'json'
+    request['dpi']      : resolution of PNG images (Default: 100)
+    request['figsize']  : figure size in inches (Default: [8, 6])
+    request['rcparams'] : matplotlib rcParams used to draw the diagram,
+                          e.g. {'font.size': 12} (Default: {})
+
+    OUTPUTS:
+    data : the rendered diagram
+
+    Created on Oct 18, 2026
+    """
+
+    kind, stats, options, fmt = _parse_request(request)
+    try:
+        stats = [np.array(values, dtype=float, ndmin=1) for values in stats]
+    except (TypeError, ValueError):
+        raise ValueError("Statistics must be numeric arrays")
+
+    with matplotlib.rc_context(request.get("rcparams", {})):
+        if fmt == "json":
+            if kind == "taylor":
+                scene = taylor_diagram_scene(*stats, **options)
+            else:
+                scene = target_diagram_scene(*stats, **options)
+            return write_diagram_json(scene).encode()
+
+        fig = Figure(figsize=request.get("figsize", (8, 6)))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        if kind == "taylor":
+            taylor_diagram(ax, *stats, **options)
+        else:
+            target_diagram(ax, *stats, **options)
+
+        buffer = io.BytesIO()
+        fig.savefig(
+            buffer, format=fmt, dpi=request.get("dpi", 100), bbox_inches="tight"
+        )
+
+    return buffer.getvalue()
+
+
+def request_key(request: dict) -> str:
+    """
+    Get the cache key of a rendering request.
+
+    The key is the SHA-256 hash of the request in a canonical form (sorted
+    keys, option names in lower case) and of the SkillMetrics version, so
+    requests for the same diagram share the key regardless of how the
+    JSON was written.
+
+    INPUTS:
+    request : dictionary describing the diagram (Refer to RENDER_DIAGRAM
+              for more information.)
+
+    OUTPUTS:
+    key : hexadecimal hash of the request followed by the file suffix of
+          the output format, e.g. '3f...9a.png'
+
+    Created on Oct 18, 2026
+    """
+
+    kind, stats, options, fmt = _parse_request(request)
+    canonical = {
+        "version": _VERSION,
+        "kind": kind,
+        "stats": stats,
+        "options": options,
+        "format": fmt,
+        "dpi": request.get("dpi", 100),
+        "figsize": request.get("figsize", [8, 6]),
+        "rcparams": request.get("rcparams", {}),
+    }
+    text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest() + "." + fmt
+
+
+def _parse_request(request: dict) -> tuple:
+    """
+    Checks a rendering request and gets its kind, statistics as lists,
+    options with lower case names and output format.
+    """
+
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+
+    kind = request.get("kind")
+    if kind not in _STATS:
+        raise ValueError("Invalid kind of diagram: " + str(kind))
+
+    stats = request.get("stats")
+    if not isinstance(stats, dict):
+        raise ValueError("Request must provide 'stats' as a JSON object")
+    missing = [name for name in _STATS[kind] if name not in stats]
+    if len(missing) > 0:
+        raise ValueError("Missing statistics: " + ", ".join(missing))
+    stats = [stats[name] for name in _STATS[kind]]
+
+    options = request.get("options", {})
+    if not isinstance(options, dict):
+        raise ValueError("Request 'options' must be a JSON object")
+    options = {name.lower(): value for name, value in options.items()}
+    if "options" in options:
+        raise ValueError("Compiled options cannot be sent in a request")
+
+    fmt = request.get("format", "png")
+    if fmt not in _CONTENT_TYPES:
+        raise ValueError("Invalid output format: " + str(fmt))
+
+    return kind, stats, options, fmt
+
+
+class DiagramCache(FileCache):
+    """
+    Directory of rendered diagrams with size-bounded LRU eviction.
+
+    Each diagram is stored in a file named after its request key (see
+    REQUEST_KEY), as described in FILECACHE. Only files named like request
+    keys are managed, so an existing directory can be used as the cache
+    directory without its other files being removed.
+
+    Created on Oct 18, 2026
+    """
+
+    KEY_PATTERN = r"[0-9a-f]{64}\.(%s)" % "|".join(_CONTENT_TYPES)
+
+
+class RenderService:
+    """
+    Renders diagrams through a pool of warm worker processes and caches
+    the results in a DiagramCache.
+
+    The workers import matplotlib and SkillMetrics and draw a first diagram
+    when the service starts, so requests do not pay for the interpreter
+    and matplotlib startup. Identical requests arriving while a diagram is
+    being rendered wait for that rendering instead of starting another.
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, cache: DiagramCache, workers: int = None):
+        """
+        INPUTS:
+        cache   : DiagramCache storing the rendered diagrams
+        workers : number of worker processes (Default: number of CPUs)
+        """
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+
+        workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_warm_worker,
+        )
+
+        # Start all workers now rather than on the first requests
+        for future in [self._executor.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+
+    def render(self, request: dict) -> tuple:
+        """
+        Gets a rendered diagram from the cache or renders it.
+
+        INPUTS:
+        request : dictionary describing the diagram (Refer to
+                  RENDER_DIAGRAM for more information.)
+
+        OUTPUTS:
+        data         : the rendered diagram
+        content_type : MIME type of the data
+        hit          : True if the diagram was found in the cache
+        """
+        key = request_key(request)
+        content_type = _CONTENT_TYPES[key.rsplit(".", 1)[1]]
+
+        data = self.cache.get(key)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data, content_type, True
+
+        with self._lock:
+            self.misses += 1
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._executor.submit(render_diagram, request)
+                self._pending[key] = future
+
+        try:
+            data = future.result()
+            if owner:
+                self.cache.put(key, data)
+        finally:
+            if owner:
+                with self._lock:
+                    del self._pending[key]
+
+        return data, content_type, False
+
+    def statistics(self) -> dict:
+        """
+        Counters of the service and of its cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.cache),
+                "bytes": self.cache.size,
+            }
+
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        self._executor.shutdown()
+
+
+def _warm_worker() -> None:
+    """
+    Initializes a worker process by rendering a small diagram, which
+    imports matplotlib and loads the fonts.
+    """
+    matplotlib.use("Agg")
+    render_diagram(
+        {
+            "kind": "taylor",
+            "stats": {"sdev": [1, 1], "crmsd": [0, 0.5], "ccoef": [1, 0.9]},
+            "options": {"markerlabel": ["Obs", "M"]},
+        }
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    HTTP interface of the rendering server.
+
+    POST /render, /taylor or /target with a JSON request in the body
+    returns the rendered diagram (the kind is given by the path for the
+    last two). The X-Cache header is HIT when it came from the cache.
+    GET /stats returns the counters of the service.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "SkillMetrics"
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            if self.path in {"/taylor", "/target"} and isinstance(request, dict):
+                request["kind"] = self.path[1:]
+            elif self.path != "/render":
+                self._send_error(HTTPStatus.NOT_FOUND, "Unknown path: " + self.path)
+                return
+            data, content_type, hit = self.server.service.render(request)
+        except ValueError as error:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(error))
+            return
+        except Exception as error:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, repr(error))
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("X-Cache", "HIT" if hit else "MISS")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path != "/stats":
+            self._send_error(HTTPStatus.NOT_FOUND, "Unknown path: " + self.path)
+            return
+        data = json.dumps(self.server.service.statistics()).encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status, message):
+        data = json.dumps({"error": message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Clients of a Unix socket have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(
+    service: RenderService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str = None,
+    verbose: bool = False,
+):
+    """
+    Create the HTTP server of a rendering service.
+
+    INPUTS:
+    service     : RenderService rendering the requests
+    host        : address to listen on (Default: '127.0.0.1')
+    port        : TCP port to listen on, 0 for any free port (Default: 8765)
+    socket_path : path of a Unix socket to listen on instead of a TCP port,
+                  a stale socket at this path is replaced but any other
+                  existing file raises a ValueError
+    verbose     : log every request (Default: False)
+
+    OUTPUTS:
+    server : socketserver server, run it with server.serve_forever()
+
+    Created on Oct 18, 2026
+    """
+
+    if socket_path is None:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    else:
+        if os.path.lexists(socket_path):
+            if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                raise ValueError("Not a socket: %s" % socket_path)
+            os.remove(socket_path)
+        server = _UnixHTTPServer(socket_path, _Handler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None) -> None:
+    """
+    Run a rendering server from the command line:
+
+    $ python -m skill_metrics.render_server --port 8765 --cache-dir /tmp/sm
+
+    and request a diagram with, e.g.
+
+    $ curl -d '{"stats": {"sdev": [1, 0.9], "crmsd": [0, 0.4],
+      "ccoef": [1, 0.92]}, "options": {"markerLabel": ["Obs", "M1"]}}'
+      http://127.0.0.1:8765/taylor -o taylor.png
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m skill_metrics.render_server",
+        description="Render Taylor and target diagrams over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="listen on this Unix socket instead")
+    parser.add_argument(
+        "--cache-dir",
+        default=os.path.join(os.path.expanduser("~"), ".cache", "skill_metrics"),
+        help="diagrams are cached in its subdirectory skill_metrics-cache",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=256, help="cache size in MiB (default 256)"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    cache = DiagramCache(args.cache_dir, args.cache_size * 2**20)
+    service = RenderService(cache, args.workers)
+    server = create_server(service, args.host, args.port, args.socket, args.verbose)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,158 @@
-def save_figures(name, format):
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_pdf import PdfPages
+import io
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+
+# Formats rendered by Agg, whose figures are saved in worker processes
+_RASTER_FORMATS = {"png", "jpg", "jpeg", "tif", "tiff", "webp", "raw", "rgba"}
+
+# rcParams not passed to the worker processes
+_PROCESS_RCPARAMS = {"backend", "backend_fallback", "interactive"}
+
+
+def save_figures(
+    name,
+    format,
+    figures=None,
+    dpi=None,
+    compression=None,
+    buffers=False,
+    workers=1,
+):
     """
     Save figures to individual numbered graphics files
-    
+
+    A single figure is saved as NAME + FORMAT and several figures as
+    NAME_1 + FORMAT, NAME_2 + FORMAT, etc., except for PDF where all the
+    figures are saved as the pages of a single file.
+
+    Raster figures can be saved concurrently by several worker processes.
+    The figures are pickled and sent to the workers, which pays off when
+    there are many figures or when they are slow to draw. The figures can
+    also be returned as in-memory buffers instead of files, e.g. to send
+    them to an object store:
+
+    buffers = save_figures(None, '.png', figures=figs, buffers=True)
+
     INPUTS:
-    name   : name of graphic file, e.g. Dynamic Kundur
-    format : graphics file format supported by matplotlib savefig, e.g. '.png'
-    
+    name        : name of graphic file, e.g. Dynamic Kundur, ignored when
+                  BUFFERS is True
+    format      : graphics file format supported by matplotlib savefig,
+                  e.g. '.png'
+    figures     : list of figures to save (Default: all the figures of
+                  pyplot)
+    dpi         : resolution in dots per inch (Default: rcParams['savefig.dpi'])
+    compression : compression level from 0 (none) to 9 (maximum) of PNG
+                  and PDF files, ignored for other formats
+                  (Default: matplotlib defaults)
+    buffers     : return the figures as BytesIO buffers rather than
+                  saving them to files (Default: False)
+    workers     : number of processes saving raster figures, None for the
+                  number of CPUs (Default: 1). The processes are spawned,
+                  so they import the calling script: a script calling
+                  SAVE_FIGURES with more than one worker must do so under
+                  an 'if __name__ == "__main__":' guard.
+
     OUTPUTS:
-    None
-    
+    buffers : list of BytesIO buffers positioned at their start, one per
+              figure or a single one for PDF, when BUFFERS is True, None
+              otherwise
+
     EXAMPLE:
-    _save_figures('example1','.png')
+    save_figures('example1','.png')
+
+    Revised on Oct 18, 2026
     """
-    fig_nums = plt.get_fignums()
-    figs = [plt.figure(n) for n in fig_nums]
-    if format == ".pdf":
-        pdfFile = name + format
-        pp = PdfPages(pdfFile)
-        for fig in figs:
-            fig.savefig(pp, format="pdf")
-        pp.close()
+    if figures is None:
+        figures = [plt.figure(n) for n in plt.get_fignums()]
+    else:
+        figures = list(figures)
+    suffix = format if format.startswith(".") else "." + format
+    fmt = suffix[1:].lower()
+
+    if compression is not None and not (
+        isinstance(compression, int)
+        and not isinstance(compression, bool)
+        and 0 <= compression <= 9
+    ):
+        raise ValueError(
+            "Compression must be an integer from 0 to 9: " + str(compression)
+        )
+
+    # Graphic files or None for buffers
+    if buffers:
+        paths = [None] * len(figures)
+    elif fmt == "pdf" or len(figures) == 1:
+        paths = [name + suffix] * len(figures)
     else:
-        if len(figs) == 1:
-            figs[0].savefig(name + format)
-        else:
-            ifig = 1
-            for fig in figs:
-                fig.savefig(name + "_" + str(ifig) + format)
-                ifig += 1
-
-    return
+        paths = [name + "_" + str(i + 1) + suffix for i in range(len(figures))]
+
+    if fmt == "pdf":
+        rc = {} if compression is None else {"pdf.compression": compression}
+        output = io.BytesIO() if buffers else paths[0]
+        with matplotlib.rc_context(rc), PdfPages(output) as pp:
+            for fig in figures:
+                fig.savefig(pp, format="pdf", dpi=dpi)
+        if not buffers:
+            return None
+        output.seek(0)
+        return [output]
+
+    kwargs = {"format": fmt, "dpi": dpi}
+    if compression is not None and fmt == "png":
+        kwargs["pil_kwargs"] = {"compress_level": compression}
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(figures))
+
+    if fmt in _RASTER_FORMATS and workers > 1:
+        rc = {
+            key: value
+            for key, value in matplotlib.rcParams.items()
+            if key not in _PROCESS_RCPARAMS
+        }
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_save_figure, pickle.dumps(fig), path, rc, kwargs)
+                for fig, path in zip(figures, paths)
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [_save(fig, path, kwargs) for fig, path in zip(figures, paths)]
+
+    if buffers:
+        return [io.BytesIO(data) for data in results]
+    return None
+
+
+def _save(fig, path, kwargs: dict):
+    """
+    Saves a figure to PATH, or to bytes returned if PATH is None.
+    """
+    if path is not None:
+        fig.savefig(path, **kwargs)
+        return None
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **kwargs)
+    return buffer.getvalue()
+
+
+def _save_figure(data: bytes, path, rc: dict, kwargs: dict):
+    """
+    Saves a pickled figure in a worker process.
+    """
+    matplotlib.use("Agg")
+    fig = pickle.loads(data)
+    try:
+        with matplotlib.rc_context(rc):
+            return _save(fig, path, kwargs)
+    finally:
+        plt.close(fig)
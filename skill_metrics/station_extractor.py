@@ -0,0 +1,176 @@
+from functools import lru_cache
+
+import numpy as np
+
+METHODS = ("bilinear", "nearest")
+
+
+class StationExtractor:
+    """
+    Extracts the values of gridded fields at station locations.
+
+    The interpolation weights of the stations in the grid are computed
+    once, when the extractor is created, and each field is then extracted
+    by gathering the values of the grid cells around the stations for all
+    its time slices at once, without a loop over stations or times. The
+    result is an (n_stations, n_time) matrix whose rows are the predicted
+    series of the stations, e.g.
+
+    extract = StationExtractor(lat, lon, station_lat, station_lon)
+    model = extract(field)  # field of shape (n_time, n_lat, n_lon)
+    stats = [target_statistics(p, r) for p, r in zip(model, observed)]
+
+    The weights are memoized on the coordinates of the grid and of the
+    stations, so extractors of the same station set in the same grid,
+    e.g. one per model file, share them. The weights are therefore
+    read-only arrays.
+
+    The grid is rectilinear: its coordinates are given by one-dimensional
+    arrays of the Y and X coordinates of the rows and columns, in
+    increasing or decreasing order (e.g. latitudes from north to south).
+    Stations outside the grid get NaN values, as do stations next to grid
+    cells with NaN values (e.g. land cells) in bilinear interpolation.
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, grid_y, grid_x, station_y, station_x, method="bilinear"):
+        """
+        INPUTS:
+        grid_y    : Y coordinates of the rows of the grid, e.g. latitudes
+        grid_x    : X coordinates of the columns of the grid, e.g.
+                    longitudes
+        station_y : Y coordinates of the stations
+        station_x : X coordinates of the stations
+        method    : 'bilinear' interpolation of the 4 surrounding grid
+                    cells, or value of the 'nearest' grid cell (Default:
+                    'bilinear')
+        """
+        if method not in METHODS:
+            raise ValueError(
+                "Unknown interpolation method: %s, expected one of %s"
+                % (method, ", ".join(METHODS))
+            )
+        grid_y = _coordinates(grid_y, "GRID_Y")
+        grid_x = _coordinates(grid_x, "GRID_X")
+        station_y = np.ravel(np.asarray(station_y, dtype=float))
+        station_x = np.ravel(np.asarray(station_x, dtype=float))
+        if station_y.shape != station_x.shape:
+            raise ValueError(
+                "STATION_Y and STATION_X differ in size: %d, %d"
+                % (station_y.size, station_x.size)
+            )
+
+        self.method = method
+        self.shape = (grid_y.size, grid_x.size)
+        self.index, self.weight = _weights(
+            method,
+            grid_y.tobytes(),
+            grid_x.tobytes(),
+            station_y.tobytes(),
+            station_x.tobytes(),
+        )
+
+    def __len__(self):
+        return self.index.shape[0]
+
+    def __call__(self, field) -> np.ndarray:
+        """
+        Values of a field at the stations.
+
+        INPUTS:
+        field : array of shape (n_time, n_y, n_x), or (n_y, n_x) for a
+                single time
+
+        OUTPUTS:
+        values : array of shape (n_stations, n_time), or (n_stations,)
+                 for a single time
+        """
+        field = np.asarray(field)
+        if field.shape[-2:] != self.shape or field.ndim not in (2, 3):
+            raise ValueError(
+                "Field of shape %s does not match grid of shape %s"
+                % (field.shape, self.shape)
+            )
+
+        # One gather of all the time slices per neighbouring grid cell
+        cells = field.reshape(-1, self.shape[0] * self.shape[1])
+        values = np.zeros((len(self), cells.shape[0]))
+        for k in range(self.index.shape[1]):
+            values += self.weight[:, k, None] * cells[:, self.index[:, k]].T
+        return values[:, 0] if field.ndim == 2 else values
+
+
+def _coordinates(values, name) -> np.ndarray:
+    """
+    Checks the coordinates of a grid axis are monotonic.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 1 or values.size < 2:
+        raise ValueError("%s must be a one-dimensional array of 2 or more" % name)
+    step = np.diff(values)
+    if not ((step > 0).all() or (step < 0).all()):
+        raise ValueError("%s must be strictly increasing or decreasing" % name)
+    return values
+
+
+@lru_cache(maxsize=16)
+def _weights(method, grid_y, grid_x, station_y, station_x) -> tuple:
+    """
+    Indices of the grid cells around the stations in the flattened grid,
+    and their weights, from the bytes of the coordinates.
+    """
+    grid_y, grid_x = np.frombuffer(grid_y), np.frombuffer(grid_x)
+    station_y, station_x = np.frombuffer(station_y), np.frombuffer(station_x)
+    lower_y, upper_y, to_upper_y, inside_y = _axis_weights(grid_y, station_y)
+    lower_x, upper_x, to_upper_x, inside_x = _axis_weights(grid_x, station_x)
+
+    if method == "nearest":
+        row = np.where(to_upper_y > 0.5, upper_y, lower_y)
+        column = np.where(to_upper_x > 0.5, upper_x, lower_x)
+        index = (row * grid_x.size + column)[:, None]
+        weight = np.ones(index.shape)
+    else:
+        index = np.stack(
+            [
+                lower_y * grid_x.size + lower_x,
+                lower_y * grid_x.size + upper_x,
+                upper_y * grid_x.size + lower_x,
+                upper_y * grid_x.size + upper_x,
+            ],
+            axis=1,
+        )
+        weight = np.stack(
+            [
+                (1.0 - to_upper_y) * (1.0 - to_upper_x),
+                (1.0 - to_upper_y) * to_upper_x,
+                to_upper_y * (1.0 - to_upper_x),
+                to_upper_y * to_upper_x,
+            ],
+            axis=1,
+        )
+    weight[~(inside_y & inside_x)] = np.nan
+
+    index.setflags(write=False)
+    weight.setflags(write=False)
+    return index, weight
+
+
+def _axis_weights(coordinates, points) -> tuple:
+    """
+    Indices of the coordinates below and above the points, the fraction of
+    the interval from the lower to the upper coordinate, and whether the
+    points are inside the coordinates.
+    """
+    number = coordinates.size
+    descending = coordinates[0] > coordinates[-1]
+    if descending:
+        coordinates = coordinates[::-1]
+    lower = np.clip(np.searchsorted(coordinates, points, "right") - 1, 0, number - 2)
+    upper = lower + 1
+    to_upper = (points - coordinates[lower]) / (coordinates[upper] - coordinates[lower])
+    inside = (points >= coordinates[0]) & (points <= coordinates[-1])
+    to_upper = np.where(inside, to_upper, 0.0)
+    if descending:
+        lower, upper = number - 1 - lower, number - 1 - upper
+    return lower, upper, to_upper, inside
@@ -0,0 +1,206 @@
+import csv
+import os
+import zipfile
+
+import numpy as np
+
+# Formats of statistics tables by file extension
+FORMATS = {".csv": "csv", ".npz": "npz", ".parquet": "parquet", ".pq": "parquet"}
+
+# Columns describing the data points, before the statistics
+DESCRIPTION_COLUMNS = ("set", "title", "label")
+
+
+class StatsTableWriter:
+    """
+    Tidy table of statistics written in chunks to a columnar file.
+
+    Each row of the table is a data point, e.g. a series of a target or
+    Taylor diagram or a case of WRITE_STATS, with a SET column numbering
+    the data set it belongs to, a TITLE column for the title of the data
+    set and a LABEL column, followed by a column per statistic. Chunks of
+    rows are written as they come by WRITE, so a table larger than the
+    memory can be written from several batches. Each chunk starts a new
+    data set unless it continues the data set of the previous chunk.
+
+    The table is written as
+    'csv'     : text file with a header row, statistics written exactly
+                (repr of Python floats)
+    'npz'     : NumPy zip archive of compressed arrays, one per column and
+                chunk, named '<column>.<chunk>' (e.g. 'sdev.000000')
+    'parquet' : Apache Parquet file, one row group per chunk. Requires
+                pyarrow.
+
+    CSV and NPZ files can also be appended to when reopened with
+    APPEND=True. The tables are read back by READ_STATS_TABLE.
+
+    EXAMPLE:
+    with StatsTableWriter('taylor.csv', ['sdev', 'crmsd', 'ccoef']) as table:
+        for title, stats in batches:
+            table.write(stats, title=title, label=labels)
+
+    with StatsTableWriter('target.npz', ['bias', 'crmsd', 'rmsd']) as table:
+        for i, stats in enumerate(station_chunks):
+            table.write(stats, title='Stations', continued=i > 0)
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, filename: str, columns: list, format=None, append=False):
+        """
+        INPUTS:
+        filename : name of the table file
+        columns  : names of the statistics, in the order of the columns
+        format   : 'csv', 'npz' or 'parquet' (Default: from the extension
+                   of FILENAME)
+        append   : append to the rows of an existing file instead of
+                   replacing it (Default: False)
+        """
+        if format is None:
+            extension = os.path.splitext(filename)[1].lower()
+            if extension not in FORMATS:
+                raise ValueError("Unknown format of statistics table: " + filename)
+            format = FORMATS[extension]
+        if format not in FORMATS.values():
+            raise ValueError("Invalid format of statistics table: " + str(format))
+
+        columns = [str(column) for column in columns]
+        for column in columns:
+            if column in DESCRIPTION_COLUMNS:
+                raise ValueError("Reserved name of statistic: " + column)
+        self.filename = filename
+        self.format = format
+        self.columns = list(DESCRIPTION_COLUMNS) + columns
+        self.chunks = 0
+        self.sets = 0
+        append = append and os.path.isfile(filename)
+
+        if format == "csv":
+            if append:
+                with open(filename, newline="") as file:
+                    rows = csv.reader(file)
+                    self._check_columns(next(rows, None))
+                    for row in rows:
+                        self.sets = int(row[0]) + 1
+            self._file = open(filename, "a" if append else "w", newline="")
+            self._csv = csv.writer(self._file)
+            if not append:
+                self._csv.writerow(self.columns)
+        elif format == "npz":
+            if append:
+                self._file = zipfile.ZipFile(
+                    filename, "a", zipfile.ZIP_DEFLATED, allowZip64=True
+                )
+                names = [n[:-4] for n in self._file.namelist() if n.endswith(".npy")]
+                header = [n.rsplit(".", 1)[0] for n in names]
+                self._check_columns(list(dict.fromkeys(header)))
+                self.chunks = header.count(self.columns[0])
+                if self.chunks > 0:
+                    with self._file.open("set.%06d.npy" % (self.chunks - 1)) as file:
+                        self.sets = int(np.lib.format.read_array(file)[-1]) + 1
+            else:
+                self._file = zipfile.ZipFile(
+                    filename, "w", zipfile.ZIP_DEFLATED, allowZip64=True
+                )
+        else:
+            if append:
+                raise ValueError("Parquet files cannot be appended to: " + filename)
+            import_pyarrow()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_columns(self, header) -> None:
+        """
+        Checks the columns of an existing file are those of the table.
+        """
+        if header != self.columns:
+            raise ValueError(
+                "Columns of %s differ from %s: %s"
+                % (self.filename, self.columns, header)
+            )
+
+    def write(self, data: dict, title="", label=None, continued=False) -> None:
+        """
+        Writes a chunk of rows, one per element of the statistics in DATA.
+
+        INPUTS:
+        data      : dictionary of the statistics of the chunk, with a key
+                    per column of the table. Scalars are a single row.
+        title     : title of the data set of the rows (Default: '')
+        label     : labels of the rows, blank where LABEL is shorter
+                    (Default: blank labels)
+        continued : the rows continue the data set of the previous chunk
+                    instead of starting a new data set (Default: False)
+        """
+        ndescription = len(DESCRIPTION_COLUMNS)
+        stats = []
+        for column in self.columns[ndescription:]:
+            if column not in data:
+                raise ValueError("Missing statistic in data: " + column)
+            stats.append(np.atleast_1d(np.asarray(data[column], dtype=float)))
+        nrow = len(stats[0])
+        for column, values in zip(self.columns[ndescription:], stats):
+            if values.ndim != 1 or len(values) != nrow:
+                raise ValueError(
+                    "Statistic %s must have %d values: %s" % (column, nrow, values)
+                )
+
+        # Columns describing the rows
+        if label is None:
+            label = []
+        label = [str(v) for v in label[:nrow]]
+        label += [""] * (nrow - len(label))
+        if not continued or self.sets == 0:
+            self.sets += 1
+        columns = [
+            np.full(nrow, self.sets - 1, dtype=np.int64),
+            np.full(nrow, str(title)),
+            np.array(label, dtype=str),
+        ] + stats
+
+        if self.format == "csv":
+            rows = zip(*[values.tolist() for values in columns])
+            self._csv.writerows(rows)
+        elif self.format == "npz":
+            for name, values in zip(self.columns, columns):
+                member = "%s.%06d.npy" % (name, self.chunks)
+                with self._file.open(member, "w", force_zip64=True) as file:
+                    np.lib.format.write_array(file, values, allow_pickle=False)
+        else:
+            self._write_parquet(columns)
+        self.chunks += 1
+
+    def _write_parquet(self, columns: list) -> None:
+        """
+        Writes a chunk of rows as a row group of the Parquet file.
+        """
+        pa, pq = import_pyarrow()
+        table = pa.table(dict(zip(self.columns, columns)))
+        if self._file is None:
+            self._file = pq.ParquetWriter(self.filename, table.schema)
+        self._file.write_table(table)
+
+    def close(self) -> None:
+        """
+        Finishes writing the file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow, an optional dependency needed for Parquet tables.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Parquet tables require pyarrow") from error
+    return pa, pq
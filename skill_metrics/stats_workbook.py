@@ -0,0 +1,113 @@
+import numpy as np
+import xlsxwriter
+
+# Number of rows and columns of an Excel worksheet
+MAX_ROWS = 1048576
+MAX_COLUMNS = 16384
+
+
+class StatsWorkbook:
+    """
+    Excel workbook of statistics written row by row in bounded memory.
+
+    The workbook is opened by xlsxwriter in constant memory mode, where
+    each row is flushed to a temporary file as soon as a later row is
+    written, so the memory used does not grow with the number of rows.
+    Rows must therefore be written in increasing order, which is done by
+    WRITE_ROW and WRITE_COLUMNS from the current row of the workbook.
+
+    A batch of statistics larger than a worksheet continues on new
+    worksheets: rows beyond MAXROWS are written to a new worksheet, which
+    starts with the last header rows written by WRITE_HEADER.
+
+    Used by WRITE_STATS, WRITE_TARGET_STATS and WRITE_TAYLOR_STATS.
+
+    EXAMPLE:
+    with StatsWorkbook('stats.xlsx') as book:
+        book.write_header([['Description', 'Bias', 'uRMSD', 'RMSD']])
+        book.write_columns([bias, crmsd, rmsd], labels=labels)
+
+    Created on Oct 18, 2026
+    """
+
+    def __init__(self, filename: str, maxrows: int = MAX_ROWS):
+        """
+        INPUTS:
+        filename : name of Excel file
+        maxrows  : maximum number of rows of each worksheet
+                   (Default: 1048576, the limit of Excel)
+        """
+        if not 1 < maxrows <= MAX_ROWS:
+            raise ValueError(
+                "Number of rows per worksheet must be from 2 to %d: %s"
+                % (MAX_ROWS, maxrows)
+            )
+        self.workbook = xlsxwriter.Workbook(filename, {"constant_memory": True})
+        self.maxrows = maxrows
+        self.header = []
+        self.worksheet = None
+        self.row = 0
+        self.add_worksheet()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_worksheet(self) -> None:
+        """
+        Continues on a new worksheet, starting with the header rows.
+        """
+        self.worksheet = self.workbook.add_worksheet()
+        self.row = 0
+        for values in self.header:
+            self.worksheet.write_row(self.row, 0, values)
+            self.row += 1
+
+    def write_header(self, rows: list) -> None:
+        """
+        Writes header rows, repeated at the top of new worksheets.
+        """
+        if len(rows) >= self.maxrows:
+            raise ValueError("Header is too long for %d rows" % self.maxrows)
+        self.header = []
+        for values in rows:
+            self.write_row(values)
+        self.header = [list(values) for values in rows]
+
+    def skip(self, rows: int = 1) -> None:
+        """
+        Leaves blank rows.
+        """
+        self.row += rows
+
+    def write_row(self, values) -> None:
+        """
+        Writes values to the current row, from the first column.
+        """
+        if self.row >= self.maxrows:
+            self.add_worksheet()
+        self.worksheet.write_row(self.row, 0, values)
+        self.row += 1
+
+    def write_columns(self, columns: list, labels=None) -> None:
+        """
+        Writes arrays of statistics as columns, one row per element,
+        after a first column of labels (blank where LABELS is shorter).
+        """
+        # Python values are written faster than NumPy scalars
+        columns = [np.atleast_1d(column).tolist() for column in columns]
+        ndata = len(columns[0])
+        if labels is None:
+            labels = []
+        labels = list(labels[:ndata]) + [None] * (ndata - len(labels))
+
+        for values in zip(labels, *columns):
+            self.write_row(values)
+
+    def close(self) -> None:
+        """
+        Writes the workbook to the Excel file.
+        """
+        self.workbook.close()
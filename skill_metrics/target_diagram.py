@@ -8,6 +8,7 @@ from . import (
     get_target_diagram_options,
     overlay_target_diagram_circles,
     plot_pattern_diagram_colorbar,
+    plot_pattern_diagram_density,
     plot_pattern_diagram_markers,
     plot_target_axes,
 )
@@ -43,7 +44,9 @@ def _display_target_diagram_options():
         "'MarkerDisplayed'",
         "'marker' (default): Experiments are represented by individual symbols\n\t\t"
         + "'colorBar': Experiments are represented by a color described "
-        + "in a colorbar",
+        + "in a colorbar\n\t\t"
+        + "'density': Experiments are binned and their number per bin is "
+        + "shaded (for very many points)",
     )
 
     _disp("OPTIONS when 'MarkerDisplayed' == 'marker'")
@@ -60,6 +63,24 @@ def _display_target_diagram_options():
     )
     _dispopt("'markerLabel'", "Labels for markers")
     _dispopt("'markerLabelColor'", "Marker label color (Default: black)")
+    _dispopt(
+        "'labelPlacement'",
+        "'fixed' (default): Marker labels above and left of the markers"
+        + "\n\t\t"
+        + "'auto': Marker labels placed around the markers without"
+        + "\n\t\t"
+        + "overlaps, labels that do not fit are omitted",
+    )
+    _dispopt(
+        "'legendMode'",
+        "'legend' (default): Display marker legend with matplotlib legend"
+        + "\n\t\t"
+        + "'table': Display labels in a table beside the diagram, labels"
+        + "\n\t\t"
+        + "that do not fit are placed on separate legend figures"
+        + "\n\t\t"
+        + "'figure': Display labels only on separate legend figures",
+    )
     _dispopt(
         "'markerLayout'",
         "Matrix layout for markers in legend [nrow, ncolumn]."
@@ -90,6 +111,17 @@ def _display_target_diagram_options():
         "Location for the colorbar, 'NorthOutside' " + "or 'EastOutside'",
     )
     _dispopt("'titleColorBar'", "Title of the colorbar.")
+
+    _disp("OPTIONS when 'MarkerDisplayed' == 'density'")
+    _dispopt("'densityBins'", "Number of bins along each axis (Default: 100)")
+    _dispopt(
+        "'densityColorBar'",
+        "'on' (default) / 'off': Show a colorbar of the point counts",
+    )
+    _dispopt(
+        "'densityScale'",
+        "'linear' / 'log' (default): Color shading of the point counts",
+    )
     _disp("")
 
     _disp("Axes options:")
@@ -149,6 +181,12 @@ def _display_target_diagram_options():
         + "\n\t\t"
         + "a '.csv' is assumed. (Default: empty string '')",
     )
+    _dispopt(
+        "'options'",
+        "DiagramOptions object created by compile_target_diagram_options"
+        + "\n\t\t"
+        + "containing validated options to reuse. (Default: None)",
+    )
 
 
 def _disp(text):
@@ -245,6 +283,22 @@ def target_diagram(*args, **kwargs):
 
     target_diagram(Bs,RMSDs,RMSDz,markerdisplayed='marker')
 
+    The diagram can also be drawn in a specific matplotlib.axes.Axes by
+    supplying it as the first argument:
+
+    target_diagram(ax,Bs,RMSDs,RMSDz,keyword=value)
+
+    In that case only the supplied axes and its figure are modified, so
+    diagrams drawn on separate figures can be rendered concurrently, e.g.
+    from the threads of a web service.
+
+    When many diagrams share the same styling, the options can be
+    validated once with COMPILE_TARGET_DIAGRAM_OPTIONS and passed with
+    the OPTIONS keyword:
+
+    opts = compile_target_diagram_options(keyword=value)
+    target_diagram(ax,Bs,RMSDs,RMSDz,options=opts)
+
     INPUTS:
     Bs    : Bias (B) or Normalized Bias (B*). Plotted along y-axis
             as "Bias".
@@ -254,7 +308,9 @@ def target_diagram(*args, **kwargs):
     RMSDz : total Root-Mean-Square Difference (RMSD). Labeled on plot as "RMSD".
 
     OUTPUTS:
-    None.
+    legend_pages : list of legend figures (matplotlib.figure.Figure) when
+                   'legendMode' is 'table' or 'figure' and a marker legend
+                   is displayed, otherwise None.
 
     LIST OF OPTIONS:
     For an exhaustive list of options to customize your diagram, call the
@@ -299,10 +355,15 @@ def target_diagram(*args, **kwargs):
         axes_handles = plot_target_axes(ax, axes)
 
     # Plot data points
+    legend_pages = None
     lowcase = option["markerdisplayed"].lower()
     if lowcase == "marker":
-        plot_pattern_diagram_markers(ax, RMSDs, Bs, option)
+        legend_pages = plot_pattern_diagram_markers(ax, RMSDs, Bs, option, "target")
     elif lowcase == "colorbar":
         plot_pattern_diagram_colorbar(ax, RMSDs, Bs, RMSDz, option)
+    elif lowcase == "density":
+        plot_pattern_diagram_density(ax, RMSDs, Bs, option, "target")
     else:
         raise ValueError("Unrecognized option: " + option["markerdisplayed"])
+
+    return legend_pages
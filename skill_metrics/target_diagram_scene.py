@@ -0,0 +1,152 @@
+import re
+
+import numpy as np
+from matplotlib import rcParams
+
+from .add_scene_markers import add_scene_markers
+from .diagram_scene import DiagramScene
+from .get_target_diagram_axes import get_target_diagram_axes
+from .get_target_diagram_geometry import get_target_diagram_geometry
+from .get_target_diagram_options import get_target_diagram_options
+
+
+def target_diagram_scene(Bs, RMSDs, RMSDz, **kwargs) -> dict:
+    """
+    Describe a target diagram as a scene of drawing primitives.
+
+    target_diagram_scene(Bs,RMSDs,RMSDz,keyword=value)
+
+    Takes the same statistics and options as TARGET_DIAGRAM, but instead
+    of drawing with matplotlib returns a description of the diagram as
+    circles, lines, texts, markers and gradients (see DiagramScene). The
+    scene is built directly from the grid geometry returned by
+    GET_TARGET_DIAGRAM_GEOMETRY without creating a figure, and can be
+    written with WRITE_DIAGRAM_SVG or WRITE_DIAGRAM_JSON:
+
+    scene = target_diagram_scene(Bs,RMSDs,RMSDz,markerLabel=label)
+    svg = write_diagram_svg(scene)
+
+    The circles, axes, markers with their labels or legend and the color
+    bar are supported. Marker labels are always placed at the fixed
+    position beside the markers and the 'density' display of markers is
+    not supported. When the same styling is used for many diagrams, pass
+    options compiled with COMPILE_TARGET_DIAGRAM_OPTIONS with the OPTIONS
+    keyword.
+
+    INPUTS:
+    Bs    : Bias (B) or Normalized Bias (B*). Plotted along y-axis
+            as "Bias".
+    RMSDs : unbiased Root-Mean-Square Difference (RMSD') or normalized
+            unbiased Root-Mean-Square Difference (RMSD*'). Plotted along
+            x-axis as "uRMSD".
+    RMSDz : total Root-Mean-Square Difference (RMSD). Used for the color
+            shading of markers when 'markerDisplayed' is 'colorBar'.
+
+    OUTPUTS:
+    scene : dictionary describing the diagram with JSON-serializable
+            values (Refer to DiagramScene.as_dict for more information.)
+
+    Created on Oct 18, 2026
+    """
+
+    Bs = _as_array(Bs, "Bs")
+    RMSDs = _as_array(RMSDs, "RMSDs")
+    RMSDz = _as_array(RMSDz, "RMSDz")
+
+    # Get options
+    option = get_target_diagram_options(**kwargs)
+
+    #  Get axis values for plot
+    axes = get_target_diagram_axes(RMSDs, Bs, option)
+    frame = [axes["xtick"][0], axes["xtick"][-1], axes["ytick"][0], axes["ytick"][-1]]
+    scene = DiagramScene("target", frame, rcParams.get("font.size"))
+
+    # Circles
+    geometry = get_target_diagram_geometry(option)
+    if geometry["reference"] is not None:
+        scene.circle([0.0, 0.0], 1.0, "k", option["circlelinewidth"])
+    for radius in geometry["circles"]:
+        scene.circle(
+            [0.0, 0.0],
+            radius,
+            option["circlecolor"],
+            option["circlelinewidth"],
+            option["circlestyle"],
+        )
+    if geometry["obsuncertainty"] is not None:
+        scene.circle(
+            [0.0, 0.0], option["obsuncertainty"], "b", rcParams["lines.linewidth"], "--"
+        )
+
+    if option["overlay"] == "off":
+        _add_axes(scene, axes)
+
+    add_scene_markers(scene, RMSDs, Bs, RMSDz, option)
+
+    return scene.as_dict()
+
+
+def _as_array(values, label: str) -> np.ndarray:
+    """
+    Converts statistics to a one-dimensional array of floats.
+    """
+    try:
+        return np.array(values, dtype=float, ndmin=1)
+    except (TypeError, ValueError):
+        raise ValueError(
+            "Argument {0} is not a numeric array: {1}".format(label, values)
+        )
+
+
+def _add_axes(scene, axes: dict) -> None:
+    """
+    Adds the axes crossing at the origin with their ticks, tick labels and
+    titles, as PLOT_TARGET_AXES.
+    """
+
+    fontSize = scene.fontsize
+    lineWidth = rcParams.get("lines.linewidth")
+    xtick, ytick = np.asarray(axes["xtick"]), np.asarray(axes["ytick"])
+    pad = scene.points(3.5)
+    ticklength = scene.points(3.5)
+
+    # Axis lines with ticks inside the axes
+    scene.line([xtick[0], xtick[-1]], [0, 0], "k", lineWidth, clip=False)
+    scene.line([0, 0], [ytick[0], ytick[-1]], "k", lineWidth, clip=False)
+    for tick in xtick:
+        scene.line([tick, tick], [0, ticklength], "k", 0.8, clip=False)
+    for tick in ytick:
+        scene.line([0, ticklength], [tick, tick], "k", 0.8, clip=False)
+    offset = np.full(len(xtick), -pad)
+    scene.texts(xtick, offset, axes["xlabel"], valign="top")
+    offset = np.full(len(ytick), -pad)
+    scene.texts(offset, ytick, axes["ylabel"], halign="right")
+
+    # Axis titles beyond the ends of the axes
+    xlabel = "uRMSD" + _offset_text(axes["xoffset"])
+    xpos = xtick[-1] + 2 * xtick[-1] / 30
+    scene.text(xpos, xtick[-1] / 30, xlabel, halign="left", valign="top")
+    ylabel = "Bias" + _offset_text(axes["yoffset"])
+    ypos = ytick[-1] + 2 * ytick[-1] / 30
+    scene.text(0, ypos, ylabel, valign="bottom")
+
+    # Room for the labels around the diagram
+    margin = scene.points(1.5 * fontSize)
+    width = scene.points(0.6 * fontSize * len(xlabel))
+    scene.extend(
+        xmin=xtick[0] - margin,
+        xmax=xpos + width + margin,
+        ymin=ytick[0] - margin,
+        ymax=ypos + scene.points(fontSize) + margin,
+    )
+
+
+def _offset_text(offset: str) -> str:
+    """
+    Converts the scientific notation offset of an axis given as mathtext
+    by GET_TARGET_DIAGRAM_AXES to plain text, e.g. ' (x10^-3)'.
+    """
+    match = re.search(r"10\^\{(-?\d+)\}", offset)
+    if match is None:
+        return ""
+    return " (x10^" + match.group(1) + ")"
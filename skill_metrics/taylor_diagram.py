@@ -1,5 +1,6 @@
 import numbers
 from array import array
+from typing import Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -10,6 +11,7 @@ from . import (
     overlay_taylor_diagram_circles,
     overlay_taylor_diagram_lines,
     plot_pattern_diagram_colorbar,
+    plot_pattern_diagram_density,
     plot_pattern_diagram_markers,
     plot_taylor_axes,
     plot_taylor_obs,
@@ -75,7 +77,9 @@ def _display_taylor_diagram_options() -> None:
         "'marker' (default): Experiments are represented by individual "
         + "symbols\n\t\t"
         + "'colorBar': Experiments are represented by a color described "
-        + "in a colorbar",
+        + "in a colorbar\n\t\t"
+        + "'density': Experiments are binned and their number per bin is "
+        + "shaded (for very many points)",
     )
 
     _disp("OPTIONS when 'MarkerDisplayed' == 'marker'")
@@ -95,6 +99,26 @@ def _display_taylor_diagram_options() -> None:
 
     _dispopt("'markerLabelColor'", "Marker label color (Default: black)")
 
+    _dispopt(
+        "'labelPlacement'",
+        "'fixed' (default): Marker labels above and left of the markers"
+        + "\n\t\t"
+        + "'auto': Marker labels placed around the markers without"
+        + "\n\t\t"
+        + "overlaps, labels that do not fit are omitted",
+    )
+
+    _dispopt(
+        "'legendMode'",
+        "'legend' (default): Display marker legend with matplotlib legend"
+        + "\n\t\t"
+        + "'table': Display labels in a table beside the diagram, labels"
+        + "\n\t\t"
+        + "that do not fit are placed on separate legend figures"
+        + "\n\t\t"
+        + "'figure': Display labels only on separate legend figures",
+    )
+
     _dispopt(
         "'markerLayout'",
         "Matrix layout for markers in legend [nrow, ncolumn]."
@@ -131,6 +155,23 @@ def _display_taylor_diagram_options() -> None:
 
     _dispopt("'titleColorBar'", "Title of the colorbar.")
 
+    _disp("OPTIONS when 'MarkerDisplayed' == 'density'")
+
+    _dispopt(
+        "'densityBins'",
+        "Number of bins along the STD and correlation coordinates (Default: 100)",
+    )
+
+    _dispopt(
+        "'densityColorBar'",
+        "'on' (default) / 'off': Show a colorbar of the point counts",
+    )
+
+    _dispopt(
+        "'densityScale'",
+        "'linear' / 'log' (default): Color shading of the point counts",
+    )
+
     _disp("")
 
     _disp("RMS axis options:")
@@ -271,6 +312,12 @@ def _display_taylor_diagram_options() -> None:
         + "\n\t\t"
         + "a '.csv' is assumed. (Default: empty string '')",
     )
+    _dispopt(
+        "'options'",
+        "DiagramOptions object created by compile_taylor_diagram_options"
+        + "\n\t\t"
+        + "containing validated options to reuse. (Default: None)",
+    )
 
 
 def _disp(text):
@@ -353,7 +400,7 @@ def _get_taylor_diagram_arguments(*args):
     return CAX, STDs, RMSs, CORs
 
 
-def taylor_diagram(*args, **kwargs) -> None:
+def taylor_diagram(*args, **kwargs) -> Union[list, None]:
     """
     Plot a Taylor diagram from statistics of different series.
 
@@ -365,6 +412,22 @@ def taylor_diagram(*args, **kwargs) -> None:
 
     taylor_diagram(STDs,RMSs,CORs,markerdisplayed='marker')
 
+    The diagram can also be drawn in a specific matplotlib.axes.Axes by
+    supplying it as the first argument:
+
+    taylor_diagram(ax,STDs,RMSs,CORs,keyword=value)
+
+    In that case only the supplied axes and its figure are modified, so
+    diagrams drawn on separate figures can be rendered concurrently, e.g.
+    from the threads of a web service.
+
+    When many diagrams share the same styling, the options can be
+    validated once with COMPILE_TAYLOR_DIAGRAM_OPTIONS and passed with
+    the OPTIONS keyword:
+
+    opts = compile_taylor_diagram_options(keyword=value)
+    taylor_diagram(ax,STDs,RMSs,CORs,options=opts)
+
     INPUTS:
     STDs: Standard deviations
     RMSs: Centered Root Mean Square Difference
@@ -387,7 +450,11 @@ def taylor_diagram(*args, **kwargs) -> None:
     this relation.
 
     OUTPUTS:
-    None.
+    legend_pages : list of legend figures (matplotlib.figure.Figure) when
+                   'legendMode' is 'table' or 'figure' and a marker legend
+                   is displayed, otherwise None. The pages are not managed
+                   by pyplot; save them with their savefig method or with
+                   SAVE_FIGURES.
 
     LIST OF OPTIONS:
     For an exhaustive list of options to customize your diagram, call the
@@ -406,7 +473,7 @@ def taylor_diagram(*args, **kwargs) -> None:
             rochford.peter1@gmail.com
 
     Created on Dec 3, 2016
-    Revised on Aug 23, 2022
+    Revised on Oct 18, 2026
     """
 
     # Check for no arguments
@@ -453,9 +520,10 @@ def taylor_diagram(*args, **kwargs) -> None:
     Y = np.multiply(rho[1:], np.sin(theta[1:]))
 
     # Plot data points
+    legend_pages = None
     lowcase = options["markerdisplayed"].lower()
     if lowcase == "marker":
-        plot_pattern_diagram_markers(ax, X, Y, options)
+        legend_pages = plot_pattern_diagram_markers(ax, X, Y, options, "taylor")
     elif lowcase == "colorbar":
         nZdata = len(options["cmapzdata"])
         if nZdata == 0:
@@ -464,7 +532,9 @@ def taylor_diagram(*args, **kwargs) -> None:
         else:
             # Use Bias values for colors
             plot_pattern_diagram_colorbar(ax, X, Y, options["cmapzdata"][1:], options)
+    elif lowcase == "density":
+        plot_pattern_diagram_density(ax, X, Y, options, "taylor")
     else:
         raise ValueError("Unrecognized option: " + options["markerdisplayed"])
 
-    return None
+    return legend_pages
@@ -0,0 +1,345 @@
+import numpy as np
+from matplotlib import rcParams
+
+from .add_scene_markers import add_scene_markers
+from .check_taylor_stats import check_taylor_stats
+from .diagram_scene import DiagramScene
+from .get_axis_tick_label import get_axis_tick_label
+from .get_from_dict_or_default import get_from_dict_or_default
+from .get_taylor_diagram_axes import get_taylor_diagram_axes
+from .get_taylor_diagram_geometry import get_taylor_diagram_geometry
+from .get_taylor_diagram_options import get_taylor_diagram_options
+
+
+def taylor_diagram_scene(STDs, RMSs, CORs, **kwargs) -> dict:
+    """
+    Describe a Taylor diagram as a scene of drawing primitives.
+
+    taylor_diagram_scene(STDs,RMSs,CORs,keyword=value)
+
+    Takes the same statistics and options as TAYLOR_DIAGRAM, but instead
+    of drawing with matplotlib returns a description of the diagram as
+    circles, lines, texts, markers and gradients (see DiagramScene). The
+    scene is built directly from the grid geometry returned by
+    GET_TAYLOR_DIAGRAM_GEOMETRY without creating a figure, so it can be
+    generated for thousands of diagrams, e.g. by a web service, and
+    written with WRITE_DIAGRAM_SVG or WRITE_DIAGRAM_JSON for rendering in
+    a browser:
+
+    scene = taylor_diagram_scene(STDs,RMSs,CORs,markerLabel=label)
+    svg = write_diagram_svg(scene)
+
+    The grid, axes, observation point, markers with their labels or
+    legend and the color bar are supported. Marker labels are always
+    placed at the fixed position beside the markers and the 'density'
+    display of markers is not supported. When the same styling is used
+    for many diagrams, pass options compiled with
+    COMPILE_TAYLOR_DIAGRAM_OPTIONS with the OPTIONS keyword.
+
+    Since there are no matplotlib axes, the default radial ticks are the
+    ones the default tick locator chooses for the data, which may differ
+    slightly from those of a diagram drawn in a small axes.
+
+    INPUTS:
+    STDs: Standard deviations
+    RMSs: Centered Root Mean Square Difference
+    CORs: Correlation
+
+    The first index corresponds to the reference series as for
+    TAYLOR_DIAGRAM.
+
+    OUTPUTS:
+    scene : dictionary describing the diagram with JSON-serializable
+            values (Refer to DiagramScene.as_dict for more information.)
+
+    Created on Oct 18, 2026
+    """
+
+    STDs = _as_array(STDs, "STDs")
+    RMSs = _as_array(RMSs, "RMSs")
+    CORs = _as_array(CORs, "CORs")
+
+    # Get options
+    option = get_taylor_diagram_options(CORs, **kwargs)
+
+    # Check the input statistics if requested.
+    if option["checkstats"] == "on":
+        check_taylor_stats(STDs, RMSs, CORs, 0.01)
+
+    # Express statistics in polar coordinates.
+    rho, theta = STDs, np.arccos(CORs)
+
+    #  Get axis values for plot
+    axes = get_taylor_diagram_axes(None, rho, option)
+    rmax = axes["rmax"]
+    if option["numberpanels"] == 2:
+        frame = [-rmax, rmax, 0, rmax]
+    else:
+        frame = [0, rmax, 0, rmax]
+    scene = DiagramScene("taylor", frame, rcParams.get("font.size"))
+
+    if option["overlay"] == "off":
+        geometry = get_taylor_diagram_geometry(axes, option)
+        _add_grid(scene, geometry, axes, option)
+        _add_axes(scene, geometry, axes, option)
+        _add_obs(scene, STDs[0], axes, option)
+
+    # Add data points. Note that only rho[1:N] and theta[1:N] are
+    # plotted.
+    X = np.multiply(rho[1:], np.cos(theta[1:]))
+    Y = np.multiply(rho[1:], np.sin(theta[1:]))
+    if len(option["cmapzdata"]) == 0:
+        Z = RMSs[1:]
+    else:
+        Z = option["cmapzdata"][1:]
+    add_scene_markers(scene, X, Y, Z, option)
+
+    return scene.as_dict()
+
+
+def _as_array(values, label: str) -> np.ndarray:
+    """
+    Converts statistics to a one-dimensional array of floats.
+    """
+    try:
+        return np.array(values, dtype=float, ndmin=1)
+    except (TypeError, ValueError):
+        raise ValueError(
+            "Argument {0} is not a numeric array: {1}".format(label, values)
+        )
+
+
+def _add_grid(scene, geometry: dict, axes: dict, option: dict) -> None:
+    """
+    Adds the RMS and STD circles and the correlation lines with their
+    labels, as OVERLAY_TAYLOR_DIAGRAM_CIRCLES and
+    OVERLAY_TAYLOR_DIAGRAM_LINES.
+    """
+
+    fontSize = scene.fontsize + 2
+
+    # RMS arcs about the observation point
+    for radius, angles in zip(geometry["rms_ticks"], geometry["rms_arc_angles"]):
+        scene.circle(
+            [axes["dx"], 0.0],
+            radius,
+            option["colrms"],
+            option["widthrms"],
+            option["stylerms"],
+            angles=angles,
+        )
+    if option["showlabelsrms"] == "on":
+        xy = geometry["rms_label_xy"]
+        scene.texts(
+            xy[:, 0],
+            xy[:, 1],
+            geometry["rms_label_text"],
+            color=option["colrms"],
+            size=fontSize,
+            rotation=geometry["rms_label_rotation"],
+        )
+
+    # STD circles about the origin, the outermost one solid
+    grid_color = get_from_dict_or_default(option, "colstd", "colsstd", "grid")
+    ncircles = len(geometry["std_circles"])
+    for i, radius in enumerate(np.ravel(option["tickstd"])):
+        style = "-" if i == ncircles - 1 else option["stylestd"]
+        scene.circle([0.0, 0.0], radius, grid_color, option["widthstd"], style)
+    scene.circle(
+        [0.0, 0.0],
+        option["axismax"],
+        grid_color,
+        option["widthstd"],
+        option["stylestd"],
+    )
+
+    # Correlation lines emanating from the origin
+    lines_col = get_from_dict_or_default(option, "colcor", "colscor", "grid")
+    for line in geometry["cor_lines"]:
+        scene.line(
+            line[:, 0], line[:, 1], lines_col, option["widthcor"], option["stylecor"]
+        )
+    if option["showlabelscor"] == "on":
+        ticklabels_col = get_from_dict_or_default(
+            option, "colcor", "colscor", "tick_labels"
+        )
+        xy = geometry["cor_label_xy"]
+        scene.texts(
+            xy[:, 0],
+            xy[:, 1],
+            geometry["cor_label_text"],
+            color=ticklabels_col,
+            valign="baseline",
+        )
+
+
+def _add_axes(scene, geometry: dict, axes: dict, option: dict) -> None:
+    """
+    Adds the axis lines, tick labels and titles, as PLOT_TAYLOR_AXES.
+    """
+
+    fontSize = scene.fontsize + 2
+    lineWidth = rcParams.get("lines.linewidth")
+    weight = option["labelweight"]
+    rmax = axes["rmax"]
+    pad = scene.points(3.5)
+
+    # Axis lines
+    if option["numberpanels"] == 2:
+        scene.line([-rmax, rmax], [0, 0], axes["tc"], lineWidth + 1, clip=False)
+        scene.line([0, 0], [0, rmax], axes["tc"], lineWidth, clip=False)
+    else:
+        scene.line([0, rmax], [0, 0], axes["tc"], lineWidth + 2, clip=False)
+        scene.line([0, 0], [0, rmax], axes["tc"], lineWidth + 1, clip=False)
+
+    # Tick labels of the standard deviation
+    labels_color = get_from_dict_or_default(option, "colstd", "colsstd", "tick_labels")
+    ticks = np.unique(np.append(geometry["std_ticks"], 0.0))
+    ticks = ticks[np.abs(ticks) <= rmax]
+    if option["numberpanels"] == 2:
+        tickSize = scene.fontsize
+    else:
+        tickSize = 0.9 * fontSize
+    labels = []
+    if option["showlabelsstd"] == "on":
+        labels = [get_axis_tick_label(abs(tick)) if tick else "0" for tick in ticks]
+        offset = np.full(len(ticks), -pad)
+        scene.texts(ticks, offset, labels, labels_color, tickSize, valign="top")
+        if option["numberpanels"] == 1:
+            scene.texts(offset, ticks, labels, labels_color, tickSize, halign="right")
+    ticklength = max([len(label) for label in labels], default=0)
+
+    # Title of the standard deviation axis
+    if option["titlestd"] == "on":
+        color = get_from_dict_or_default(option, "colstd", "colsstd", "title")
+        if option["numberpanels"] == 2:
+            y = -pad - scene.points(1.2 * tickSize)
+            scene.text(
+                0, y, "Standard Deviation", color, fontSize, valign="top", weight=weight
+            )
+        else:
+            x = -pad - scene.points(0.6 * tickSize * ticklength + 0.8 * fontSize)
+            scene.text(
+                x,
+                0.5 * rmax,
+                "Standard Deviation",
+                color,
+                fontSize,
+                rotation=90,
+                weight=weight,
+            )
+
+    # Title of the correlation, curved along the boundary
+    if option["titlecor"] == "on":
+        color = get_from_dict_or_default(option, "colcor", "colscor", "title")
+        lab = "Correlation Coefficient"
+        if option["numberpanels"] == 2:
+            pos1, DA = 90, 25
+        else:
+            pos1, DA = 45, 15
+        if option["numberpanels"] == 1 and option["titlecorshape"] == "linear":
+            pos_x_y = 1.13 * rmax * np.cos(pos1 * np.pi / 180)
+            scene.text(
+                pos_x_y, pos_x_y, lab, color, fontSize, rotation=-45, weight=weight
+            )
+        elif option["titlecorshape"] in {"curved", "linear"}:
+            _add_curved_text(
+                scene,
+                lab,
+                [0.0, 0.0],
+                1.1 * rmax,
+                pos1,
+                DA,
+                color,
+                fontSize,
+                "bottom",
+                weight,
+            )
+        else:
+            raise ValueError(
+                "Invalid value for 'titlecorshape': %s" % option["titlecorshape"]
+            )
+
+    # Title of the RMS, curved along the RMS circles
+    if option["titlerms"] == "on":
+        if option["numberpanels"] == 2:
+            fraction, valign = 0.7, "bottom"
+        else:
+            fraction, valign = 0.8, "top"
+        tickrms = np.ravel(option["tickrms"])
+        if tickrms[0] > 0:
+            dd = fraction * tickrms[0] + (1 - fraction) * tickrms[1]
+        else:
+            dd = fraction * tickrms[1] + (1 - fraction) * tickrms[2]
+        DA = 10 if dd / rmax >= 0.35 else 20
+        _add_curved_text(
+            scene,
+            option["labelrms"],
+            [axes["dx"], 0.0],
+            dd,
+            option["titlermsdangle"],
+            DA,
+            option["colrms"],
+            fontSize,
+            valign,
+            weight,
+        )
+
+    # Room for the labels around the diagram
+    margin = scene.points(1.5 * fontSize)
+    scene.extend(
+        xmin=(-1.1 * rmax - margin) if option["numberpanels"] == 2 else None,
+        xmax=1.1 * rmax + margin,
+        ymin=-pad - scene.points(1.2 * tickSize) - margin,
+        ymax=1.1 * rmax + margin,
+    )
+    if option["numberpanels"] == 1:
+        scene.extend(xmin=-pad - scene.points(0.6 * tickSize * ticklength) - margin)
+
+
+def _add_curved_text(
+    scene, text, center, radius, angle, spread, color, size, valign, weight
+) -> None:
+    """
+    Adds TEXT character by character along a circle of RADIUS about CENTER,
+    centered on ANGLE and spanning ANGLE-SPREAD to ANGLE+SPREAD degrees.
+    """
+    angles = np.linspace(angle + spread, angle - spread, len(text))
+    x = center[0] + radius * np.cos(angles * np.pi / 180)
+    y = center[1] + radius * np.sin(angles * np.pi / 180)
+    scene.texts(
+        x, y, list(text), color, size, angles - 90, valign=valign, weight=weight
+    )
+
+
+def _add_obs(scene, obsSTD, axes: dict, option: dict) -> None:
+    """
+    Adds the observation point, its label and circle, as PLOT_TAYLOR_OBS.
+    """
+
+    if option["markerobs"] != "none":
+        scene.markers(
+            [obsSTD],
+            [0.001 * axes["rmax"] - axes["rmin"]],
+            option["markerobs"],
+            option["markersize"] - 4,
+            option["colobs"],
+            option["colobs"],
+        )
+
+    if option["titleobs"] != "":
+        y = scene.limits[2] + scene.points(1.5 * scene.fontsize)
+        scene.text(
+            obsSTD,
+            y,
+            option["titleobs"],
+            option["colobs"],
+            scene.fontsize + 2,
+            valign="top",
+            weight="bold",
+        )
+
+    if option["styleobs"] != "":
+        scene.circle(
+            [0.0, 0.0], obsSTD, option["colobs"], option["widthobs"], option["styleobs"]
+        )
@@ -0,0 +1,201 @@
+import datetime
+import json
+import os
+import re
+import shutil
+import tempfile
+
+import numpy as np
+
+# Name of the manifest of an array store and identifier of its format
+MANIFEST = "manifest.json"
+STORE_FORMAT = "skill_metrics.array_store"
+STORE_VERSION = 1
+
+# Number of bytes copied at a time from arrays that are not in memory
+CHUNK_BYTES = 64 * 2**20
+
+
+def write_array_store(directory, data, overwrite=False) -> None:
+    """
+    Write data sets to a directory of NumPy arrays with a JSON manifest.
+
+    This function stores DATA, e.g. the dictionaries of statistics or of
+    time series of the examples, in DIRECTORY as one NumPy '.npy' file per
+    array and a 'manifest.json' file describing the structure of DATA, so
+    that READ_ARRAY_STORE loads it back with the arrays memory-mapped,
+    without copying or deserializing them. Unlike pickle files, the store
+    does not depend on the version of Python or on the classes of the
+    objects that were stored.
+
+    DATA can contain dictionaries with string keys, objects with
+    attributes (e.g. a Container of dictionaries), lists, NumPy arrays,
+    strings, numbers, booleans and None. Lists of numbers, strings, dates
+    or times are stored as arrays and read back as lists. Arrays that are
+    not in memory, e.g. datasets of HDF5 files, are copied in chunks.
+
+    The store is written to a temporary directory next to DIRECTORY,
+    which is then renamed to DIRECTORY, so that readers never see a
+    partial store. An existing store is first renamed aside and removed
+    once replaced: a reader opening the store at that moment finds
+    either the old store, the new one or no store, and the arrays of
+    the old store that were already opened remain readable, except on
+    Windows where removing them fails while they are open.
+
+    INPUTS:
+    directory : name of the directory of the store
+    data      : data to store
+    overwrite : replace an existing store (Default: False)
+
+    OUTPUTS:
+        None.
+
+    EXAMPLE:
+    write_array_store('target_data', {'ref': ref, 'pred1': pred1})
+
+    Created on Oct 18, 2026
+    """
+
+    directory = os.path.normpath(directory)
+    if os.path.exists(directory):
+        if not overwrite:
+            raise ValueError("Array store already exists: " + directory)
+        if not os.path.isfile(os.path.join(directory, MANIFEST)):
+            raise ValueError("Not an array store: " + directory)
+
+    # Unique staging directory of the new store and of the replaced one,
+    # left over only if the process is killed
+    parent, base = os.path.split(directory)
+    os.makedirs(parent or os.curdir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix="." + base + ".", suffix=".tmp", dir=parent)
+    temporary = os.path.join(staging, "new")
+    old = os.path.join(staging, "old")
+    try:
+        os.mkdir(temporary)
+        files = set()
+        tree = _node(data, [], temporary, files)
+        manifest = {"format": STORE_FORMAT, "version": STORE_VERSION, "data": tree}
+        with open(os.path.join(temporary, MANIFEST), "w") as file:
+            json.dump(manifest, file, indent=1)
+        if os.path.exists(directory):
+            os.replace(directory, old)
+        try:
+            os.replace(temporary, directory)
+        except BaseException:
+            if os.path.exists(old):
+                os.replace(old, directory)
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _node(value, path, directory, files) -> dict:
+    """
+    Manifest entry of a value, writing its arrays to DIRECTORY.
+    """
+    if isinstance(value, dict):
+        items = {}
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise ValueError("Keys must be strings: %r in %s" % (key, _name(path)))
+            items[key] = _node(item, path + [key], directory, files)
+        return {"type": "dict", "items": items}
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"type": "value", "value": value}
+    if isinstance(value, np.generic) and value.dtype.kind in "biuf":
+        return {"type": "value", "value": value.item()}
+
+    if isinstance(value, (list, tuple)):
+        array, kind = _list_array(value)
+        if array is None:
+            items = [
+                _node(item, path + [str(i)], directory, files)
+                for i, item in enumerate(value)
+            ]
+            return {"type": "list", "items": items}
+        return _array_node(array, path, directory, files, kind)
+
+    if isinstance(value, np.ndarray) or (
+        hasattr(value, "shape") and hasattr(value, "dtype")
+    ):
+        return _array_node(value, path, directory, files, None)
+
+    if hasattr(value, "__dict__"):
+        # e.g. Container objects of the examples, by their attributes
+        node = _node(vars(value), path, directory, files)
+        node["type"] = "object"
+        return node
+
+    raise ValueError(
+        "Cannot store value of type %s in %s" % (type(value).__name__, _name(path))
+    )
+
+
+def _list_array(value) -> tuple:
+    """
+    Array of a list of numbers, strings, dates or times, or None for other
+    lists, and the kind of values it holds.
+    """
+    if len(value) == 0:
+        return None, None
+    if all(isinstance(item, datetime.datetime) for item in value):
+        return np.array(value, dtype="datetime64[us]"), "datetime"
+    if all(isinstance(item, datetime.date) for item in value):
+        return np.array(value, dtype="datetime64[D]"), "date"
+    if all(isinstance(item, datetime.time) for item in value):
+        return np.array([item.isoformat() for item in value]), "time"
+    if all(isinstance(item, str) for item in value):
+        return np.array(value), "list"
+    numbers = (bool, int, float, np.bool_, np.number)
+    if all(isinstance(item, numbers) for item in value):
+        return np.array(value), "list"
+    return None, None
+
+
+def _array_node(array, path, directory, files, kind) -> dict:
+    """
+    Writes an array to a NPY file, in chunks if it is not in memory.
+    """
+    base = re.sub(r"[^A-Za-z0-9_.-]", "_", _name(path)) or "data"
+    name, number = base + ".npy", 1
+    while name in files:
+        number += 1
+        name = "%s_%d.npy" % (base, number)
+    files.add(name)
+    filename = os.path.join(directory, name)
+
+    if hasattr(array, "to_numpy"):
+        # pandas objects
+        array = array.to_numpy()
+    if isinstance(array, np.ndarray) or len(array.shape) == 0:
+        array = np.asarray(array)
+        if array.dtype.hasobject:
+            raise ValueError("Cannot store array of objects in " + _name(path))
+        np.save(filename, array, allow_pickle=False)
+    else:
+        # e.g. an HDF5 dataset, copied without reading it whole
+        dtype = np.dtype(array.dtype)
+        if dtype.hasobject:
+            raise ValueError("Cannot store array of objects in " + _name(path))
+        output = np.lib.format.open_memmap(
+            filename, mode="w+", dtype=dtype, shape=tuple(array.shape)
+        )
+        row_bytes = max(dtype.itemsize * int(np.prod(array.shape[1:])), 1)
+        step = max(CHUNK_BYTES // row_bytes, 1)
+        for start in range(0, array.shape[0], step):
+            output[start : start + step] = array[start : start + step]
+        output.flush()
+        del output
+
+    node = {"type": "array", "file": name}
+    if kind is not None:
+        node["kind"] = kind
+    return node
+
+
+def _name(path) -> str:
+    """
+    Dotted name of a path in the data, e.g. 'ref.data'.
+    """
+    return ".".join(path)
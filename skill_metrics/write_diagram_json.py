@@ -0,0 +1,31 @@
+import json
+
+
+def write_diagram_json(scene: dict, filename: str = None) -> str:
+    """
+    Write a diagram scene as a JSON document.
+
+    Serializes the scene returned by TAYLOR_DIAGRAM_SCENE or
+    TARGET_DIAGRAM_SCENE without whitespace, e.g. to be drawn by a client
+    such as a web browser. The scene can be read back with json.loads and
+    passed to WRITE_DIAGRAM_SVG.
+
+    INPUTS:
+    scene    : dictionary describing the diagram (Refer to
+               DiagramScene.as_dict for more information.)
+    filename : name of the JSON file to write. If None (default) the
+               document is only returned.
+
+    OUTPUTS:
+    text : the JSON document
+
+    Created on Oct 18, 2026
+    """
+
+    text = json.dumps(scene, separators=(",", ":"))
+
+    if filename is not None:
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    return text
@@ -0,0 +1,289 @@
+import hashlib
+from functools import lru_cache
+from html import escape
+
+import numpy as np
+from matplotlib.markers import MarkerStyle
+from matplotlib.path import Path
+
+# Dash patterns of the matplotlib line styles in multiples of the line width
+_DASHES = {"--": (3.7, 1.6), "-.": (6.4, 1.6, 1.0, 1.6), ":": (1.0, 1.65)}
+
+# Text alignment attributes
+_ANCHOR = {"left": "start", "center": "middle", "right": "end"}
+_SHIFT = {"top": "0.75em", "center": "0.35em", "bottom": "-0.25em", "baseline": None}
+
+# Placeholder for the identifiers of definitions, replaced by a hash of
+# the content so several diagrams can be embedded in the same document
+_ID = "@ID@"
+
+
+def write_diagram_svg(scene: dict, filename: str = None) -> str:
+    """
+    Write a diagram scene as a Scalable Vector Graphics (SVG) image.
+
+    Converts the scene returned by TAYLOR_DIAGRAM_SCENE or
+    TARGET_DIAGRAM_SCENE to a compact SVG document, e.g. to be served by
+    a web application or embedded in an HTML page. Grid circles and arcs
+    are written as SVG circles and arcs, and each marker symbol is
+    defined once and reused for all markers. No matplotlib figure is
+    created.
+
+    INPUTS:
+    scene    : dictionary describing the diagram (Refer to
+               DiagramScene.as_dict for more information.)
+    filename : name of the SVG file to write. If None (default) the
+               document is only returned.
+
+    OUTPUTS:
+    svg : the SVG document
+
+    Created on Oct 18, 2026
+    """
+
+    xmin, xmax, ymin, ymax = scene["limits"]
+    width, height = scene["size"]
+    scale = width / (xmax - xmin)
+
+    parts = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="%.1fpt" height="%.1fpt" '
+        'viewBox="0 0 %.1f %.1f" font-family="sans-serif">'
+        % (width, height, width, height)
+    ]
+
+    # Clip path of the diagram axes
+    fx0, fx1, fy0, fy1 = scene["frame"]
+    parts.append(
+        '<clipPath id="%sc"><rect x="%.2f" y="%.2f" width="%.2f" height="%.2f"/>'
+        "</clipPath>"
+        % (
+            _ID,
+            (fx0 - xmin) * scale,
+            (ymax - fy1) * scale,
+            (fx1 - fx0) * scale,
+            (fy1 - fy0) * scale,
+        )
+    )
+
+    def x(value):
+        return (value - xmin) * scale
+
+    def y(value):
+        return (ymax - value) * scale
+
+    symbols = {}
+    for n, item in enumerate(scene["items"]):
+        kind = item["type"]
+        if kind == "circle":
+            parts.append(_circle(item, x, y, scale))
+        elif kind == "line":
+            parts.append(_line(item, x, y))
+        elif kind == "text":
+            parts.append(_text(item, x, y))
+        elif kind == "markers":
+            parts.append(_markers(item, x, y, symbols))
+        elif kind == "gradient":
+            parts.append(_gradient(item, x, y, n))
+        else:
+            raise ValueError("Unknown type of scene item: " + str(kind))
+
+    # Marker symbols used, defined once
+    parts.insert(
+        1,
+        "<defs>"
+        + "".join(
+            '<path id="%sm%d" d="%s"/>' % (_ID, index, _marker_path(*key))
+            for key, index in symbols.items()
+        )
+        + "</defs>",
+    )
+    parts.append("</svg>")
+
+    svg = "".join(parts)
+    key = hashlib.blake2b(svg.encode(), digest_size=4).hexdigest()
+    svg = svg.replace(_ID, "sm" + key + "-")
+
+    if filename is not None:
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(svg)
+
+    return svg
+
+
+def _stroke(item) -> str:
+    """
+    Stroke attributes of a circle or line, or None if it is not drawn.
+    """
+    style = item["style"]
+    if style in {"", " ", "None", "none"}:
+        return None
+    attributes = 'fill="none" stroke="%s" stroke-width="%g"' % (
+        item["color"],
+        item["width"],
+    )
+    if style in _DASHES:
+        dashes = ",".join("%.2f" % (d * item["width"]) for d in _DASHES[style])
+        attributes += ' stroke-dasharray="%s"' % dashes
+    if item.get("clip", False):
+        attributes += ' clip-path="url(#%sc)"' % _ID
+    return attributes
+
+
+def _circle(item, x, y, scale) -> str:
+    stroke = _stroke(item)
+    if stroke is None:
+        return ""
+    cx, cy = item["center"]
+    r = item["radius"]
+    angles = item.get("angles")
+    if angles is None or angles[1] - angles[0] >= 360:
+        return '<circle cx="%.2f" cy="%.2f" r="%.2f" %s/>' % (
+            x(cx),
+            y(cy),
+            r * scale,
+            stroke,
+        )
+
+    # Counterclockwise arc with the y-axis pointing up
+    a0, a1 = np.radians(angles)
+    large = 1 if angles[1] - angles[0] > 180 else 0
+    return '<path d="M%.2f %.2fA%.2f %.2f 0 %d 0 %.2f %.2f" %s/>' % (
+        x(cx + r * np.cos(a0)),
+        y(cy + r * np.sin(a0)),
+        r * scale,
+        r * scale,
+        large,
+        x(cx + r * np.cos(a1)),
+        y(cy + r * np.sin(a1)),
+        stroke,
+    )
+
+
+def _line(item, x, y) -> str:
+    stroke = _stroke(item)
+    if stroke is None:
+        return ""
+    points = np.asarray(item["points"])
+    xy = np.column_stack((x(points[:, 0]), y(points[:, 1])))
+    return '<polyline points="%s" %s/>' % (
+        " ".join("%.2f,%.2f" % (px, py) for px, py in xy.tolist()),
+        stroke,
+    )
+
+
+def _text(item, x, y) -> str:
+    px, py = item["position"]
+    px, py = x(px), y(py)
+    attributes = 'x="%.2f" y="%.2f" font-size="%g" fill="%s"' % (
+        px,
+        py,
+        item["size"],
+        item["color"],
+    )
+    if item["halign"] != "left":
+        attributes += ' text-anchor="%s"' % _ANCHOR[item["halign"]]
+    if _SHIFT[item["valign"]] is not None:
+        attributes += ' dy="%s"' % _SHIFT[item["valign"]]
+    if item["weight"] != "normal":
+        attributes += ' font-weight="%s"' % item["weight"]
+    if item["rotation"]:
+        attributes += ' transform="rotate(%g %.2f %.2f)"' % (-item["rotation"], px, py)
+    return "<text %s>%s</text>" % (attributes, escape(item["text"], quote=False))
+
+
+def _markers(item, x, y, symbols: dict) -> str:
+    """
+    Markers as references to the symbol definitions collected in SYMBOLS.
+    """
+
+    points = np.asarray(item["positions"])
+    n = len(points)
+    px = x(points[:, 0]).tolist()
+    py = y(points[:, 1]).tolist()
+
+    def each(value):
+        return value if isinstance(value, list) else [value] * n
+
+    symbol = each(item["symbol"])
+    size = each(item["size"])
+    facecolor = each(item["facecolor"])
+    edgecolor = each(item["edgecolor"])
+
+    group = '<g stroke-width="%g"' % item["edgewidth"]
+    if item["alpha"] < 1:
+        group += ' fill-opacity="%g"' % item["alpha"]
+    if item["clip"]:
+        group += ' clip-path="url(#%sc)"' % _ID
+    parts = [group + ">"]
+    for i in range(n):
+        key = (symbol[i], size[i])
+        if key not in symbols:
+            symbols[key] = len(symbols)
+        if _is_filled(symbol[i]):
+            fill = facecolor[i]
+        else:
+            fill = "none"
+        parts.append(
+            '<use href="#%sm%d" x="%.2f" y="%.2f" fill="%s" stroke="%s"/>'
+            % (_ID, symbols[key], px[i], py[i], fill, edgecolor[i])
+        )
+    parts.append("</g>")
+    return "".join(parts)
+
+
+def _gradient(item, x, y, n) -> str:
+    x0, y0, x1, y1 = item["rect"]
+    colors = item["colors"]
+    if item["orientation"] == "horizontal":
+        direction = 'x1="0" y1="0" x2="1" y2="0"'
+    else:
+        direction = 'x1="0" y1="1" x2="0" y2="0"'
+    stops = "".join(
+        '<stop offset="%.3f" stop-color="%s"/>' % (i / (len(colors) - 1), color)
+        for i, color in enumerate(colors)
+    )
+    return (
+        '<linearGradient id="%sg%d" %s>%s</linearGradient>'
+        '<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" fill="url(#%sg%d)"/>'
+        % (
+            _ID,
+            n,
+            direction,
+            stops,
+            x(x0),
+            y(y1),
+            x(x1) - x(x0),
+            y(y0) - y(y1),
+            _ID,
+            n,
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _is_filled(symbol: str) -> bool:
+    return MarkerStyle(symbol).is_filled()
+
+
+@lru_cache(maxsize=128)
+def _marker_path(symbol: str, size: float) -> str:
+    """
+    SVG path data of a matplotlib marker SYMBOL of SIZE points centered on
+    the origin.
+    """
+    marker = MarkerStyle(symbol)
+    transform = marker.get_transform().scale(size, -size)
+    d = []
+    for vertices, code in marker.get_path().iter_segments(transform, simplify=False):
+        values = " ".join("%.2f" % v for v in vertices)
+        if code == Path.MOVETO:
+            d.append("M" + values)
+        elif code == Path.LINETO:
+            d.append("L" + values)
+        elif code == Path.CURVE3:
+            d.append("Q" + values)
+        elif code == Path.CURVE4:
+            d.append("C" + values)
+        elif code == Path.CLOSEPOLY:
+            d.append("Z")
+    return "".join(d)
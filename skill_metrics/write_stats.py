@@ -1,6 +1,8 @@
 import os
 
-import xlsxwriter
+import numpy as np
+
+from .stats_workbook import MAX_COLUMNS, StatsWorkbook
 
 
 def write_stats(filename, data, **kwargs):
@@ -17,7 +19,10 @@ def write_stats(filename, data, **kwargs):
     INPUTS:
     filename     : name for statistics Excel file
     data         : a dictionary containing the statistics
-    data['stat'] : statistics, e.g. data.bias for Bias.
+    data['stat'] : statistics, e.g. data.bias for Bias, as a scalar or
+                   an array of one value per case. Cases beyond the
+                   columns of an Excel worksheet continue on new
+                   worksheets.
 
     OUTPUTS:
         None.
@@ -36,6 +41,7 @@ def write_stats(filename, data, **kwargs):
         prochford@thesymplectic.com
 
     Created on Dec 10, 2016
+    Revised on Oct 18, 2026
     """
 
     option = get_write_stats_options(**kwargs)
@@ -47,33 +53,33 @@ def write_stats(filename, data, **kwargs):
         else:
             raise ValueError("File already exists: " + filename)
 
-    # Write title information to file
-    workbook = xlsxwriter.Workbook(filename)
-    worksheet = workbook.add_worksheet()
-
-    # Write descriptive title
-    if len(option["title"]) > 0:
-        worksheet.write(1, 0, option["title"])
-    else:
-        worksheet.write(1, 0, "Skill Metrics")
-
-    # Determine number of elements in the dictionary lists and write
-    # appropriate header
-    worksheet.write(3, 0, "Skill Metric")
-    ncell = len(list(data.items())[0]) - 1
-    for i in range(ncell):
-        worksheet.write(3, i + 1, "Case " + str(i + 1))
-
-    # Write data of all the fields
-    row = 4
-    col = 0
-    for key, value in data.items():
-        worksheet.write(row, col, key)
-        for i, v in enumerate([value]):
-            worksheet.write(row, col + 1 + i, v)
-        row += 1
-
-    workbook.close()
+    # Statistics of each case as a list, a scalar being a single case
+    names = list(data.keys())
+    values = [np.ravel(value).tolist() for value in data.values()]
+    ncell = max([len(value) for value in values], default=0)
+
+    # Write rows in order in constant memory. Cases beyond the number of
+    # columns of Excel continue on new worksheets.
+    with StatsWorkbook(filename) as book:
+        for start in range(0, max(ncell, 1), MAX_COLUMNS - 1):
+            if start > 0:
+                book.add_worksheet()
+            cases = range(start, min(ncell, start + MAX_COLUMNS - 1))
+
+            # Write descriptive title
+            book.skip()
+            if len(option["title"]) > 0:
+                book.write_row([option["title"]])
+            else:
+                book.write_row(["Skill Metrics"])
+
+            # Write header of the cases
+            book.skip()
+            book.write_row(["Skill Metric"] + ["Case " + str(i + 1) for i in cases])
+
+            # Write data of all the fields
+            for name, value in zip(names, values):
+                book.write_row([name] + value[cases.start : cases.stop])
 
 
 def get_write_stats_options(**kwargs):
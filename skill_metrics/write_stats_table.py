@@ -0,0 +1,138 @@
+import os
+
+from .stats_table_writer import StatsTableWriter
+
+
+def write_stats_table(filename, data, **kwargs):
+    """
+    Write statistics to a columnar table file.
+
+    This function writes to FILENAME the statistics of each of the
+    dictionaries contained in DATA as a tidy table: one row per data
+    point, with the number and title of its data set and its label, and
+    one column per statistic. It is the columnar counterpart of WRITE_STATS,
+    WRITE_TARGET_STATS and WRITE_TAYLOR_STATS, for tables too large or
+    read too often for Excel files, and the table is read back in the
+    layout of the diagram functions by READ_STATS_TABLE.
+
+    The format of the table is given by the extension of FILENAME:
+    '.csv', '.npz' (compressed NumPy arrays) or '.parquet' (requires
+    pyarrow). Rows can be appended to existing CSV and NPZ tables, e.g.
+    to write statistics in chunks as they are calculated, each dictionary
+    being a new data set even if its title is already in the table. See
+    STATSTABLEWRITER to write chunks to a file kept open.
+
+    INPUTS:
+    filename     : name for statistics table file
+    data         : a dictionary containing the statistics, or a list of
+                   dictionaries with the same statistics
+    data['stat'] : statistics, e.g. data['sdev'] for the standard
+                   deviations of a Taylor diagram, as a scalar or an array
+                   of one value per data point
+
+    OUTPUTS:
+        None.
+
+    LIST OF OPTIONS:
+      A title description for each dictionary (TITLE) can be optionally
+    provided as well as a LABEL for each data point.
+
+    append = boolean : true/false flag to append the rows to an existing
+                       table of the same statistics (Default: false)
+    format = format : 'csv', 'npz' or 'parquet' (Default: from the
+                      extension of FILENAME)
+    label = label : label for each data point, e.g. 'OC445 (CB)'
+    overwrite = boolean : true/false flag to overwrite table file
+    title = title : title descriptor for each data set in data, e.g.
+                    'Expt. 01.0' (Default: 'Data set 1', 'Data set 2',
+                    etc. when data contains several data sets)
+
+    EXAMPLE:
+    write_stats_table('taylor_stats.csv', [taylor_stats1, taylor_stats2],
+                      title=['Expt. 1', 'Expt. 2'], label=['Obs', 'M1'])
+
+    Created on Oct 18, 2026
+    """
+
+    option = get_write_stats_table_options(**kwargs)
+
+    # Check for existence of file
+    if os.path.isfile(filename) and option["append"] == "off":
+        if option["overwrite"] == "on":
+            os.remove(filename)
+        else:
+            raise ValueError("File already exists: " + filename)
+
+    # Covert data to list if necessary
+    if type(data) is not list:
+        data = [data]
+    if len(data) == 0:
+        raise ValueError("No statistics to write")
+
+    # Title of each data set
+    title = option["title"]
+    if isinstance(title, str):
+        if len(title) == 0 and len(data) > 1:
+            title = ["Data set " + str(i + 1) for i in range(len(data))]
+        else:
+            title = [title] * len(data)
+    elif len(title) != len(data):
+        raise ValueError(
+            "Number of titles (%d) differs from number of data sets (%d)"
+            % (len(title), len(data))
+        )
+
+    with StatsTableWriter(
+        filename, list(data[0].keys()), option["format"], option["append"] == "on"
+    ) as table:
+        for i in range(len(data)):
+            table.write(data[i], title=title[i], label=option["label"])
+
+
+def get_write_stats_table_options(**kwargs):
+    """
+    Get optional arguments for write_stats_table function.
+
+    Retrieves the keywords supplied to the WRITE_STATS_TABLE function
+    (**KWARGS), and returns the values in a OPTION dictionary. Default
+    values are assigned to selected optional arguments. The function will
+    terminate with an error if an unrecognized optional argument is
+    supplied.
+
+    INPUTS:
+    **kwargs : keyword argument list
+
+    OUTPUTS:
+    option : data structure containing option values.
+    option['append']    : 'on'/'off' switch to append to table file.
+    option['format']    : format of table file.
+    option['label']     : label for each data point.
+    option['overwrite'] : 'on'/'off' switch to overwrite table file.
+    option['title']     : title descriptor for each data set.
+
+    Created on Oct 18, 2026
+    """
+    from .check_on_off import check_on_off
+
+    #  Set default parameters
+    option = {}
+    option["append"] = "off"
+    option["format"] = None
+    option["label"] = []
+    option["overwrite"] = "off"
+    option["title"] = ""
+
+    # Check for valid keys and values in dictionary
+    for optname, optvalue in kwargs.items():
+        optname = optname.lower()
+        if optname not in option:
+            raise ValueError("Unrecognized option: " + optname)
+        else:
+            # Replace option value with that from arguments
+            option[optname] = optvalue
+
+            # Check values for specific options
+            if optname in ["append", "overwrite"]:
+                option[optname] = check_on_off(option[optname])
+
+    return option
@@ -1,6 +1,6 @@
 import os
 
-import xlsxwriter
+from .stats_workbook import MAX_ROWS, StatsWorkbook
 
 
 def write_target_stats(filename, data, **kwargs):
@@ -32,6 +32,9 @@ def write_target_stats(filename, data, **kwargs):
 
     label = label : label for each data point in target diagram, e.g.
                     'OC445 (CB)'
+    maxrows = number : maximum number of rows of each worksheet, the
+                       rows beyond being written to new worksheets
+                       (Default: 1048576, the limit of Excel)
     overwrite = boolean : true/false flag to overwrite Excel file
     title = title : title descriptor data set, e.g. 'Expt. 01.0'
 
@@ -41,6 +44,7 @@ def write_target_stats(filename, data, **kwargs):
         prochford@thesymplectic.com
 
     Created on Dec 12, 2016
+    Revised on Oct 18, 2026
     """
 
     option = get_write_target_stats_options(**kwargs)
@@ -56,54 +60,31 @@ def write_target_stats(filename, data, **kwargs):
     if type(data) is not list:
         data = [data]
 
-    # Write title information to file
-    workbook = xlsxwriter.Workbook(filename)
-    worksheet = workbook.add_worksheet()
-
-    # Write title information to file
-    worksheet.write(1, 0, "Target Statistics")
-
-    # Determine number of dictionaries in data variable
-    ncell = len(data)
-
-    # Write data for each dictionary
-    row = 2
-    headers = ["Description", "Bias", "uRMSD", "RMSD"]
-    for i in range(ncell):
-        row += 1
-        if len(option["title"]) > 0:
-            worksheet.write(row, 0, option["title"][i])
-
-        # Write column headers
-        row += 1
-        for j, h in enumerate(headers):
-            worksheet.write(row, j, h)
-
-        # Retrieve input values as list
-        try:
-            iter(data[i]["bias"])
-        except TypeError:
-            bias = [data[i]["bias"]]
-            crmsd = [data[i]["crmsd"]]
-            rmsd = [data[i]["rmsd"]]
-        else:
-            bias = data[i]["bias"]
-            crmsd = data[i]["crmsd"]
-            rmsd = data[i]["rmsd"]
-        ndata = len(bias)
-
-        # Write each row of data
-        row += 1
-        for j in range(ndata):
-            if len(option["label"]) > 0:
-                worksheet.write(row, 0, option["label"][j])
-
-            worksheet.write(row, 1, bias[j])
-            worksheet.write(row, 2, crmsd[j])
-            worksheet.write(row, 3, rmsd[j])
-            row += 1
-
-    workbook.close()
+    # Write rows in order in constant memory, continuing on new worksheets
+    # beyond maxrows rows
+    with StatsWorkbook(filename, option["maxrows"]) as book:
+        # Write title information to file
+        book.skip()
+        book.write_row(["Target Statistics"])
+
+        # Write data for each dictionary
+        headers = ["Description", "Bias", "uRMSD", "RMSD"]
+        for i in range(len(data)):
+            book.skip()
+            if len(option["title"]) > 0:
+                header = [[option["title"][i]], headers]
+            else:
+                book.skip()
+                header = [headers]
+
+            # Write column headers, repeated on new worksheets
+            book.write_header(header)
+
+            # Write all the rows of data
+            book.write_columns(
+                [data[i]["bias"], data[i]["crmsd"], data[i]["rmsd"]],
+                labels=option["label"],
+            )
 
 
 def get_write_target_stats_options(**kwargs):
@@ -123,6 +104,7 @@ def get_write_target_stats_options(**kwargs):
     option : data structure containing option values.
     option['title']     : title descriptor for data set.
     option['overwrite'] : boolean to overwrite Excel file.
+    option['maxrows']   : maximum number of rows of each worksheet.
 
     LIST OF OPTIONS:
       A title description for each dataset TITLE can be optionally
@@ -131,6 +113,7 @@ def get_write_target_stats_options(**kwargs):
 
     label = label : label for each data point in target diagram, e.g.
                     'OC445 (CB)'
+    maxrows = number : maximum number of rows of each worksheet
     overwrite = boolean : true/false flag to overwrite Excel file
     title = title : title descriptor for each data set in data, e.g.
                    'Expt. 01.0'
@@ -152,6 +135,7 @@ def get_write_target_stats_options(**kwargs):
     option["overwrite"] = False
     option["label"] = []
     option["title"] = ""
+    option["maxrows"] = MAX_ROWS
     if nargin == 0:
         # No options requested, so return with only defaults
         return option
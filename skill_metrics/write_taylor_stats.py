@@ -1,6 +1,6 @@
 import os
 
-import xlsxwriter
+from .stats_workbook import MAX_ROWS, StatsWorkbook
 
 
 def write_taylor_stats(filename, data, **kwargs):
@@ -30,6 +30,9 @@ def write_taylor_stats(filename, data, **kwargs):
 
     label = label : label for each data point in target diagram, e.g.
                     'OC445 (CB)'
+    maxrows = number : maximum number of rows of each worksheet, the
+                       rows beyond being written to new worksheets
+                       (Default: 1048576, the limit of Excel)
     overwrite = boolean : true/false flag to overwrite Excel file
     title = title : title descriptor data set, e.g. 'Expt. 01.0'
 
@@ -39,6 +42,7 @@ def write_taylor_stats(filename, data, **kwargs):
         prochford@thesymplectic.com
 
     Created on Dec 12, 2016
+    Revised on Oct 18, 2026
     """
 
     option = get_write_taylor_stats_options(**kwargs)
@@ -54,54 +58,31 @@ def write_taylor_stats(filename, data, **kwargs):
     if type(data) is not list:
         data = [data]
 
-    # Write title information to file
-    workbook = xlsxwriter.Workbook(filename)
-    worksheet = workbook.add_worksheet()
-
-    # Write title information to file
-    worksheet.write(1, 0, "Taylor Statistics")
-
-    # Determine number of dictionaries in data variable
-    ncell = len(data)
-
-    # Write data for each dictionary
-    row = 2
-    headers = ["Description", "Standard Deviation", "CRMSD", "Correlation Coeff."]
-    for i in range(ncell):
-        row += 1
-        if len(option["title"]) > 0:
-            worksheet.write(row, 0, option["title"][i])
-
-        # Write column headers
-        row += 1
-        for j, h in enumerate(headers):
-            worksheet.write(row, j, h)
-
-        # Retrieve input values as list
-        try:
-            iter(data[i]["sdev"])
-        except TypeError:
-            sdev = [data[i]["sdev"]]
-            crmsd = [data[i]["crmsd"]]
-            ccoef = [data[i]["ccoef"]]
-        else:
-            sdev = data[i]["sdev"]
-            crmsd = data[i]["crmsd"]
-            ccoef = data[i]["ccoef"]
-        ndata = len(sdev)
-
-        # Write each row of data
-        row += 1
-        for j in range(ndata):
-            if len(option["label"]) > 0:
-                worksheet.write(row, 0, option["label"][j])
-
-            worksheet.write(row, 1, sdev[j])
-            worksheet.write(row, 2, crmsd[j])
-            worksheet.write(row, 3, ccoef[j])
-            row += 1
-
-    workbook.close()
+    # Write rows in order in constant memory, continuing on new worksheets
+    # beyond maxrows rows
+    with StatsWorkbook(filename, option["maxrows"]) as book:
+        # Write title information to file
+        book.skip()
+        book.write_row(["Taylor Statistics"])
+
+        # Write data for each dictionary
+        headers = ["Description", "Standard Deviation", "CRMSD", "Correlation Coeff."]
+        for i in range(len(data)):
+            book.skip()
+            if len(option["title"]) > 0:
+                header = [[option["title"][i]], headers]
+            else:
+                book.skip()
+                header = [headers]
+
+            # Write column headers, repeated on new worksheets
+            book.write_header(header)
+
+            # Write all the rows of data
+            book.write_columns(
+                [data[i]["sdev"], data[i]["crmsd"], data[i]["ccoef"]],
+                labels=option["label"],
+            )
 
 
 def get_write_taylor_stats_options(**kwargs):
@@ -121,6 +102,7 @@ def get_write_taylor_stats_options(**kwargs):
     option : data structure containing option values.
     option['title']     : title descriptor for data set.
     option['overwrite'] : boolean to overwrite Excel file.
+    option['maxrows']   : maximum number of rows of each worksheet.
 
     LIST OF OPTIONS:
       A title description for each dataset TITLE can be optionally
@@ -129,6 +111,7 @@ def get_write_taylor_stats_options(**kwargs):
 
     label = label : label for each data point in target diagram, e.g.
                     'OC445 (CB)'
+    maxrows = number : maximum number of rows of each worksheet
     overwrite = boolean : true/false flag to overwrite Excel file
     title = title : title descriptor for each data set in data, e.g.
                    'Expt. 01.0'
@@ -150,6 +133,7 @@ def get_write_taylor_stats_options(**kwargs):
     option["overwrite"] = False
     option["label"] = []
     option["title"] = ""
+    option["maxrows"] = MAX_ROWS
     if nargin == 0:
         # No options requested, so return with only defaults
         return option